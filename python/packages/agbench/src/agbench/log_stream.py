@@ -0,0 +1,114 @@
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Iterable, Optional, Type
+
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class LogSettings:
+    """
+    How the console output of a run is logged.
+
+    Args:
+        quiet (bool):           True if the output should only be written to the log file, and not echoed to the console.
+        max_bytes (int):        The size at which the log file is rotated. None (the default) never rotates it.
+        backup_count (int):     The number of rotated log files to keep, as console_log.txt.1, console_log.txt.2, etc.
+                                Older output is discarded. With 0 (the default), the log file is truncated when it
+                                reaches max_bytes, so it only holds the most recent output.
+    """
+
+    quiet: bool = False
+    max_bytes: Optional[int] = None
+    backup_count: int = 0
+
+
+class ConsoleLog:
+    """
+    Writes the console output of a run to its log file, in chunks, and echoes it to the console line by line,
+    so that the output of parallel runs is not interleaved mid-line. Safe to write to from several threads.
+    """
+
+    def __init__(self, path: str, settings: Optional[LogSettings] = None) -> None:
+        self._path = path
+        self._settings = settings or LogSettings()
+        self._lock = threading.Lock()
+        self._file = open(path, "wb")
+        self._size = 0
+        self._pending = b""
+
+    def _rotate(self) -> None:
+        self._file.close()
+        backup_count = self._settings.backup_count
+        if backup_count > 0:
+            for i in range(backup_count - 1, 0, -1):
+                if os.path.isfile(f"{self._path}.{i}"):
+                    os.replace(f"{self._path}.{i}", f"{self._path}.{i + 1}")
+            os.replace(self._path, f"{self._path}.1")
+        self._file = open(self._path, "wb")
+        self._size = 0
+
+    def _echo(self, data: bytes) -> None:
+        # Write whole lines with a single call, so they are not split by the output of other processes.
+        # Progress bars redraw their line with \r, which ends a line as well. A partial line longer than
+        # CHUNK_SIZE is written as is, rather than held back without bound.
+        data = self._pending + data
+        end = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+        if len(data) - end > CHUNK_SIZE:
+            end = len(data)
+        self._pending = data[end:]
+        if end > 0:
+            os.write(sys.stdout.fileno(), data[:end])
+
+    def write(self, data: bytes) -> None:
+        with self._lock:
+            max_bytes = self._settings.max_bytes
+            if max_bytes is not None and self._size > 0 and self._size + len(data) > max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+            if not self._settings.quiet:
+                self._echo(data)
+
+    def write_message(self, message: str) -> None:
+        """
+        Write a message of agbench itself to the log, and echo it to the console even in quiet mode.
+        """
+        data = message.encode("utf-8")
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+            if self._settings.quiet:
+                os.write(sys.stdout.fileno(), data)
+            else:
+                self._echo(data)
+
+    def pump(self, chunks: Iterable[bytes]) -> None:
+        """
+        Write chunks of output until they are exhausted.
+        """
+        for chunk in chunks:
+            self.write(chunk)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pending:
+                os.write(sys.stdout.fileno(), self._pending)
+                self._pending = b""
+            self._file.close()
+
+    def __enter__(self) -> "ConsoleLog":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -1,5 +1,6 @@
 import argparse
 import errno
+import functools
 import json
 import logging
 import os
@@ -10,6 +11,7 @@
 import stat
 import subprocess
 import sys
+import threading
 import time
 import traceback
 from multiprocessing import Pool
@@ -22,6 +24,7 @@
 from docker.errors import APIError, DockerException, ImageNotFound
 from typing_extensions import TypedDict
 
+from .log_stream import CHUNK_SIZE, ConsoleLog, LogSettings
 from .version import __version__
 
 # Figure out where everything is
@@ -66,6 +69,8 @@ def run_scenarios(
     results_dir: str = "Results",
     subsample: Union[None, int, float] = None,
     env_file: Union[None, str] = None,
+    rerun_incomplete: bool = False,
+    log_settings: Optional[LogSettings] = None,
 ) -> None:
     """
     Run a set agbench scenarios a given number of times.
@@ -76,62 +81,15 @@ def run_scenarios(
         n_repeats (int):    The number of times each scenario instance will be repeated
         is_native (bool):   True if the scenario should be run locally rather than in Docker (proceed with caution!)
         results_dir (path): The folder were results will be saved.
+        rerun_incomplete (bool): True if the results of runs that did not complete should be deleted and run again.
+        log_settings (LogSettings): how the console output of the runs is logged.
     """
 
-    files: List[str] = []
-
-    # Figure out which files or folders we are working with
-    if scenario == "-" or os.path.isfile(scenario):
-        files.append(scenario)
-    elif os.path.isdir(scenario):
-        for f in os.listdir(scenario):
-            scenario_file = os.path.join(scenario, f)
-
-            if not os.path.isfile(scenario_file):
-                continue
-
-            if not scenario_file.lower().endswith(".jsonl"):
-                continue
-
-            files.append(scenario_file)
-    else:
-        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), scenario)
-
     # Run all the scenario files
-    for scenario_file in files:
-        scenario_name: Optional[str] = None
-        scenario_dir: Optional[str] = None
-        file_handle = None
-
-        # stdin
-        if scenario_file == "-":
-            scenario_name = "stdin"
-            scenario_dir = "."
-            file_handle = sys.stdin
-        else:
-            scenario_name_parts = os.path.basename(scenario_file).split(".")
-            scenario_name_parts.pop()
-            scenario_name = ".".join(scenario_name_parts)
-            scenario_dir = os.path.dirname(os.path.realpath(scenario_file))
-            file_handle = open(scenario_file, "rt")
-
-        # Read all the lines, then subsample if needed
-        lines = [line for line in file_handle]
-        if subsample is not None:
-            # How many lines are we sampling
-            n = 0
-            # It's a proportion
-            if 0 <= subsample < 1:
-                n = int(len(lines) * subsample + 0.5)
-            # It's a raw count
-            else:
-                n = int(subsample)
-            n = max(0, min(n, len(lines)))
-            lines = subsample_rng.sample(lines, n)
-
-        for line in lines:
-            instance = json.loads(line)
+    for scenario_file in get_scenario_files(scenario):
+        scenario_name, scenario_dir, instances = read_scenario_file(scenario_file, subsample)
 
+        for instance in instances:
             # Create a folder to store the results
             # Results base
             if not os.path.isdir(results_dir):
@@ -152,8 +110,7 @@ def run_scenarios(
                 results_repetition = os.path.join(results_instance, str(i))
 
                 # Skip it if it already exists
-                if os.path.isdir(results_repetition):
-                    print(f"Found folder {results_repetition} ... Skipping.")
+                if not prepare_results_folder(results_repetition, rerun_incomplete):
                     continue
                 print(f"Running scenario {results_repetition}")
 
@@ -165,17 +122,110 @@ def run_scenarios(
 
                 # Run the scenario
                 if is_native:
-                    run_scenario_natively(results_repetition, env)
+                    run_scenario_natively(results_repetition, env, log_settings=log_settings)
                 else:
                     run_scenario_in_docker(
                         results_repetition,
                         env,
                         docker_image=docker_image,
+                        log_settings=log_settings,
                     )
 
-        # Close regular files
-        if scenario_file != "-":
-            file_handle.close()
+
+def get_scenario_files(scenario: str) -> List[str]:
+    """
+    Get the scenario JSONL files to run: the given file, '-' for stdin, or all JSONL files of the given folder.
+    """
+    files: List[str] = []
+
+    # Figure out which files or folders we are working with
+    if scenario == "-" or os.path.isfile(scenario):
+        files.append(scenario)
+    elif os.path.isdir(scenario):
+        for f in os.listdir(scenario):
+            scenario_file = os.path.join(scenario, f)
+
+            if not os.path.isfile(scenario_file):
+                continue
+
+            if not scenario_file.lower().endswith(".jsonl"):
+                continue
+
+            files.append(scenario_file)
+    else:
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), scenario)
+
+    return files
+
+
+def read_scenario_file(
+    scenario_file: str, subsample: Union[None, int, float] = None
+) -> Tuple[str, str, List[ScenarioInstance]]:
+    """
+    Read the instances of a scenario file, subsampling them if needed.
+
+    Returns:
+        The name of the scenario, the folder its templates are relative to, and its instances.
+    """
+    # stdin
+    if scenario_file == "-":
+        scenario_name = "stdin"
+        scenario_dir = "."
+        lines = [line for line in sys.stdin]
+    else:
+        scenario_name_parts = os.path.basename(scenario_file).split(".")
+        scenario_name_parts.pop()
+        scenario_name = ".".join(scenario_name_parts)
+        scenario_dir = os.path.dirname(os.path.realpath(scenario_file))
+        with open(scenario_file, "rt") as fh:
+            lines = [line for line in fh]
+
+    # Subsample if needed
+    if subsample is not None:
+        # How many lines are we sampling
+        n = 0
+        # It's a proportion
+        if 0 <= subsample < 1:
+            n = int(len(lines) * subsample + 0.5)
+        # It's a raw count
+        else:
+            n = int(subsample)
+        n = max(0, min(n, len(lines)))
+        lines = subsample_rng.sample(lines, n)
+
+    return scenario_name, scenario_dir, [json.loads(line) for line in lines]
+
+
+def is_run_complete(results_repetition: str) -> bool:
+    """
+    Check whether the run stored in a results folder completed, rather than being interrupted.
+    """
+    console_log = os.path.join(results_repetition, "console_log.txt")
+    if not os.path.isfile(console_log):
+        return False
+    # The marker is printed at the very end of run.sh
+    with open(console_log, "rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        fh.seek(max(0, fh.tell() - 4096))
+        return b"RUN.SH COMPLETE !#!#" in fh.read()
+
+
+def prepare_results_folder(results_repetition: str, rerun_incomplete: bool = False) -> bool:
+    """
+    Check whether a run needs to happen, given its results folder. Deletes the folder of an incomplete run
+    if rerun_incomplete is True.
+
+    Returns:
+        True if the run should happen, False if it should be skipped.
+    """
+    if not os.path.isdir(results_repetition):
+        return True
+    if rerun_incomplete and not is_run_complete(results_repetition):
+        print(f"Found incomplete folder {results_repetition} ... Deleting and re-running.")
+        shutil.rmtree(results_repetition)
+        return True
+    print(f"Found folder {results_repetition} ... Skipping.")
+    return False
 
 
 def expand_scenario(
@@ -376,12 +426,15 @@ def replace_in_list(lst: List[Any]) -> None:
         replace_in_list(cast(List[Any], json_data))  # type: ignore
 
 
-def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TASK_TIMEOUT) -> None:
+def run_scenario_natively(
+    work_dir: str, env: Dict[str, str], timeout: int = TASK_TIMEOUT, log_settings: Optional[LogSettings] = None
+) -> None:
     """
     Run a scenario in the native environment.
 
     Args:
         work_dir (path): the path to the working directory previously created to house this sceario instance
+        log_settings (LogSettings): how the console output is logged (default: echoed, and never rotated)
     """
 
     # Get the current working directory
@@ -463,16 +516,17 @@ def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TAS
         )
 
     # Run the script and log the output
-    with open("console_log.txt", "wb") as f:
+    with ConsoleLog("console_log.txt", log_settings) as log:
         process = subprocess.Popen(
             ["sh", "run.sh"],
             env=full_env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
         )
-        for c in iter(lambda: process.stdout.read(1), b""):  # type: ignore
-            f.write(c)
-            os.write(sys.stdout.fileno(), c)  # Write binary to stdout
+        assert process.stdout is not None
+        # read1 returns whatever output is available, up to CHUNK_SIZE, without waiting for a full chunk
+        log.pump(iter(lambda: process.stdout.read1(CHUNK_SIZE), b""))  # type: ignore
+        process.wait()
 
     # Return where we started
     os.chdir(cwd)
@@ -480,7 +534,11 @@ def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TAS
 
 
 def run_scenario_in_docker(
-    work_dir: str, env: Dict[str, str], timeout: int = TASK_TIMEOUT, docker_image: Optional[str] = None
+    work_dir: str,
+    env: Dict[str, str],
+    timeout: int = TASK_TIMEOUT,
+    docker_image: Optional[str] = None,
+    log_settings: Optional[LogSettings] = None,
 ) -> None:
     """
     Run a scenario in a Docker environment.
@@ -488,6 +546,7 @@ def run_scenario_in_docker(
     Args:
         work_dir (path): the path to the working directory previously created to house this sceario instance
         timeout (Optional, int): the number of seconds to allow a Docker container to run before timing out
+        log_settings (LogSettings): how the console output is logged (default: echoed, and never rotated)
     """
 
     client = docker.from_env()
@@ -637,25 +696,28 @@ def run_scenario_in_docker(
         network="host",  # Use the host network to avoid issues with localhost.
     )
 
-    # Read the logs in a streaming fashion. Keep an eye on the time to make sure we don't need to stop.
+    # Read the logs in a streaming fashion, on a separate thread. Keep an eye on the time to make sure we don't need to stop.
     docker_timeout: float = timeout + 60  # One full minute after the bash timeout command should have already triggered
     start_time = time.time()
     logs = container.logs(stream=True)
-    log_file = open(os.path.join(work_dir, "console_log.txt"), "wt", encoding="utf-8")
+    log = ConsoleLog(os.path.join(work_dir, "console_log.txt"), log_settings)
+    pump_errors: List[BaseException] = []
+
+    def pump_logs() -> None:
+        try:
+            log.pump(logs)
+        except BaseException as e:
+            # Re-raised below once the container is cleaned up, rather than ending the run with a truncated log.
+            pump_errors.append(e)
+
+    pump = threading.Thread(target=pump_logs, daemon=True)
+    pump.start()
     stopping = False
     exiting = False
 
-    while True:
+    while pump.is_alive():
         try:
-            chunk = next(logs)  # Manually step the iterator so it is captures with the try-catch
-
-            # Stream the data to the log file and the console
-            chunk_str = chunk.decode("utf-8")
-            log_file.write(chunk_str)
-            log_file.flush()
-            sys.stdout.reconfigure(encoding="utf-8")  # type: ignore
-            sys.stdout.write(chunk_str)
-            sys.stdout.flush()
+            pump.join(timeout=1)
 
             # Check if we need to terminate
             if not stopping and time.time() - start_time >= docker_timeout:
@@ -665,29 +727,33 @@ def run_scenario_in_docker(
                 # but remember how we got here.
                 stopping = True
         except KeyboardInterrupt:
-            log_file.write("\nKeyboard interrupt (Ctrl-C). Attempting to exit gracefully.\n")
-            log_file.flush()
-            sys.stdout.write("\nKeyboard interrupt (Ctrl-C). Attempting to exit gracefully.\n")
-            sys.stdout.flush()
+            log.write_message("\nKeyboard interrupt (Ctrl-C). Attempting to exit gracefully.\n")
 
             # Start the exit process, and give it a minute, but keep iterating
             container.stop()
             exiting = True
             docker_timeout = time.time() - start_time + 60
-        except StopIteration:
-            break
 
     # Clean up the container
+    if pump_errors:
+        # The container may still be running, as its logs were not read to the end.
+        try:
+            container.stop()
+        except APIError:
+            pass
     try:
         container.remove()
     except APIError:
         pass
 
+    if pump_errors:
+        log.write_message(f"\nReading the container logs failed: {pump_errors[0]!r}\n")
+        log.close()
+        raise pump_errors[0]
+
     if stopping:  # By this line we've exited the loop, and the container has actually stopped.
-        log_file.write("\nDocker timed out.\n")
-        log_file.flush()
-        sys.stdout.write("\nDocker timed out.\n")
-        sys.stdout.flush()
+        log.write_message("\nDocker timed out.\n")
+    log.close()
 
     if exiting:  # User hit ctrl-C
         sys.exit(1)
@@ -733,18 +799,6 @@ def find_autogen_repo(path: str) -> Optional[str]:
     return None
 
 
-def split_jsonl(file_path: str, num_parts: int) -> List[List[Dict[str, Any]]]:
-    """
-    Split a JSONL file into num_parts approximately equal parts.
-    """
-    with open(file_path, "r") as f:
-        data = [json.loads(line) for line in f]
-
-    random.shuffle(data)  # Shuffle the data for better distribution
-    chunk_size = len(data) // num_parts
-    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
-
-
 def mkdir_p(path: str) -> None:
     """
     Create a directory if it doesn't exist, handling race conditions.
@@ -756,92 +810,131 @@ def mkdir_p(path: str) -> None:
             raise
 
 
-def run_scenarios_subset(
-    scenario_name: str,
-    scenarios: List[Dict[str, Any]],
-    n_repeats: int,
+class ScenarioUnit(TypedDict):
+    scenario_dir: str
+    instance: ScenarioInstance
+    results_repetition: str
+
+
+def run_scenario_unit(
+    unit: ScenarioUnit,
     is_native: bool,
     config_file: Union[None, str],
     docker_image: Optional[str] = None,
-    results_dir: str = "Results",
-    subsample: Union[None, int, float] = None,
     env_file: Union[None, str] = None,
-) -> None:
+    log_settings: Optional[LogSettings] = None,
+) -> Tuple[str, Optional[str]]:
     """
-    Run a subset of agbench scenarios a given number of times.
+    Run one repetition of a scenario instance in a worker process.
+
+    Returns:
+        The results folder of the run, and the error that stopped it, if any.
     """
-    for instance in scenarios:
-        # Create a folder to store the results
-        # Results base
+    results_repetition = unit["results_repetition"]
+    try:
+        print(f"Running scenario {results_repetition}")
 
-        mkdir_p(results_dir)
+        # Expand the scenario
+        expand_scenario(unit["scenario_dir"], unit["instance"], results_repetition, config_file)
 
-        # Results for the scenario
+        # Prepare the environment (keys/values that need to be added)
+        env = get_scenario_env(env_file=env_file)
 
-        results_scenario = os.path.join(results_dir, scenario_name)
-        mkdir_p(results_scenario)
+        # Run the scenario
+        if is_native:
+            run_scenario_natively(results_repetition, env, log_settings=log_settings)
+        else:
+            run_scenario_in_docker(
+                results_repetition,
+                env,
+                docker_image=docker_image,
+                log_settings=log_settings,
+            )
+    except Exception:
+        return results_repetition, traceback.format_exc()
+    return results_repetition, None
 
-        # Results for the instance
-        results_instance = os.path.join(results_scenario, instance["id"])
-        mkdir_p(results_instance)
 
-        # Results for the repeats
-        for i in range(0, n_repeats):
-            results_repetition = os.path.join(results_instance, str(i))
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
 
-            # Skip it if it already exists
-            if os.path.isdir(results_repetition):
-                print(f"Found folder {results_repetition} ... Skipping.")
-                continue
-            print(f"Running scenario {results_repetition}")
 
-            # Expand the scenario
-            expand_scenario(".", instance, results_repetition, config_file)  # type: ignore
+def run_parallel(
+    scenario: str,
+    n_repeats: int,
+    n_workers: int,
+    is_native: bool,
+    config_file: Union[None, str],
+    docker_image: Optional[str] = None,
+    results_dir: str = "Results",
+    subsample: Union[None, int, float] = None,
+    env_file: Union[None, str] = None,
+    rerun_incomplete: bool = False,
+    log_settings: Optional[LogSettings] = None,
+) -> None:
+    """
+    Run a set agbench scenarios a given number of times, with n_workers worker processes.
 
-            # Prepare the environment (keys/values that need to be added)
-            env = get_scenario_env(env_file=env_file)
+    Each repetition of each instance is a unit of work, handed to the next worker that is free, so a slow
+    instance only holds up its own worker. Units whose results folder already exists are skipped, so an
+    interrupted run can be resumed by running the same command again.
 
-            # Run the scenario
-            if is_native:
-                run_scenario_natively(results_repetition, env)
-            else:
-                run_scenario_in_docker(
-                    results_repetition,
-                    env,
-                    docker_image=docker_image,
-                )
+    Args:
+        See run_scenarios.
+        n_workers (int):    The number of worker processes.
+    """
+    units: List[ScenarioUnit] = []
+    for scenario_file in get_scenario_files(scenario):
+        scenario_name, scenario_dir, instances = read_scenario_file(scenario_file, subsample)
 
+        # Repetitions are scheduled round by round, so that early results cover as many instances as possible
+        for i in range(0, n_repeats):
+            for instance in instances:
+                results_instance = os.path.join(results_dir, scenario_name, instance["id"])
+                mkdir_p(results_instance)
 
-def run_parallel(args: argparse.Namespace) -> None:
-    """
-    Run scenarios in parallel.
-    """
-    # Read and split the JSONL file
-    scenarios = split_jsonl(args.scenario, args.parallel)
-    scenario_name_parts = os.path.basename(args.scenario).split(".")
-    scenario_name_parts.pop()
-    scenario_name = ".".join(scenario_name_parts)
-
-    # Create a pool of worker processes
-    with Pool(processes=args.parallel) as pool:
-        # Prepare arguments for each worker
-        worker_args = [
-            (
-                scenario_name,
-                scenario_subset,
-                args.repeat,
-                args.native,
-                args.config,
-                args.docker_image,
-                "Results",
-                args.subsample,
-                args.env,
+                results_repetition = os.path.join(results_instance, str(i))
+                if prepare_results_folder(results_repetition, rerun_incomplete):
+                    units.append(
+                        ScenarioUnit(
+                            scenario_dir=scenario_dir, instance=instance, results_repetition=results_repetition
+                        )
+                    )
+
+    total = len(units)
+    print(f"Running {total} scenario runs with {n_workers} parallel workers.")
+    if total == 0:
+        return
+
+    worker = functools.partial(
+        run_scenario_unit,
+        is_native=is_native,
+        config_file=config_file,
+        docker_image=docker_image,
+        env_file=env_file,
+        log_settings=log_settings,
+    )
+
+    failed: List[str] = []
+    start_time = time.time()
+    with Pool(processes=n_workers) as pool:
+        # chunksize=1 makes each worker fetch a new unit as soon as it finishes the previous one
+        for finished, (results_repetition, error) in enumerate(pool.imap_unordered(worker, units, chunksize=1), 1):
+            if error is not None:
+                failed.append(results_repetition)
+                print(f"Scenario {results_repetition} failed:\n{error}")
+
+            elapsed = time.time() - start_time
+            eta = elapsed / finished * (total - finished)
+            print(
+                f"Progress: {finished}/{total} runs finished ({len(failed)} failed). "
+                f"Elapsed: {format_duration(elapsed)}, ETA: {format_duration(eta)}"
             )
-            for scenario_subset in scenarios
-        ]
 
-        # Run scenarios in parallel
-        pool.starmap(run_scenarios_subset, worker_args)
+    if failed:
+        print(f"{len(failed)} runs failed:\n" + "\n".join(failed))
 
 
 def get_azure_token_provider() -> Optional[Callable[[], str]]:
@@ -898,9 +991,14 @@ def run_cli(args: Sequence[str]) -> None:
         "-p",
         "--parallel",
         type=int,
-        help="The number of parallel processes to run (default: 1).",
+        help="The number of parallel processes to run (default: 1). Runs are handed out one at a time to the processes as they become free.",
         default=1,
     )
+    parser.add_argument(
+        "--rerun-incomplete",
+        action="store_true",
+        help="Delete and re-run the results of runs that did not complete, for example because a previous invocation was interrupted. By default, all runs with an existing results folder are skipped.",
+    )
     parser.add_argument(
         "-a",
         "--azure",
@@ -932,6 +1030,24 @@ def run_cli(args: Sequence[str]) -> None:
         + "', which will be created if not present)",
         default=None,
     )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Do not echo the output of the runs to the console. It is still written to each run's console_log.txt.",
+    )
+    parser.add_argument(
+        "--log-max-bytes",
+        type=int,
+        help="Rotate each run's console_log.txt when it reaches this many bytes (default: never rotate).",
+        default=None,
+    )
+    parser.add_argument(
+        "--log-backups",
+        type=int,
+        help="The number of rotated logs to keep per run, as console_log.txt.1, console_log.txt.2, etc. Older output is discarded, which caps the log size of a run to (LOG_BACKUPS + 1) * LOG_MAX_BYTES. (default: 0)",
+        default=0,
+    )
     parser.add_argument(
         "--native",
         action="store_true",
@@ -945,10 +1061,6 @@ def run_cli(args: Sequence[str]) -> None:
         with open(parsed_args.config, "r"):
             pass
 
-    # don't support parallel and subsample together
-    if parsed_args.parallel > 1 and parsed_args.subsample is not None:
-        sys.exit("The options --parallel and --subsample can not be used together currently. Exiting.")
-
     # Don't allow both --docker-image and --native on the same command
     if parsed_args.docker_image is not None and parsed_args.native:
         sys.exit("The options --native and --docker-image can not be used together. Exiting.")
@@ -990,6 +1102,12 @@ def run_cli(args: Sequence[str]) -> None:
                     )
                 )
 
+    if parsed_args.log_max_bytes is not None and parsed_args.log_max_bytes <= 0:
+        sys.exit("The option --log-max-bytes must be a positive number of bytes. Exiting.")
+    log_settings = LogSettings(
+        quiet=parsed_args.quiet, max_bytes=parsed_args.log_max_bytes, backup_count=max(0, parsed_args.log_backups)
+    )
+
     # Get the Azure bearer token generator if a token wasn't provided and there's any evidence of using Azure
     azure_token_provider = None
     if parsed_args.azure:
@@ -997,7 +1115,18 @@ def run_cli(args: Sequence[str]) -> None:
 
     # Run the scenario
     if parsed_args.parallel > 1:
-        run_parallel(parsed_args)
+        run_parallel(
+            scenario=parsed_args.scenario,
+            n_repeats=parsed_args.repeat,
+            n_workers=parsed_args.parallel,
+            is_native=True if parsed_args.native else False,
+            config_file=parsed_args.config,
+            docker_image=parsed_args.docker_image,
+            subsample=subsample,
+            env_file=parsed_args.env,
+            rerun_incomplete=parsed_args.rerun_incomplete,
+            log_settings=log_settings,
+        )
     else:
         run_scenarios(
             scenario=parsed_args.scenario,
@@ -1008,4 +1137,6 @@ def run_cli(args: Sequence[str]) -> None:
             docker_image=parsed_args.docker_image,
             subsample=subsample,
             env_file=parsed_args.env,
+            rerun_incomplete=parsed_args.rerun_incomplete,
+            log_settings=log_settings,
         )
@@ -1,8 +1,11 @@
 import argparse
+import json
 import os
+import pickle
 import re
 import sys
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import tabulate as tb
@@ -28,6 +31,13 @@
 
 TIMER_REGEX = r"RUNTIME:\s*([\d.]+) !#!#"
 
+# The success, completion and timer markers are printed at the end of a run, so only the end of the log is scanned
+LOG_TAIL_BYTES = 1024 * 1024
+
+# The scores of the instances, kept in the run logs folder so that only changed instances are scored again
+INDEX_FILE = ".agbench_tabulate_index.json"
+INDEX_VERSION = 1
+
 
 def find_tabulate_module(search_dir: str, stop_dir: Optional[str] = None) -> Optional[str]:
     """Hunt for the tabulate script."""
@@ -65,24 +75,31 @@ def find_tabulate_module(search_dir: str, stop_dir: Optional[str] = None) -> Opt
     return None
 
 
+def read_log_tail(path: str, max_bytes: int = LOG_TAIL_BYTES) -> str:
+    """Read the last max_bytes of a log file."""
+    with open(path, "rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        fh.seek(max(0, fh.tell() - max_bytes))
+        return fh.read().decode("utf-8", errors="replace")
+
+
 def default_scorer(instance_dir: str, success_strings: List[str] = SUCCESS_STRINGS) -> Optional[bool]:
     console_log = os.path.join(instance_dir, "console_log.txt")
     if os.path.isfile(console_log):
-        with open(console_log, "rt") as fh:
-            content = fh.read()
+        content = read_log_tail(console_log)
 
-            # It succeeded
-            for s in success_strings:
-                if s in content:
-                    return True
+        # It succeeded
+        for s in success_strings:
+            if s in content:
+                return True
 
-            # It completed without succeeding
-            for s in COMPLETED_STRINGS:
-                if s in content:
-                    return False
+        # It completed without succeeding
+        for s in COMPLETED_STRINGS:
+            if s in content:
+                return False
 
-            # Has not, or did not, complete
-            return None
+        # Has not, or did not, complete
+        return None
     else:
         return None
 
@@ -90,15 +107,14 @@ def default_scorer(instance_dir: str, success_strings: List[str] = SUCCESS_STRIN
 def default_timer(instance_dir: str, timer_regex: str = TIMER_REGEX) -> Optional[float]:
     console_log = os.path.join(instance_dir, "console_log.txt")
     if os.path.isfile(console_log):
-        with open(console_log, "rt") as fh:
-            content = fh.read()
+        content = read_log_tail(console_log)
 
-            # It succeeded
-            m = re.search(timer_regex, content)
-            if m:
-                return float(m.group(1))
-            else:
-                return None
+        # It succeeded
+        m = re.search(timer_regex, content)
+        if m:
+            return float(m.group(1))
+        else:
+            return None
     else:
         return None
 
@@ -106,6 +122,99 @@ def default_timer(instance_dir: str, timer_regex: str = TIMER_REGEX) -> Optional
 ScorerFunc = Callable[[str], Optional[bool]]
 TimerFunc = Callable[[str], Optional[float]]
 
+InstanceScore = Tuple[Optional[bool], Optional[float]]
+
+
+def _func_id(func: Callable[..., Any]) -> str:
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if module is None or qualname is None:
+        return repr(func)
+    return f"{module}.{qualname}"
+
+
+def instance_signature(instance_dir: str) -> List[int]:
+    """
+    A signature of the state of an instance: the modification time of its folder, and the modification time and
+    size of its console log. It changes when files are added to, or removed from, the folder, or the log is written.
+    """
+    signature = [os.stat(instance_dir).st_mtime_ns]
+    console_log = os.path.join(instance_dir, "console_log.txt")
+    if os.path.isfile(console_log):
+        st = os.stat(console_log)
+        signature += [st.st_mtime_ns, st.st_size]
+    return signature
+
+
+def load_index(runlogs: str, scorer: ScorerFunc, timer: TimerFunc) -> Dict[str, Any]:
+    """
+    Load the scores of the instances of a previous tabulation of runlogs. The index is discarded when it was
+    written by a different version, scorer, or timer.
+    """
+    path = os.path.join(runlogs, INDEX_FILE)
+    try:
+        with open(path, "rt") as fh:
+            index = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != INDEX_VERSION
+        or index.get("scorer") != _func_id(scorer)
+        or index.get("timer") != _func_id(timer)
+    ):
+        return {}
+    instances = index.get("instances")
+    return instances if isinstance(instances, dict) else {}
+
+
+def save_index(runlogs: str, scorer: ScorerFunc, timer: TimerFunc, instances: Dict[str, Any]) -> None:
+    path = os.path.join(runlogs, INDEX_FILE)
+    index = {"version": INDEX_VERSION, "scorer": _func_id(scorer), "timer": _func_id(timer), "instances": instances}
+    try:
+        with open(path + ".tmp", "wt") as fh:
+            json.dump(index, fh)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        sys.stderr.write(f"Could not save the tabulation index to '{path}': {e}\n")
+
+
+def score_instance(instance_dir: str, scorer: ScorerFunc, timer: TimerFunc) -> InstanceScore:
+    return scorer(instance_dir), timer(instance_dir)
+
+
+def score_instances(
+    instance_dirs: List[str], scorer: ScorerFunc, timer: TimerFunc, n_workers: int
+) -> List[InstanceScore]:
+    """
+    Score the instances, in a pool of n_workers processes when there are enough of them to be worth it.
+    Falls back to scoring them in this process when the scorer or timer cannot be sent to the workers, for
+    example when they are defined in a custom_tabulate.py that the workers cannot import.
+    """
+    if n_workers > 1 and len(instance_dirs) > 1:
+        try:
+            pickle.dumps((scorer, timer))
+        except Exception:
+            n_workers = 1
+    if n_workers <= 1 or len(instance_dirs) <= 1:
+        return [score_instance(d, scorer, timer) for d in instance_dirs]
+
+    n_workers = min(n_workers, len(instance_dirs))
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            return list(
+                pool.map(
+                    score_instance,
+                    instance_dirs,
+                    [scorer] * len(instance_dirs),
+                    [timer] * len(instance_dirs),
+                    chunksize=max(1, len(instance_dirs) // (n_workers * 4)),
+                )
+            )
+    except Exception as e:
+        sys.stderr.write(f"Scoring in parallel failed ({e}), scoring serially.\n")
+        return [score_instance(d, scorer, timer) for d in instance_dirs]
+
 
 def default_tabulate(
     args: List[str],
@@ -139,9 +248,27 @@ def default_tabulate(
         "-e", "--excel", help="Output the results in Excel format. Please specify a path for the Excel file.", type=str
     )
 
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="The number of processes that score the instances in parallel. (default: the number of CPUs)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Score every instance again, instead of only those that changed since the last tabulation (the scores are kept in '{INDEX_FILE}' in the run logs folder).",
+    )
+
     parsed_args = parser.parse_args(args)
     runlogs: str = parsed_args.runlogs
 
+    index = {} if parsed_args.no_cache else load_index(runlogs, scorer, timer)
+    new_index: Dict[str, Any] = {}
+    pending: List[Tuple[str, List[int]]] = []
+
     all_results: List[Dict[str, Any]] = list()
     max_instances = 0
 
@@ -168,15 +295,37 @@ def default_tabulate(
         instances = [int(d) for d in instance_dirs if d.isdigit()]
 
         for instance in instances:
-            instance_dir = os.path.join(task_path, str(instance))
-            results[f"Trial {instance} Success"] = scorer(instance_dir)
-            results[f"Trial {instance} Time"] = timer(instance_dir)
+            key = f"{task_id}/{instance}"
+            signature = instance_signature(os.path.join(task_path, str(instance)))
+            entry = index.get(key)
+            if isinstance(entry, dict) and entry.get("signature") == signature:
+                new_index[key] = entry
+            else:
+                # Score it below, with the other instances that changed
+                pending.append((key, signature))
+                new_index[key] = {"signature": signature}
 
         max_instances = max(instances)
 
         # Buffer the results
         all_results.append(results)
 
+    # Score the new and changed instances
+    scores = score_instances(
+        [os.path.join(runlogs, key) for key, _ in pending], scorer, timer, n_workers=parsed_args.workers
+    )
+    for (key, _), (success, elapsed) in zip(pending, scores):
+        new_index[key].update(success=success, time=elapsed)
+
+    results_by_task = {results["Task Id"]: results for results in all_results}
+    for key, entry in new_index.items():
+        task_id, trial = key.rsplit("/", 1)
+        results_by_task[task_id][f"Trial {trial} Success"] = entry["success"]
+        results_by_task[task_id][f"Trial {trial} Time"] = entry["time"]
+
+    if new_index != index:
+        save_index(runlogs, scorer, timer, new_index)
+
     num_instances = max_instances + 1
 
     # Pad the results to max_instances
@@ -31,6 +31,7 @@
     BaseAgentEvent,
     BaseChatMessage,
     CodeExecutionEvent,
+    CodeExecutionStreamingChunkEvent,
     CodeGenerationEvent,
     HandoffMessage,
     ModelClientStreamingChunkEvent,
@@ -55,6 +56,7 @@ class CodeExecutorAgentConfig(BaseModel):
     model_client_stream: bool = False
     model_context: ComponentModel | None = None
     supported_languages: List[str] | None = None
+    code_executor_stream: bool = False
 
 
 class RetryDecision(BaseModel):
@@ -113,6 +115,12 @@ class CodeExecutorAgent(BaseChatAgent, Component[CodeExecutorAgentConfig]):
             If the code execution fails after this number of retries, the agent will yield a reflection result.
         supported_languages (List[str], optional): List of programming languages that will be parsed and executed from agent response;
             others will be ignored. Defaults to DEFAULT_SUPPORTED_LANGUAGES.
+        code_executor_stream (bool, optional): If `True`, the code is executed with
+            :meth:`~autogen_core.code_executor.CodeExecutor.execute_code_blocks_stream`, and
+            :meth:`on_messages_stream` and :meth:`BaseChatAgent.run_stream` methods will
+            also yield :class:`~autogen_agentchat.messages.CodeExecutionStreamingChunkEvent`
+            messages as the code produces output. Subclasses customize the streamed execution by
+            overriding :meth:`execute_code_block_stream`. Defaults to `False`.
 
 
     .. note::
@@ -350,6 +358,7 @@ def __init__(
         system_message: str | None = DEFAULT_SYSTEM_MESSAGE,
         sources: Sequence[str] | None = None,
         supported_languages: List[str] | None = None,
+        code_executor_stream: bool = False,
     ) -> None:
         if description is None:
             if model_client is None:
@@ -362,6 +371,7 @@ def __init__(
         self._sources = sources
         self._model_client_stream = model_client_stream
         self._max_retries_on_error = max_retries_on_error
+        self._code_executor_stream = code_executor_stream
 
         if supported_languages is not None:
             self._supported_languages = supported_languages
@@ -436,7 +446,12 @@ async def on_messages_stream(
                     )
                 )
                 return
-            execution_result = await self.execute_code_block(code_blocks, cancellation_token)
+            async for execution_output in self._execute_code_block_stream(code_blocks, 0, cancellation_token):
+                if isinstance(execution_output, CodeResult):
+                    execution_result = execution_output
+                else:
+                    yield execution_output
+            assert execution_result is not None, "No code execution result was produced."
             yield Response(chat_message=TextMessage(content=execution_result.output, source=self.name))
             return
 
@@ -507,7 +522,16 @@ async def on_messages_stream(
             yield inferred_text_message
 
             # Step 8: Execute the extracted code blocks
-            execution_result = await self.execute_code_block(inferred_text_message.code_blocks, cancellation_token)
+            execution_result = None
+            async for execution_output in self._execute_code_block_stream(
+                inferred_text_message.code_blocks, nth_try, cancellation_token
+            ):
+                if isinstance(execution_output, CodeResult):
+                    execution_result = execution_output
+                else:
+                    # Streaming chunk event
+                    yield execution_output
+            assert execution_result is not None, "No code execution result was produced."
 
             # Step 9: Update model context with the code execution result
             await model_context.add_message(
@@ -586,7 +610,41 @@ async def execute_code_block(
     ) -> CodeResult:
         # Execute the code blocks.
         result = await self._code_executor.execute_code_blocks(code_blocks, cancellation_token=cancellation_token)
+        return self._format_code_result(result)
+
+    async def execute_code_block_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[str | CodeResult, None]:
+        """Execute the code blocks with :meth:`~autogen_core.code_executor.CodeExecutor.execute_code_blocks_stream`,
+        yielding chunks of output as the code produces them and then the :class:`~autogen_core.code_executor.CodeResult`.
 
+        Used instead of :meth:`execute_code_block` when `code_executor_stream` is enabled. A subclass that
+        overrides :meth:`execute_code_block` but not this method has its override called instead, without streaming.
+        """
+        async for item in self._code_executor.execute_code_blocks_stream(code_blocks, cancellation_token):
+            if isinstance(item, CodeResult):
+                yield self._format_code_result(item)
+            else:
+                yield item
+
+    async def _execute_code_block_stream(
+        self, code_blocks: List[CodeBlock], retry_attempt: int, cancellation_token: CancellationToken
+    ) -> AsyncGenerator[CodeExecutionStreamingChunkEvent | CodeResult, None]:
+        """Execute the code blocks, yielding output chunk events if streaming is enabled, and then the result."""
+        agent_class = type(self)
+        overrides_execute = agent_class.execute_code_block is not CodeExecutorAgent.execute_code_block
+        overrides_stream = agent_class.execute_code_block_stream is not CodeExecutorAgent.execute_code_block_stream
+        if not self._code_executor_stream or (overrides_execute and not overrides_stream):
+            yield await self.execute_code_block(code_blocks, cancellation_token)
+            return
+        async for item in self.execute_code_block_stream(code_blocks, cancellation_token):
+            if isinstance(item, CodeResult):
+                yield item
+            else:
+                yield CodeExecutionStreamingChunkEvent(retry_attempt=retry_attempt, content=item, source=self.name)
+
+    @staticmethod
+    def _format_code_result(result: CodeResult) -> CodeResult:
         if result.output.strip() == "":
             # No output
             result.output = f"The script ran but produced no output to console. The POSIX exit code was: {result.exit_code}. If you were expecting output, consider revising the script to ensure content is printed to stdout."
@@ -625,6 +683,7 @@ def _to_config(self) -> CodeExecutorAgentConfig:
             model_client_stream=self._model_client_stream,
             model_context=self._model_context.dump_component(),
             supported_languages=self._supported_languages,
+            code_executor_stream=self._code_executor_stream,
         )
 
     @classmethod
@@ -641,6 +700,7 @@ def _from_config(cls, config: CodeExecutorAgentConfig) -> Self:
             model_client_stream=config.model_client_stream,
             model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
             supported_languages=config.supported_languages,
+            code_executor_stream=config.code_executor_stream,
         )
 
     @staticmethod
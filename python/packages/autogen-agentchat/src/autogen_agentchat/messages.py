@@ -478,6 +478,21 @@ def to_text(self) -> str:
         return self.result.output
 
 
+class CodeExecutionStreamingChunkEvent(BaseAgentEvent):
+    """An event signaling a chunk of output from code that is being executed."""
+
+    retry_attempt: int
+    "Retry number, 0 means first execution"
+
+    content: str
+    """A string chunk of the output of the code execution."""
+
+    type: Literal["CodeExecutionStreamingChunkEvent"] = "CodeExecutionStreamingChunkEvent"
+
+    def to_text(self) -> str:
+        return self.content
+
+
 class ToolCallExecutionEvent(BaseAgentEvent):
     """An event signaling the execution of tool calls."""
 
@@ -592,6 +607,7 @@ def __init__(self) -> None:
         self._message_types[SelectSpeakerEvent.__name__] = SelectSpeakerEvent
         self._message_types[CodeGenerationEvent.__name__] = CodeGenerationEvent
         self._message_types[CodeExecutionEvent.__name__] = CodeExecutionEvent
+        self._message_types[CodeExecutionStreamingChunkEvent.__name__] = CodeExecutionStreamingChunkEvent
 
     def is_registered(self, message_type: type[BaseAgentEvent | BaseChatMessage]) -> bool:
         """Check if a message type is registered with the factory."""
@@ -647,7 +663,8 @@ def create(self, data: Mapping[str, Any]) -> BaseAgentEvent | BaseChatMessage:
     | ThoughtEvent
     | SelectSpeakerEvent
     | CodeGenerationEvent
-    | CodeExecutionEvent,
+    | CodeExecutionEvent
+    | CodeExecutionStreamingChunkEvent,
     Field(discriminator="type"),
 ]
 """The union type of all built-in concrete subclasses of :class:`BaseAgentEvent`."""
@@ -677,4 +694,5 @@ def create(self, data: Mapping[str, Any]) -> BaseAgentEvent | BaseChatMessage:
     "MessageFactory",
     "CodeGenerationEvent",
     "CodeExecutionEvent",
+    "CodeExecutionStreamingChunkEvent",
 ]
@@ -13,6 +13,7 @@
 from autogen_agentchat.messages import (
     BaseAgentEvent,
     BaseChatMessage,
+    CodeExecutionStreamingChunkEvent,
     ModelClientStreamingChunkEvent,
     MultiModalMessage,
     UserInputRequestedEvent,
@@ -176,7 +177,7 @@ async def Console(
                 await aprint(
                     f"{'-' * 10} {message.__class__.__name__} ({message.source}) {'-' * 10}", end="\n", flush=True
                 )
-            if isinstance(message, ModelClientStreamingChunkEvent):
+            if isinstance(message, (ModelClientStreamingChunkEvent, CodeExecutionStreamingChunkEvent)):
                 await aprint(message.to_text(), end="", flush=True)
                 streaming_chunks.append(message.content)
             else:
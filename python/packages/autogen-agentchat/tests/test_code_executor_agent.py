@@ -1,12 +1,16 @@
+from typing import List
+
 import pytest
 from autogen_agentchat.agents import CodeExecutorAgent
 from autogen_agentchat.base import Response
 from autogen_agentchat.messages import (
     CodeExecutionEvent,
+    CodeExecutionStreamingChunkEvent,
     CodeGenerationEvent,
     TextMessage,
 )
 from autogen_core import CancellationToken
+from autogen_core.code_executor import CodeBlock, CodeResult
 from autogen_core.models import ModelFamily, ModelInfo
 from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
 from autogen_ext.models.replay import ReplayChatCompletionClient
@@ -399,6 +403,72 @@ async def test_code_execution_multiple_blocks() -> None:
     assert "ValueError: math domain error" in response.chat_message.content
 
 
+@pytest.mark.asyncio
+async def test_code_execution_streaming() -> None:
+    """Test that the output of the code is streamed while it runs"""
+
+    agent = CodeExecutorAgent(
+        name="code_executor", code_executor=LocalCommandLineCodeExecutor(), code_executor_stream=True
+    )
+
+    messages = [
+        TextMessage(
+            content="""
+```python
+import time
+
+print("first", flush=True)
+time.sleep(0.5)
+print("second", flush=True)
+```
+""".strip(),
+            source="assistant",
+        )
+    ]
+    chunks: list[str] = []
+    response: Response | None = None
+    async for message in agent.on_messages_stream(messages, CancellationToken()):
+        if isinstance(message, CodeExecutionStreamingChunkEvent):
+            assert message.source == "code_executor"
+            chunks.append(message.content)
+        else:
+            assert isinstance(message, Response)
+            response = message
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == "first\nsecond\n"
+    assert response is not None
+    assert isinstance(response.chat_message, TextMessage)
+    assert response.chat_message.content == "first\nsecond\n"
+
+
+class PrefixingCodeExecutorAgent(CodeExecutorAgent):
+    async def execute_code_block(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> CodeResult:
+        result = await super().execute_code_block(code_blocks, cancellation_token)
+        return CodeResult(exit_code=result.exit_code, output="overridden: " + result.output)
+
+
+@pytest.mark.asyncio
+async def test_code_execution_streaming_execute_code_block_override() -> None:
+    """Test that streaming falls back to an overridden execute_code_block"""
+
+    agent = PrefixingCodeExecutorAgent(
+        name="code_executor", code_executor=LocalCommandLineCodeExecutor(), code_executor_stream=True
+    )
+    messages = [TextMessage(content="```python\nprint('hello')\n```", source="assistant")]
+    response: Response | None = None
+    async for message in agent.on_messages_stream(messages, CancellationToken()):
+        assert not isinstance(message, CodeExecutionStreamingChunkEvent)
+        if isinstance(message, Response):
+            response = message
+
+    assert response is not None
+    assert isinstance(response.chat_message, TextMessage)
+    assert response.chat_message.content == "overridden: hello\n"
+
+
 @pytest.mark.asyncio
 async def test_code_execution_agent_serialization() -> None:
     """Test agent config serialization"""
@@ -0,0 +1,91 @@
+"""Benchmark for publish throughput of :class:`~autogen_core.SingleThreadedAgentRuntime`.
+
+Publishes a large message to a topic with many subscribers and reports messages per second
+with event logging disabled and with a handler attached to the ``EVENT_LOGGER_NAME`` logger.
+
+Run with:
+
+.. code-block:: bash
+
+    python benchmarks/runtime_publish.py
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import TextIO
+
+from autogen_core import (
+    EVENT_LOGGER_NAME,
+    DefaultTopicId,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    TypeSubscription,
+    message_handler,
+    try_get_known_serializers_for_type,
+)
+
+
+@dataclass
+class LargeMessage:
+    content: str
+
+
+class SinkAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("A sink agent.")
+
+    @message_handler
+    async def on_message(self, message: LargeMessage, ctx: MessageContext) -> None:
+        pass
+
+
+async def run(num_agents: int, num_messages: int, message_size: int) -> float:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.add_message_serializer(try_get_known_serializers_for_type(LargeMessage))
+    for i in range(num_agents):
+        await SinkAgent.register(runtime, f"sink_{i}", SinkAgent, skip_class_subscriptions=True)
+        await runtime.add_subscription(TypeSubscription("default", f"sink_{i}"))
+
+    message = LargeMessage(content="x" * message_size)
+    runtime.start()
+    start = time.perf_counter()
+    for _ in range(num_messages):
+        await runtime.publish_message(message, topic_id=DefaultTopicId())
+    await runtime.stop_when_idle()
+    elapsed = time.perf_counter() - start
+    await runtime.close()
+    return num_messages / elapsed
+
+
+async def main(num_agents: int, num_messages: int, message_size: int, log_stream: TextIO) -> None:
+    event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+    off = await run(num_agents, num_messages, message_size)
+
+    handler = logging.StreamHandler(log_stream)
+    event_logger.addHandler(handler)
+    event_logger.setLevel(logging.INFO)
+    try:
+        on = await run(num_agents, num_messages, message_size)
+    finally:
+        event_logger.removeHandler(handler)
+        event_logger.setLevel(logging.NOTSET)
+
+    print(f"{num_agents} subscribers, {message_size} byte message")  # noqa: T201
+    print(f"event logging off: {off:10.1f} publishes/s")  # noqa: T201
+    print(f"event logging on:  {on:10.1f} publishes/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--message-size", type=int, default=100_000)
+    args = parser.parse_args()
+    # The events are formatted and written to a stream, as with a real handler, but discarded.
+    with open(os.devnull, "w") as devnull:
+        asyncio.run(main(args.agents, args.messages, args.message_size, devnull))
@@ -0,0 +1,64 @@
+"""Benchmark for :class:`autogen_core._runtime_impl_helpers.SubscriptionManager`.
+
+Registers an increasing number of session-scoped :class:`~autogen_core.TypeSubscription` instances
+(plus a handful of :class:`~autogen_core.TypePrefixSubscription` instances) and reports the average
+cost of adding a subscription and of resolving the recipients of a topic, both uncached and cached.
+
+Run with:
+
+.. code-block:: bash
+
+    python benchmarks/subscription_manager.py
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from autogen_core import TopicId, TypePrefixSubscription, TypeSubscription
+from autogen_core._runtime_impl_helpers import SubscriptionManager
+
+
+async def run(num_subscriptions: int, num_lookups: int) -> List[float]:
+    manager = SubscriptionManager()
+    for i in range(10):
+        await manager.add_subscription(TypePrefixSubscription(f"session-{i}", "observer"))
+
+    start = time.perf_counter()
+    for i in range(num_subscriptions):
+        await manager.add_subscription(TypeSubscription(f"session-{i}", "assistant"))
+    add_cost = (time.perf_counter() - start) / num_subscriptions
+
+    rng = random.Random(0)
+    # Distinct sources so that the first pass never hits the recipient cache.
+    topics = [TopicId(f"session-{rng.randrange(num_subscriptions)}", f"source-{i}") for i in range(num_lookups)]
+
+    start = time.perf_counter()
+    for topic in topics:
+        await manager.get_subscribed_recipients(topic)
+    lookup_cost = (time.perf_counter() - start) / num_lookups
+
+    start = time.perf_counter()
+    for topic in topics:
+        await manager.get_subscribed_recipients(topic)
+    cached_lookup_cost = (time.perf_counter() - start) / num_lookups
+    return [add_cost, lookup_cost, cached_lookup_cost]
+
+
+async def main(sizes: List[int], num_lookups: int) -> None:
+    print(f"{'subscriptions':>14} {'add (us)':>10} {'lookup (us)':>12} {'cached (us)':>12}")  # noqa: T201
+    for size in sizes:
+        add_cost, lookup_cost, cached_lookup_cost = await run(size, num_lookups)
+        print(  # noqa: T201
+            f"{size:>14} {add_cost * 1e6:>10.2f} {lookup_cost * 1e6:>12.2f} {cached_lookup_cost * 1e6:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.lookups))
@@ -6,11 +6,12 @@
 from ._agent_id import AgentId
 from ._agent_instantiation import AgentInstantiationContext
 from ._agent_metadata import AgentMetadata
+from ._agent_passivation import AgentPassivationPolicy
 from ._agent_proxy import AgentProxy
 from ._agent_runtime import AgentRuntime
 from ._agent_type import AgentType
 from ._base_agent import BaseAgent
-from ._cache_store import CacheStore, InMemoryStore
+from ._cache_store import AsyncCacheStore, CacheStore, InMemoryStore
 from ._cancellation_token import CancellationToken
 from ._closure_agent import ClosureAgent, ClosureContext
 from ._component_config import (
@@ -89,9 +90,11 @@
     "AgentId",
     "AgentProxy",
     "AgentMetadata",
+    "AgentPassivationPolicy",
     "AgentRuntime",
     "BaseAgent",
     "CacheStore",
+    "AsyncCacheStore",
     "InMemoryStore",
     "CancellationToken",
     "AgentInstantiationContext",
@@ -0,0 +1,55 @@
+from typing import Any, Mapping
+
+from ._cache_store import CacheStore, InMemoryStore
+
+
+class AgentPassivationPolicy:
+    """Policy for passivating idle agents in an agent runtime.
+
+    A passivated agent has its state saved with :meth:`~autogen_core.Agent.save_state` into `state_store`,
+    is closed and is dropped from memory. The next message for the agent creates a new instance through the
+    agent factory and restores its state with :meth:`~autogen_core.Agent.load_state` before the message is delivered.
+
+    Agents are passivated when they have not received a message for `idle_timeout` seconds, or when more than
+    `max_resident_agents` agents are in memory, least recently used first. Agents that are handling a message,
+    and agents registered with :meth:`~autogen_core.AgentRuntime.register_agent_instance`, are never passivated.
+
+    Idle agents are checked for every `sweep_interval` seconds while the runtime is running, and whenever the
+    runtime instantiates or rehydrates an agent. The saved state of an agent is deleted from `state_store` once the
+    agent is rehydrated, if the store implements :meth:`~autogen_core.CacheStore.delete`.
+
+    Args:
+        max_resident_agents (int, optional): Maximum number of agents kept in memory. Defaults to None, meaning no limit.
+        idle_timeout (float, optional): Number of seconds after which an idle agent is passivated. Defaults to None, meaning agents are not passivated based on idle time.
+        state_store (CacheStore[Mapping[str, Any]], optional): Store for the state of passivated agents, keyed by the string form of the agent ID. Defaults to an :class:`~autogen_core.InMemoryStore`.
+        sweep_interval (float, optional): Number of seconds between periodic checks for idle agents. Only used when `idle_timeout` is set. Defaults to 1.0.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_core import AgentPassivationPolicy, SingleThreadedAgentRuntime
+
+            runtime = SingleThreadedAgentRuntime(
+                passivation_policy=AgentPassivationPolicy(max_resident_agents=1000, idle_timeout=600),
+            )
+    """
+
+    def __init__(
+        self,
+        *,
+        max_resident_agents: int | None = None,
+        idle_timeout: float | None = None,
+        state_store: CacheStore[Mapping[str, Any]] | None = None,
+        sweep_interval: float = 1.0,
+    ) -> None:
+        if max_resident_agents is not None and max_resident_agents < 1:
+            raise ValueError("max_resident_agents must be at least 1")
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError("idle_timeout must be non-negative")
+        if sweep_interval <= 0:
+            raise ValueError("sweep_interval must be positive")
+        self.max_resident_agents = max_resident_agents
+        self.idle_timeout = idle_timeout
+        self.state_store: CacheStore[Mapping[str, Any]] = state_store or InMemoryStore[Mapping[str, Any]]()
+        self.sweep_interval = sweep_interval
@@ -1,5 +1,11 @@
+import pickle
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, Optional, TypeVar
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, Literal, Mapping, Optional, TypeVar, cast
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -44,27 +50,311 @@ def set(self, key: str, value: T) -> None:
         """
         ...
 
+    def delete(self, key: str) -> None:
+        """
+        Remove an item from the store. Does nothing if the key is not found.
+
+        Stores that do not support removal raise :class:`NotImplementedError`, which is the default.
+
+        Args:
+            key: The key identifying the item in the store.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support delete")
+
+
+class AsyncCacheStore(ABC, Generic[T], ComponentBase[BaseModel]):
+    """
+    The asynchronous counterpart of :class:`CacheStore`, for stores whose
+    operations perform I/O and should not block the event loop.
+
+    Sub-classes should handle the lifecycle of underlying storage.
+    """
+
+    component_type = "cache_store"
+
+    @abstractmethod
+    async def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        """
+        Retrieve an item from the store.
+
+        Args:
+            key: The key identifying the item in the store.
+            default (optional): The default value to return if the key is not found.
+                                Defaults to None.
+
+        Returns:
+            The value associated with the key if found, else the default value.
+        """
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: T) -> None:
+        """
+        Set an item in the store.
+
+        Args:
+            key: The key under which the item is to be stored.
+            value: The value to be stored in the store.
+        """
+        ...
+
 
 class InMemoryStoreConfig(BaseModel):
-    pass
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+    ttl: Optional[float] = None
+    eviction_policy: Literal["lru", "lfu"] = "lru"
+    serialize: bool = False
+
+
+@dataclass(slots=True)
+class _InMemoryStoreEntry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+    frequency: int = 1
 
 
 class InMemoryStore(CacheStore[T], Component[InMemoryStoreConfig]):
+    """
+    A :class:`CacheStore` that keeps items in process memory.
+
+    By default the store is unbounded. Setting `max_entries` and/or `max_bytes` turns it
+    into a bounded cache that evicts the least recently used (``"lru"``) or least frequently
+    used (``"lfu"``) items when a budget is exceeded, and `ttl` expires items a fixed number
+    of seconds after they were set.
+
+    The size of an item is the length of its pickled form. Sizes are only computed when
+    `max_bytes` is set or `serialize` is enabled. With `serialize`, items are kept in their
+    pickled form, which is usually more compact than the live objects, and every
+    :meth:`get` returns a fresh copy. Values must then be picklable.
+
+    The store is safe to use from multiple threads.
+
+    Args:
+        max_entries (int, optional): Maximum number of items kept. Defaults to None, meaning no limit.
+        max_bytes (int, optional): Maximum total size of the items kept, in bytes. Items larger than this are not stored. Defaults to None, meaning no limit.
+        ttl (float, optional): Number of seconds after which an item expires. Defaults to None, meaning items do not expire.
+        eviction_policy (str, optional): Either ``"lru"`` or ``"lfu"``. Defaults to ``"lru"``.
+        serialize (bool, optional): Whether to keep items in pickled form. Defaults to False.
+        clock (Callable[[], float], optional): Source of the current time for `ttl`. Defaults to :func:`time.monotonic`.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_core import InMemoryStore
+
+            store = InMemoryStore[str](max_entries=1000, max_bytes=64 * 1024 * 1024, ttl=3600)
+            store.set("key", "value")
+            assert store.get("key") == "value"
+            assert store.hits == 1
+    """
+
     component_provider_override = "autogen_core.InMemoryStore"
     component_config_schema = InMemoryStoreConfig
 
-    def __init__(self) -> None:
-        self.store: Dict[str, T] = {}
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        eviction_policy: Literal["lru", "lfu"] = "lru",
+        serialize: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if eviction_policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._eviction_policy = eviction_policy
+        self._serialize = serialize
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Ordered from least to most recently used.
+        self._entries: OrderedDict[str, _InMemoryStoreEntry] = OrderedDict()
+        # Ordered from earliest to latest expiry, only maintained when ttl is set.
+        self._expiry_order: OrderedDict[str, None] = OrderedDict()
+        # Keys by access frequency, each ordered from least to most recently used, only maintained for lfu.
+        self._frequencies: Dict[int, OrderedDict[str, None]] = {}
+        self._min_frequency = 0
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of :meth:`get` calls that found an item."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of :meth:`get` calls that did not find an item, including expired ones."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of items removed to stay within `max_entries` or `max_bytes`."""
+        return self._evictions
+
+    @property
+    def expirations(self) -> int:
+        """Number of items removed because their `ttl` elapsed."""
+        return self._expirations
+
+    @property
+    def entry_count(self) -> int:
+        """Number of items currently kept, including expired items that have not been removed yet."""
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the items currently kept. Always 0 unless `max_bytes` or `serialize` is set."""
+        return self._total_bytes
+
+    @property
+    def store(self) -> Mapping[str, T]:
+        """A read-only snapshot of the items currently kept, for inspection.
+
+        Reading it does not count as hits or misses, nor as a use of the items for eviction.
+        The store used to be a plain dict in this attribute; use :meth:`set` to add items."""
+        with self._lock:
+            self._remove_expired()
+            values = {key: entry.value for key, entry in self._entries.items()}
+        if self._serialize:
+            values = {key: pickle.loads(value) for key, value in values.items()}
+        return MappingProxyType(cast(Dict[str, T], values))
 
     def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
-        return self.store.get(key, default)
+        with self._lock:
+            self._remove_expired()
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._entries.move_to_end(key)
+            if self._eviction_policy == "lfu":
+                self._bump_frequency(key, entry)
+            value = entry.value
+        if self._serialize:
+            return cast(T, pickle.loads(value))
+        return cast(T, value)
 
     def set(self, key: str, value: T) -> None:
-        self.store[key] = value
+        stored: Any = value
+        size = 0
+        if self._serialize or self._max_bytes is not None:
+            serialized = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            size = len(serialized)
+            if self._serialize:
+                stored = serialized
+        with self._lock:
+            self._remove_expired()
+            if key in self._entries:
+                self._remove(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                return
+            expires_at = self._clock() + self._ttl if self._ttl is not None else None
+            self._entries[key] = _InMemoryStoreEntry(stored, size, expires_at)
+            self._total_bytes += size
+            if self._ttl is not None:
+                self._expiry_order[key] = None
+            if self._eviction_policy == "lfu":
+                self._frequencies.setdefault(1, OrderedDict())[key] = None
+                self._min_frequency = 1
+            self._evict(exclude=key)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _bump_frequency(self, key: str, entry: _InMemoryStoreEntry) -> None:
+        bucket = self._frequencies[entry.frequency]
+        del bucket[key]
+        if not bucket:
+            del self._frequencies[entry.frequency]
+            if self._min_frequency == entry.frequency:
+                self._min_frequency = entry.frequency + 1
+        entry.frequency += 1
+        self._frequencies.setdefault(entry.frequency, OrderedDict())[key] = None
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+        self._expiry_order.pop(key, None)
+        if self._eviction_policy == "lfu":
+            bucket = self._frequencies[entry.frequency]
+            del bucket[key]
+            if not bucket:
+                del self._frequencies[entry.frequency]
+                if self._min_frequency == entry.frequency and self._frequencies:
+                    self._min_frequency = min(self._frequencies)
+
+    def _remove_expired(self) -> None:
+        if self._ttl is None:
+            return
+        now = self._clock()
+        while self._expiry_order:
+            key = next(iter(self._expiry_order))
+            expires_at = self._entries[key].expires_at
+            assert expires_at is not None
+            if expires_at > now:
+                break
+            self._remove(key)
+            self._expirations += 1
+
+    def _over_budget(self) -> bool:
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        return self._max_bytes is not None and self._total_bytes > self._max_bytes
+
+    def _evict(self, exclude: str) -> None:
+        while self._over_budget():
+            self._remove(self._select_victim(exclude))
+            self._evictions += 1
+
+    def _select_victim(self, exclude: str) -> str:
+        if self._eviction_policy == "lru":
+            # The item that was just set is the most recently used, and the only item if nothing else is left,
+            # in which case the store would not be over budget.
+            return next(iter(self._entries))
+        # The item that was just set has the lowest frequency; never evict it in favor of older items.
+        for key in self._frequencies[self._min_frequency]:
+            if key != exclude:
+                return key
+        for frequency in sorted(self._frequencies):
+            for key in self._frequencies[frequency]:
+                if key != exclude:
+                    return key
+        raise RuntimeError("No item left to evict")
 
     def _to_config(self) -> InMemoryStoreConfig:
-        return InMemoryStoreConfig()
+        return InMemoryStoreConfig(
+            max_entries=self._max_entries,
+            max_bytes=self._max_bytes,
+            ttl=self._ttl,
+            eviction_policy=self._eviction_policy,
+            serialize=self._serialize,
+        )
 
     @classmethod
     def _from_config(cls, config: InMemoryStoreConfig) -> Self:
-        return cls()
+        return cls(
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            ttl=config.ttl,
+            eviction_policy=config.eviction_policy,
+            serialize=config.serialize,
+        )
@@ -1,11 +1,20 @@
-from collections import defaultdict
-from typing import Awaitable, Callable, DefaultDict, List, Sequence, Set
+import asyncio
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, DefaultDict, Dict, List, Mapping, Sequence, Set, Tuple
 
 from ._agent import Agent
 from ._agent_id import AgentId
+from ._agent_passivation import AgentPassivationPolicy
 from ._agent_type import AgentType
 from ._subscription import Subscription
 from ._topic import TopicId
+from ._type_prefix_subscription import TypePrefixSubscription
+from ._type_subscription import TypeSubscription
+
+logger = logging.getLogger("autogen_core")
 
 
 async def get_impl(
@@ -29,50 +38,407 @@ async def get_impl(
     return id
 
 
-class SubscriptionManager:
+class _PrefixTrieNode:
+    __slots__ = ("children", "subscriptions")
+
     def __init__(self) -> None:
-        self._subscriptions: List[Subscription] = []
-        self._seen_topics: Set[TopicId] = set()
-        self._subscribed_recipients: DefaultDict[TopicId, List[AgentId]] = defaultdict(list)
+        self.children: Dict[str, _PrefixTrieNode] = {}
+        self.subscriptions: Dict[int, Subscription] = {}
+
+
+def _is_exact_type_subscription(subscription: Subscription) -> bool:
+    # Only index subscriptions whose matching behavior is known. Subclasses that override
+    # matching are treated like any other custom subscription.
+    return (
+        isinstance(subscription, TypeSubscription)
+        and type(subscription).is_match is TypeSubscription.is_match
+        and type(subscription).map_to_agent is TypeSubscription.map_to_agent
+    )
+
+
+def _is_prefix_type_subscription(subscription: Subscription) -> bool:
+    return (
+        isinstance(subscription, TypePrefixSubscription)
+        and type(subscription).is_match is TypePrefixSubscription.is_match
+        and type(subscription).map_to_agent is TypePrefixSubscription.map_to_agent
+    )
+
+
+class SubscriptionManager:
+    """Routes topics to subscribed recipients.
+
+    :class:`~autogen_core.TypeSubscription` instances are indexed by exact topic type in a hash map and
+    :class:`~autogen_core.TypePrefixSubscription` instances are indexed in a trie keyed by the prefix,
+    so the cost of resolving a topic does not depend on the total number of subscriptions.
+    Any other :class:`~autogen_core.Subscription` implementation is matched by calling
+    :meth:`~autogen_core.Subscription.is_match`.
+
+    Resolved recipients are cached per topic in an LRU cache of at most `max_cached_topics` entries.
+    Adding or removing a subscription only invalidates the cached topics it can match.
+
+    Args:
+        max_cached_topics (int, optional): Maximum number of topics whose recipients are cached. Defaults to 10000.
+    """
+
+    def __init__(self, max_cached_topics: int = 10000) -> None:
+        if max_cached_topics < 1:
+            raise ValueError("max_cached_topics must be at least 1")
+        self._max_cached_topics = max_cached_topics
+        self._next_seq = 0
+        # All subscriptions keyed by a monotonically increasing sequence number, in registration order.
+        self._subscriptions: Dict[int, Subscription] = {}
+        self._seqs_by_id: DefaultDict[str, List[int]] = defaultdict(list)
+        # Indexes.
+        self._exact: DefaultDict[str, Dict[int, Subscription]] = defaultdict(dict)
+        self._prefix_root = _PrefixTrieNode()
+        self._unindexed: Dict[int, Subscription] = {}
+        # (kind, topic type or prefix, agent type) of indexed subscriptions, used for deduplication.
+        self._structural_keys: Dict[Tuple[str, str, str], int] = {}
+        # Recipient cache.
+        self._subscribed_recipients: OrderedDict[TopicId, List[AgentId]] = OrderedDict()
+        self._cached_topics_by_type: DefaultDict[str, Set[TopicId]] = defaultdict(set)
 
     @property
     def subscriptions(self) -> Sequence[Subscription]:
-        return self._subscriptions
+        return list(self._subscriptions.values())
 
     async def add_subscription(self, subscription: Subscription) -> None:
         # Check if the subscription already exists
-        if any(sub == subscription for sub in self._subscriptions):
+        if self._contains(subscription):
             raise ValueError("Subscription already exists")
 
-        self._subscriptions.append(subscription)
-        self._rebuild_subscriptions(self._seen_topics)
+        seq = self._next_seq
+        self._next_seq += 1
+        self._subscriptions[seq] = subscription
+        self._seqs_by_id[subscription.id].append(seq)
+        self._index(seq, subscription)
+        self._invalidate(subscription)
 
     async def remove_subscription(self, id: str) -> None:
         # Check if the subscription exists
-        if not any(sub.id == id for sub in self._subscriptions):
+        seqs = self._seqs_by_id.pop(id, None)
+        if not seqs:
             raise ValueError("Subscription does not exist")
 
-        def is_not_sub(x: Subscription) -> bool:
-            return x.id != id
+        for seq in seqs:
+            subscription = self._subscriptions.pop(seq)
+            self._unindex(seq, subscription)
+            self._invalidate(subscription)
+
+    async def get_subscribed_recipients(self, topic: TopicId) -> List[AgentId]:
+        recipients = self._subscribed_recipients.get(topic)
+        if recipients is not None:
+            self._subscribed_recipients.move_to_end(topic)
+            return recipients
 
-        self._subscriptions = list(filter(is_not_sub, self._subscriptions))
+        recipients = [subscription.map_to_agent(topic) for subscription in self._match(topic)]
+        self._subscribed_recipients[topic] = recipients
+        self._cached_topics_by_type[topic.type].add(topic)
+        if len(self._subscribed_recipients) > self._max_cached_topics:
+            evicted, _ = self._subscribed_recipients.popitem(last=False)
+            self._discard_cached_topic_type(evicted)
+        return recipients
 
-        # Rebuild the subscriptions
-        self._rebuild_subscriptions(self._seen_topics)
+    def _contains(self, subscription: Subscription) -> bool:
+        if any(existing == subscription for existing in self._by_id(subscription.id)):
+            return True
+        key = self._structural_key(subscription)
+        if key is not None:
+            if key in self._structural_keys:
+                return True
+            # Custom subscriptions may define equality against indexed ones.
+            return any(existing == subscription for existing in self._unindexed.values())
+        return any(existing == subscription for existing in self._subscriptions.values())
 
-    async def get_subscribed_recipients(self, topic: TopicId) -> List[AgentId]:
-        if topic not in self._seen_topics:
-            self._build_for_new_topic(topic)
-        return self._subscribed_recipients[topic]
-
-    # TODO: optimize this...
-    def _rebuild_subscriptions(self, topics: Set[TopicId]) -> None:
-        self._subscribed_recipients.clear()
-        for topic in topics:
-            self._build_for_new_topic(topic)
-
-    def _build_for_new_topic(self, topic: TopicId) -> None:
-        self._seen_topics.add(topic)
-        for subscription in self._subscriptions:
+    def _by_id(self, id: str) -> List[Subscription]:
+        seqs = self._seqs_by_id.get(id)
+        if not seqs:
+            return []
+        return [self._subscriptions[seq] for seq in seqs]
+
+    @staticmethod
+    def _structural_key(subscription: Subscription) -> Tuple[str, str, str] | None:
+        if _is_exact_type_subscription(subscription):
+            assert isinstance(subscription, TypeSubscription)
+            return ("type", subscription.topic_type, subscription.agent_type)
+        if _is_prefix_type_subscription(subscription):
+            assert isinstance(subscription, TypePrefixSubscription)
+            return ("prefix", subscription.topic_type_prefix, subscription.agent_type)
+        return None
+
+    def _index(self, seq: int, subscription: Subscription) -> None:
+        key = self._structural_key(subscription)
+        if key is None:
+            self._unindexed[seq] = subscription
+            return
+        self._structural_keys.setdefault(key, seq)
+        kind, topic_type, _ = key
+        if kind == "type":
+            self._exact[topic_type][seq] = subscription
+        else:
+            node = self._prefix_root
+            for char in topic_type:
+                node = node.children.setdefault(char, _PrefixTrieNode())
+            node.subscriptions[seq] = subscription
+
+    def _unindex(self, seq: int, subscription: Subscription) -> None:
+        key = self._structural_key(subscription)
+        if key is None:
+            del self._unindexed[seq]
+            return
+        if self._structural_keys.get(key) == seq:
+            del self._structural_keys[key]
+        kind, topic_type, _ = key
+        if kind == "type":
+            bucket = self._exact[topic_type]
+            del bucket[seq]
+            if not bucket:
+                del self._exact[topic_type]
+        else:
+            # Walk down recording the path so that empty nodes can be pruned on the way back up.
+            path: List[Tuple[_PrefixTrieNode, str]] = []
+            node = self._prefix_root
+            for char in topic_type:
+                path.append((node, char))
+                node = node.children[char]
+            del node.subscriptions[seq]
+            for parent, char in reversed(path):
+                child = parent.children[char]
+                if child.subscriptions or child.children:
+                    break
+                del parent.children[char]
+
+    def _match(self, topic: TopicId) -> List[Subscription]:
+        matched: List[Tuple[int, Subscription]] = []
+        exact = self._exact.get(topic.type)
+        if exact:
+            matched.extend(exact.items())
+        node = self._prefix_root
+        matched.extend(node.subscriptions.items())
+        for char in topic.type:
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            matched.extend(node.subscriptions.items())
+        for seq, subscription in self._unindexed.items():
             if subscription.is_match(topic):
-                self._subscribed_recipients[topic].append(subscription.map_to_agent(topic))
+                matched.append((seq, subscription))
+        # Preserve registration order across the different indexes.
+        matched.sort(key=lambda item: item[0])
+        return [subscription for _, subscription in matched]
+
+    def _invalidate(self, subscription: Subscription) -> None:
+        if _is_exact_type_subscription(subscription):
+            assert isinstance(subscription, TypeSubscription)
+            affected_types = [subscription.topic_type] if subscription.topic_type in self._cached_topics_by_type else []
+        elif _is_prefix_type_subscription(subscription):
+            assert isinstance(subscription, TypePrefixSubscription)
+            prefix = subscription.topic_type_prefix
+            affected_types = [t for t in self._cached_topics_by_type if t.startswith(prefix)]
+        else:
+            self._subscribed_recipients.clear()
+            self._cached_topics_by_type.clear()
+            return
+
+        for topic_type in affected_types:
+            for topic in self._cached_topics_by_type.pop(topic_type):
+                del self._subscribed_recipients[topic]
+
+    def _discard_cached_topic_type(self, topic: TopicId) -> None:
+        topics = self._cached_topics_by_type.get(topic.type)
+        if topics is None:
+            return
+        topics.discard(topic)
+        if not topics:
+            del self._cached_topics_by_type[topic.type]
+
+
+class AgentPassivationManager:
+    """Tracks agent usage for a runtime and passivates idle agents according to an :class:`~autogen_core.AgentPassivationPolicy`.
+
+    Args:
+        policy (AgentPassivationPolicy): The passivation policy.
+        instantiated_agents (Dict[AgentId, Agent]): The runtime's map of resident agents. It is updated in place.
+        is_evictable (Callable[[AgentId], bool]): Whether the agent can be recreated through its factory.
+        clock (Callable[[], float], optional): Monotonic clock in seconds. Defaults to :func:`time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        policy: AgentPassivationPolicy,
+        instantiated_agents: Dict[AgentId, Agent],
+        is_evictable: Callable[[AgentId], bool],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policy = policy
+        self._agents = instantiated_agents
+        self._is_evictable = is_evictable
+        self._clock = clock
+        # Evictable resident agents, least recently used first.
+        self._last_used: OrderedDict[AgentId, float] = OrderedDict()
+        self._pins: DefaultDict[AgentId, int] = defaultdict(int)
+        self._passivated: Set[AgentId] = set()
+        # Agents that are being passivated or rehydrated.
+        self._transitions: Dict[AgentId, asyncio.Future[None]] = {}
+        self._sweep_task: asyncio.Task[None] | None = None
+        self._sweep_stopped = asyncio.Event()
+
+    @property
+    def resident_count(self) -> int:
+        return len(self._agents)
+
+    @property
+    def passivated_count(self) -> int:
+        return len(self._passivated)
+
+    def passivated_states(self) -> Dict[AgentId, Mapping[str, Any]]:
+        """The stored state of every passivated agent."""
+        states: Dict[AgentId, Mapping[str, Any]] = {}
+        for agent_id in self._passivated:
+            state = self._policy.state_store.get(str(agent_id))
+            if state is not None:
+                states[agent_id] = state
+        return states
+
+    async def get_agent(self, agent_id: AgentId, create: Callable[[AgentId], Awaitable[Agent]]) -> Agent:
+        """Get a resident agent, creating it or rehydrating it from the state store if needed."""
+        agent, created = await self._make_resident(agent_id, create)
+        if created:
+            await self.passivate_idle_agents(keep=agent_id)
+        return agent
+
+    async def _make_resident(
+        self, agent_id: AgentId, create: Callable[[AgentId], Awaitable[Agent]]
+    ) -> Tuple[Agent, bool]:
+        """Get a resident agent and whether it was created. Nothing is awaited between the agent becoming
+        resident and the return, so the caller can pin it before another task gets to passivate it."""
+        while (transition := self._transitions.get(agent_id)) is not None:
+            await asyncio.shield(transition)
+
+        agent = self._agents.get(agent_id)
+        if agent is not None:
+            self._touch(agent_id)
+            return agent, False
+
+        transition = asyncio.get_running_loop().create_future()
+        self._transitions[agent_id] = transition
+        try:
+            agent = await create(agent_id)
+            if agent_id in self._passivated:
+                state = self._policy.state_store.get(str(agent_id))
+                if state is not None:
+                    await agent.load_state(state)
+                self._passivated.discard(agent_id)
+                self._delete_state(agent_id)
+            self._agents[agent_id] = agent
+            self._touch(agent_id)
+        finally:
+            del self._transitions[agent_id]
+            transition.set_result(None)
+        return agent, True
+
+    def start_idle_sweep(self) -> None:
+        """Start passivating idle agents every `sweep_interval` seconds of the policy. Does nothing without an idle timeout."""
+        if self._policy.idle_timeout is None or self._sweep_task is not None:
+            return
+        self._sweep_stopped.clear()
+        self._sweep_task = asyncio.create_task(self._sweep_idle_agents())
+
+    async def stop_idle_sweep(self) -> None:
+        """Stop the periodic sweep, waiting for a passivation in progress to finish."""
+        task = self._sweep_task
+        if task is None:
+            return
+        self._sweep_task = None
+        self._sweep_stopped.set()
+        await task
+
+    async def _sweep_idle_agents(self) -> None:
+        while not self._sweep_stopped.is_set():
+            try:
+                await asyncio.wait_for(self._sweep_stopped.wait(), timeout=self._policy.sweep_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.passivate_idle_agents()
+            except Exception:
+                logger.error("Error passivating idle agents", exc_info=True)
+
+    @asynccontextmanager
+    async def pinned(self, agent_id: AgentId, create: Callable[[AgentId], Awaitable[Agent]]) -> AsyncIterator[Agent]:
+        """Get an agent and prevent it from being passivated until the context exits."""
+        agent, created = await self._make_resident(agent_id, create)
+        # Pin before the eviction pass, as other calls may passivate agents while it awaits.
+        self._pins[agent_id] += 1
+        try:
+            if created:
+                await self.passivate_idle_agents()
+            yield agent
+        finally:
+            self._pins[agent_id] -= 1
+            if self._pins[agent_id] == 0:
+                del self._pins[agent_id]
+            self._touch(agent_id)
+
+    async def passivate_idle_agents(self, keep: AgentId | None = None) -> None:
+        """Passivate agents that exceed the idle timeout or the resident agent limit.
+
+        Args:
+            keep (AgentId, optional): An agent that must stay resident, e.g. because it was just requested.
+        """
+        max_resident = self._policy.max_resident_agents
+        idle_timeout = self._policy.idle_timeout
+        excess = len(self._last_used) - max_resident if max_resident is not None else 0
+        now = self._clock()
+        candidates: List[AgentId] = []
+        for agent_id, last_used in self._last_used.items():
+            expired = idle_timeout is not None and now - last_used >= idle_timeout
+            if not expired and excess <= 0:
+                break
+            if agent_id in self._pins or agent_id == keep:
+                continue
+            candidates.append(agent_id)
+            excess -= 1
+        for agent_id in candidates:
+            await self._passivate(agent_id)
+
+    def _touch(self, agent_id: AgentId) -> None:
+        if agent_id in self._agents and self._is_evictable(agent_id):
+            self._last_used[agent_id] = self._clock()
+            self._last_used.move_to_end(agent_id)
+
+    async def _passivate(self, agent_id: AgentId) -> None:
+        agent = self._agents.pop(agent_id, None)
+        self._last_used.pop(agent_id, None)
+        if agent is None:
+            return
+        transition = asyncio.get_running_loop().create_future()
+        self._transitions[agent_id] = transition
+        try:
+            try:
+                state = await agent.save_state()
+                self._policy.state_store.set(str(agent_id), state)
+            except Exception:
+                # Keep the agent in memory if its state cannot be saved.
+                logger.error("Error saving state of agent %s, not passivating it", agent_id, exc_info=True)
+                self._agents[agent_id] = agent
+                self._touch(agent_id)
+                return
+            self._passivated.add(agent_id)
+            try:
+                await agent.close()
+            except Exception:
+                logger.error("Error closing passivated agent %s", agent_id, exc_info=True)
+        finally:
+            del self._transitions[agent_id]
+            transition.set_result(None)
+
+    def _delete_state(self, agent_id: AgentId) -> None:
+        try:
+            self._policy.state_store.delete(str(agent_id))
+        except NotImplementedError:
+            pass
+        except Exception:
+            logger.error("Error deleting the saved state of rehydrated agent %s", agent_id, exc_info=True)
@@ -8,9 +8,27 @@
 import uuid
 import warnings
 from asyncio import CancelledError, Future, Queue, Task
+from collections import deque
 from collections.abc import Sequence
-from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, ParamSpec, Set, Type, TypeVar, cast
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Mapping,
+    ParamSpec,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from opentelemetry.trace import TracerProvider
 
@@ -33,13 +51,14 @@
 from ._agent_id import AgentId
 from ._agent_instantiation import AgentInstantiationContext
 from ._agent_metadata import AgentMetadata
+from ._agent_passivation import AgentPassivationPolicy
 from ._agent_runtime import AgentRuntime
 from ._agent_type import AgentType
 from ._cancellation_token import CancellationToken
 from ._intervention import DropMessage, InterventionHandler
 from ._message_context import MessageContext
 from ._message_handler_context import MessageHandlerContext
-from ._runtime_impl_helpers import SubscriptionManager, get_impl
+from ._runtime_impl_helpers import AgentPassivationManager, SubscriptionManager, get_impl
 from ._serialization import JSON_DATA_CONTENT_TYPE, MessageSerializer, SerializationRegistry
 from ._subscription import Subscription
 from ._telemetry import EnvelopeMetadata, MessageRuntimeTracingConfig, TraceHelper, get_telemetry_envelope_metadata
@@ -53,6 +72,9 @@
 # This is a workaround to avoid shadowing the built-in `type` function.
 type_func_alias = type
 
+# The runtime whose message handler is running in the current task, used to detect nested sends and publishes.
+_handler_runtime: ContextVar[SingleThreadedAgentRuntime | None] = ContextVar("_handler_runtime", default=None)
+
 
 @dataclass(kw_only=True)
 class PublishMessageEnvelope:
@@ -65,6 +87,9 @@ class PublishMessageEnvelope:
     topic_id: TopicId
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    # Whether the message was sent from inside a message handler of the same runtime.
+    nested: bool = False
+    serialized_message: Tuple[Any, str] | None = field(default=None, init=False, repr=False)
 
 
 @dataclass(kw_only=True)
@@ -79,6 +104,9 @@ class SendMessageEnvelope:
     cancellation_token: CancellationToken
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    # Whether the message was sent from inside a message handler of the same runtime.
+    nested: bool = False
+    serialized_message: Tuple[Any, str] | None = field(default=None, init=False, repr=False)
 
 
 @dataclass(kw_only=True)
@@ -90,6 +118,131 @@ class ResponseMessageEnvelope:
     sender: AgentId
     recipient: AgentId | None
     metadata: EnvelopeMetadata | None = None
+    serialized_message: Tuple[Any, str] | None = field(default=None, init=False, repr=False)
+
+
+MessageEnvelope = PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope
+
+
+def _event_logging_enabled() -> bool:
+    """Whether an INFO record on the event logger would reach any handler.
+
+    Event payloads are only built when this returns True."""
+    return event_logger.isEnabledFor(logging.INFO) and event_logger.hasHandlers()
+
+
+class _MessageQueue:
+    """The runtime message queue with a priority lane.
+
+    :class:`ResponseMessageEnvelope` and nested :class:`SendMessageEnvelope` are queued in the priority lane,
+    which is always dequeued first and never waits for a free slot: `maxsize` only bounds the normal lane.
+    Nested publishes go to the normal lane but do not wait for a free slot either. The normal lane can be
+    paused, in which case only the priority lane is dequeued until it is resumed.
+
+    The interface follows :class:`asyncio.Queue`, including :meth:`shutdown`."""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._maxsize = maxsize
+        self._normal_queue: deque[MessageEnvelope] = deque()
+        self._priority_queue: deque[MessageEnvelope] = deque()
+        self._normal_lane_paused = False
+        self._is_shutdown = False
+        self._unfinished_tasks = 0
+        # Set when an item may have become available to get, or a slot may have become free to put.
+        self._gettable = asyncio.Event()
+        self._puttable = asyncio.Event()
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    @staticmethod
+    def _is_priority(item: MessageEnvelope) -> bool:
+        return isinstance(item, ResponseMessageEnvelope) or (isinstance(item, SendMessageEnvelope) and item.nested)
+
+    @staticmethod
+    def _is_bounded(item: MessageEnvelope) -> bool:
+        return not isinstance(item, ResponseMessageEnvelope) and not item.nested
+
+    def qsize(self) -> int:
+        return len(self._normal_queue) + len(self._priority_queue)
+
+    def empty(self) -> bool:
+        if self._priority_queue:
+            return False
+        return self._normal_lane_paused or not self._normal_queue
+
+    def full(self) -> bool:
+        if self._maxsize <= 0:
+            return False
+        return len(self._normal_queue) >= self._maxsize
+
+    async def put(self, item: MessageEnvelope) -> None:
+        if self._is_bounded(item):
+            while self.full():
+                if self._is_shutdown:
+                    raise QueueShutDown
+                self._puttable.clear()
+                await self._puttable.wait()
+        self.put_nowait(item)
+
+    def put_nowait(self, item: MessageEnvelope) -> None:
+        if self._is_shutdown:
+            raise QueueShutDown
+        if self._is_priority(item):
+            self._priority_queue.append(item)
+        else:
+            if self._is_bounded(item) and self.full():
+                raise asyncio.QueueFull
+            self._normal_queue.append(item)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._gettable.set()
+
+    async def get(self) -> MessageEnvelope:
+        while self.empty():
+            if self._is_shutdown:
+                raise QueueShutDown
+            self._gettable.clear()
+            await self._gettable.wait()
+        if self._priority_queue:
+            return self._priority_queue.popleft()
+        item = self._normal_queue.popleft()
+        self._puttable.set()
+        return item
+
+    def task_done(self) -> None:
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        if self._unfinished_tasks > 0:
+            await self._finished.wait()
+
+    def pause_normal_lane(self) -> None:
+        self._normal_lane_paused = True
+
+    def resume_normal_lane(self) -> None:
+        if self._normal_lane_paused:
+            self._normal_lane_paused = False
+            if self._normal_queue:
+                self._gettable.set()
+
+    def shutdown(self, immediate: bool = False) -> None:
+        """Shut down the queue. Pending and later calls to :meth:`put` raise :class:`QueueShutDown`, and so do
+        calls to :meth:`get` once the queue is empty. An immediate shutdown discards the queued items."""
+        self._is_shutdown = True
+        self._normal_lane_paused = False
+        if immediate:
+            discarded = len(self._normal_queue) + len(self._priority_queue)
+            self._normal_queue.clear()
+            self._priority_queue.clear()
+            self._unfinished_tasks = max(0, self._unfinished_tasks - discarded)
+            if self._unfinished_tasks == 0:
+                self._finished.set()
+        self._gettable.set()
+        self._puttable.set()
 
 
 P = ParamSpec("P")
@@ -101,6 +254,10 @@ def __init__(self, runtime: SingleThreadedAgentRuntime) -> None:
         self._runtime = runtime
         self._run_task = asyncio.create_task(self._run())
         self._stopped = asyncio.Event()
+        # Passivate idle agents periodically while the runtime is running.
+        self._passivation = runtime._passivation  # type: ignore
+        if self._passivation is not None:
+            self._passivation.start_idle_sweep()
 
     async def _run(self) -> None:
         while True:
@@ -109,16 +266,23 @@ async def _run(self) -> None:
 
             await self._runtime._process_next()  # type: ignore
 
+    async def _wait_for_run_task(self) -> None:
+        try:
+            await self._run_task
+        finally:
+            if self._passivation is not None:
+                await self._passivation.stop_idle_sweep()
+
     async def stop(self) -> None:
         self._stopped.set()
         self._runtime._message_queue.shutdown(immediate=True)  # type: ignore
-        await self._run_task
+        await self._wait_for_run_task()
 
     async def stop_when_idle(self) -> None:
         await self._runtime._message_queue.join()  # type: ignore
         self._stopped.set()
         self._runtime._message_queue.shutdown(immediate=True)  # type: ignore
-        await self._run_task
+        await self._wait_for_run_task()
 
     async def stop_when(self, condition: Callable[[], bool], check_period: float = 1.0) -> None:
         async def check_condition() -> None:
@@ -162,6 +326,18 @@ class SingleThreadedAgentRuntime(AgentRuntime):
         tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
             Additionally, you can set environment variable `AUTOGEN_DISABLE_RUNTIME_TRACING` to `true` to disable the agent runtime telemetry if you don't have access to the runtime constructor. For example, if you are using `ComponentConfig`.
         ignore_unhandled_exceptions (bool, optional): Whether to ignore unhandled exceptions in that occur in agent event handlers. Any background exceptions will be raised on the next call to `process_next` or from an awaited `stop`, `stop_when_idle` or `stop_when`. Note, this does not apply to RPC handlers. Defaults to True.
+        max_queue_size (int, optional): The maximum number of published and sent messages waiting in the queue.
+            When the queue is full, :meth:`publish_message` and :meth:`send_message` wait until a slot is free.
+            RPC responses are queued in a separate priority lane that is not bounded and is always processed first.
+            Defaults to 0, meaning the queue is unbounded.
+        passivation_policy (AgentPassivationPolicy, optional): Policy for saving the state of idle agents and dropping them from memory.
+            Passivated agents are recreated through their factory and have their state restored on the next message they receive.
+            Defaults to None, meaning agents stay in memory until the runtime is closed.
+        max_concurrent_handlers (int, optional): The maximum number of publish and send messages being handled concurrently.
+            While the limit is reached, no further publishes or sends are taken from the queue, but RPC responses are still delivered.
+            Messages sent with :meth:`send_message` from inside a message handler are exempt from the limit and from `max_queue_size`,
+            and messages published from inside a message handler never wait for a free queue slot, so handlers that wait on
+            nested calls cannot deadlock the runtime. Defaults to None, meaning no limit.
 
     Examples:
 
@@ -252,9 +428,17 @@ def __init__(
         intervention_handlers: List[InterventionHandler] | None = None,
         tracer_provider: TracerProvider | None = None,
         ignore_unhandled_exceptions: bool = True,
+        max_queue_size: int = 0,
+        max_concurrent_handlers: int | None = None,
+        passivation_policy: AgentPassivationPolicy | None = None,
     ) -> None:
+        if max_concurrent_handlers is not None and max_concurrent_handlers < 1:
+            raise ValueError("max_concurrent_handlers must be at least 1")
         self._tracer_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("SingleThreadedAgentRuntime"))
-        self._message_queue: Queue[PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope] = Queue()
+        self._max_queue_size = max_queue_size
+        self._max_concurrent_handlers = max_concurrent_handlers
+        self._in_flight_messages = 0
+        self._message_queue = self._new_message_queue()
         # (namespace, type) -> List[AgentId]
         self._agent_factories: Dict[
             str, Callable[[], Agent | Awaitable[Agent]] | Callable[[AgentRuntime, AgentId], Agent | Awaitable[Agent]]
@@ -268,6 +452,13 @@ def __init__(
         self._ignore_unhandled_handler_exceptions = ignore_unhandled_exceptions
         self._background_exception: BaseException | None = None
         self._agent_instance_types: Dict[str, Type[Agent]] = {}
+        self._passivation: AgentPassivationManager | None = None
+        if passivation_policy is not None:
+            self._passivation = AgentPassivationManager(
+                passivation_policy,
+                self._instantiated_agents,
+                is_evictable=lambda agent_id: agent_id.type not in self._agent_instance_types,
+            )
 
     @property
     def unprocessed_messages_count(
@@ -275,38 +466,87 @@ def unprocessed_messages_count(
     ) -> int:
         return self._message_queue.qsize()
 
+    @property
+    def in_flight_messages_count(self) -> int:
+        """The number of publish and send messages whose handlers are currently running."""
+        return self._in_flight_messages
+
+    @property
+    def resident_agents_count(self) -> int:
+        """The number of agent instances in memory."""
+        return len(self._instantiated_agents)
+
+    @property
+    def passivated_agents_count(self) -> int:
+        """The number of agents whose state was saved to the passivation state store and that are not in memory."""
+        return self._passivation.passivated_count if self._passivation is not None else 0
+
+    def _new_message_queue(self) -> _MessageQueue:
+        queue = _MessageQueue(self._max_queue_size)
+        if self._max_concurrent_handlers is not None and self._in_flight_messages >= self._max_concurrent_handlers:
+            queue.pause_normal_lane()
+        return queue
+
+    async def _run_handler(self, coro: Coroutine[Any, Any, None]) -> None:
+        # Handler tasks run in a copy of the context, so this does not leak into the caller.
+        _handler_runtime.set(self)
+        await coro
+
+    def _start_handler_task(self, coro: Coroutine[Any, Any, None], counted: bool = True) -> None:
+        task = asyncio.create_task(self._run_handler(coro))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        if not counted:
+            return
+        self._in_flight_messages += 1
+        if self._max_concurrent_handlers is not None and self._in_flight_messages >= self._max_concurrent_handlers:
+            self._message_queue.pause_normal_lane()
+        task.add_done_callback(self._on_handler_task_done)
+
+    def _on_handler_task_done(self, task: Task[Any]) -> None:
+        self._in_flight_messages -= 1
+        if self._max_concurrent_handlers is not None and self._in_flight_messages < self._max_concurrent_handlers:
+            self._message_queue.resume_normal_lane()
+
     @property
     def _known_agent_names(self) -> Set[str]:
         return set(self._agent_factories.keys())
 
-    async def _create_otel_attributes(
+    def _create_otel_attributes(
         self,
         sender_agent_id: AgentId | None = None,
         recipient_agent_id: AgentId | None = None,
         message_context: MessageContext | None = None,
-        message: Any = None,
+        message_envelope: MessageEnvelope | None = None,
     ) -> Mapping[str, str]:
         """Create OpenTelemetry attributes for the given agent and message.
 
+        The agent classes are only included for agents that are resident, so that building the attributes
+        never creates or rehydrates an agent.
+
         Args:
-            sender_agent (Agent, optional): The sender agent instance.
-            recipient_agent (Agent, optional): The recipient agent instance.
-            message (Any): The message instance.
+            sender_agent_id (AgentId, optional): The sender agent.
+            recipient_agent_id (AgentId, optional): The recipient agent.
+            message_context (MessageContext, optional): The context of the message.
+            message_envelope (MessageEnvelope, optional): The envelope of the message.
 
         Returns:
             Attributes: A dictionary of OpenTelemetry attributes.
         """
+        message = message_envelope.message if message_envelope is not None else None
         if not sender_agent_id and not recipient_agent_id and not message:
             return {}
         attributes: Dict[str, str] = {}
         if sender_agent_id:
-            sender_agent = await self._get_agent(sender_agent_id)
-            attributes["sender_agent_type"] = sender_agent.id.type
-            attributes["sender_agent_class"] = sender_agent.__class__.__name__
+            attributes["sender_agent_type"] = sender_agent_id.type
+            sender_agent = self._instantiated_agents.get(sender_agent_id)
+            if sender_agent is not None:
+                attributes["sender_agent_class"] = sender_agent.__class__.__name__
         if recipient_agent_id:
-            recipient_agent = await self._get_agent(recipient_agent_id)
-            attributes["recipient_agent_type"] = recipient_agent.id.type
-            attributes["recipient_agent_class"] = recipient_agent.__class__.__name__
+            attributes["recipient_agent_type"] = recipient_agent_id.type
+            recipient_agent = self._instantiated_agents.get(recipient_agent_id)
+            if recipient_agent is not None:
+                attributes["recipient_agent_class"] = recipient_agent.__class__.__name__
 
         if message_context:
             serialized_message_context = {
@@ -317,9 +557,9 @@ async def _create_otel_attributes(
             }
             attributes["message_context"] = json.dumps(serialized_message_context)
 
-        if message:
+        if message_envelope is not None and message:
             try:
-                serialized_message = self._try_serialize(message)
+                serialized_message = self._serialize_envelope_message(message_envelope)
             except Exception as e:
                 serialized_message = str(e)
         else:
@@ -344,15 +584,18 @@ async def send_message(
         if message_id is None:
             message_id = str(uuid.uuid4())
 
-        event_logger.info(
-            MessageEvent(
-                payload=self._try_serialize(message),
-                sender=sender,
-                receiver=recipient,
-                kind=MessageKind.DIRECT,
-                delivery_stage=DeliveryStage.SEND,
+        payload: str | None = None
+        if _event_logging_enabled():
+            payload = self._try_serialize(message)
+            event_logger.info(
+                MessageEvent(
+                    payload=payload,
+                    sender=sender,
+                    receiver=recipient,
+                    kind=MessageKind.DIRECT,
+                    delivery_stage=DeliveryStage.SEND,
+                )
             )
-        )
 
         with self._tracer_helper.trace_block(
             "create",
@@ -365,20 +608,23 @@ async def send_message(
                 future.set_exception(Exception("Recipient not found"))
                 return await future
 
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info("Sending message of type %s to %s: %s", type(message).__name__, recipient.type, content)
 
-            await self._message_queue.put(
-                SendMessageEnvelope(
-                    message=message,
-                    recipient=recipient,
-                    future=future,
-                    cancellation_token=cancellation_token,
-                    sender=sender,
-                    metadata=get_telemetry_envelope_metadata(),
-                    message_id=message_id,
-                )
+            envelope = SendMessageEnvelope(
+                message=message,
+                recipient=recipient,
+                future=future,
+                cancellation_token=cancellation_token,
+                sender=sender,
+                metadata=get_telemetry_envelope_metadata(),
+                message_id=message_id,
+                nested=_handler_runtime.get() is self,
             )
+            if payload is not None:
+                envelope.serialized_message = (message, payload)
+            await self._message_queue.put(envelope)
 
             cancellation_token.link_future(future)
 
@@ -401,32 +647,34 @@ async def publish_message(
         ):
             if cancellation_token is None:
                 cancellation_token = CancellationToken()
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info("Publishing message of type %s to all subscribers: %s", type(message).__name__, content)
 
             if message_id is None:
                 message_id = str(uuid.uuid4())
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message),
-                    sender=sender,
-                    receiver=topic_id,
-                    kind=MessageKind.PUBLISH,
-                    delivery_stage=DeliveryStage.SEND,
-                )
+            envelope = PublishMessageEnvelope(
+                message=message,
+                cancellation_token=cancellation_token,
+                sender=sender,
+                topic_id=topic_id,
+                metadata=get_telemetry_envelope_metadata(),
+                message_id=message_id,
+                nested=_handler_runtime.get() is self,
             )
-
-            await self._message_queue.put(
-                PublishMessageEnvelope(
-                    message=message,
-                    cancellation_token=cancellation_token,
-                    sender=sender,
-                    topic_id=topic_id,
-                    metadata=get_telemetry_envelope_metadata(),
-                    message_id=message_id,
+            if _event_logging_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._serialize_envelope_message(envelope),
+                        sender=sender,
+                        receiver=topic_id,
+                        kind=MessageKind.PUBLISH,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
+
+            await self._message_queue.put(envelope)
 
     async def save_state(self) -> Mapping[str, Any]:
         """Save the state of all instantiated agents.
@@ -442,8 +690,11 @@ async def save_state(self) -> Mapping[str, Any]:
 
         """
         state: Dict[str, Dict[str, Any]] = {}
-        for agent_id in self._instantiated_agents:
-            state[str(agent_id)] = dict(await (await self._get_agent(agent_id)).save_state())
+        for agent_id in list(self._instantiated_agents):
+            state[str(agent_id)] = dict(await self._instantiated_agents[agent_id].save_state())
+        if self._passivation is not None:
+            for agent_id, agent_state in self._passivation.passivated_states().items():
+                state[str(agent_id)] = dict(agent_state)
         return state
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
@@ -471,87 +722,92 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
                 raise LookupError(f"Agent type '{recipient.type}' does not exist.")
 
             try:
-                sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
                 logger.info(
-                    f"Calling message handler for {recipient} with message type {type(message_envelope.message).__name__} sent by {sender_id}"
+                    "Calling message handler for %s with message type %s sent by %s",
+                    recipient,
+                    type(message_envelope.message).__name__,
+                    message_envelope.sender if message_envelope.sender is not None else "Unknown",
                 )
-                event_logger.info(
-                    MessageEvent(
-                        payload=self._try_serialize(message_envelope.message),
+                if _event_logging_enabled():
+                    event_logger.info(
+                        MessageEvent(
+                            payload=self._serialize_envelope_message(message_envelope),
+                            sender=message_envelope.sender,
+                            receiver=recipient,
+                            kind=MessageKind.DIRECT,
+                            delivery_stage=DeliveryStage.DELIVER,
+                        )
+                    )
+                async with self._agent_in_use(recipient) as recipient_agent:
+                    message_context = MessageContext(
                         sender=message_envelope.sender,
-                        receiver=recipient,
-                        kind=MessageKind.DIRECT,
-                        delivery_stage=DeliveryStage.DELIVER,
+                        topic_id=None,
+                        is_rpc=True,
+                        cancellation_token=message_envelope.cancellation_token,
+                        message_id=message_envelope.message_id,
                     )
-                )
-                recipient_agent = await self._get_agent(recipient)
-
-                message_context = MessageContext(
-                    sender=message_envelope.sender,
-                    topic_id=None,
-                    is_rpc=True,
-                    cancellation_token=message_envelope.cancellation_token,
-                    message_id=message_envelope.message_id,
-                )
-                with self._tracer_helper.trace_block(
-                    "process",
-                    recipient_agent.id,
-                    parent=message_envelope.metadata,
-                    attributes=await self._create_otel_attributes(
-                        sender_agent_id=message_envelope.sender,
-                        recipient_agent_id=recipient,
-                        message_context=message_context,
-                        message=message_envelope.message,
-                    ),
-                ):
-                    with MessageHandlerContext.populate_context(recipient_agent.id):
-                        response = await recipient_agent.on_message(
-                            message_envelope.message,
-                            ctx=message_context,
-                        )
+                    with self._tracer_helper.trace_block(
+                        "process", recipient_agent.id, parent=message_envelope.metadata
+                    ) as span:
+                        if span.is_recording():
+                            span.set_attributes(
+                                self._create_otel_attributes(
+                                    sender_agent_id=message_envelope.sender,
+                                    recipient_agent_id=recipient,
+                                    message_context=message_context,
+                                    message_envelope=message_envelope,
+                                )
+                            )
+                        with MessageHandlerContext.populate_context(recipient_agent.id):
+                            response = await recipient_agent.on_message(
+                                message_envelope.message,
+                                ctx=message_context,
+                            )
             except CancelledError as e:
                 if not message_envelope.future.cancelled():
                     message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if _event_logging_enabled():
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._serialize_envelope_message(message_envelope),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
             except BaseException as e:
                 message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if _event_logging_enabled():
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._serialize_envelope_message(message_envelope),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(response),
-                    sender=message_envelope.recipient,
-                    receiver=message_envelope.sender,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.SEND,
-                )
+            response_envelope = ResponseMessageEnvelope(
+                message=response,
+                future=message_envelope.future,
+                sender=message_envelope.recipient,
+                recipient=message_envelope.sender,
+                metadata=get_telemetry_envelope_metadata(),
             )
-
-            await self._message_queue.put(
-                ResponseMessageEnvelope(
-                    message=response,
-                    future=message_envelope.future,
-                    sender=message_envelope.recipient,
-                    recipient=message_envelope.sender,
-                    metadata=get_telemetry_envelope_metadata(),
+            if _event_logging_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._serialize_envelope_message(response_envelope),
+                        sender=message_envelope.recipient,
+                        receiver=message_envelope.sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
+
+            await self._message_queue.put(response_envelope)
             self._message_queue.task_done()
 
     async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> None:
@@ -559,69 +815,75 @@ async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> No
             try:
                 responses: List[Awaitable[Any]] = []
                 recipients = await self._subscription_manager.get_subscribed_recipients(message_envelope.topic_id)
-                for agent_id in recipients:
-                    # Avoid sending the message back to the sender
-                    if message_envelope.sender is not None and agent_id == message_envelope.sender:
-                        continue
-
-                    sender_agent = (
-                        await self._get_agent(message_envelope.sender) if message_envelope.sender is not None else None
-                    )
-                    sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
-                    logger.info(
-                        f"Calling message handler for {agent_id.type} with message type {type(message_envelope.message).__name__} published by {sender_name}"
-                    )
-                    event_logger.info(
-                        MessageEvent(
-                            payload=self._try_serialize(message_envelope.message),
+                sender_name = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
+                async with AsyncExitStack() as pinned_agents:
+                    for agent_id in recipients:
+                        # Avoid sending the message back to the sender
+                        if message_envelope.sender is not None and agent_id == message_envelope.sender:
+                            continue
+
+                        logger.info(
+                            "Calling message handler for %s with message type %s published by %s",
+                            agent_id.type,
+                            type(message_envelope.message).__name__,
+                            sender_name,
+                        )
+                        if _event_logging_enabled():
+                            event_logger.info(
+                                MessageEvent(
+                                    payload=self._serialize_envelope_message(message_envelope),
+                                    sender=message_envelope.sender,
+                                    receiver=None,
+                                    kind=MessageKind.PUBLISH,
+                                    delivery_stage=DeliveryStage.DELIVER,
+                                )
+                            )
+                        message_context = MessageContext(
                             sender=message_envelope.sender,
-                            receiver=None,
-                            kind=MessageKind.PUBLISH,
-                            delivery_stage=DeliveryStage.DELIVER,
+                            topic_id=message_envelope.topic_id,
+                            is_rpc=False,
+                            cancellation_token=message_envelope.cancellation_token,
+                            message_id=message_envelope.message_id,
                         )
-                    )
-                    message_context = MessageContext(
-                        sender=message_envelope.sender,
-                        topic_id=message_envelope.topic_id,
-                        is_rpc=False,
-                        cancellation_token=message_envelope.cancellation_token,
-                        message_id=message_envelope.message_id,
-                    )
-                    agent = await self._get_agent(agent_id)
-
-                    async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
-                        with self._tracer_helper.trace_block(
-                            "process",
-                            agent.id,
-                            parent=message_envelope.metadata,
-                            attributes=await self._create_otel_attributes(
-                                sender_agent_id=message_envelope.sender,
-                                recipient_agent_id=agent.id,
-                                message_context=message_context,
-                                message=message_envelope.message,
-                            ),
-                        ):
-                            with MessageHandlerContext.populate_context(agent.id):
-                                try:
-                                    return await agent.on_message(
-                                        message_envelope.message,
-                                        ctx=message_context,
-                                    )
-                                except BaseException as e:
-                                    logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
-                                    event_logger.info(
-                                        MessageHandlerExceptionEvent(
-                                            payload=self._try_serialize(message_envelope.message),
-                                            handling_agent=agent.id,
-                                            exception=e,
+                        # Pin the agent up front so that construction errors abort the publish, and so that
+                        # it is not passivated before it handles the message.
+                        agent = await pinned_agents.enter_async_context(self._agent_in_use(agent_id))
+
+                        async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
+                            with self._tracer_helper.trace_block(
+                                "process", agent.id, parent=message_envelope.metadata
+                            ) as span:
+                                if span.is_recording():
+                                    span.set_attributes(
+                                        self._create_otel_attributes(
+                                            sender_agent_id=message_envelope.sender,
+                                            recipient_agent_id=agent.id,
+                                            message_context=message_context,
+                                            message_envelope=message_envelope,
                                         )
                                     )
-                                    raise e
-
-                    future = _on_message(agent, message_context)
-                    responses.append(future)
-
-                await asyncio.gather(*responses)
+                                with MessageHandlerContext.populate_context(agent.id):
+                                    try:
+                                        return await agent.on_message(
+                                            message_envelope.message,
+                                            ctx=message_context,
+                                        )
+                                    except BaseException as e:
+                                        logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
+                                        if _event_logging_enabled():
+                                            event_logger.info(
+                                                MessageHandlerExceptionEvent(
+                                                    payload=self._serialize_envelope_message(message_envelope),
+                                                    handling_agent=agent.id,
+                                                    exception=e,
+                                                )
+                                            )
+                                        raise e
+
+                        future = _on_message(agent, message_context)
+                        responses.append(future)
+
+                    await asyncio.gather(*responses)
             except BaseException as e:
                 if not self._ignore_unhandled_handler_exceptions:
                     self._background_exception = e
@@ -631,32 +893,39 @@ async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
 
     async def _process_response(self, message_envelope: ResponseMessageEnvelope) -> None:
         with self._tracer_helper.trace_block(
-            "ack",
-            message_envelope.recipient,
-            parent=message_envelope.metadata,
-            attributes=await self._create_otel_attributes(
-                sender_agent_id=message_envelope.sender,
-                recipient_agent_id=message_envelope.recipient,
-                message=message_envelope.message,
-            ),
-        ):
-            content = (
-                message_envelope.message.__dict__
-                if hasattr(message_envelope.message, "__dict__")
-                else message_envelope.message
-            )
-            logger.info(
-                f"Resolving response with message type {type(message_envelope.message).__name__} for recipient {message_envelope.recipient} from {message_envelope.sender.type}: {content}"
-            )
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message_envelope.message),
-                    sender=message_envelope.sender,
-                    receiver=message_envelope.recipient,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.DELIVER,
+            "ack", message_envelope.recipient, parent=message_envelope.metadata
+        ) as span:
+            if span.is_recording():
+                span.set_attributes(
+                    self._create_otel_attributes(
+                        sender_agent_id=message_envelope.sender,
+                        recipient_agent_id=message_envelope.recipient,
+                        message_envelope=message_envelope,
+                    )
+                )
+            if logger.isEnabledFor(logging.INFO):
+                content = (
+                    message_envelope.message.__dict__
+                    if hasattr(message_envelope.message, "__dict__")
+                    else message_envelope.message
+                )
+                logger.info(
+                    "Resolving response with message type %s for recipient %s from %s: %s",
+                    type(message_envelope.message).__name__,
+                    message_envelope.recipient,
+                    message_envelope.sender.type,
+                    content,
+                )
+            if _event_logging_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._serialize_envelope_message(message_envelope),
+                        sender=message_envelope.sender,
+                        receiver=message_envelope.recipient,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
                 )
-            )
             if not message_envelope.future.cancelled():
                 message_envelope.future.set_result(message_envelope.message)
             self._message_queue.task_done()
@@ -709,21 +978,21 @@ async def _process_next(self) -> None:
                                 future.set_exception(e)
                                 return
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=recipient,
-                                        kind=MessageKind.DIRECT,
+                                if _event_logging_enabled():
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._serialize_envelope_message(message_envelope),
+                                            sender=sender,
+                                            receiver=recipient,
+                                            kind=MessageKind.DIRECT,
+                                        )
                                     )
-                                )
                                 future.set_exception(MessageDroppedException())
                                 return
 
                         message_envelope.message = temp_message
-                task = asyncio.create_task(self._process_send(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
+                # Nested sends are awaited by a running handler, so they must not wait for a free handler slot.
+                self._start_handler_task(self._process_send(message_envelope), counted=not message_envelope.nested)
             case PublishMessageEnvelope(
                 message=message,
                 sender=sender,
@@ -749,21 +1018,20 @@ async def _process_next(self) -> None:
                                 logger.error(f"Exception raised in in intervention handler: {e}", exc_info=True)
                                 return
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=topic_id,
-                                        kind=MessageKind.PUBLISH,
+                                if _event_logging_enabled():
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._serialize_envelope_message(message_envelope),
+                                            sender=sender,
+                                            receiver=topic_id,
+                                            kind=MessageKind.PUBLISH,
+                                        )
                                     )
-                                )
                                 return
 
                         message_envelope.message = temp_message
 
-                task = asyncio.create_task(self._process_publish(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
+                self._start_handler_task(self._process_publish(message_envelope))
             case ResponseMessageEnvelope(message=message, sender=sender, recipient=recipient, future=future):
                 if self._intervention_handlers is not None:
                     for handler in self._intervention_handlers:
@@ -775,20 +1043,19 @@ async def _process_next(self) -> None:
                             future.set_exception(e)
                             return
                         if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                            event_logger.info(
-                                MessageDroppedEvent(
-                                    payload=self._try_serialize(message),
-                                    sender=sender,
-                                    receiver=recipient,
-                                    kind=MessageKind.RESPOND,
+                            if _event_logging_enabled():
+                                event_logger.info(
+                                    MessageDroppedEvent(
+                                        payload=self._serialize_envelope_message(message_envelope),
+                                        sender=sender,
+                                        receiver=recipient,
+                                        kind=MessageKind.RESPOND,
+                                    )
                                 )
-                            )
                             future.set_exception(MessageDroppedException())
                             return
                         message_envelope.message = temp_message
-                task = asyncio.create_task(self._process_response(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
+                self._start_handler_task(self._process_response(message_envelope), counted=False)
 
         # Yield control to the message loop to allow other tasks to run
         await asyncio.sleep(0)
@@ -839,7 +1106,7 @@ async def stop(self) -> None:
             await self._run_context.stop()
         finally:
             self._run_context = None
-            self._message_queue = Queue()
+            self._message_queue = self._new_message_queue()
 
     async def stop_when_idle(self) -> None:
         """Stop the runtime message processing loop when there is
@@ -851,7 +1118,7 @@ async def stop_when_idle(self) -> None:
             await self._run_context.stop_when_idle()
         finally:
             self._run_context = None
-            self._message_queue = Queue()
+            self._message_queue = self._new_message_queue()
 
     async def stop_when(self, condition: Callable[[], bool]) -> None:
         """Stop the runtime message processing loop when the condition is met.
@@ -872,7 +1139,7 @@ async def stop_when(self, condition: Callable[[], bool]) -> None:
         await self._run_context.stop_when(condition)
 
         self._run_context = None
-        self._message_queue = Queue()
+        self._message_queue = self._new_message_queue()
 
     async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
         return (await self._get_agent(agent)).metadata
@@ -973,16 +1240,31 @@ async def _invoke_agent_factory(
                 raise
 
     async def _get_agent(self, agent_id: AgentId) -> Agent:
+        if self._passivation is not None:
+            return await self._passivation.get_agent(agent_id, self._create_agent)
+
         if agent_id in self._instantiated_agents:
             return self._instantiated_agents[agent_id]
 
+        agent = await self._create_agent(agent_id)
+        self._instantiated_agents[agent_id] = agent
+        return agent
+
+    async def _create_agent(self, agent_id: AgentId) -> Agent:
         if agent_id.type not in self._agent_factories:
             raise LookupError(f"Agent with name {agent_id.type} not found.")
 
         agent_factory = self._agent_factories[agent_id.type]
-        agent = await self._invoke_agent_factory(agent_factory, agent_id)
-        self._instantiated_agents[agent_id] = agent
-        return agent
+        return await self._invoke_agent_factory(agent_factory, agent_id)
+
+    @asynccontextmanager
+    async def _agent_in_use(self, agent_id: AgentId) -> AsyncIterator[Agent]:
+        """Get an agent for handling a message, keeping it from being passivated while the message is handled."""
+        if self._passivation is None:
+            yield await self._get_agent(agent_id)
+            return
+        async with self._passivation.pinned(agent_id, self._create_agent) as agent:
+            yield agent
 
     # TODO: uncomment out the following type ignore when this is fixed in mypy: https://github.com/python/mypy/issues/3737
     async def try_get_underlying_agent_instance(self, id: AgentId, type: Type[T] = Agent) -> T:  # type: ignore[assignment]
@@ -1018,6 +1300,18 @@ async def get(
     def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
         self._serialization_registry.add_serializer(serializer)
 
+    def _serialize_envelope_message(self, message_envelope: MessageEnvelope) -> str:
+        """Serialize the message of an envelope for event logging.
+
+        The result is cached on the envelope so the message is serialized at most once however
+        many events are logged for it. The cache is keyed on the message object, so a message
+        replaced by an intervention handler is serialized again."""
+        cached = message_envelope.serialized_message
+        if cached is None or cached[0] is not message_envelope.message:
+            cached = (message_envelope.message, self._try_serialize(message_envelope.message))
+            message_envelope.serialized_message = cached
+        return cached[1]
+
     def _try_serialize(self, message: Any) -> str:
         try:
             type_name = self._serialization_registry.type_name(message)
@@ -6,7 +6,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from types import TracebackType
-from typing import List, Optional, Type
+from typing import AsyncGenerator, List, Optional, Type, Union
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -71,6 +71,25 @@ async def execute_code_blocks(
         """
         ...
 
+    async def execute_code_blocks_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[str, CodeResult], None]:
+        """Execute code blocks and yield their output while they run.
+
+        The output is yielded as string chunks, and the last item is the
+        :class:`CodeResult` of the execution. The default implementation
+        yields only the result of :meth:`execute_code_blocks`; code executors
+        that can observe the output of the running code should override it.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+            cancellation_token (CancellationToken): A token to cancel the execution.
+
+        Returns:
+            AsyncGenerator[Union[str, CodeResult], None]: Chunks of output, followed by the result.
+        """
+        yield await self.execute_code_blocks(code_blocks, cancellation_token)
+
     @abstractmethod
     async def start(self) -> None:
         """Start the code executor."""
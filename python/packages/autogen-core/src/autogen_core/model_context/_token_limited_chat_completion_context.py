@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, List, Literal, Mapping
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -14,6 +14,7 @@ class TokenLimitedChatCompletionContextConfig(BaseModel):
     token_limit: int | None = None
     tool_schema: List[ToolSchema] | None = None
     initial_messages: List[LLMMessage] | None = None
+    trim_strategy: Literal["recount", "prefix_sum"] = "recount"
 
 
 class TokenLimitedChatCompletionContext(ChatCompletionContext, Component[TokenLimitedChatCompletionContextConfig]):
@@ -33,6 +34,15 @@ class TokenLimitedChatCompletionContext(ChatCompletionContext, Component[TokenLi
             :meth:`~autogen_core.models.ChatCompletionClient.remaining_tokens` method.
         tools (List[ToolSchema] | None): A list of tool schema to use in the context.
         initial_messages (List[LLMMessage] | None): A list of initial messages to include in the context.
+        trim_strategy (Literal["recount", "prefix_sum"]): How messages are removed from the middle of the
+            context until it fits. ``"recount"`` removes one message at a time and counts the remaining
+            messages again after each removal. ``"prefix_sum"`` counts each message once, when it is first
+            seen, and finds the same cut with a binary search over running totals, so the cost of
+            :meth:`get_messages` grows with the number of new messages only. It assumes that the token
+            count of a list of messages is a fixed overhead plus the sum of the counts of the individual
+            messages, and that :meth:`~autogen_core.models.ChatCompletionClient.remaining_tokens` is a
+            fixed limit minus :meth:`~autogen_core.models.ChatCompletionClient.count_tokens`, which holds
+            for the built-in model clients. Defaults to ``"recount"``.
 
     """
 
@@ -46,19 +56,83 @@ def __init__(
         token_limit: int | None = None,
         tool_schema: List[ToolSchema] | None = None,
         initial_messages: List[LLMMessage] | None = None,
+        trim_strategy: Literal["recount", "prefix_sum"] = "recount",
     ) -> None:
         super().__init__(initial_messages)
         if token_limit is not None and token_limit <= 0:
             raise ValueError("token_limit must be greater than 0.")
+        if trim_strategy not in ("recount", "prefix_sum"):
+            raise ValueError(f"Unknown trim_strategy: {trim_strategy}")
         self._token_limit = token_limit
         self._model_client = model_client
         self._tool_schema = tool_schema or []
+        self._trim_strategy = trim_strategy
+        # Running totals of the token counts of self._messages, used by the prefix_sum strategy:
+        # self._token_prefix_sums[i] is the total count of the first i messages.
+        self._token_prefix_sums: List[int] = [0]
+
+    async def add_message(self, message: LLMMessage) -> None:
+        await super().add_message(message)
+        if self._trim_strategy == "prefix_sum":
+            self._update_token_prefix_sums()
+
+    async def clear(self) -> None:
+        await super().clear()
+        self._token_prefix_sums = [0]
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        await super().load_state(state)
+        self._token_prefix_sums = [0]
+
+    def _update_token_prefix_sums(self) -> None:
+        """Count the messages that have not been counted yet."""
+        if len(self._token_prefix_sums) > len(self._messages) + 1:
+            # The messages were replaced without going through this class.
+            self._token_prefix_sums = [0]
+        if len(self._token_prefix_sums) == len(self._messages) + 1:
+            return
+        overhead = self._model_client.count_tokens([], tools=self._tool_schema)
+        for message in self._messages[len(self._token_prefix_sums) - 1 :]:
+            message_tokens = self._model_client.count_tokens([message], tools=self._tool_schema) - overhead
+            self._token_prefix_sums.append(self._token_prefix_sums[-1] + message_tokens)
+
+    def _trim_with_prefix_sums(self, budget: int) -> List[LLMMessage]:
+        """Return the messages left after removing the middle message until the sum of the
+        token counts of the remaining messages is within `budget`.
+
+        Removing the middle message of a list of length m, m // 2, repeatedly always keeps the
+        first (m + 1) // 2 and the last m // 2 messages of the original list, so the count of
+        the kept messages is known from the prefix sums for every m."""
+        self._update_token_prefix_sums()
+        prefix_sums = self._token_prefix_sums
+        num_messages = len(self._messages)
+
+        def kept_tokens(kept: int) -> int:
+            head, tail = (kept + 1) // 2, kept // 2
+            return prefix_sums[head] + prefix_sums[num_messages] - prefix_sums[num_messages - tail]
+
+        # Find the largest number of messages to keep that fits, the count being monotonic in it.
+        low, high = 0, num_messages
+        while low < high:
+            middle = (low + high + 1) // 2
+            if kept_tokens(middle) <= budget:
+                low = middle
+            else:
+                high = middle - 1
+        head, tail = (low + 1) // 2, low // 2
+        return self._messages[:head] + self._messages[num_messages - tail :]
 
     async def get_messages(self) -> List[LLMMessage]:
         """Get at most `token_limit` tokens in recent messages. If the token limit is not
         provided, then return as many messages as the remaining token allowed by the model client."""
         messages = list(self._messages)
-        if self._token_limit is None:
+        if self._trim_strategy == "prefix_sum":
+            if self._token_limit is None:
+                budget = self._model_client.remaining_tokens([], tools=self._tool_schema)
+            else:
+                budget = self._token_limit - self._model_client.count_tokens([], tools=self._tool_schema)
+            messages = self._trim_with_prefix_sums(budget)
+        elif self._token_limit is None:
             remaining_tokens = self._model_client.remaining_tokens(messages, tools=self._tool_schema)
             while remaining_tokens < 0 and len(messages) > 0:
                 middle_index = len(messages) // 2
@@ -82,6 +156,7 @@ def _to_config(self) -> TokenLimitedChatCompletionContextConfig:
             token_limit=self._token_limit,
             tool_schema=self._tool_schema,
             initial_messages=self._initial_messages,
+            trim_strategy=self._trim_strategy,
         )
 
     @classmethod
@@ -91,4 +166,5 @@ def _from_config(cls, config: TokenLimitedChatCompletionContextConfig) -> Self:
             token_limit=config.token_limit,
             tool_schema=config.tool_schema,
             initial_messages=config.initial_messages,
+            trim_strategy=config.trim_strategy,
         )
@@ -1,5 +1,5 @@
 from ._base import BaseTool, BaseToolWithState, ParametersSchema, Tool, ToolSchema
-from ._function_tool import FunctionTool
+from ._function_tool import FunctionTool, FunctionToolMetrics
 from ._static_workbench import StaticWorkbench
 from ._workbench import ImageResultContent, TextResultContent, ToolResult, Workbench
 
@@ -10,6 +10,7 @@
     "BaseTool",
     "BaseToolWithState",
     "FunctionTool",
+    "FunctionToolMetrics",
     "Workbench",
     "ToolResult",
     "TextResultContent",
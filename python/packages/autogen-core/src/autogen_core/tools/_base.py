@@ -2,7 +2,7 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Any, Dict, Generic, Mapping, Protocol, Type, TypeVar, cast, runtime_checkable
+from typing import Any, Dict, Generic, Mapping, Protocol, Tuple, Type, TypeVar, cast, runtime_checkable
 
 import jsonref
 from pydantic import BaseModel
@@ -83,9 +83,21 @@ def __init__(
         self._name = name
         self._description = description
         self._strict = strict
+        self._schema: Tuple[Tuple[str, str, bool], ToolSchema] | None = None
 
     @property
     def schema(self) -> ToolSchema:
+        """The schema of the tool.
+
+        The schema is computed once and the same object is returned on every access, so it
+        must not be modified. It is recomputed if the name, description or strict mode of the
+        tool change."""
+        key = (self._name, self._description, self._strict)
+        if self._schema is None or self._schema[0] != key:
+            self._schema = (key, self._build_schema())
+        return self._schema[1]
+
+    def _build_schema(self) -> ToolSchema:
         model_schema: Dict[str, Any] = self._args_type.model_json_schema()
 
         if "$defs" in model_schema:
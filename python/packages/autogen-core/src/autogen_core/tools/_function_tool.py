@@ -1,8 +1,13 @@
 import asyncio
 import functools
+import os
+import threading
+import time
 import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from textwrap import dedent
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -25,6 +30,79 @@ class FunctionToolConfig(BaseModel):
     description: str
     global_imports: Sequence[Import]
     has_cancellation_support: bool
+    executor: Optional[str] = None
+
+
+@dataclass
+class FunctionToolMetrics:
+    """Execution metrics of a :class:`FunctionTool`, in seconds.
+
+    The queue wait is the time a call of a synchronous function waits for a worker of the
+    executor; it is always 0 for asynchronous functions."""
+
+    calls: int = 0
+    """The number of calls that ran, including the ones that raised an exception."""
+    errors: int = 0
+    """The number of calls that raised an exception."""
+    cancelled: int = 0
+    """The number of calls cancelled before they completed."""
+    total_queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+    total_run_time: float = 0.0
+    max_run_time: float = 0.0
+
+    @property
+    def mean_queue_wait(self) -> float:
+        return self.total_queue_wait / self.calls if self.calls else 0.0
+
+    @property
+    def mean_run_time(self) -> float:
+        return self.total_run_time / self.calls if self.calls else 0.0
+
+    def _record(self, queue_wait: float, run_time: float, error: bool) -> None:
+        self.calls += 1
+        self.errors += int(error)
+        self.total_queue_wait += queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+        self.total_run_time += run_time
+        self.max_run_time = max(self.max_run_time, run_time)
+
+
+_executors: Dict[str, Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(name: str) -> Executor:
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            if name == "thread":
+                executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) + 4), thread_name_prefix="FunctionTool"
+                )
+            elif name == "process":
+                executor = ProcessPoolExecutor()
+            else:
+                raise ValueError(f"Unknown executor: {name}. Register it with FunctionTool.register_executor.")
+            _executors[name] = executor
+        return executor
+
+
+def _timed_call(func: Callable[[], Any], started: Optional[threading.Event] = None) -> Tuple[float, Any, bool]:
+    """Run the function in a worker and return its run time, and its result or exception."""
+    if started is not None:
+        started.set()
+    start = time.perf_counter()
+    try:
+        result = func()
+    except Exception as e:
+        return time.perf_counter() - start, e, False
+    return time.perf_counter() - start, result, True
+
+
+def _cancel_if_waiting(future: "asyncio.Future[Any]", started: threading.Event) -> None:
+    if not started.is_set():
+        future.cancel()
 
 
 class FunctionTool(BaseTool[BaseModel, BaseModel], Component[FunctionToolConfig]):
@@ -50,6 +128,20 @@ class FunctionTool(BaseTool[BaseModel, BaseModel], Component[FunctionToolConfig]
         strict (bool, optional): If set to True, the tool schema will only contain arguments that are explicitly
             defined in the function signature, and no default values will be allowed. Defaults to False.
             This is required to be set to True when used with models in structured output mode.
+        executor (str | Executor, optional): The executor that runs a synchronous function. Either an
+            executor, or the name of one: "thread" for a bounded thread pool shared by the tools that
+            use it, "process" for a shared :class:`~concurrent.futures.ProcessPoolExecutor`, or a name
+            registered with :meth:`register_executor`. Defaults to None, which uses the default executor
+            of the event loop. Only names are saved in the component config. A process pool runs CPU-bound
+            functions without holding the GIL of the event loop; the function, its arguments and its
+            return value must be picklable, so it must be defined at module level, and it cannot take a
+            cancellation token.
+
+    Cancelling the cancellation token cancels a call of a synchronous function that is still waiting
+    for a worker of the executor. A call that is already running is no longer awaited, but runs to
+    completion, unless the function takes the cancellation token: such a call is awaited until the
+    function returns, and its return value is the result of the tool.
+    Queue wait and run times of the calls are kept in :attr:`metrics`.
 
     Example:
 
@@ -92,6 +184,7 @@ def __init__(
         name: str | None = None,
         global_imports: Sequence[Import] = [],
         strict: bool = False,
+        executor: str | Executor | None = None,
     ) -> None:
         self._func = func
         self._global_imports = global_imports
@@ -99,9 +192,45 @@ def __init__(
         func_name = name or func.func.__name__ if isinstance(func, functools.partial) else name or func.__name__
         args_model = args_base_model_from_signature(func_name + "args", self._signature)
         self._has_cancellation_support = "cancellation_token" in self._signature.parameters
+        if executor is not None and asyncio.iscoroutinefunction(func):
+            raise ValueError("An executor can only be used with a synchronous function.")
+        self._executor_name = executor if isinstance(executor, str) else None
+        self._executor = _get_executor(executor) if isinstance(executor, str) else executor
+        if isinstance(self._executor, ProcessPoolExecutor) and self._has_cancellation_support:
+            raise ValueError("A function run in a process pool cannot take a cancellation token.")
+        self._metrics = FunctionToolMetrics()
         return_type = self._signature.return_annotation
         super().__init__(args_model, return_type, func_name, description, strict)
 
+    @staticmethod
+    def register_executor(name: str, executor: Executor) -> None:
+        """Register an executor under a name, for tools created with `executor=name`.
+
+        Example:
+
+            .. code-block:: python
+
+                from concurrent.futures import ThreadPoolExecutor
+
+                from autogen_core.tools import FunctionTool
+
+
+                def query_database(sql: str) -> str:
+                    return "..."
+
+
+                # At most 4 queries run at once, without taking workers from other tools.
+                FunctionTool.register_executor("database", ThreadPoolExecutor(max_workers=4))
+                tool = FunctionTool(query_database, description="Query the database.", executor="database")
+        """
+        with _executors_lock:
+            _executors[name] = executor
+
+    @property
+    def metrics(self) -> FunctionToolMetrics:
+        """The execution metrics of the tool."""
+        return self._metrics
+
     async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> Any:
         kwargs = {}
 
@@ -110,24 +239,43 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
                 kwargs[name] = getattr(args, name)
 
         if asyncio.iscoroutinefunction(self._func):
-            if self._has_cancellation_support:
-                result = await self._func(**kwargs, cancellation_token=cancellation_token)
-            else:
-                result = await self._func(**kwargs)
+            start = time.perf_counter()
+            try:
+                if self._has_cancellation_support:
+                    result = await self._func(**kwargs, cancellation_token=cancellation_token)
+                else:
+                    result = await self._func(**kwargs)
+            except asyncio.CancelledError:
+                self._metrics.cancelled += 1
+                raise
+            except Exception:
+                self._metrics._record(0.0, time.perf_counter() - start, error=True)
+                raise
+            self._metrics._record(0.0, time.perf_counter() - start, error=False)
         else:
             if self._has_cancellation_support:
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    functools.partial(
-                        self._func,
-                        **kwargs,
-                        cancellation_token=cancellation_token,
-                    ),
-                )
+                call = functools.partial(self._func, **kwargs, cancellation_token=cancellation_token)
+            else:
+                call = functools.partial(self._func, **kwargs)
+            started = threading.Event() if self._has_cancellation_support else None
+            submitted = time.perf_counter()
+            future = asyncio.get_running_loop().run_in_executor(self._executor, _timed_call, call, started)
+            if started is not None:
+                # Once the function runs, it handles the cancellation itself, and what it returns is kept.
+                cancellation_token.add_callback(functools.partial(_cancel_if_waiting, future, started))
             else:
-                future = asyncio.get_event_loop().run_in_executor(None, functools.partial(self._func, **kwargs))
                 cancellation_token.link_future(future)
-                result = await future
+            try:
+                run_time, result, ok = await future
+            except asyncio.CancelledError:
+                self._metrics.cancelled += 1
+                raise
+            # The run time is measured in the worker, which may be another process, so the queue wait is
+            # derived from it instead of comparing clocks across processes.
+            queue_wait = max(0.0, time.perf_counter() - submitted - run_time)
+            self._metrics._record(queue_wait, run_time, error=not ok)
+            if not ok:
+                raise result
 
         return result
 
@@ -138,6 +286,7 @@ def _to_config(self) -> FunctionToolConfig:
             name=self.name,
             description=self.description,
             has_cancellation_support=self._has_cancellation_support,
+            executor=self._executor_name,
         )
 
     @classmethod
@@ -178,4 +327,10 @@ def _from_config(cls, config: FunctionToolConfig) -> Self:
         if not callable(func):
             raise TypeError(f"Expected function but got {type(func)}")
 
-        return cls(func, name=config.name, description=config.description, global_imports=config.global_imports)
+        return cls(
+            func,
+            name=config.name,
+            description=config.description,
+            global_imports=config.global_imports,
+            executor=config.executor,
+        )
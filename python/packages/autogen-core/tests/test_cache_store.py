@@ -1,5 +1,8 @@
+import threading
+from typing import List
 from unittest.mock import Mock
 
+import pytest
 from autogen_core import CacheStore, InMemoryStore
 
 
@@ -46,3 +49,161 @@ def test_inmemory_store() -> None:
     key = "non_existent_key"
     default_value = 99
     assert store.get(key, default_value) == default_value
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_inmemory_store_lru_eviction() -> None:
+    store = InMemoryStore[int](max_entries=2)
+    store.set("a", 1)
+    store.set("b", 2)
+    assert store.get("a") == 1
+    store.set("c", 3)
+
+    # "b" was the least recently used item.
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+    assert store.entry_count == 2
+    assert store.evictions == 1
+    assert store.hits == 3
+    assert store.misses == 1
+
+
+def test_inmemory_store_lfu_eviction() -> None:
+    store = InMemoryStore[int](max_entries=2, eviction_policy="lfu")
+    store.set("a", 1)
+    store.set("b", 2)
+    for _ in range(3):
+        store.get("a")
+    store.get("b")
+    store.get("b")
+
+    # The new item is never evicted in favor of older items, even though it is the least frequently used.
+    store.set("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    store.set("d", 4)
+    assert store.get("c") is None
+    assert store.get("a") == 1
+    assert store.get("d") == 4
+    assert store.evictions == 2
+
+
+def test_inmemory_store_max_bytes() -> None:
+    store = InMemoryStore[str](max_bytes=300)
+    store.set("a", "x" * 100)
+    store.set("b", "y" * 100)
+    assert store.total_bytes > 200
+    store.set("c", "z" * 100)
+    assert store.get("a") is None
+    assert store.entry_count == 2
+    assert store.total_bytes <= 300
+
+    # Items larger than the budget are not stored, and do not evict anything.
+    store.set("d", "w" * 1000)
+    assert store.get("d") is None
+    assert store.entry_count == 2
+
+
+def test_inmemory_store_ttl() -> None:
+    clock = FakeClock()
+    store = InMemoryStore[int](ttl=10, clock=clock)
+    store.set("a", 1)
+    clock.now = 5
+    store.set("b", 2)
+    assert store.get("a") == 1
+
+    clock.now = 10
+    assert store.get("a") is None
+    assert store.get("b") == 2
+    assert store.expirations == 1
+
+    # Setting an item again restarts its ttl.
+    store.set("b", 3)
+    clock.now = 16
+    assert store.get("b") == 3
+    assert store.entry_count == 1
+
+
+def test_inmemory_store_serialize() -> None:
+    store = InMemoryStore[List[int]](serialize=True)
+    value = [1, 2, 3]
+    store.set("a", value)
+    value.append(4)
+
+    cached = store.get("a")
+    assert cached == [1, 2, 3]
+    assert cached is not store.get("a")
+    assert store.total_bytes > 0
+
+
+def test_inmemory_store_delete() -> None:
+    store = InMemoryStore[str](max_bytes=300, eviction_policy="lfu")
+    store.set("a", "x" * 100)
+    store.set("b", "y" * 100)
+    store.delete("a")
+    store.delete("missing")
+    assert store.get("a") is None
+    assert store.get("b") == "y" * 100
+    assert store.entry_count == 1
+    assert 0 < store.total_bytes <= 150
+
+
+def test_inmemory_store_items() -> None:
+    store = InMemoryStore[List[int]](max_entries=2, serialize=True)
+    store.set("a", [1])
+    store.set("b", [2])
+    assert dict(store.store) == {"a": [1], "b": [2]}
+    assert (store.hits, store.misses) == (0, 0)
+    with pytest.raises(TypeError):
+        store.store["c"] = [3]  # type: ignore[index]
+
+    # Reading the items is not a use: "a" is still the least recently used item.
+    store.set("c", [3])
+    assert list(store.store) == ["b", "c"]
+
+
+def test_inmemory_store_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        InMemoryStore[int](max_entries=0)
+    with pytest.raises(ValueError):
+        InMemoryStore[int](ttl=0)
+    with pytest.raises(ValueError):
+        InMemoryStore[int](eviction_policy="fifo")  # type: ignore[arg-type]
+
+
+def test_inmemory_store_threads() -> None:
+    store = InMemoryStore[int](max_entries=50, eviction_policy="lfu")
+
+    def worker(offset: int) -> None:
+        for i in range(1000):
+            store.set(str((offset + i) % 100), i)
+            store.get(str(i % 100))
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.entry_count == 50
+    assert store.hits + store.misses == 8000
+
+
+def test_inmemory_store_serialization() -> None:
+    store = InMemoryStore[int](max_entries=10, max_bytes=1024, ttl=60, eviction_policy="lfu", serialize=True)
+    config = store.dump_component()
+    assert config.provider == "autogen_core.InMemoryStore"
+    loaded = InMemoryStore[int].load_component(config)
+    assert loaded.dump_component() == config
+
+    # Configs dumped before the store was configurable still load.
+    config.config = {}
+    assert InMemoryStore[int].load_component(config).dump_component() == InMemoryStore[int]().dump_component()
@@ -1,8 +1,13 @@
 import textwrap
+from typing import List, Union
 
 import pytest
+from autogen_core import CancellationToken
 from autogen_core.code_executor import (
     Alias,
+    CodeBlock,
+    CodeExecutor,
+    CodeResult,
     FunctionWithRequirements,
     FunctionWithRequirementsStr,
     ImportFromModule,
@@ -51,3 +56,29 @@ def template_function2():
     functions_module2 = build_python_functions_file([function2])
 
     assert "import pandas as pd" in functions_module2
+
+
+class EchoCodeExecutor(CodeExecutor):
+    async def execute_code_blocks(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> CodeResult:
+        return CodeResult(exit_code=0, output="".join(block.code for block in code_blocks))
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def restart(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_execute_code_blocks_stream_default() -> None:
+    executor = EchoCodeExecutor()
+    code_blocks = [CodeBlock(code="a", language="python"), CodeBlock(code="b", language="python")]
+    items: List[Union[str, CodeResult]] = [
+        item async for item in executor.execute_code_blocks_stream(code_blocks, CancellationToken())
+    ]
+    assert items == [CodeResult(exit_code=0, output="ab")]
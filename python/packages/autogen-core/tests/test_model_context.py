@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 import pytest
 from autogen_core.model_context import (
@@ -14,8 +14,10 @@
     LLMMessage,
     UserMessage,
 )
+from autogen_core.tools import Tool, ToolSchema
 from autogen_ext.models.ollama import OllamaChatCompletionClient
 from autogen_ext.models.openai import OpenAIChatCompletionClient
+from autogen_ext.models.replay import ReplayChatCompletionClient
 
 
 @pytest.mark.asyncio
@@ -205,3 +207,75 @@ async def test_token_limited_model_context_openai_with_function_result(
     assert type(retrieved[0]) == UserMessage  # Function result should be removed
     assert type(retrieved[1]) == AssistantMessage
     assert type(retrieved[2]) == UserMessage
+
+
+class CountingReplayChatCompletionClient(ReplayChatCompletionClient):
+    """Counts the messages passed to count_tokens, with a fixed overhead per call."""
+
+    def __init__(self) -> None:
+        super().__init__(["unused"])
+        self.counted_messages = 0
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        self.counted_messages += len(messages)
+        return 5 + super().count_tokens(messages, tools=tools)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("token_limit", [5, 10, 23, 40, 75, 1000])
+async def test_token_limited_model_context_prefix_sum_matches_recount(token_limit: int) -> None:
+    recount_context = TokenLimitedChatCompletionContext(
+        model_client=CountingReplayChatCompletionClient(), token_limit=token_limit
+    )
+    prefix_sum_context = TokenLimitedChatCompletionContext(
+        model_client=CountingReplayChatCompletionClient(), token_limit=token_limit, trim_strategy="prefix_sum"
+    )
+    for i in range(30):
+        message: LLMMessage
+        if i % 3 == 2:
+            message = FunctionExecutionResultMessage(content=[])
+        else:
+            message = UserMessage(content=" ".join(["word"] * (i % 7 + 1)), source="user")
+        await recount_context.add_message(message)
+        await prefix_sum_context.add_message(message)
+        assert await prefix_sum_context.get_messages() == await recount_context.get_messages()
+
+
+@pytest.mark.asyncio
+async def test_token_limited_model_context_prefix_sum_is_incremental() -> None:
+    model_client = CountingReplayChatCompletionClient()
+    model_context = TokenLimitedChatCompletionContext(
+        model_client=model_client, token_limit=50, trim_strategy="prefix_sum"
+    )
+    for i in range(100):
+        await model_context.add_message(UserMessage(content=f"Message number {i}", source="user"))
+    await model_context.get_messages()
+    # Each message is counted once, when it is added.
+    assert model_client.counted_messages == 100
+
+    await model_context.add_message(UserMessage(content="One more message", source="user"))
+    retrieved = await model_context.get_messages()
+    assert model_client.counted_messages == 101
+    assert retrieved[-1] == UserMessage(content="One more message", source="user")
+
+    # Counts are recomputed after the messages are replaced.
+    state = await model_context.save_state()
+    await model_context.clear()
+    assert await model_context.get_messages() == []
+    await model_context.load_state(state)
+    assert await model_context.get_messages() == retrieved
+    assert model_client.counted_messages == 202
+
+
+@pytest.mark.asyncio
+async def test_token_limited_model_context_prefix_sum_without_token_limit() -> None:
+    model_client = ReplayChatCompletionClient(["unused"])
+    model_context = TokenLimitedChatCompletionContext(model_client=model_client, trim_strategy="prefix_sum")
+    messages: List[LLMMessage] = [UserMessage(content=f"Message number {i}", source="user") for i in range(3)]
+    for msg in messages:
+        await model_context.add_message(msg)
+    assert await model_context.get_messages() == messages
+
+    config = model_context.dump_component()
+    loaded = TokenLimitedChatCompletionContext.load_component(config)
+    assert loaded.dump_component() == config
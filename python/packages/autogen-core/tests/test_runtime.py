@@ -1,10 +1,13 @@
+import asyncio
 import logging
 
 import pytest
 from autogen_core import (
+    EVENT_LOGGER_NAME,
     AgentId,
     AgentInstantiationContext,
     AgentType,
+    CancellationToken,
     DefaultTopicId,
     MessageContext,
     RoutedAgent,
@@ -16,6 +19,12 @@
     type_subscription,
 )
 from autogen_core._default_subscription import default_subscription
+from autogen_core._queue import QueueShutDown
+from autogen_core._single_threaded_agent_runtime import (
+    PublishMessageEnvelope,
+    ResponseMessageEnvelope,
+    _MessageQueue,  # pyright: ignore[reportPrivateUsage]
+)
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -168,6 +177,10 @@ async def test_register_receives_publish(tracer_provider: TracerProvider) -> Non
         "autogen process name.(default)-A",
         "autogen publish default.(default)-T",
     ]
+    process_attributes = exported_spans[1].attributes
+    assert process_attributes is not None
+    assert process_attributes["recipient_agent_type"] == "name"
+    assert process_attributes["recipient_agent_class"] == "LoopbackAgent"
 
     await runtime.close()
 
@@ -364,3 +377,191 @@ async def test_event_handler_exception_multi_message() -> None:
         await runtime.stop_when_idle()
 
     await runtime.close()
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("event_logging", [False, True])
+async def test_publish_serializes_message_once(event_logging: bool) -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    for i in range(5):
+        await LoopbackAgent.register(runtime, f"loopback_{i}", LoopbackAgent, skip_class_subscriptions=True)
+        await runtime.add_subscription(TypeSubscription("default", f"loopback_{i}"))
+
+    serialized: list[object] = []
+    try_serialize = runtime._try_serialize  # pyright: ignore[reportPrivateUsage]
+
+    def counting_try_serialize(message: object) -> str:
+        serialized.append(message)
+        return try_serialize(message)
+
+    runtime._try_serialize = counting_try_serialize  # type: ignore[method-assign]
+
+    handler = _RecordingHandler()
+    event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+    previous_level = event_logger.level
+    if event_logging:
+        event_logger.addHandler(handler)
+        event_logger.setLevel(logging.INFO)
+    try:
+        runtime.start()
+        await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+        await runtime.stop_when_idle()
+    finally:
+        event_logger.removeHandler(handler)
+        event_logger.setLevel(previous_level)
+
+    # One SEND event and one DELIVER event per recipient share a single serialization.
+    assert len(serialized) <= 1
+    assert len(handler.records) == (6 if event_logging else 0)
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_backpressure() -> None:
+    runtime = SingleThreadedAgentRuntime(max_queue_size=2)
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    blocked = asyncio.create_task(runtime.publish_message(MessageType(), topic_id=DefaultTopicId()))
+    await asyncio.sleep(0.01)
+    # The queue is full and nothing is consuming it yet.
+    assert not blocked.done()
+    assert runtime.unprocessed_messages_count == 2
+
+    runtime.start()
+    await blocked
+    await runtime.stop_when_idle()
+
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("name", "default"), type=LoopbackAgent)
+    assert agent.num_calls == 3
+    await runtime.close()
+
+
+class BlockingAgent(RoutedAgent):
+    def __init__(self, release: asyncio.Event) -> None:
+        super().__init__("A blocking agent.")
+        self.release = release
+        self.num_calls = 0
+
+    @event
+    async def on_new_message_event(self, message: MessageType, ctx: MessageContext) -> None:
+        await self.release.wait()
+        self.num_calls += 1
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_handlers() -> None:
+    runtime = SingleThreadedAgentRuntime(max_concurrent_handlers=2)
+    release = asyncio.Event()
+    await BlockingAgent.register(runtime, "blocking", lambda: BlockingAgent(release))
+    await runtime.add_subscription(TypeSubscription("blocking", "blocking"))
+
+    runtime.start()
+    for i in range(5):
+        await runtime.publish_message(MessageType(), topic_id=TopicId("blocking", f"source_{i}"))
+    await asyncio.sleep(0.05)
+    assert runtime.in_flight_messages_count == 2
+    assert runtime.unprocessed_messages_count == 3
+
+    release.set()
+    await runtime.stop_when_idle()
+    assert runtime.in_flight_messages_count == 0
+    for i in range(5):
+        agent = await runtime.try_get_underlying_agent_instance(AgentId("blocking", f"source_{i}"), type=BlockingAgent)
+        assert agent.num_calls == 1
+    await runtime.close()
+
+
+class RelayAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that relays messages to a loopback agent.")
+        self.responses: list[MessageType] = []
+
+    @event
+    async def on_new_message_event(self, message: MessageType, ctx: MessageContext) -> None:
+        self.responses.append(await self.send_message(message, AgentId("loopback", self.id.key)))
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_handlers_nested_send() -> None:
+    runtime = SingleThreadedAgentRuntime(max_concurrent_handlers=1, max_queue_size=1)
+    await RelayAgent.register(runtime, "relay", RelayAgent)
+    await LoopbackAgent.register(runtime, "loopback", LoopbackAgent)
+    await runtime.add_subscription(TypeSubscription("relay", "relay"))
+
+    runtime.start()
+    for i in range(3):
+        await runtime.publish_message(MessageType(), topic_id=TopicId("relay", f"source_{i}"))
+    # Each relay handler holds the only slot while it waits on its nested send.
+    await asyncio.wait_for(runtime.stop_when_idle(), timeout=5)
+
+    for i in range(3):
+        agent = await runtime.try_get_underlying_agent_instance(AgentId("relay", f"source_{i}"), type=RelayAgent)
+        assert len(agent.responses) == 1
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_message_queue_response_priority_lane() -> None:
+    queue = _MessageQueue(maxsize=1)
+    publish = PublishMessageEnvelope(
+        message=MessageType(),
+        cancellation_token=CancellationToken(),
+        sender=None,
+        topic_id=DefaultTopicId(),
+        message_id="1",
+    )
+    response = ResponseMessageEnvelope(
+        message=MessageType(),
+        future=asyncio.get_running_loop().create_future(),
+        sender=AgentId("name", "default"),
+        recipient=None,
+    )
+    await queue.put(publish)
+    assert queue.full()
+    # Responses bypass the bound and are dequeued first.
+    await asyncio.wait_for(queue.put(response), timeout=1)
+    assert queue.qsize() == 2
+
+    queue.pause_normal_lane()
+    assert await queue.get() is response
+    assert queue.empty()
+    queue.resume_normal_lane()
+    assert await queue.get() is publish
+
+
+@pytest.mark.asyncio
+async def test_message_queue_shutdown() -> None:
+    queue = _MessageQueue(maxsize=1)
+    publish = PublishMessageEnvelope(
+        message=MessageType(),
+        cancellation_token=CancellationToken(),
+        sender=None,
+        topic_id=DefaultTopicId(),
+        message_id="1",
+    )
+    await queue.put(publish)
+    getter = asyncio.create_task(queue.get())
+    assert await getter is publish
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+
+    queue.shutdown(immediate=True)
+    with pytest.raises(QueueShutDown):
+        await getter
+    with pytest.raises(QueueShutDown):
+        await queue.put(publish)
+    # The item taken before the shutdown is still unfinished.
+    queue.task_done()
+    await asyncio.wait_for(queue.join(), timeout=1)
@@ -1,7 +1,20 @@
+import asyncio
 from typing import Any, Mapping
 
 import pytest
-from autogen_core import AgentId, BaseAgent, MessageContext, SingleThreadedAgentRuntime
+from autogen_core import (
+    AgentId,
+    AgentPassivationPolicy,
+    BaseAgent,
+    InMemoryStore,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    TopicId,
+    TypeSubscription,
+    message_handler,
+)
+from autogen_test_utils import MessageType
 
 
 class StatefulAgent(BaseAgent):
@@ -59,3 +72,144 @@ async def test_runtime_can_save_state() -> None:
 
     await runtime2.load_state(runtime_state)
     assert agent2.state == 1
+
+
+class CountingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("A counting agent")
+        self.count = 0
+
+    @message_handler
+    async def handle_message(self, message: MessageType, ctx: MessageContext) -> int:
+        self.count += 1
+        return self.count
+
+    async def save_state(self) -> Mapping[str, Any]:
+        return {"count": self.count}
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        self.count = state["count"]
+
+
+@pytest.mark.asyncio
+async def test_runtime_passivates_least_recently_used_agents() -> None:
+    store = InMemoryStore[Mapping[str, Any]]()
+    runtime = SingleThreadedAgentRuntime(
+        passivation_policy=AgentPassivationPolicy(max_resident_agents=2, state_store=store)
+    )
+    await CountingAgent.register(runtime, "counter", CountingAgent)
+
+    runtime.start()
+    for key in ["a", "b", "a", "c"]:
+        await runtime.send_message(MessageType(), AgentId("counter", key))
+    # "b" is the least recently used agent.
+    assert runtime.resident_agents_count == 2
+    assert runtime.passivated_agents_count == 1
+    assert store.get(str(AgentId("counter", "b"))) == {"count": 1}
+
+    # The next message rehydrates "b", which passivates "a".
+    assert await runtime.send_message(MessageType(), AgentId("counter", "b")) == 2
+    assert runtime.passivated_agents_count == 1
+    assert await runtime.send_message(MessageType(), AgentId("counter", "a")) == 3
+    await runtime.stop()
+
+    state = await runtime.save_state()
+    assert {key: value["count"] for key, value in state.items()} == {
+        "counter/a": 3,
+        "counter/b": 2,
+        "counter/c": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_runtime_passivates_idle_agents() -> None:
+    runtime = SingleThreadedAgentRuntime(passivation_policy=AgentPassivationPolicy(idle_timeout=0.05))
+    await CountingAgent.register(runtime, "counter", CountingAgent)
+    await runtime.register_agent_instance(CountingAgent(), AgentId("instance", "default"))
+
+    runtime.start()
+    await runtime.send_message(MessageType(), AgentId("counter", "a"))
+    await runtime.send_message(MessageType(), AgentId("instance", "default"))
+    await asyncio.sleep(0.1)
+    await runtime.send_message(MessageType(), AgentId("counter", "b"))
+
+    # Agents registered as instances cannot be recreated and stay in memory.
+    assert runtime.resident_agents_count == 2
+    assert runtime.passivated_agents_count == 1
+    assert await runtime.send_message(MessageType(), AgentId("counter", "a")) == 2
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_runtime_sweeps_idle_agents() -> None:
+    store = InMemoryStore[Mapping[str, Any]]()
+    runtime = SingleThreadedAgentRuntime(
+        passivation_policy=AgentPassivationPolicy(idle_timeout=0.05, sweep_interval=0.01, state_store=store)
+    )
+    await CountingAgent.register(runtime, "counter", CountingAgent)
+
+    runtime.start()
+    await runtime.send_message(MessageType(), AgentId("counter", "a"))
+    # No other agent is created, the periodic sweep passivates "a".
+    await asyncio.sleep(0.2)
+    assert runtime.resident_agents_count == 0
+    assert runtime.passivated_agents_count == 1
+    assert store.get(str(AgentId("counter", "a"))) == {"count": 1}
+
+    # The saved state is deleted once the agent is rehydrated.
+    assert await runtime.send_message(MessageType(), AgentId("counter", "a")) == 2
+    assert runtime.passivated_agents_count == 0
+    assert store.get(str(AgentId("counter", "a"))) is None
+    await runtime.stop()
+
+
+class SlowSavingAgent(CountingAgent):
+    def __init__(self) -> None:
+        super().__init__()
+        self.closed = False
+
+    async def save_state(self) -> Mapping[str, Any]:
+        await asyncio.sleep(0.05)
+        return await super().save_state()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_runtime_does_not_passivate_agent_about_to_handle_message() -> None:
+    runtime = SingleThreadedAgentRuntime(passivation_policy=AgentPassivationPolicy(max_resident_agents=1))
+    await SlowSavingAgent.register(runtime, "counter", SlowSavingAgent)
+
+    runtime.start()
+    await runtime.send_message(MessageType(), AgentId("counter", "a"))
+    # "b" passivates "a", which takes a while. Meanwhile "c" is created and must not passivate "b".
+    b_id, c_id = AgentId("counter", "b"), AgentId("counter", "c")
+    b_count, c_count = await asyncio.gather(
+        runtime.send_message(MessageType(), b_id), runtime.send_message(MessageType(), c_id)
+    )
+    assert (b_count, c_count) == (1, 1)
+    b = await runtime.try_get_underlying_agent_instance(b_id, type=SlowSavingAgent)
+    assert not b.closed
+    await runtime.stop()
+
+    state = await runtime.save_state()
+    assert {key: value["count"] for key, value in state.items()} == {"counter/a": 1, "counter/b": 1, "counter/c": 1}
+
+
+@pytest.mark.asyncio
+async def test_runtime_publish_does_not_rehydrate_sender() -> None:
+    runtime = SingleThreadedAgentRuntime(passivation_policy=AgentPassivationPolicy(max_resident_agents=1))
+    await CountingAgent.register(runtime, "counter", CountingAgent)
+    await runtime.add_subscription(TypeSubscription("default", "counter"))
+
+    runtime.start()
+    await runtime.send_message(MessageType(), AgentId("counter", "a"))
+    await runtime.send_message(MessageType(), AgentId("counter", "b"))
+    assert runtime.passivated_agents_count == 1
+
+    # "a" is passivated and stays so while a message it published is delivered to "default".
+    await runtime.publish_message(MessageType(), TopicId("default", "default"), sender=AgentId("counter", "a"))
+    await runtime.stop_when_idle()
+    assert runtime.passivated_agents_count == 2
+    assert runtime.resident_agents_count == 1
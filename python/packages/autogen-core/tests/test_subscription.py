@@ -5,8 +5,10 @@
     DefaultTopicId,
     SingleThreadedAgentRuntime,
     TopicId,
+    TypePrefixSubscription,
     TypeSubscription,
 )
+from autogen_core._runtime_impl_helpers import SubscriptionManager
 from autogen_core.exceptions import CantHandleException
 from autogen_test_utils import LoopbackAgent, MessageType
 
@@ -120,3 +122,72 @@ async def test_subscription_deduplication() -> None:
     default_subscription = DefaultSubscription(agent_type=agent_type)
     with pytest.raises(ValueError, match="Subscription already exists"):
         await runtime.add_subscription(default_subscription)
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_routing_order() -> None:
+    manager = SubscriptionManager()
+    exact = TypeSubscription("t1", "a1")
+    prefix = TypePrefixSubscription("t", "a2")
+    longer_prefix = TypePrefixSubscription("t1", "a3")
+    other = TypeSubscription("t2", "a4")
+    for sub in (prefix, exact, other, longer_prefix):
+        await manager.add_subscription(sub)
+
+    # Recipients are returned in registration order regardless of which index matched.
+    assert await manager.get_subscribed_recipients(TopicId("t1", "s")) == [
+        AgentId("a2", "s"),
+        AgentId("a1", "s"),
+        AgentId("a3", "s"),
+    ]
+    assert await manager.get_subscribed_recipients(TopicId("t2", "s")) == [AgentId("a2", "s"), AgentId("a4", "s")]
+    assert await manager.get_subscribed_recipients(TopicId("x", "s")) == []
+
+    await manager.remove_subscription(prefix.id)
+    assert await manager.get_subscribed_recipients(TopicId("t1", "s")) == [AgentId("a1", "s"), AgentId("a3", "s")]
+    assert await manager.get_subscribed_recipients(TopicId("t2", "s")) == [AgentId("a4", "s")]
+
+    await manager.add_subscription(TypePrefixSubscription("", "a5"))
+    assert await manager.get_subscribed_recipients(TopicId("x", "s")) == [AgentId("a5", "s")]
+
+    with pytest.raises(ValueError, match="Subscription does not exist"):
+        await manager.remove_subscription(prefix.id)
+    assert list(manager.subscriptions)[:3] == [exact, other, longer_prefix]
+
+
+class _SourceSubscription(TypeSubscription):
+    def is_match(self, topic_id: TopicId) -> bool:
+        return topic_id.source == self.topic_type
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_custom_subscription() -> None:
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypeSubscription("t1", "a1"))
+    custom = _SourceSubscription("s1", "a2")
+    await manager.add_subscription(custom)
+
+    # Subclasses overriding matching are not indexed by topic type.
+    assert await manager.get_subscribed_recipients(TopicId("t1", "s1")) == [AgentId("a1", "s1"), AgentId("a2", "s1")]
+    assert await manager.get_subscribed_recipients(TopicId("t9", "s1")) == [AgentId("a2", "s1")]
+
+    await manager.remove_subscription(custom.id)
+    assert await manager.get_subscribed_recipients(TopicId("t9", "s1")) == []
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_cache_eviction() -> None:
+    manager = SubscriptionManager(max_cached_topics=2)
+    await manager.add_subscription(TypeSubscription("t", "a"))
+    for source in ("s1", "s2", "s3"):
+        assert await manager.get_subscribed_recipients(TopicId("t", source)) == [AgentId("a", source)]
+    assert len(manager._subscribed_recipients) == 2  # pyright: ignore[reportPrivateUsage]
+    assert TopicId("t", "s1") not in manager._subscribed_recipients  # pyright: ignore[reportPrivateUsage]
+
+    # Adding a subscription only invalidates matching cached topics.
+    await manager.add_subscription(TypeSubscription("t", "b"))
+    assert len(manager._subscribed_recipients) == 0  # pyright: ignore[reportPrivateUsage]
+    assert await manager.get_subscribed_recipients(TopicId("t", "s1")) == [AgentId("a", "s1"), AgentId("b", "s1")]
+    await manager.get_subscribed_recipients(TopicId("u", "s1"))
+    await manager.add_subscription(TypeSubscription("t2", "c"))
+    assert TopicId("u", "s1") in manager._subscribed_recipients  # pyright: ignore[reportPrivateUsage]
@@ -1,4 +1,8 @@
+import asyncio
 import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial
 from typing import Annotated, List
@@ -6,7 +10,7 @@
 import pytest
 from autogen_core import CancellationToken
 from autogen_core._function_utils import get_typed_signature
-from autogen_core.tools import BaseTool, FunctionTool
+from autogen_core.tools import BaseTool, FunctionTool, FunctionToolMetrics
 from autogen_core.tools._base import ToolSchema
 from pydantic import BaseModel, Field, ValidationError, model_serializer
 from pydantic_core import PydanticUndefined
@@ -589,3 +593,101 @@ async def test_func_tool_with_dataclass_conversion_failure() -> None:
 
     with pytest.raises(ValidationError, match="Field required"):
         await tool.run_json(test_input, CancellationToken())
+
+
+def square_tool(x: int) -> int:
+    return x * x
+
+
+@pytest.mark.asyncio
+async def test_func_tool_process_executor() -> None:
+    tool = FunctionTool(square_tool, description="Square a number.", executor="process")
+    assert await tool.run_json({"x": 7}, CancellationToken()) == 49
+    assert tool.metrics.calls == 1
+    assert tool.metrics.total_run_time >= 0
+    assert tool.dump_component().config["executor"] == "process"
+
+    def with_token(x: int, cancellation_token: CancellationToken) -> int:
+        return x
+
+    with pytest.raises(ValueError, match="cancellation token"):
+        FunctionTool(with_token, description="Function tool.", executor="process")
+
+
+@pytest.mark.asyncio
+async def test_func_tool_named_executor_metrics_and_cancellation() -> None:
+    release = threading.Event()
+
+    def blocking(x: int) -> int:
+        release.wait(5)
+        if x < 0:
+            raise ValueError("negative")
+        return x
+
+    FunctionTool.register_executor("test_single_worker", ThreadPoolExecutor(max_workers=1))
+    tool = FunctionTool(blocking, description="Blocking tool.", executor="test_single_worker")
+
+    # The first call takes the only worker, the second waits in the queue and is cancelled there.
+    first = asyncio.ensure_future(tool.run_json({"x": 1}, CancellationToken()))
+    token = CancellationToken()
+    second = asyncio.ensure_future(tool.run_json({"x": 2}, token))
+    await asyncio.sleep(0.1)
+    token.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    third = asyncio.ensure_future(tool.run_json({"x": 3}, CancellationToken()))
+    await asyncio.sleep(0.1)
+    release.set()
+    assert await first == 1
+    assert await third == 3
+    with pytest.raises(ValueError, match="negative"):
+        await tool.run_json({"x": -1}, CancellationToken())
+
+    metrics = tool.metrics
+    assert isinstance(metrics, FunctionToolMetrics)
+    assert (metrics.calls, metrics.errors, metrics.cancelled) == (3, 1, 1)
+    assert metrics.max_queue_wait >= 0.1
+    assert metrics.max_run_time >= 0.1
+    assert metrics.mean_run_time <= metrics.max_run_time
+
+    async def async_function() -> None:
+        return None
+
+    with pytest.raises(ValueError, match="synchronous"):
+        FunctionTool(async_function, description="Function tool.", executor="thread")
+    with pytest.raises(ValueError, match="Unknown executor"):
+        FunctionTool(blocking, description="Function tool.", executor="missing")
+
+
+@pytest.mark.asyncio
+async def test_func_tool_sync_cancellation_keeps_return_value() -> None:
+    running = threading.Event()
+
+    def stoppable(cancellation_token: CancellationToken) -> str:
+        running.set()
+        while not cancellation_token.is_cancelled():
+            time.sleep(0.01)
+        return "stopped"
+
+    tool = FunctionTool(stoppable, description="Stoppable tool.")
+    token = CancellationToken()
+    call = asyncio.ensure_future(tool.run_json({}, token))
+    await asyncio.get_running_loop().run_in_executor(None, running.wait, 5)
+    token.cancel()
+    assert await call == "stopped"
+    assert (tool.metrics.calls, tool.metrics.cancelled) == (1, 0)
+
+
+def test_func_tool_schema_memoized() -> None:
+    def my_function(arg: str, count: int = 1) -> str:
+        return arg * count
+
+    tool = FunctionTool(my_function, description="Function tool.")
+    schema = tool.schema
+    assert tool.schema is schema
+    assert schema["parameters"]["properties"]["count"]["default"] == 1
+
+    # The schema follows changes of the description.
+    tool._description = "Another description."  # pyright: ignore[reportPrivateUsage]
+    assert tool.schema is not schema
+    assert tool.schema.get("description") == "Another description."
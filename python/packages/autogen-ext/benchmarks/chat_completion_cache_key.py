@@ -0,0 +1,83 @@
+"""Benchmark for the cache keys of :class:`~autogen_ext.models.cache.ChatCompletionCache`.
+
+Grows a conversation one message at a time, as an agent does, and reports the average cost of
+computing the cache key at different history lengths. The memoized key builder is compared with
+a full re-serialization of the conversation on every call, which is what the cache did before.
+
+Run with:
+
+.. code-block:: bash
+
+    python benchmarks/chat_completion_cache_key.py
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from typing import Any, List, Mapping
+
+from autogen_core.models import AssistantMessage, LLMMessage, SystemMessage, UserMessage
+from autogen_ext.models.cache._cache_key import CacheKeyBuilder
+from pydantic import BaseModel
+
+
+class Answer(BaseModel):
+    thought: str
+    answer: str
+
+
+def full_key(messages: List[LLMMessage], json_output: type[BaseModel], extra_create_args: Mapping[str, Any]) -> str:
+    data = {
+        "messages": [message.model_dump() for message in messages],
+        "tools": [],
+        "json_output": json.dumps(json_output.model_json_schema()),
+        "extra_create_args": extra_create_args,
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def make_message(i: int) -> LLMMessage:
+    content = f"Message number {i}. " + "Lorem ipsum dolor sit amet. " * 20
+    if i % 2:
+        return AssistantMessage(content=content, source="assistant")
+    return UserMessage(content=content, source="user")
+
+
+def run(history_length: int, repeats: int) -> List[float]:
+    base: List[LLMMessage] = [SystemMessage(content="You are a helpful assistant.")]
+    base.extend(make_message(i) for i in range(history_length - 1))
+    builder = CacheKeyBuilder()
+    builder.build(base, [], Answer, {})
+
+    full_cost = 0.0
+    memoized_cost = 0.0
+    for i in range(repeats):
+        # Each call extends the previously seen history by one new message.
+        messages = [*base, make_message(history_length + i)]
+
+        start = time.perf_counter()
+        full_key(messages, Answer, {})
+        full_cost += time.perf_counter() - start
+
+        start = time.perf_counter()
+        builder.build(messages, [], Answer, {})
+        memoized_cost += time.perf_counter() - start
+    return [full_cost / repeats, memoized_cost / repeats]
+
+
+def main(sizes: List[int], repeats: int) -> None:
+    print(f"{'history':>8} {'full (us)':>10} {'memoized (us)':>14} {'speedup':>8}")  # noqa: T201
+    for size in sizes:
+        full_cost, memoized_cost = run(size, repeats)
+        print(  # noqa: T201
+            f"{size:>8} {full_cost * 1e6:>10.1f} {memoized_cost * 1e6:>14.1f} {full_cost / memoized_cost:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200, 1000])
+    parser.add_argument("--repeats", type=int, default=100)
+    args = parser.parse_args()
+    main(args.sizes, args.repeats)
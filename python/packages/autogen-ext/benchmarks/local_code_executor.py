@@ -0,0 +1,68 @@
+"""Benchmark for the interpreter pool of :class:`~autogen_ext.code_executors.local.LocalCommandLineCodeExecutor`.
+
+Runs many small Python snippets, as an agent does during a task, and reports the snippets per
+second of a new process per code block against a pool of warm interpreters that preload the
+modules the snippets import.
+
+Run with:
+
+.. code-block:: bash
+
+    python benchmarks/local_code_executor.py --preload json decimal
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import List
+
+from autogen_core import CancellationToken
+from autogen_core.code_executor import CodeBlock
+from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
+
+
+async def run(executor: LocalCommandLineCodeExecutor, snippets: int, concurrency: int, preload: List[str]) -> float:
+    imports = "".join(f"import {module}\n" for module in preload)
+    cancellation_token = CancellationToken()
+    await executor.start()
+    # Warm up, so both modes are measured in their steady state.
+    await executor.execute_code_blocks([CodeBlock(code="print(0)", language="python")], cancellation_token)
+
+    async def worker(offset: int) -> None:
+        for i in range(offset, snippets, concurrency):
+            code_blocks = [CodeBlock(code=f"{imports}print(sum(range({i})))", language="python")]
+            result = await executor.execute_code_blocks(code_blocks, cancellation_token)
+            assert result.exit_code == 0, result.output
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await executor.stop()
+    return snippets / elapsed
+
+
+async def main(snippets: int, concurrency: int, preload: List[str], max_executions: int) -> None:
+    with tempfile.TemporaryDirectory() as work_dir:
+        subprocess_rate = await run(LocalCommandLineCodeExecutor(work_dir=work_dir), snippets, concurrency, preload)
+        pool_executor = LocalCommandLineCodeExecutor(
+            work_dir=work_dir,
+            interpreter_pool_size=concurrency,
+            preload_modules=preload,
+            max_executions_per_interpreter=max_executions,
+        )
+        pool_rate = await run(pool_executor, snippets, concurrency, preload)
+    print(f"{'mode':>12} {'snippets/s':>11}")  # noqa: T201
+    print(f"{'subprocess':>12} {subprocess_rate:>11.1f}")  # noqa: T201
+    print(f"{'pool':>12} {pool_rate:>11.1f}")  # noqa: T201
+    print(f"speedup: {pool_rate / subprocess_rate:.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--snippets", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--preload", nargs="*", default=[])
+    parser.add_argument("--max-executions", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.snippets, args.concurrency, args.preload, args.max_executions))
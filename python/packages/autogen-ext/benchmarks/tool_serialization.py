@@ -0,0 +1,86 @@
+"""Benchmark for the per-turn cost of serializing the tools of an agent for a model client.
+
+Agents send the same tools to the model client on every turn, and the client converts each of
+them to the payload of its API. The memoized path, where the tool schemas and the converted
+payloads are computed once per tool, is compared with building the schema from the argument
+model and converting it on every turn, which is what the clients did before.
+
+Run with:
+
+.. code-block:: bash
+
+    python benchmarks/tool_serialization.py --tools 50
+"""
+
+import argparse
+import time
+from typing import Any, Callable, List, Literal, Optional, Tuple
+
+from autogen_core.tools import FunctionTool
+from autogen_ext.models.anthropic import _anthropic_client
+from autogen_ext.models.ollama import _ollama_client
+from autogen_ext.models.openai import _openai_client
+from pydantic import BaseModel
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    country: Optional[str] = None
+
+
+def make_tool(i: int) -> FunctionTool:
+    def tool(
+        query: str, limit: int = 10, mode: Literal["fast", "exact"] = "fast", address: Optional[Address] = None
+    ) -> str:
+        return query
+
+    return FunctionTool(tool, name=f"tool_{i}", description=f"Tool number {i}, which looks things up.")
+
+
+def run(
+    convert: Callable[[Any], Any], convert_one: Callable[[Any], Any], tools: List[FunctionTool], turns: int
+) -> Tuple[float, float]:
+    convert(tools)
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        convert(tools)
+    memoized = (time.perf_counter() - start) / turns
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        # Builds the schema from the argument model, bypassing the memoized schema, and converts it.
+        [convert_one(tool._build_schema()) for tool in tools]  # pyright: ignore[reportPrivateUsage]
+    unmemoized = (time.perf_counter() - start) / turns
+
+    return memoized, unmemoized
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=50, help="Number of tools of the agent.")
+    parser.add_argument("--turns", type=int, default=200, help="Number of turns to average over.")
+    args = parser.parse_args()
+
+    tools = [make_tool(i) for i in range(args.tools)]
+    clients = {
+        "openai": _openai_client,
+        "anthropic": _anthropic_client,
+        "ollama": _ollama_client,
+    }
+    print(f"{'client':>10} {'memoized (us/turn)':>20} {'unmemoized (us/turn)':>22} {'speedup':>8}")  # noqa: T201
+    for name, module in clients.items():
+        memoized, unmemoized = run(
+            module.convert_tools,
+            module._convert_tool,  # pyright: ignore[reportPrivateUsage]
+            tools,
+            args.turns,
+        )
+        print(  # noqa: T201
+            f"{name:>10} {memoized * 1e6:>20.1f} {unmemoized * 1e6:>22.1f} {unmemoized / memoized:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
+import asyncio
+from concurrent.futures import Executor
 from typing import Any, Optional, TypeVar, cast
 
 import diskcache
-from autogen_core import CacheStore, Component
+from autogen_core import AsyncCacheStore, CacheStore, Component
 from pydantic import BaseModel
 from typing_extensions import Self
 
@@ -37,6 +39,9 @@ def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
     def set(self, key: str, value: T) -> None:
         self.cache.set(key, cast(Any, value))  # type: ignore[reportUnknownMemberType]
 
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)  # type: ignore[reportUnknownMemberType]
+
     def _to_config(self) -> DiskCacheStoreConfig:
         # Get directory from cache instance
         return DiskCacheStoreConfig(directory=self.cache.directory)
@@ -44,3 +49,41 @@ def _to_config(self) -> DiskCacheStoreConfig:
     @classmethod
     def _from_config(cls, config: DiskCacheStoreConfig) -> Self:
         return cls(cache_instance=diskcache.Cache(config.directory))  # type: ignore[no-any-return]
+
+
+class AsyncDiskCacheStore(AsyncCacheStore[T], Component[DiskCacheStoreConfig]):
+    """
+    An :class:`~autogen_core.AsyncCacheStore` implementation that uses diskcache as the
+    underlying storage. diskcache is a blocking, file-backed store, so every operation
+    is dispatched to a thread pool to keep the event loop responsive.
+    See :class:`~autogen_ext.models.cache.ChatCompletionCache` for an example of usage.
+
+    Args:
+        cache_instance: An instance of diskcache.Cache.
+                        The user is responsible for managing the DiskCache instance's lifetime.
+        executor (optional): The executor to run diskcache operations in.
+                             Defaults to the event loop's default thread pool.
+    """
+
+    component_config_schema = DiskCacheStoreConfig
+    component_provider_override = "autogen_ext.cache_store.diskcache.AsyncDiskCacheStore"
+
+    def __init__(self, cache_instance: diskcache.Cache, executor: Optional[Executor] = None):  # type: ignore[no-any-unimported]
+        self.cache = cache_instance
+        self._executor = executor
+
+    async def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        loop = asyncio.get_running_loop()
+        value = await loop.run_in_executor(self._executor, self.cache.get, key, default)  # type: ignore[reportUnknownMemberType]
+        return cast(Optional[T], value)
+
+    async def set(self, key: str, value: T) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.cache.set, key, cast(Any, value))  # type: ignore[reportUnknownMemberType]
+
+    def _to_config(self) -> DiskCacheStoreConfig:
+        return DiskCacheStoreConfig(directory=self.cache.directory)
+
+    @classmethod
+    def _from_config(cls, config: DiskCacheStoreConfig) -> Self:
+        return cls(cache_instance=diskcache.Cache(config.directory))  # type: ignore[no-any-return]
@@ -1,7 +1,8 @@
 from typing import Any, Dict, Optional, TypeVar, cast
 
 import redis
-from autogen_core import CacheStore, Component
+import redis.asyncio
+from autogen_core import AsyncCacheStore, CacheStore, Component
 from pydantic import BaseModel
 from typing_extensions import Self
 
@@ -21,6 +22,25 @@ class RedisStoreConfig(BaseModel):
     socket_timeout: Optional[float] = None
 
 
+def _config_from_connection_pool(connection_pool: Any) -> RedisStoreConfig:
+    # Extract connection info from the redis instance's connection pool
+    connection_kwargs: Dict[str, Any] = connection_pool.connection_kwargs
+
+    username = connection_kwargs.get("username")
+    password = connection_kwargs.get("password")
+    socket_timeout = connection_kwargs.get("socket_timeout")
+
+    return RedisStoreConfig(
+        host=str(connection_kwargs.get("host", "localhost")),
+        port=int(connection_kwargs.get("port", 6379)),
+        db=int(connection_kwargs.get("db", 0)),
+        username=str(username) if username is not None else None,
+        password=str(password) if password is not None else None,
+        ssl=bool(connection_kwargs.get("ssl", False)),
+        socket_timeout=float(socket_timeout) if socket_timeout is not None else None,
+    )
+
+
 class RedisStore(CacheStore[T], Component[RedisStoreConfig]):
     """
     A typed CacheStore implementation that uses redis as the underlying storage.
@@ -46,24 +66,11 @@ def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
     def set(self, key: str, value: T) -> None:
         self.cache.set(key, cast(Any, value))
 
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
     def _to_config(self) -> RedisStoreConfig:
-        # Extract connection info from redis instance
-        connection_pool = self.cache.connection_pool
-        connection_kwargs: Dict[str, Any] = connection_pool.connection_kwargs  # type: ignore[reportUnknownMemberType]
-
-        username = connection_kwargs.get("username")
-        password = connection_kwargs.get("password")
-        socket_timeout = connection_kwargs.get("socket_timeout")
-
-        return RedisStoreConfig(
-            host=str(connection_kwargs.get("host", "localhost")),
-            port=int(connection_kwargs.get("port", 6379)),
-            db=int(connection_kwargs.get("db", 0)),
-            username=str(username) if username is not None else None,
-            password=str(password) if password is not None else None,
-            ssl=bool(connection_kwargs.get("ssl", False)),
-            socket_timeout=float(socket_timeout) if socket_timeout is not None else None,
-        )
+        return _config_from_connection_pool(self.cache.connection_pool)
 
     @classmethod
     def _from_config(cls, config: RedisStoreConfig) -> Self:
@@ -78,3 +85,46 @@ def _from_config(cls, config: RedisStoreConfig) -> Self:
             socket_timeout=config.socket_timeout,
         )
         return cls(redis_instance=redis_instance)
+
+
+class AsyncRedisStore(AsyncCacheStore[T], Component[RedisStoreConfig]):
+    """
+    An :class:`~autogen_core.AsyncCacheStore` implementation that uses the asyncio
+    redis client, so lookups do not block the event loop.
+    See :class:`~autogen_ext.models.cache.ChatCompletionCache` for an example of usage.
+
+    Args:
+        redis_instance: An instance of `redis.asyncio.Redis`.
+                        The user is responsible for managing the Redis instance's lifetime.
+    """
+
+    component_config_schema = RedisStoreConfig
+    component_provider_override = "autogen_ext.cache_store.redis.AsyncRedisStore"
+
+    def __init__(self, redis_instance: redis.asyncio.Redis):
+        self.cache = redis_instance
+
+    async def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        value = cast(Optional[T], await self.cache.get(key))
+        if value is None:
+            return default
+        return value
+
+    async def set(self, key: str, value: T) -> None:
+        await self.cache.set(key, cast(Any, value))
+
+    def _to_config(self) -> RedisStoreConfig:
+        return _config_from_connection_pool(self.cache.connection_pool)
+
+    @classmethod
+    def _from_config(cls, config: RedisStoreConfig) -> Self:
+        redis_instance = redis.asyncio.Redis(
+            host=config.host,
+            port=config.port,
+            db=config.db,
+            username=config.username,
+            password=config.password,
+            ssl=config.ssl,
+            socket_timeout=config.socket_timeout,
+        )
+        return cls(redis_instance=redis_instance)
@@ -1,10 +1,12 @@
+import asyncio
+import codecs
 import inspect
 import re
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent, indent
-from typing import Any, Callable, Optional, Sequence, Set, TypeVar, Union
+from typing import Any, AsyncGenerator, BinaryIO, Callable, List, Optional, Sequence, Set, TypeVar, Union
 
 from autogen_core.code_executor import Alias, CodeResult, FunctionWithRequirements, FunctionWithRequirementsStr, Import
 from typing_extensions import ParamSpec
@@ -21,6 +23,112 @@ class CommandLineCodeResult(CodeResult):
 P = ParamSpec("P")
 
 
+class OutputCapture:
+    """Collects the output of a command, keeping at most `max_bytes` of it in memory.
+
+    When the output exceeds `max_bytes`, only its head and tail are kept, and
+    :meth:`getvalue` marks the bytes left out in between. If `spill_path` is given,
+    the complete output is written to that file once it exceeds the budget.
+
+    Args:
+        max_bytes (Optional[int]): The number of bytes to keep. If None, the whole output is kept.
+        spill_path (Optional[Path]): The file to write the complete output to when it is truncated.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, spill_path: Optional[Path] = None) -> None:
+        if max_bytes is not None and max_bytes < 2:
+            raise ValueError("max_bytes must be at least 2.")
+        self._max_bytes = max_bytes
+        self._spill_path = spill_path
+        self._spill: Optional[BinaryIO] = None
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._total_bytes = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    @property
+    def total_bytes(self) -> int:
+        """The number of bytes written so far."""
+        return self._total_bytes
+
+    @property
+    def truncated(self) -> bool:
+        """Whether part of the output was left out."""
+        return self._max_bytes is not None and self._total_bytes > self._max_bytes
+
+    @property
+    def spill_path(self) -> Optional[Path]:
+        """The file holding the complete output, if the output was truncated and spilled."""
+        return self._spill_path if self._spill is not None else None
+
+    def write(self, data: bytes) -> str:
+        """Add a chunk of output and return it decoded, for streaming it to a caller."""
+        text = self._decoder.decode(data)
+        if self._max_bytes is None:
+            self._head += data
+            self._total_bytes += len(data)
+            return text
+        if self._spill is None and self._spill_path is not None and self._total_bytes + len(data) > self._max_bytes:
+            # Nothing was left out yet, so the head and tail still hold all of the output.
+            self._spill = self._spill_path.open("wb")
+            self._spill.write(self._head)
+            self._spill.write(self._tail)
+        if self._spill is not None:
+            self._spill.write(data)
+        self._total_bytes += len(data)
+        head_size = self._max_bytes - self._max_bytes // 2
+        if len(self._head) < head_size:
+            kept = data[: head_size - len(self._head)]
+            self._head += kept
+            data = data[len(kept) :]
+        if data:
+            self._tail += data
+            excess = len(self._tail) - self._max_bytes // 2
+            if excess > 0:
+                del self._tail[:excess]
+        return text
+
+    def getvalue(self) -> str:
+        """Return the kept output, with a marker where bytes were left out."""
+        if not self.truncated:
+            return (self._head + self._tail).decode("utf-8", errors="replace")
+        omitted = self._total_bytes - len(self._head) - len(self._tail)
+        location = f"; the full output is in {self._spill_path}" if self._spill is not None else ""
+        return (
+            self._head.decode("utf-8", errors="replace")
+            + f"\n[... {omitted} bytes truncated{location} ...]\n"
+            + self._tail.decode("utf-8", errors="replace")
+        )
+
+    def close(self) -> None:
+        """Close the spill file."""
+        if self._spill is not None:
+            self._spill.close()
+
+
+async def drain_until_done(queue: "asyncio.Queue[str]", task: "asyncio.Future[T]") -> AsyncGenerator[str, None]:
+    """Yield the items put in `queue` until `task` is done, then the items still in the queue.
+
+    The task is not awaited, so its result or exception must be retrieved by the caller.
+    If the consumer stops early, the task is cancelled."""
+    try:
+        while not task.done():
+            getter = asyncio.ensure_future(queue.get())
+            waiters: List["asyncio.Future[Any]"] = [getter, task]
+            try:
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+            if getter.done() and not getter.cancelled():
+                yield getter.result()
+        while not queue.empty():
+            yield queue.get_nowait()
+    finally:
+        if not task.done():
+            task.cancel()
+
+
 def _to_code(func: Union[FunctionWithRequirements[T, P], Callable[P, T], FunctionWithRequirementsStr]) -> str:
     if isinstance(func, FunctionWithRequirementsStr):
         return func.func
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Coroutine, Dict, Generic, List, Optional, Set, TypeVar
+
+from autogen_core import ComponentBase
+from pydantic import BaseModel
+from typing_extensions import Self
+
+KernelT = TypeVar("KernelT")
+
+
+class BaseKernelPool(ABC, Generic[KernelT], ComponentBase[BaseModel]):
+    """Base class of pools of pre-started Jupyter kernels that code executors lease and give back.
+
+    :meth:`start` starts `size` kernels and runs the `warmup_code` in each of them. When a
+    kernel is given back, it is shut down once it has served `max_uses` leases, and otherwise
+    returned to the pool with its state. The default of 1 gives every lease a fresh kernel.
+    Kernels that will not come back are replaced in the background as soon as they are leased,
+    so the next lease, for example the one made by a code executor that restarts, is served by
+    a warm kernel.
+
+    Subclasses implement how kernels are started, warmed up and shut down."""
+
+    component_type = "kernel_pool"
+
+    def __init__(self, size: int = 1, *, warmup_code: Optional[str] = None, max_uses: int = 1) -> None:
+        if size < 1:
+            raise ValueError("Kernel pool size must be at least 1.")
+        if max_uses < 1:
+            raise ValueError("max_uses must be at least 1.")
+        self._size = size
+        self._warmup_code = warmup_code
+        self._max_uses = max_uses
+        self._idle: List[KernelT] = []
+        self._uses: Dict[KernelT, int] = {}
+        self._leased: Set[KernelT] = set()
+        self._starting = 0
+        self._background_tasks: Set["asyncio.Task[None]"] = set()
+        self._started = False
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """The number of kernels kept ready."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """The number of kernels that are ready to be leased."""
+        return len(self._idle)
+
+    @abstractmethod
+    async def _start_kernel(self) -> KernelT: ...
+
+    @abstractmethod
+    async def _run_warmup(self, kernel: KernelT, code: str) -> None:
+        """Run the warm-up code in the kernel, raising an exception if it fails."""
+        ...
+
+    @abstractmethod
+    async def _shutdown_kernel(self, kernel: KernelT) -> None: ...
+
+    async def _is_alive(self, kernel: KernelT) -> bool:
+        return True
+
+    async def _start_warm_kernel(self) -> KernelT:
+        kernel = await self._start_kernel()
+        if self._warmup_code is not None:
+            try:
+                await self._run_warmup(kernel, self._warmup_code)
+            except BaseException:
+                await self._shutdown_kernel(kernel)
+                raise
+        self._uses[kernel] = 0
+        return kernel
+
+    def _run_in_background(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _replenish_one(self) -> None:
+        try:
+            kernel = await self._start_warm_kernel()
+        except Exception as e:
+            # The next lease starts a kernel itself and reports the error.
+            logging.warning(f"Failed to start a replacement kernel: {e}")
+            return
+        finally:
+            self._starting -= 1
+        if self._closed:
+            await self._discard(kernel)
+        else:
+            self._idle.append(kernel)
+
+    def _replenish(self) -> None:
+        returning = sum(1 for kernel in self._leased if self._uses[kernel] < self._max_uses)
+        while not self._closed and len(self._idle) + self._starting + returning < self._size:
+            self._starting += 1
+            self._run_in_background(self._replenish_one())
+
+    async def _discard(self, kernel: KernelT) -> None:
+        self._uses.pop(kernel, None)
+        self._leased.discard(kernel)
+        try:
+            await self._shutdown_kernel(kernel)
+        except Exception as e:
+            logging.warning(f"Failed to shut down kernel: {e}")
+
+    async def start(self) -> None:
+        """Start the kernels of the pool. Does nothing if the pool is already started."""
+        if self._closed:
+            raise RuntimeError("Kernel pool is stopped.")
+        if self._started:
+            return
+        self._started = True
+        count = self._size - len(self._idle) - self._starting
+        self._starting += count
+        results = await asyncio.gather(*(self._start_warm_kernel() for _ in range(count)), return_exceptions=True)
+        self._starting -= count
+        errors: List[BaseException] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                self._idle.append(result)
+        if errors:
+            raise errors[0]
+
+    async def acquire(self) -> KernelT:
+        """Lease a kernel. If no kernel is ready, one is started."""
+        if self._closed:
+            raise RuntimeError("Kernel pool is stopped.")
+        kernel: Optional[KernelT] = None
+        while self._idle:
+            candidate = self._idle.pop(0)
+            if await self._is_alive(candidate):
+                kernel = candidate
+                break
+            self._run_in_background(self._discard(candidate))
+        if kernel is None:
+            kernel = await self._start_warm_kernel()
+        self._uses[kernel] += 1
+        self._leased.add(kernel)
+        self._replenish()
+        return kernel
+
+    async def release(self, kernel: KernelT) -> None:
+        """Give back a leased kernel.
+
+        The kernel is returned to the pool if it can serve more leases, and otherwise shut down
+        in the background."""
+        uses = self._uses.get(kernel)
+        self._leased.discard(kernel)
+        if (
+            uses is not None
+            and uses < self._max_uses
+            and not self._closed
+            and len(self._idle) < self._size
+            and await self._is_alive(kernel)
+        ):
+            self._idle.append(kernel)
+            return
+        self._run_in_background(self._discard(kernel))
+        self._replenish()
+
+    async def stop(self) -> None:
+        """Shut down all kernels, including the leased ones."""
+        self._closed = True
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        kernels = list(self._uses)
+        self._idle.clear()
+        await asyncio.gather(*(self._discard(kernel) for kernel in kernels))
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
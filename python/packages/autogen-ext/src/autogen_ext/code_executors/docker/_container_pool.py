@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+import tempfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+from docker.types import DeviceRequest
+
+try:
+    import docker
+    from docker.errors import DockerException, ImageNotFound, NotFound
+    from docker.models.containers import Container
+except ImportError as e:
+    raise RuntimeError(
+        "Missing dependecies for DockerContainerPool. Please ensure the autogen-ext package was installed with the 'docker' extra."
+    ) from e
+
+
+@dataclass
+class ContainerPoolStats:
+    """Utilization of a :class:`DockerContainerPool`."""
+
+    containers: int
+    """Number of containers owned by the pool."""
+    leased: int
+    """Number of containers currently leased."""
+    cold_starts: int
+    """Total number of containers created, including the ones created when the pool started."""
+    warm_leases: int
+    """Total number of leases served by a container that was already running."""
+    replaced: int
+    """Total number of containers removed because they failed a health check."""
+
+    @property
+    def idle(self) -> int:
+        """Number of running containers that are not leased."""
+        return self.containers - self.leased
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the containers that are leased."""
+        return self.leased / self.containers if self.containers else 0.0
+
+
+@dataclass
+class ContainerLease:
+    """A container leased from a :class:`DockerContainerPool`.
+
+    The container mounts `work_dir` at ``/workspace``. The directory is emptied from inside the
+    container when the lease is returned, so each lease starts with an empty workspace."""
+
+    container: Container
+    """The leased container."""
+    work_dir: Path
+    """The host directory mounted at ``/workspace`` in the container."""
+
+
+# Empties the workspace, including hidden files, as the container user so that files created as root are removed too.
+_CLEAN_WORKSPACE_COMMAND = ["sh", "-c", "rm -rf /workspace/* /workspace/.[!.]* /workspace/..?*"]
+
+
+async def _wait_for_ready(container: Any, timeout: int = 60, stop_time: float = 0.1) -> None:
+    elapsed_time = 0.0
+    while container.status != "running" and elapsed_time < timeout:
+        await asyncio.sleep(stop_time)
+        elapsed_time += stop_time
+        await asyncio.to_thread(container.reload)
+    if container.status != "running":
+        raise ValueError("Container failed to start")
+
+
+class DockerContainerPool:
+    """A pool of warm Docker containers that code executors lease and return.
+
+    .. note::
+
+        This class requires the :code:`docker` extra for the :code:`autogen-ext` package:
+
+        .. code-block:: bash
+
+            pip install "autogen-ext[docker]"
+
+    :meth:`start` creates `size` containers up front, so
+    :class:`~autogen_ext.code_executors.docker.DockerCommandLineCodeExecutor` instances that
+    use the pool start without the cost of creating a container. Each container mounts its
+    own directory under `work_dir` as ``/workspace``. When a lease is returned, the processes
+    left running in the container are killed and its workspace is emptied from inside the
+    container, so leases do not see each other's files. A container whose workspace cannot be
+    emptied is replaced. Other changes to the container, such as installed packages, persist.
+    Executors holding different leases run code concurrently.
+
+    When all containers are leased, the pool creates more, up to `max_size`, and otherwise
+    waits for a container to be returned. Containers are checked before they are leased and,
+    if `health_check_interval` is set, periodically while idle; containers that are no
+    longer running are replaced.
+
+    Args:
+        image (str, optional): Docker image to use for the containers. Defaults to "python:3-slim".
+        size (int, optional): Number of containers created when the pool starts. Defaults to 1.
+        max_size (Optional[int], optional): Maximum number of containers. Defaults to `size`.
+        work_dir (Union[Path, str, None], optional): The directory holding the workspaces of the containers.
+            Defaults to a temporary directory.
+        bind_dir (Union[Path, str, None], optional): The host path of `work_dir` to bind to the containers.
+            Useful when the pool runs in a container itself. Defaults to `work_dir`.
+        auto_remove (bool, optional): If true, the containers are removed by Docker when they stop. Defaults to True.
+        device_requests (Optional[List[DeviceRequest]], optional): Device requests added to the containers. Defaults to None.
+        extra_volumes (Optional[Dict[str, Dict[str, str]]], optional): Extra volumes to mount to the containers. Defaults to None.
+        extra_hosts (Optional[Dict[str, str]], optional): Host mappings to add to the containers. Defaults to None.
+        init_command (Optional[str], optional): A shell command to run when a container starts. Defaults to None.
+        health_check_interval (Optional[float], optional): Seconds between health checks of idle containers.
+            If None, containers are only checked when they are leased. Defaults to None.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_core import CancellationToken
+            from autogen_core.code_executor import CodeBlock
+            from autogen_ext.code_executors.docker import DockerCommandLineCodeExecutor, DockerContainerPool
+
+
+            async def main() -> None:
+                async with DockerContainerPool(size=4) as pool:
+
+                    async def run(i: int) -> str:
+                        async with DockerCommandLineCodeExecutor(container_pool=pool) as executor:
+                            code_blocks = [CodeBlock(code=f"print({i})", language="python")]
+                            result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+                            return result.output
+
+                    print(await asyncio.gather(*(run(i) for i in range(8))))
+                    print(pool.stats)
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        image: str = "python:3-slim",
+        *,
+        size: int = 1,
+        max_size: Optional[int] = None,
+        work_dir: Union[Path, str, None] = None,
+        bind_dir: Union[Path, str, None] = None,
+        auto_remove: bool = True,
+        device_requests: Optional[List[DeviceRequest]] = None,
+        extra_volumes: Optional[Dict[str, Dict[str, str]]] = None,
+        extra_hosts: Optional[Dict[str, str]] = None,
+        init_command: Optional[str] = None,
+        health_check_interval: Optional[float] = None,
+    ) -> None:
+        if size < 0:
+            raise ValueError("size must be greater than or equal to 0.")
+        if max_size is None:
+            max_size = max(size, 1)
+        if max_size < 1 or max_size < size:
+            raise ValueError("max_size must be at least 1 and at least size.")
+        if health_check_interval is not None and health_check_interval <= 0:
+            raise ValueError("health_check_interval must be greater than 0.")
+        self._image = image
+        self._size = size
+        self._max_size = max_size
+        self._work_dir = Path(work_dir) if work_dir is not None else None
+        self._bind_dir = Path(bind_dir) if bind_dir is not None else None
+        self._auto_remove = auto_remove
+        self._device_requests = device_requests
+        self._extra_volumes = extra_volumes if extra_volumes is not None else {}
+        self._extra_hosts = extra_hosts if extra_hosts is not None else {}
+        self._init_command = init_command
+        self._health_check_interval = health_check_interval
+
+        self._client: Optional[docker.DockerClient] = None
+        self._temp_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+        # None is a sentinel put by stop to wake the callers waiting in acquire.
+        self._idle: asyncio.Queue[Optional[ContainerLease]] = asyncio.Queue()
+        self._leased: Set[str] = set()
+        self._containers: Dict[str, ContainerLease] = {}
+        self._creating = 0
+        self._health_check_task: Optional[asyncio.Task[None]] = None
+        self._running = False
+        self._cold_starts = 0
+        self._warm_leases = 0
+        self._replaced = 0
+
+    @property
+    def stats(self) -> ContainerPoolStats:
+        """The current utilization of the pool."""
+        return ContainerPoolStats(
+            containers=len(self._containers),
+            leased=len(self._leased),
+            cold_starts=self._cold_starts,
+            warm_leases=self._warm_leases,
+            replaced=self._replaced,
+        )
+
+    @property
+    def work_dir(self) -> Path:
+        if self._work_dir is not None:
+            return self._work_dir
+        if self._temp_dir is not None:
+            return Path(self._temp_dir.name)
+        raise RuntimeError("Working directory not properly initialized")
+
+    async def start(self) -> None:
+        """Connect to Docker, pull the image if needed and create the initial containers."""
+        if self._running:
+            return
+        if self._work_dir is None and self._temp_dir is None:
+            self._temp_dir = tempfile.TemporaryDirectory()
+        self.work_dir.mkdir(exist_ok=True, parents=True)
+        self._idle = asyncio.Queue()
+
+        try:
+            self._client = docker.from_env()
+        except DockerException as e:
+            if "FileNotFoundError" in str(e):
+                raise RuntimeError("Failed to connect to Docker. Please ensure Docker is installed and running.") from e
+            raise
+        try:
+            await asyncio.to_thread(self._client.images.get, self._image)
+        except ImageNotFound:
+            logging.info(f"Pulling image {self._image}...")
+            await asyncio.to_thread(self._client.images.pull, self._image)
+
+        self._running = True
+        self._creating += self._size
+        try:
+            leases = await asyncio.gather(*(self._create() for _ in range(self._size)))
+        except BaseException:
+            self._creating -= self._size
+            await self.stop()
+            raise
+        self._creating -= self._size
+        for lease in leases:
+            self._idle.put_nowait(lease)
+
+        if self._health_check_interval is not None:
+            self._health_check_task = asyncio.create_task(self._run_health_checks(self._health_check_interval))
+
+    async def stop(self) -> None:
+        """Remove all containers, including leased ones, and the temporary working directory."""
+        self._running = False
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+            except asyncio.CancelledError:
+                pass
+            self._health_check_task = None
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        self._idle.put_nowait(None)
+        containers = list(self._containers.values())
+        self._containers.clear()
+        self._leased.clear()
+        await asyncio.gather(*(self._remove(lease) for lease in containers))
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+
+    async def __aenter__(self) -> "DockerContainerPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
+
+    async def _create(self) -> ContainerLease:
+        assert self._client is not None
+        client = self._client
+        name = f"autogen-code-exec-pool-{uuid.uuid4()}"
+        work_dir = self.work_dir / name
+        work_dir.mkdir()
+        bind_dir = (self._bind_dir / name) if self._bind_dir is not None else work_dir
+        shell_command = "/bin/sh"
+        command = ["-c", f"{(self._init_command)};exec {shell_command}"] if self._init_command else None
+        container = await asyncio.to_thread(
+            client.containers.create,
+            self._image,
+            name=name,
+            entrypoint=shell_command,
+            command=command,
+            tty=True,
+            detach=True,
+            auto_remove=self._auto_remove,
+            volumes={str(bind_dir.resolve()): {"bind": "/workspace", "mode": "rw"}, **self._extra_volumes},
+            working_dir="/workspace",
+            extra_hosts=self._extra_hosts,
+            device_requests=self._device_requests,
+        )
+        lease = ContainerLease(container=container, work_dir=work_dir)
+        try:
+            await asyncio.to_thread(container.start)
+            await _wait_for_ready(container)
+        except BaseException:
+            await self._remove(lease)
+            raise
+        self._cold_starts += 1
+        self._containers[container.name] = lease
+        return lease
+
+    async def _remove(self, lease: ContainerLease) -> None:
+        self._containers.pop(lease.container.name, None)
+        try:
+            await asyncio.to_thread(lease.container.remove, force=True)
+        except NotFound:
+            pass
+        except DockerException as e:
+            logging.error(f"Failed to remove container {lease.container.name}: {e}")
+        shutil.rmtree(lease.work_dir, ignore_errors=True)
+
+    async def _is_healthy(self, lease: ContainerLease) -> bool:
+        try:
+            await asyncio.to_thread(lease.container.reload)
+        except DockerException:
+            return False
+        return bool(lease.container.status == "running")
+
+    async def acquire(self) -> ContainerLease:
+        """Lease a container, creating one if none is idle and the pool is not full,
+        and otherwise waiting for one to be returned.
+
+        Raises:
+            RuntimeError: If the pool is not running, or is stopped while waiting."""
+        while True:
+            if not self._running:
+                raise RuntimeError(
+                    "Container pool is not running. Must first be started with either start or a context manager."
+                )
+            if self._idle.empty() and len(self._containers) + self._creating < self._max_size:
+                self._creating += 1
+                try:
+                    lease = await self._create()
+                finally:
+                    self._creating -= 1
+                if not self._running:
+                    await self._remove(lease)
+                    continue
+            else:
+                idle = await self._idle.get()
+                if idle is None:
+                    # The pool was stopped; pass the sentinel on to the next waiter.
+                    self._idle.put_nowait(None)
+                    continue
+                lease = idle
+                try:
+                    healthy = await self._is_healthy(lease)
+                except BaseException:
+                    self._idle.put_nowait(lease)
+                    raise
+                if not healthy:
+                    logging.warning(f"Replacing container {lease.container.name}, which is no longer running.")
+                    self._replaced += 1
+                    await self._remove(lease)
+                    continue
+                self._warm_leases += 1
+            self._leased.add(lease.container.name)
+            return lease
+
+    async def release(self, lease: ContainerLease) -> None:
+        """Return a leased container to the pool.
+
+        The processes left running in the container are killed and its workspace is emptied.
+        If the workspace cannot be emptied, the container is replaced with a new one."""
+        self._leased.discard(lease.container.name)
+        if not self._running or lease.container.name not in self._containers:
+            await self._remove(lease)
+            return
+        try:
+            # Kill every process except the shell that keeps the container running.
+            await asyncio.to_thread(lease.container.exec_run, ["sh", "-c", "kill -9 -1"])
+        except DockerException as e:
+            logging.warning(f"Failed to reset container {lease.container.name}: {e}")
+        try:
+            result = await asyncio.to_thread(lease.container.exec_run, _CLEAN_WORKSPACE_COMMAND)
+            error = None if result.exit_code == 0 else result.output.decode("utf-8", errors="replace")
+        except DockerException as e:
+            error = str(e)
+        if error is not None:
+            logging.warning(
+                f"Replacing container {lease.container.name}, whose workspace could not be emptied: {error}"
+            )
+            self._replaced += 1
+            await self._remove(lease)
+            await self._replace()
+            return
+        if not self._running:
+            await self._remove(lease)
+            return
+        self._idle.put_nowait(lease)
+
+    async def _replace(self) -> None:
+        """Create a container in place of one that was removed, so that callers waiting in acquire get one."""
+        if not self._running:
+            return
+        self._creating += 1
+        try:
+            lease = await self._create()
+        except Exception as e:
+            logging.error(f"Failed to replace container: {e}")
+            return
+        finally:
+            self._creating -= 1
+        if not self._running:
+            await self._remove(lease)
+            return
+        self._idle.put_nowait(lease)
+
+    async def _run_health_checks(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            idle: List[ContainerLease] = []
+            while not self._idle.empty():
+                item = self._idle.get_nowait()
+                if item is not None:
+                    idle.append(item)
+            healthy = await asyncio.gather(*(self._is_healthy(lease) for lease in idle))
+            for lease, is_healthy in zip(idle, healthy, strict=True):
+                if is_healthy:
+                    self._idle.put_nowait(lease)
+                    continue
+                logging.warning(f"Replacing container {lease.container.name}, which is no longer running.")
+                self._replaced += 1
+                await self._remove(lease)
+                # Keep the pool at its initial size.
+                if len(self._containers) + self._creating < self._size:
+                    try:
+                        self._idle.put_nowait(await self._create())
+                    except Exception as e:
+                        logging.error(f"Failed to replace container: {e}")
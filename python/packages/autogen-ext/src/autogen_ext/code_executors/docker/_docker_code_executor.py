@@ -14,7 +14,7 @@
 from concurrent.futures import Future as ConcurrentFuture
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Dict, List, Optional, ParamSpec, Tuple, Union
+from typing import Any, AsyncGenerator, Callable, ClassVar, Dict, List, Optional, ParamSpec, Tuple, Union
 
 from autogen_core import CancellationToken, Component
 from autogen_core.code_executor import (
@@ -30,11 +30,14 @@
 
 from .._common import (
     CommandLineCodeResult,
+    OutputCapture,
     build_python_functions_file,
+    drain_until_done,
     get_file_name_from_content,
     lang_to_cmd,
     silence_pip,
 )
+from ._container_pool import ContainerLease, DockerContainerPool
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -82,6 +85,7 @@ class DockerCommandLineCodeExecutorConfig(BaseModel):
     extra_hosts: Dict[str, str] = {}
     init_command: Optional[str] = None
     delete_tmp_files: bool = False
+    max_output_bytes: Optional[int] = None
 
 
 class DockerCommandLineCodeExecutor(CodeExecutor, Component[DockerCommandLineCodeExecutorConfig]):
@@ -130,6 +134,14 @@ class DockerCommandLineCodeExecutor(CodeExecutor, Component[DockerCommandLineCod
         init_command (Optional[str], optional): A shell command to run before each shell operation execution. Defaults to None.
             Example: init_command="kubectl config use-context docker-hub"
         delete_tmp_files (bool, optional): If true, will delete temporary files after execution. Defaults to False.
+        max_output_bytes (Optional[int], optional): The number of bytes of output of a code block kept in the result.
+            Longer output is truncated to its head and tail, and written in full to a log file next to the code file.
+            If None, the whole output is kept. Defaults to None.
+        container_pool (Optional[DockerContainerPool], optional): A pool to lease a warm container from instead of
+            creating one. :meth:`start` leases a container and :meth:`stop` returns it, so the working directory is the
+            workspace of the leased container and is emptied when the executor stops. The image, container and volume
+            arguments are taken from the pool, and `work_dir` and `bind_dir` cannot be set. The pool is not included
+            in the serialized configuration. Defaults to None.
 
     .. note::
         Using the current directory (".") as working directory is deprecated. Using it will raise a deprecation warning.
@@ -180,9 +192,15 @@ def __init__(
         extra_hosts: Optional[Dict[str, str]] = None,
         init_command: Optional[str] = None,
         delete_tmp_files: bool = False,
+        max_output_bytes: Optional[int] = None,
+        container_pool: Optional[DockerContainerPool] = None,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
+        if max_output_bytes is not None and max_output_bytes < 2:
+            raise ValueError("Max output bytes must be greater than or equal to 2.")
+        if container_pool is not None and (work_dir is not None or bind_dir is not None):
+            raise ValueError("work_dir and bind_dir cannot be set when using a container pool.")
 
         # Handle working directory logic
         if work_dir is None:
@@ -235,6 +253,9 @@ def __init__(
         self._init_command = init_command
         self._delete_tmp_files = delete_tmp_files
         self._device_requests = device_requests
+        self._max_output_bytes = max_output_bytes
+        self._container_pool = container_pool
+        self._lease: Optional[ContainerLease] = None
 
         # Setup could take some time so we intentionally wait for the first code block to do it.
         if len(functions) > 0:
@@ -292,21 +313,48 @@ async def _kill_running_command(self, command: List[str]) -> None:
         await asyncio.to_thread(self._container.exec_run, ["pkill", "-f", " ".join(command)])
 
     async def _execute_command(self, command: List[str], cancellation_token: CancellationToken) -> Tuple[str, int]:
+        async for item in self._execute_command_stream(command, cancellation_token):
+            if isinstance(item, tuple):
+                return item
+        raise AssertionError("The stream should have returned the final result.")
+
+    async def _execute_command_stream(
+        self, command: List[str], cancellation_token: CancellationToken, spill_path: Optional[Path] = None
+    ) -> AsyncGenerator[Union[str, Tuple[str, int]], None]:
         if self._container is None or not self._running:
             raise ValueError("Container is not running. Must first be started with either start or a context manager.")
 
-        exec_task = asyncio.create_task(asyncio.to_thread(self._container.exec_run, command))
+        container = self._container
+        loop = asyncio.get_running_loop()
+        capture = OutputCapture(self._max_output_bytes, spill_path)
+        chunks: asyncio.Queue[str] = asyncio.Queue()
+        cancelled = False
+
+        def on_chunk(data: bytes) -> None:
+            # The command keeps running for a moment after a cancellation; its output is dropped.
+            if not cancelled:
+                text = capture.write(data)
+                if text:
+                    chunks.put_nowait(text)
+
+        def run() -> int:
+            api = container.client.api
+            exec_id = api.exec_create(container.id, command)["Id"]
+            for data in api.exec_start(exec_id, stream=True):
+                loop.call_soon_threadsafe(on_chunk, data)
+            exit_code: int = api.exec_inspect(exec_id)["ExitCode"]
+            return exit_code
+
+        exec_task = asyncio.create_task(asyncio.to_thread(run))
         cancellation_token.link_future(exec_task)
 
-        # Wait for the exec task to finish.
+        # Stream the output until the exec task finishes.
         try:
-            result = await exec_task
-            exit_code = result.exit_code
-            output = result.output.decode("utf-8")
-            if exit_code == 124:
-                output += "\n Timeout"
-            return output, exit_code
+            async for chunk in drain_until_done(chunks, exec_task):
+                yield chunk
+            exit_code = await exec_task
         except asyncio.CancelledError:
+            cancelled = True
             # Schedule a task to kill the running command in the background.
             if self._loop and not self._loop.is_closed():
                 try:
@@ -324,11 +372,27 @@ async def _execute_command(self, command: List[str], cancellation_token: Cancell
                 logging.warning(
                     f"Cannot schedule kill command: Executor loop is not available or closed (loop: {self._loop!r})."
                 )
-            return "Code execution was cancelled.", 1
+            yield "Code execution was cancelled.", 1
+            return
+        finally:
+            capture.close()
+
+        output = capture.getvalue()
+        if exit_code == 124:
+            output += "\n Timeout"
+        yield output, exit_code
 
     async def _execute_code_dont_check_setup(
         self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
     ) -> CommandLineCodeResult:
+        async for item in self._execute_code_dont_check_setup_stream(code_blocks, cancellation_token):
+            if isinstance(item, CommandLineCodeResult):
+                return item
+        raise AssertionError("The stream should have returned the final result.")
+
+    async def _execute_code_dont_check_setup_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[str, CommandLineCodeResult], None]:
         if self._container is None or not self._running:
             raise ValueError("Container is not running. Must first be started with either start or a context manager.")
 
@@ -361,7 +425,15 @@ async def _execute_code_dont_check_setup(
 
                 command = ["timeout", str(self._timeout), lang_to_cmd(lang), filename]
 
-                output, exit_code = await self._execute_command(command, cancellation_token)
+                # Output beyond max_output_bytes is spilled to a log file next to the code file.
+                output, exit_code = "", 0
+                async for item in self._execute_command_stream(
+                    command, cancellation_token, code_path.with_suffix(".log")
+                ):
+                    if isinstance(item, tuple):
+                        output, exit_code = item
+                    else:
+                        yield item
                 outputs.append(output)
                 last_exit_code = exit_code
                 if exit_code != 0:
@@ -375,10 +447,13 @@ async def _execute_code_dont_check_setup(
                         pass
 
         code_file = str(files[0]) if files else None
-        return CommandLineCodeResult(exit_code=last_exit_code, output="".join(outputs), code_file=code_file)
+        yield CommandLineCodeResult(exit_code=last_exit_code, output="".join(outputs), code_file=code_file)
 
     @property
     def work_dir(self) -> Path:
+        # If the container is leased from a pool, use the workspace of the lease
+        if self._lease is not None:
+            return self._lease.work_dir
         # If a user specifies a working directory, use that
         if self._work_dir is not None:
             # If a user specifies the current directory, warn them that this is deprecated
@@ -420,6 +495,23 @@ async def execute_code_blocks(
 
         return await self._execute_code_dont_check_setup(code_blocks, cancellation_token)
 
+    async def execute_code_blocks_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[str, CommandLineCodeResult], None]:
+        """(Experimental) Execute the code blocks and yield their output while they run.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+
+        Returns:
+            AsyncGenerator[Union[str, CommandLineCodeResult], None]: Chunks of output, followed by the result."""
+
+        if not self._setup_functions_complete:
+            await self._setup_functions(cancellation_token)
+
+        async for item in self._execute_code_dont_check_setup_stream(code_blocks, cancellation_token):
+            yield item
+
     async def restart(self) -> None:
         """(Experimental) Restart the Docker container code executor."""
         if self._container is None or not self._running:
@@ -436,11 +528,23 @@ async def stop(self) -> None:
 
         Stops the Docker container and cleans up any temporary files (if they were created), along with the temporary directory.
         The method first waits for all cancellation tasks to finish before stopping the container. Finally it marks the executor as not running.
-        If the container is not running, the method does nothing.
+        If the container is not running, the method does nothing. If the container was leased from a container pool,
+        it is returned to the pool instead of being stopped.
         """
         if not self._running:
             return
 
+        if self._lease is not None and self._container_pool is not None:
+            lease = self._lease
+            try:
+                await self._wait_for_cancellation_futures()
+                await self._container_pool.release(lease)
+            finally:
+                self._lease = None
+                self._container = None
+                self._running = False
+            return
+
         if self._temp_dir is not None:
             self._temp_dir.cleanup()
             self._temp_dir = None
@@ -455,32 +559,7 @@ async def stop(self) -> None:
                 self._cancellation_futures.clear()
                 return
 
-            if self._cancellation_futures:
-                if not self._loop or self._loop.is_closed():
-                    logging.warning(
-                        f"Executor loop ({self._loop!r}) is closed or unavailable. Cannot reliably wait for "
-                        f"{len(self._cancellation_futures)} cancellation futures."
-                    )
-                    self._cancellation_futures.clear()
-                else:
-                    # concurrent.futures.Future -> asyncio.Future
-                    asyncio_futures = [asyncio.wrap_future(f, loop=self._loop) for f in self._cancellation_futures]
-
-                    if asyncio_futures:
-                        logging.debug(
-                            f"Waiting for {len(asyncio_futures)} cancellation futures to complete on loop {self._loop!r}..."
-                        )
-                        results = await asyncio.gather(*asyncio_futures, return_exceptions=True)
-                        for i, result in enumerate(results):
-                            original_future = self._cancellation_futures[i]
-                            if isinstance(result, Exception):
-                                logging.warning(f"Cancellation future {original_future!r} failed: {result}")
-                            else:
-                                logging.debug(f"Cancellation future {original_future!r} completed successfully.")
-                    else:
-                        logging.debug("No valid cancellation futures to await.")
-
-                    self._cancellation_futures.clear()
+            await self._wait_for_cancellation_futures()
 
             logging.debug(f"Stopping container {self.container_name}...")
             await asyncio.to_thread(container.stop)
@@ -494,13 +573,55 @@ async def stop(self) -> None:
             self._running = False
             self._cancellation_futures.clear()
 
+    async def _wait_for_cancellation_futures(self) -> None:
+        if self._cancellation_futures:
+            if not self._loop or self._loop.is_closed():
+                logging.warning(
+                    f"Executor loop ({self._loop!r}) is closed or unavailable. Cannot reliably wait for "
+                    f"{len(self._cancellation_futures)} cancellation futures."
+                )
+                self._cancellation_futures.clear()
+            else:
+                # concurrent.futures.Future -> asyncio.Future
+                asyncio_futures = [asyncio.wrap_future(f, loop=self._loop) for f in self._cancellation_futures]
+
+                if asyncio_futures:
+                    logging.debug(
+                        f"Waiting for {len(asyncio_futures)} cancellation futures to complete on loop {self._loop!r}..."
+                    )
+                    results = await asyncio.gather(*asyncio_futures, return_exceptions=True)
+                    for i, result in enumerate(results):
+                        original_future = self._cancellation_futures[i]
+                        if isinstance(result, Exception):
+                            logging.warning(f"Cancellation future {original_future!r} failed: {result}")
+                        else:
+                            logging.debug(f"Cancellation future {original_future!r} completed successfully.")
+                else:
+                    logging.debug("No valid cancellation futures to await.")
+
+                self._cancellation_futures.clear()
+
     async def start(self) -> None:
         """(Experimental) Start the code executor.
 
         This method sets the working environment variables, connects to Docker and starts the code executor.
         If no working directory was provided to the code executor, it creates a temporary directory and sets it as the code executor working directory.
+        If the code executor uses a container pool, it leases a container from the pool instead.
         """
 
+        if self._container_pool is not None:
+            if self._running:
+                return
+            self._lease = await self._container_pool.acquire()
+            self._container = self._lease.container
+            self.container_name = self._container.name
+            # The workspace of the lease is empty, so the functions module has to be written again.
+            self._setup_functions_complete = len(self._functions) == 0
+            self._loop = asyncio.get_running_loop()
+            self._cancellation_futures = []
+            self._running = True
+            return
+
         if self._work_dir is None and self._temp_dir is None:
             self._temp_dir = tempfile.TemporaryDirectory()
             self._temp_dir_path = Path(self._temp_dir.name)
@@ -576,6 +697,8 @@ def _to_config(self) -> DockerCommandLineCodeExecutorConfig:
         """(Experimental) Convert the component to a config object."""
         if self._functions:
             logging.info("Functions will not be included in serialized configuration")
+        if self._container_pool is not None:
+            logging.info("Container pool will not be included in serialized configuration")
 
         return DockerCommandLineCodeExecutorConfig(
             image=self._image,
@@ -590,6 +713,7 @@ def _to_config(self) -> DockerCommandLineCodeExecutorConfig:
             extra_hosts=self._extra_hosts,
             init_command=self._init_command,
             delete_tmp_files=self._delete_tmp_files,
+            max_output_bytes=self._max_output_bytes,
         )
 
     @classmethod
@@ -610,4 +734,5 @@ def _from_config(cls, config: DockerCommandLineCodeExecutorConfig) -> Self:
             extra_hosts=config.extra_hosts,
             init_command=config.init_command,
             delete_tmp_files=config.delete_tmp_files,
+            max_output_bytes=config.max_output_bytes,
         )
@@ -1,5 +1,6 @@
 from ._docker_jupyter import DockerJupyterCodeExecutor, DockerJupyterCodeResult
 from ._jupyter_server import DockerJupyterServer, JupyterClient, JupyterKernelClient
+from ._kernel_pool import DockerJupyterKernel, DockerJupyterKernelPool
 
 __all__ = [
     "DockerJupyterCodeExecutor",
@@ -7,4 +8,6 @@
     "JupyterClient",
     "JupyterKernelClient",
     "DockerJupyterCodeResult",
+    "DockerJupyterKernel",
+    "DockerJupyterKernelPool",
 ]
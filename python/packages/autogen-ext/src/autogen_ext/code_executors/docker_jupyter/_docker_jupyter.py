@@ -16,6 +16,7 @@
 from typing_extensions import Self
 
 from ._jupyter_server import JupyterClient, JupyterConnectable, JupyterConnectionInfo, JupyterKernelClient
+from ._kernel_pool import DockerJupyterKernel, DockerJupyterKernelPool
 
 
 @dataclass
@@ -56,6 +57,10 @@ class DockerJupyterCodeExecutor(CodeExecutor, Component[DockerJupyterCodeExecuto
             By default, it is "python3".
         timeout (int): The timeout for code execution, by default 60.
         output_dir (str): The directory to save output files, by default None.
+        kernel_pool (Optional[DockerJupyterKernelPool]): A pool of pre-started kernels to lease the kernel from,
+            instead of starting one. The kernel name is taken from the pool. The pool can be shared by
+            many executors; it is started by the first executor that starts, but it is not stopped by the executors.
+            By default, None.
 
     Example of using it directly:
 
@@ -160,6 +165,7 @@ def __init__(
         kernel_name: str = "python3",
         timeout: int = 60,
         output_dir: Path | None = None,
+        kernel_pool: Optional[DockerJupyterKernelPool] = None,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
@@ -179,10 +185,12 @@ def __init__(
 
         self._jupyter_client = JupyterClient(self._connection_info)
 
-        self._kernel_name = kernel_name
+        self._kernel_name = kernel_pool.kernel_name if kernel_pool is not None else kernel_name
         self._timeout = timeout
         self._async_jupyter_kernel_client: Optional[JupyterKernelClient] = None
         self._kernel_id: Optional[str] = None
+        self._kernel_pool = kernel_pool
+        self._kernel: Optional[DockerJupyterKernel] = None
 
     async def _ensure_async_kernel_client(self) -> JupyterKernelClient:
         """Ensure that an async kernel client exists and return it."""
@@ -245,7 +253,14 @@ async def execute_code_blocks(
         )
 
     async def restart(self) -> None:
-        """(Experimental) Restart a new session."""
+        """(Experimental) Restart a new session.
+
+        If the executor uses a kernel pool, the kernel is given back and a kernel from the pool is leased instead."""
+        if self._kernel_pool is not None and self._kernel is not None:
+            kernel = self._kernel
+            self._lease_kernel(await self._kernel_pool.acquire())
+            await self._kernel_pool.release(kernel)
+            return
         # Use async client to restart kernel
         if self._kernel_id is not None:
             await self._jupyter_client.restart_kernel(self._kernel_id)
@@ -254,8 +269,18 @@ async def restart(self) -> None:
             await self._async_jupyter_kernel_client.stop()
             self._async_jupyter_kernel_client = None
 
+    def _lease_kernel(self, kernel: DockerJupyterKernel) -> None:
+        self._kernel = kernel
+        self._kernel_id = kernel.kernel_id
+        self._async_jupyter_kernel_client = kernel.client
+
     async def start(self) -> None:
         """(Experimental) Start a new session."""
+        if self._kernel_pool is not None:
+            if self._kernel is None:
+                await self._kernel_pool.start()
+                self._lease_kernel(await self._kernel_pool.acquire())
+            return
         available_kernels = await self._jupyter_client.list_kernel_specs()
         if self._kernel_name not in available_kernels["kernelspecs"]:
             raise ValueError(f"Kernel {self._kernel_name} is not installed.")
@@ -279,7 +304,15 @@ def _save_html(self, html_data: str) -> str:
         return os.path.abspath(path)
 
     async def stop(self) -> None:
-        """Stop the kernel."""
+        """Stop the kernel. If the executor uses a kernel pool, the kernel is given back to the pool instead."""
+        if self._kernel_pool is not None:
+            if self._kernel is not None:
+                await self._kernel_pool.release(self._kernel)
+                self._kernel = None
+            self._kernel_id = None
+            self._async_jupyter_kernel_client = None
+            await self._jupyter_client.close()
+            return
         if self._kernel_id is not None:
             await self._jupyter_client.delete_kernel(self._kernel_id)
         if self._async_jupyter_kernel_client is not None:
@@ -0,0 +1,122 @@
+from typing import Optional, Union
+
+from .._kernel_pool import BaseKernelPool
+from ._jupyter_server import JupyterClient, JupyterConnectable, JupyterConnectionInfo, JupyterKernelClient
+
+
+class DockerJupyterKernel:
+    """(Experimental) A kernel of a :class:`DockerJupyterKernelPool`, with the client connected to it."""
+
+    def __init__(self, kernel_id: str, client: JupyterKernelClient) -> None:
+        self.kernel_id = kernel_id
+        self.client = client
+
+
+class DockerJupyterKernelPool(BaseKernelPool[DockerJupyterKernel]):
+    """(Experimental) A pool of pre-started kernels on a Jupyter server for :class:`DockerJupyterCodeExecutor`.
+
+    Executors created with the pool lease a kernel when they start and give it back when they
+    stop. :meth:`DockerJupyterCodeExecutor.restart` gives back its kernel and leases another one,
+    which has been started in the background, instead of restarting the kernel.
+    The pool can be shared by many executors connected to the same server.
+
+    Args:
+        jupyter_server (Union[JupyterConnectable, JupyterConnectionInfo]): The Jupyter server to start the kernels on.
+        kernel_name (str): The kernel name to use. Make sure it is installed.
+            By default, it is "python3".
+        size (int): The number of kernels kept ready. By default, 1.
+        warmup_code (Optional[str]): Code run in each kernel when it starts, for example to import
+            the libraries the executed code uses. By default, None.
+        max_uses (int): The number of leases a kernel serves before it is shut down. Kernels keep
+            their state between leases. By default, 1, which gives every lease a fresh kernel.
+        timeout (int): The timeout for starting a kernel and running the warm-up code, by default 60.
+
+    Example:
+
+    .. code-block:: python
+
+        import asyncio
+        from autogen_core import CancellationToken
+        from autogen_core.code_executor import CodeBlock
+        from autogen_ext.code_executors.docker_jupyter import (
+            DockerJupyterCodeExecutor,
+            DockerJupyterKernelPool,
+            DockerJupyterServer,
+        )
+
+
+        async def main() -> None:
+            async with DockerJupyterServer() as jupyter_server:
+                async with DockerJupyterKernelPool(jupyter_server, size=2) as pool:
+                    async with DockerJupyterCodeExecutor(jupyter_server=jupyter_server, kernel_pool=pool) as executor:
+                        code_blocks = [CodeBlock(code="print('hello world!')", language="python")]
+                        print(await executor.execute_code_blocks(code_blocks, cancellation_token=CancellationToken()))
+
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        jupyter_server: Union[JupyterConnectable, JupyterConnectionInfo],
+        kernel_name: str = "python3",
+        size: int = 1,
+        *,
+        warmup_code: Optional[str] = None,
+        max_uses: int = 1,
+        timeout: int = 60,
+    ) -> None:
+        if timeout < 1:
+            raise ValueError("Timeout must be greater than or equal to 1.")
+        if isinstance(jupyter_server, JupyterConnectable):
+            connection_info = jupyter_server.connection_info
+        elif isinstance(jupyter_server, JupyterConnectionInfo):
+            connection_info = jupyter_server
+        else:
+            raise ValueError("jupyter_server must be a JupyterConnectable or JupyterConnectionInfo.")
+        super().__init__(size, warmup_code=warmup_code, max_uses=max_uses)
+        self._jupyter_client = JupyterClient(connection_info)
+        self._kernel_name = kernel_name
+        self._timeout = timeout
+
+    @property
+    def kernel_name(self) -> str:
+        return self._kernel_name
+
+    async def start(self) -> None:
+        if not self._started:
+            available_kernels = await self._jupyter_client.list_kernel_specs()
+            if self._kernel_name not in available_kernels["kernelspecs"]:
+                raise ValueError(f"Kernel {self._kernel_name} is not installed.")
+        await super().start()
+
+    async def _start_kernel(self) -> DockerJupyterKernel:
+        kernel_id = await self._jupyter_client.start_kernel(self._kernel_name)
+        try:
+            client = await self._jupyter_client.get_kernel_client(kernel_id)
+        except BaseException:
+            await self._jupyter_client.delete_kernel(kernel_id)
+            raise
+        kernel = DockerJupyterKernel(kernel_id, client)
+        try:
+            is_ready = await client.wait_for_ready(timeout_seconds=self._timeout)
+        except BaseException:
+            await self._shutdown_kernel(kernel)
+            raise
+        if not is_ready:
+            await self._shutdown_kernel(kernel)
+            raise RuntimeError(f"Kernel {kernel_id} is not ready.")
+        return kernel
+
+    async def _run_warmup(self, kernel: DockerJupyterKernel, code: str) -> None:
+        result = await kernel.client.execute(code, timeout_seconds=self._timeout)
+        if not result.is_ok:
+            raise RuntimeError(f"Warm-up code failed: {result.output}")
+
+    async def _shutdown_kernel(self, kernel: DockerJupyterKernel) -> None:
+        await kernel.client.stop()
+        await self._jupyter_client.delete_kernel(kernel.kernel_id)
+
+    async def stop(self) -> None:
+        await super().stop()
+        await self._jupyter_client.close()
@@ -1,6 +1,9 @@
 from ._jupyter_code_executor import JupyterCodeExecutor, JupyterCodeResult
+from ._kernel_pool import JupyterKernel, JupyterKernelPool
 
 __all__ = [
     "JupyterCodeExecutor",
     "JupyterCodeResult",
+    "JupyterKernel",
+    "JupyterKernelPool",
 ]
@@ -9,7 +9,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-from autogen_core import Component
+from autogen_core import Component, ComponentModel
 from pydantic import BaseModel
 
 if sys.version_info >= (3, 11):
@@ -28,6 +28,7 @@
 from typing_extensions import Self
 
 from .._common import silence_pip
+from ._kernel_pool import JupyterKernel, JupyterKernelPool
 
 
 @dataclass
@@ -43,6 +44,7 @@ class JupyterCodeExecutorConfig(BaseModel):
     kernel_name: str = "python3"
     timeout: int = 60
     output_dir: Optional[str] = None
+    kernel_pool: Optional[ComponentModel] = None
 
 
 class JupyterCodeExecutor(CodeExecutor, Component[JupyterCodeExecutorConfig]):
@@ -127,6 +129,11 @@ async def main() -> None:
         kernel_name (str): The kernel name to use. By default, "python3".
         timeout (int): The timeout for code execution, by default 60.
         output_dir (Path): The directory to save output files, by default a temporary directory.
+        kernel_pool (Optional[JupyterKernelPool]): A pool of pre-started kernels to lease the kernel from,
+            instead of starting one. The kernel name is taken from the pool. The pool can be shared by
+            many executors and is started by the first executor that starts, but it is not stopped by
+            the executors, except when the executor was loaded from a configuration that includes the
+            pool. By default, None.
 
 
     .. note::
@@ -141,6 +148,7 @@ def __init__(
         kernel_name: str = "python3",
         timeout: int = 60,
         output_dir: Optional[Union[Path, str]] = None,
+        kernel_pool: Optional[JupyterKernelPool] = None,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
@@ -153,12 +161,16 @@ def __init__(
 
         self._started = False
 
-        self._kernel_name = kernel_name
+        self._kernel_name = kernel_pool.kernel_name if kernel_pool is not None else kernel_name
         self._timeout = timeout
 
         self._client: Optional[NotebookClient] = None
         self.kernel_context: Optional[AbstractAsyncContextManager[None]] = None
 
+        self._kernel_pool = kernel_pool
+        self._owns_kernel_pool = False
+        self._kernel: Optional[JupyterKernel] = None
+
     async def execute_code_blocks(
         self, code_blocks: list[CodeBlock], cancellation_token: CancellationToken
     ) -> JupyterCodeResult:
@@ -266,10 +278,22 @@ def _save_html(self, html_data: str) -> Path:
         return path.absolute()
 
     async def restart(self) -> None:
-        """Restart the code executor."""
+        """Restart the code executor.
+
+        If the executor uses a kernel pool, the kernel is given back and a kernel from the pool is leased instead."""
+        if self._kernel_pool is not None and self._kernel is not None:
+            kernel = self._kernel
+            self._lease_kernel(await self._kernel_pool.acquire())
+            await self._kernel_pool.release(kernel)
+            return
         await self.stop()
         await self.start()
 
+    def _lease_kernel(self, kernel: JupyterKernel) -> None:
+        self._kernel = kernel
+        self._client = kernel.client
+        self._client.timeout = self._timeout
+
     async def start(self) -> None:
         """(Experimental) Start the code executor.
 
@@ -280,6 +304,12 @@ async def start(self) -> None:
         if self._started:
             return
 
+        if self._kernel_pool is not None:
+            await self._kernel_pool.start()
+            self._lease_kernel(await self._kernel_pool.acquire())
+            self._started = True
+            return
+
         notebook: NotebookNode = nbformat.new_notebook()  # type: ignore
 
         self._client = NotebookClient(
@@ -297,10 +327,21 @@ async def start(self) -> None:
     async def stop(self) -> None:
         """(Experimental) Stop the code executor.
 
-        Terminates the Jupyter Notebook execution by exiting the kernel context and cleaning up the associated resources."""
+        Terminates the Jupyter Notebook execution by exiting the kernel context and cleaning up the associated resources.
+        If the executor uses a kernel pool, the kernel is given back to the pool instead."""
         if not self._started:
             return
 
+        if self._kernel_pool is not None:
+            if self._kernel is not None:
+                await self._kernel_pool.release(self._kernel)
+                self._kernel = None
+            if self._owns_kernel_pool:
+                await self._kernel_pool.stop()
+            self._client = None
+            self._started = False
+            return
+
         if self.kernel_context is not None:
             await self.kernel_context.__aexit__(None, None, None)
             self.kernel_context = None
@@ -311,7 +352,10 @@ async def stop(self) -> None:
     def _to_config(self) -> JupyterCodeExecutorConfig:
         """Convert current instance to config object"""
         return JupyterCodeExecutorConfig(
-            kernel_name=self._kernel_name, timeout=self._timeout, output_dir=str(self.output_dir)
+            kernel_name=self._kernel_name,
+            timeout=self._timeout,
+            output_dir=str(self.output_dir),
+            kernel_pool=self._kernel_pool.dump_component() if self._kernel_pool is not None else None,
         )
 
     @property
@@ -328,8 +372,12 @@ def output_dir(self) -> Path:
     @classmethod
     def _from_config(cls, config: JupyterCodeExecutorConfig) -> Self:
         """Create instance from config object"""
-        return cls(
+        kernel_pool = JupyterKernelPool.load_component(config.kernel_pool) if config.kernel_pool else None
+        executor = cls(
             kernel_name=config.kernel_name,
             timeout=config.timeout,
             output_dir=Path(config.output_dir) if config.output_dir else None,
+            kernel_pool=kernel_pool,
         )
+        executor._owns_kernel_pool = kernel_pool is not None
+        return executor
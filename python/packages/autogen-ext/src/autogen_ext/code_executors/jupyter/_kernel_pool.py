@@ -0,0 +1,149 @@
+from contextlib import AbstractAsyncContextManager
+from typing import Optional
+
+from autogen_core import Component
+from nbclient import NotebookClient
+from nbclient.util import ensure_async
+from nbformat import NotebookNode
+from nbformat import v4 as nbformat
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from .._kernel_pool import BaseKernelPool
+
+
+class JupyterKernel:
+    """A kernel of a :class:`JupyterKernelPool`, with the notebook client used to run cells in it."""
+
+    def __init__(self, client: NotebookClient, kernel_context: AbstractAsyncContextManager[None]) -> None:
+        self.client = client
+        self.kernel_context = kernel_context
+
+
+class JupyterKernelPoolConfig(BaseModel):
+    """Configuration for JupyterKernelPool"""
+
+    kernel_name: str = "python3"
+    size: int = 1
+    warmup_code: Optional[str] = None
+    max_uses: int = 1
+    timeout: int = 60
+
+
+class JupyterKernelPool(BaseKernelPool[JupyterKernel], Component[JupyterKernelPoolConfig]):
+    """A pool of pre-started local Jupyter kernels for :class:`JupyterCodeExecutor`.
+
+    Executors created with the pool lease a kernel when they start and give it back when they
+    stop. :meth:`JupyterCodeExecutor.restart` gives back its kernel and leases another one, which
+    has been started in the background, instead of waiting for a new kernel to start.
+    The pool can be shared by many executors.
+
+    .. danger::
+
+        This will execute code on the local machine. If being used with LLM generated code, caution should be used.
+
+    Args:
+        kernel_name (str): The kernel name to use. By default, "python3".
+        size (int): The number of kernels kept ready. By default, 1.
+        warmup_code (Optional[str]): Code run in each kernel when it starts, for example to import
+            the libraries the executed code uses. By default, None.
+        max_uses (int): The number of leases a kernel serves before it is shut down. Kernels keep
+            their state between leases. By default, 1, which gives every lease a fresh kernel.
+        timeout (int): The timeout for starting a kernel and running the warm-up code, by default 60.
+
+    Example:
+
+    .. code-block:: python
+
+        import asyncio
+        from autogen_core import CancellationToken
+        from autogen_core.code_executor import CodeBlock
+        from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterKernelPool
+
+
+        async def main() -> None:
+            async with JupyterKernelPool(size=2, warmup_code="import json") as pool:
+                async with JupyterCodeExecutor(kernel_pool=pool) as executor:
+                    code_blocks = [CodeBlock(code="print(json.dumps({'a': 1}))", language="python")]
+                    print(await executor.execute_code_blocks(code_blocks, CancellationToken()))
+                    # Leases a warm kernel with a fresh state.
+                    await executor.restart()
+
+
+        asyncio.run(main())
+    """
+
+    component_config_schema = JupyterKernelPoolConfig
+    component_provider_override = "autogen_ext.code_executors.jupyter.JupyterKernelPool"
+
+    def __init__(
+        self,
+        kernel_name: str = "python3",
+        size: int = 1,
+        *,
+        warmup_code: Optional[str] = None,
+        max_uses: int = 1,
+        timeout: int = 60,
+    ) -> None:
+        if timeout < 1:
+            raise ValueError("Timeout must be greater than or equal to 1.")
+        super().__init__(size, warmup_code=warmup_code, max_uses=max_uses)
+        self._kernel_name = kernel_name
+        self._timeout = timeout
+
+    @property
+    def kernel_name(self) -> str:
+        return self._kernel_name
+
+    async def _start_kernel(self) -> JupyterKernel:
+        notebook: NotebookNode = nbformat.new_notebook()  # type: ignore
+        client = NotebookClient(
+            nb=notebook,
+            kernel_name=self._kernel_name,
+            timeout=self._timeout,
+            startup_timeout=self._timeout,
+            allow_errors=True,
+        )
+        kernel_context = client.async_setup_kernel()
+        await kernel_context.__aenter__()
+        return JupyterKernel(client, kernel_context)
+
+    async def _run_warmup(self, kernel: JupyterKernel, code: str) -> None:
+        cell = nbformat.new_code_cell(code)  # type: ignore
+        kernel.client.nb.cells.append(cell)
+        try:
+            output = await kernel.client.async_execute_cell(cell, cell_index=0)
+        finally:
+            kernel.client.nb.cells.pop()
+        for item in output.get("outputs", []):
+            if item.get("output_type") == "error":
+                raise RuntimeError(f"Warm-up code failed: {item.get('ename')}: {item.get('evalue')}")
+
+    async def _shutdown_kernel(self, kernel: JupyterKernel) -> None:
+        await kernel.kernel_context.__aexit__(None, None, None)
+
+    async def _is_alive(self, kernel: JupyterKernel) -> bool:
+        if kernel.client.km is None:
+            return False
+        return bool(await ensure_async(kernel.client.km.is_alive()))
+
+    def _to_config(self) -> JupyterKernelPoolConfig:
+        """Convert current instance to config object"""
+        return JupyterKernelPoolConfig(
+            kernel_name=self._kernel_name,
+            size=self._size,
+            warmup_code=self._warmup_code,
+            max_uses=self._max_uses,
+            timeout=self._timeout,
+        )
+
+    @classmethod
+    def _from_config(cls, config: JupyterKernelPoolConfig) -> Self:
+        """Create instance from config object"""
+        return cls(
+            kernel_name=config.kernel_name,
+            size=config.size,
+            warmup_code=config.warmup_code,
+            max_uses=config.max_uses,
+            timeout=config.timeout,
+        )
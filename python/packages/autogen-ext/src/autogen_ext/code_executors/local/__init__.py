@@ -11,7 +11,7 @@
 from pathlib import Path
 from string import Template
 from types import SimpleNamespace
-from typing import Any, Callable, ClassVar, List, Optional, Sequence, Union
+from typing import Any, AsyncGenerator, Callable, ClassVar, Dict, List, Optional, Sequence, Union
 
 from autogen_core import CancellationToken, Component
 from autogen_core.code_executor import CodeBlock, CodeExecutor, FunctionWithRequirements, FunctionWithRequirementsStr
@@ -21,17 +21,22 @@
 from .._common import (
     PYTHON_VARIANTS,
     CommandLineCodeResult,
+    OutputCapture,
     build_python_functions_file,
+    drain_until_done,
     get_file_name_from_content,
     lang_to_cmd,
     silence_pip,
     to_stub,
 )
+from ._interpreter_pool import InterpreterPool
 
 __all__ = ("LocalCommandLineCodeExecutor",)
 
 A = ParamSpec("A")
 
+_READ_CHUNK_SIZE = 64 * 1024
+
 
 class LocalCommandLineCodeExecutorConfig(BaseModel):
     """Configuration for LocalCommandLineCodeExecutor"""
@@ -40,6 +45,10 @@ class LocalCommandLineCodeExecutorConfig(BaseModel):
     work_dir: Optional[str] = None
     functions_module: str = "functions"
     cleanup_temp_files: bool = True
+    interpreter_pool_size: int = 0
+    preload_modules: List[str] = []
+    max_executions_per_interpreter: int = 100
+    max_output_bytes: Optional[int] = None
 
 
 class LocalCommandLineCodeExecutor(CodeExecutor, Component[LocalCommandLineCodeExecutorConfig]):
@@ -75,16 +84,33 @@ class LocalCommandLineCodeExecutor(CodeExecutor, Component[LocalCommandLineCodeE
 
     Args:
         timeout (int): The timeout for the execution of any single code block. Default is 60.
+            With an interpreter pool, the time spent waiting for a free interpreter does not count.
         work_dir (str): The working directory for the code execution. If None,
             a default working directory will be used. The default working directory is a temporary directory.
         functions (List[Union[FunctionWithRequirements[Any, A], Callable[..., Any]]]): A list of functions that are available to the code executor. Default is an empty list.
         functions_module (str, optional): The name of the module that will be created to store the functions. Defaults to "functions".
         cleanup_temp_files (bool, optional): Whether to automatically clean up temporary files after execution. Defaults to True.
         virtual_env_context (Optional[SimpleNamespace], optional): The virtual environment context. Defaults to None.
+        interpreter_pool_size (int, optional): The number of warm Python interpreters used to run Python code blocks.
+            If 0, each Python code block runs in a new process. Defaults to 0.
+        preload_modules (Sequence[str], optional): Modules the pooled interpreters import when they start. Defaults to an empty list.
+        max_executions_per_interpreter (int, optional): The number of code blocks a pooled interpreter runs before it is replaced. Defaults to 100.
+        max_output_bytes (Optional[int], optional): The number of bytes of stdout and of stderr of a code block kept in the result.
+            Longer output is truncated to its head and tail, and written in full to a log file next to the code file.
+            If None, the whole output is kept. Defaults to None.
 
     .. note::
         Using the current directory (".") as working directory is deprecated. Using it will raise a deprecation warning.
 
+    .. note::
+        With `interpreter_pool_size` greater than 0, Python code blocks run in pre-started interpreters instead
+        of a new process each, which saves the interpreter startup and the imports of `preload_modules`.
+        Each code block gets a fresh ``__main__`` namespace, but changes to interpreter-wide state, such as
+        attributes set on imported modules, are visible to later code blocks until the interpreter is
+        replaced after `max_executions_per_interpreter` code blocks. Exit handlers registered with
+        :mod:`atexit` do not run. An interpreter is also replaced when a code block times out, is cancelled
+        or crashes it. Shell scripts always run in a new process.
+
 
     Example:
 
@@ -158,9 +184,19 @@ def __init__(
         functions_module: str = "functions",
         cleanup_temp_files: bool = True,
         virtual_env_context: Optional[SimpleNamespace] = None,
+        interpreter_pool_size: int = 0,
+        preload_modules: Sequence[str] = (),
+        max_executions_per_interpreter: int = 100,
+        max_output_bytes: Optional[int] = None,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
+        if interpreter_pool_size < 0:
+            raise ValueError("Interpreter pool size must be greater than or equal to 0.")
+        if max_executions_per_interpreter < 1:
+            raise ValueError("Max executions per interpreter must be greater than or equal to 1.")
+        if max_output_bytes is not None and max_output_bytes < 2:
+            raise ValueError("Max output bytes must be greater than or equal to 2.")
         self._timeout = timeout
 
         self._work_dir: Optional[Path] = None
@@ -192,6 +228,12 @@ def __init__(
         self._cleanup_temp_files = cleanup_temp_files
         self._virtual_env_context: Optional[SimpleNamespace] = virtual_env_context
 
+        self._interpreter_pool_size = interpreter_pool_size
+        self._preload_modules = list(preload_modules)
+        self._max_executions_per_interpreter = max_executions_per_interpreter
+        self._interpreter_pool: Optional[InterpreterPool] = None
+        self._max_output_bytes = max_output_bytes
+
         self._temp_dir: Optional[tempfile.TemporaryDirectory[str]] = None
         self._started = False
 
@@ -261,6 +303,28 @@ def cleanup_temp_files(self) -> bool:
         """(Experimental) Whether to automatically clean up temporary files after execution."""
         return self._cleanup_temp_files
 
+    def _build_env(self) -> Dict[str, str]:
+        env = os.environ.copy()
+        if self._virtual_env_context:
+            virtual_env_bin_abs_path = os.path.abspath(self._virtual_env_context.bin_path)
+            env["PATH"] = f"{virtual_env_bin_abs_path}{os.pathsep}{env['PATH']}"
+        return env
+
+    def _python_executable(self) -> str:
+        return os.path.abspath(self._virtual_env_context.env_exe) if self._virtual_env_context else sys.executable
+
+    def _get_interpreter_pool(self) -> InterpreterPool:
+        if self._interpreter_pool is None:
+            self._interpreter_pool = InterpreterPool(
+                self._interpreter_pool_size,
+                executable=self._python_executable(),
+                work_dir=self.work_dir,
+                env=self._build_env(),
+                preload_modules=self._preload_modules,
+                max_executions=self._max_executions_per_interpreter,
+            )
+        return self._interpreter_pool
+
     async def _setup_functions(self, cancellation_token: CancellationToken) -> None:
         func_file_content = build_python_functions_file(self._functions)
         func_file = self.work_dir / f"{self._functions_module}.py"
@@ -329,6 +393,28 @@ async def execute_code_blocks(
 
         return await self._execute_code_dont_check_setup(code_blocks, cancellation_token)
 
+    async def execute_code_blocks_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[str, CommandLineCodeResult], None]:
+        """(Experimental) Execute the code blocks and yield their output while they run.
+
+        Output chunks are yielded as they are read from the process; the last item is the
+        :class:`~autogen_ext.code_executors.CommandLineCodeResult`. Code blocks run by the interpreter
+        pool yield their output when they finish.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+            cancellation_token (CancellationToken): a token to cancel the operation
+
+        Returns:
+            AsyncGenerator[Union[str, CommandLineCodeResult], None]: Chunks of output, followed by the result."""
+
+        if not self._setup_functions_complete:
+            await self._setup_functions(cancellation_token)
+
+        async for item in self._execute_code_dont_check_setup_stream(code_blocks, cancellation_token):
+            yield item
+
     async def _execute_code_dont_check_setup(
         self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
     ) -> CommandLineCodeResult:
@@ -336,6 +422,60 @@ async def _execute_code_dont_check_setup(
         Execute the provided code blocks in the local command line without re-checking setup.
         Returns a CommandLineCodeResult indicating success or failure.
         """
+        async for item in self._execute_code_dont_check_setup_stream(code_blocks, cancellation_token):
+            if isinstance(item, CommandLineCodeResult):
+                return item
+        raise AssertionError("The stream should have returned the final result.")
+
+    async def _run_process(
+        self,
+        program: str,
+        args: List[str],
+        env: Dict[str, str],
+        stdout: OutputCapture,
+        stderr: OutputCapture,
+        chunks: "asyncio.Queue[str]",
+        timeout: Optional[float] = None,
+    ) -> int:
+        return await asyncio.wait_for(self._run_process_until_exit(program, args, env, stdout, stderr, chunks), timeout)
+
+    async def _run_process_until_exit(
+        self,
+        program: str,
+        args: List[str],
+        env: Dict[str, str],
+        stdout: OutputCapture,
+        stderr: OutputCapture,
+        chunks: "asyncio.Queue[str]",
+    ) -> int:
+        proc = await asyncio.create_subprocess_exec(
+            program,
+            *args,
+            cwd=self.work_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+
+        async def pump(stream: Optional[asyncio.StreamReader], capture: OutputCapture) -> None:
+            assert stream is not None
+            while data := await stream.read(_READ_CHUNK_SIZE):
+                text = capture.write(data)
+                if text:
+                    chunks.put_nowait(text)
+
+        try:
+            await asyncio.gather(pump(proc.stdout, stdout), pump(proc.stderr, stderr))
+            return await proc.wait()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.terminate()
+            await proc.wait()  # Ensure process is fully dead
+            raise
+
+    async def _execute_code_dont_check_setup_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[str, CommandLineCodeResult], None]:
         logs_all: str = ""
         file_names: List[Path] = []
         exitcode = 0
@@ -361,11 +501,12 @@ async def _execute_code_dont_check_setup(
             try:
                 filename = get_file_name_from_content(code, self.work_dir)
             except ValueError:
-                return CommandLineCodeResult(
+                yield CommandLineCodeResult(
                     exit_code=1,
                     output="Filename is not in the workspace",
                     code_file=None,
                 )
+                return
 
             # If no filename is found, create one
             if filename is None:
@@ -384,70 +525,70 @@ async def _execute_code_dont_check_setup(
                 f.write(code)
             file_names.append(written_file)
 
-            # Build environment
-            env = os.environ.copy()
-            if self._virtual_env_context:
-                virtual_env_bin_abs_path = os.path.abspath(self._virtual_env_context.bin_path)
-                env["PATH"] = f"{virtual_env_bin_abs_path}{os.pathsep}{env['PATH']}"
+            # Output beyond max_output_bytes is spilled to log files next to the code file.
+            stdout = OutputCapture(self._max_output_bytes, written_file.with_suffix(".stdout.log"))
+            stderr = OutputCapture(self._max_output_bytes, written_file.with_suffix(".stderr.log"))
+            chunks: asyncio.Queue[str] = asyncio.Queue()
 
-            # Decide how to invoke the script
-            if lang == "python":
-                program = (
-                    os.path.abspath(self._virtual_env_context.env_exe) if self._virtual_env_context else sys.executable
-                )
-                extra_args = [str(written_file.absolute())]
+            if lang == "python" and self._interpreter_pool_size > 0:
+                # Run Python code in a warm interpreter of the pool. The timeout starts once an interpreter is free.
+                run = self._get_interpreter_pool().execute(written_file, stdout, stderr, timeout=self._timeout)
             else:
-                # Get the appropriate command for the language
-                program = lang_to_cmd(lang)
-
-                # Special handling for PowerShell
-                if program == "pwsh":
-                    extra_args = [
-                        "-NoProfile",
-                        "-ExecutionPolicy",
-                        "Bypass",
-                        "-File",
-                        str(written_file.absolute()),
-                    ]
-                else:
-                    # Shell commands (bash, sh, etc.)
-                    extra_args = [str(written_file.absolute())]
+                # Build environment
+                env = self._build_env()
 
-            # Create a subprocess and run
-            task = asyncio.create_task(
-                asyncio.create_subprocess_exec(
-                    program,
-                    *extra_args,
-                    cwd=self.work_dir,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env=env,
-                )
-            )
-            cancellation_token.link_future(task)
-
-            proc = None  # Track the process
+                # Decide how to invoke the script
+                if lang == "python":
+                    program = self._python_executable()
+                    extra_args = [str(written_file.absolute())]
+                else:
+                    # Get the appropriate command for the language
+                    program = lang_to_cmd(lang)
+
+                    # Special handling for PowerShell
+                    if program == "pwsh":
+                        extra_args = [
+                            "-NoProfile",
+                            "-ExecutionPolicy",
+                            "Bypass",
+                            "-File",
+                            str(written_file.absolute()),
+                        ]
+                    else:
+                        # Shell commands (bash, sh, etc.)
+                        extra_args = [str(written_file.absolute())]
+
+                run = self._run_process(program, extra_args, env, stdout, stderr, chunks, timeout=self._timeout)
+
+            # Run the code, streaming its output until it exits or times out
+            execution = asyncio.ensure_future(run)
+            cancellation_token.link_future(execution)
             try:
-                proc = await task
-                stdout, stderr = await asyncio.wait_for(proc.communicate(), self._timeout)
-                exitcode = proc.returncode or 0
+                async for chunk in drain_until_done(chunks, execution):
+                    yield chunk
+                exitcode = await execution
             except asyncio.TimeoutError:
+                # Keep the output produced before the timeout, as it was streamed already.
+                logs_all += stderr.getvalue() + stdout.getvalue()
                 logs_all += "\nTimeout"
                 exitcode = 124
-                if proc:
-                    proc.terminate()
-                    await proc.wait()  # Ensure process is fully dead
                 break
             except asyncio.CancelledError:
+                logs_all += stderr.getvalue() + stdout.getvalue()
                 logs_all += "\nCancelled"
                 exitcode = 125
-                if proc:
-                    proc.terminate()
-                    await proc.wait()
+                # Wait for the process to be terminated, and drop the run if it never started.
+                await asyncio.wait({execution})
+                run.close()
                 break
+            finally:
+                stdout.close()
+                stderr.close()
 
-            logs_all += stderr.decode()
-            logs_all += stdout.decode()
+            output = stderr.getvalue() + stdout.getvalue()
+            if lang == "python" and self._interpreter_pool_size > 0 and output:
+                yield output
+            logs_all += output
 
             if exitcode != 0:
                 break
@@ -462,7 +603,7 @@ async def _execute_code_dont_check_setup(
                 except OSError as error:
                     logging.error(f"Failed to delete temporary file {file}: {error}")
 
-        return code_result
+        yield code_result
 
     async def restart(self) -> None:
         """(Experimental) Restart the code executor."""
@@ -480,6 +621,8 @@ async def start(self) -> None:
         """
         if self._work_dir is None and self._temp_dir is None:
             self._temp_dir = tempfile.TemporaryDirectory()
+        if self._interpreter_pool_size > 0:
+            await self._get_interpreter_pool().start()
         self._started = True
 
     async def stop(self) -> None:
@@ -488,6 +631,9 @@ async def stop(self) -> None:
         Stops the local code executor and performs the cleanup of the temporary working directory (if it was created).
         The executor's internal state is markes as no longer started.
         """
+        if self._interpreter_pool is not None:
+            await self._interpreter_pool.stop()
+            self._interpreter_pool = None
         if self._temp_dir is not None:
             self._temp_dir.cleanup()
             self._temp_dir = None
@@ -505,6 +651,10 @@ def _to_config(self) -> LocalCommandLineCodeExecutorConfig:
             work_dir=str(self.work_dir),
             functions_module=self._functions_module,
             cleanup_temp_files=self._cleanup_temp_files,
+            interpreter_pool_size=self._interpreter_pool_size,
+            preload_modules=self._preload_modules,
+            max_executions_per_interpreter=self._max_executions_per_interpreter,
+            max_output_bytes=self._max_output_bytes,
         )
 
     @classmethod
@@ -514,4 +664,8 @@ def _from_config(cls, config: LocalCommandLineCodeExecutorConfig) -> Self:
             work_dir=Path(config.work_dir) if config.work_dir is not None else None,
             functions_module=config.functions_module,
             cleanup_temp_files=config.cleanup_temp_files,
+            interpreter_pool_size=config.interpreter_pool_size,
+            preload_modules=config.preload_modules,
+            max_executions_per_interpreter=config.max_executions_per_interpreter,
+            max_output_bytes=config.max_output_bytes,
         )
@@ -0,0 +1,256 @@
+import asyncio
+import json
+import logging
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set
+
+from .._common import OutputCapture
+
+logger = logging.getLogger(__name__)
+
+_WORKER_SOURCE = Path(__file__).with_name("_interpreter_worker.py").read_text(encoding="utf-8")
+
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _read_output(path: Path, capture: OutputCapture) -> None:
+    # The file does not exist if the interpreter died before the script started.
+    try:
+        with path.open("rb") as f:
+            while data := f.read(_READ_CHUNK_SIZE):
+                capture.write(data)
+    except FileNotFoundError:
+        pass
+
+
+class _Interpreter:
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.executions = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def run(self, path: Path, stdout_path: Path, stderr_path: Path) -> int:
+        assert self.process.stdin is not None and self.process.stdout is not None
+        request = {"path": str(path), "stdout": str(stdout_path), "stderr": str(stderr_path)}
+        self.executions += 1
+        self.process.stdin.write((json.dumps(request) + "\n").encode())
+        await self.process.stdin.drain()
+        line = await self.process.stdout.readline()
+        if not line:
+            # The script took the interpreter down, for example with os._exit or a segfault.
+            return await self.process.wait()
+        exit_code: int = json.loads(line)["exit_code"]
+        return exit_code
+
+    async def kill(self) -> None:
+        if self.alive:
+            self.process.kill()
+        await self.process.wait()
+
+
+class InterpreterPool:
+    """A pool of warm Python interpreters that run scripts one after another.
+
+    Each interpreter imports the `preload_modules` once when it starts, so scripts that use them
+    do not pay for the interpreter startup and the imports. Scripts run in a fresh ``__main__``
+    namespace, with the working directory, ``sys.argv`` and ``sys.path`` restored and the modules
+    of the script directory unloaded afterwards. Other interpreter-wide state, such as attributes
+    set on imported modules, persists until the interpreter is recycled after
+    `max_executions` scripts. An interpreter that is killed because of a timeout or cancellation,
+    or that crashes, is replaced by a new one.
+
+    Args:
+        size (int): The number of interpreters.
+        executable (str): The Python executable.
+        work_dir (Path): The working directory of the interpreters.
+        env (Dict[str, str]): The environment variables of the interpreters.
+        preload_modules (Sequence[str], optional): Modules imported when an interpreter starts. Defaults to ().
+        max_executions (int, optional): The number of scripts an interpreter runs before it is replaced. Defaults to 100.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        executable: str,
+        work_dir: Path,
+        env: Dict[str, str],
+        preload_modules: Sequence[str] = (),
+        max_executions: int = 100,
+    ) -> None:
+        if size < 1:
+            raise ValueError("Interpreter pool size must be at least 1.")
+        if max_executions < 1:
+            raise ValueError("max_executions must be at least 1.")
+        self._size = size
+        self._executable = executable
+        self._work_dir = work_dir
+        self._env = env
+        self._preload_modules = list(preload_modules)
+        self._max_executions = max_executions
+        # Holds one item per interpreter slot; None stands for a slot whose interpreter has not been started.
+        self._idle: asyncio.Queue[Optional[_Interpreter]] = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+        self._in_use: Set[_Interpreter] = set()
+        self._background_tasks: Set[asyncio.Task[None]] = set()
+        self._output_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def _spawn(self) -> _Interpreter:
+        process = await asyncio.create_subprocess_exec(
+            self._executable,
+            "-c",
+            _WORKER_SOURCE,
+            *self._preload_modules,
+            cwd=self._work_dir,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=self._env,
+        )
+        interpreter = _Interpreter(process)
+        assert process.stdout is not None
+        try:
+            line = await process.stdout.readline()
+        except BaseException:
+            await interpreter.kill()
+            raise
+        message = json.loads(line) if line else {"error": f"Interpreter exited with code {await process.wait()}"}
+        if "error" in message:
+            await interpreter.kill()
+            raise RuntimeError(message["error"])
+        return interpreter
+
+    async def _replace(self) -> None:
+        try:
+            interpreter: Optional[_Interpreter] = await self._spawn()
+        except Exception as e:
+            # Leave the slot empty; the next execution starts the interpreter and reports the error.
+            logger.warning("Failed to start a replacement interpreter: %s", e)
+            interpreter = None
+        if self._closed and interpreter is not None:
+            await interpreter.kill()
+            interpreter = None
+        self._idle.put_nowait(interpreter)
+
+    async def start(self) -> None:
+        """Start the interpreters that are not running yet."""
+        running: List[_Interpreter] = []
+        empty = 0
+        while not self._idle.empty():
+            slot = self._idle.get_nowait()
+            if slot is None:
+                empty += 1
+            else:
+                running.append(slot)
+        results: List[_Interpreter | BaseException] = []
+        try:
+            results = await asyncio.gather(*(self._spawn() for _ in range(empty)), return_exceptions=True)
+        finally:
+            for interpreter in running:
+                self._idle.put_nowait(interpreter)
+            for result in results:
+                self._idle.put_nowait(result if isinstance(result, _Interpreter) else None)
+            for _ in range(empty - len(results)):
+                self._idle.put_nowait(None)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _acquire(self) -> _Interpreter:
+        interpreter = await self._idle.get()
+        if interpreter is None or not interpreter.alive:
+            try:
+                interpreter = await self._spawn()
+            except BaseException:
+                self._idle.put_nowait(None)
+                raise
+        self._in_use.add(interpreter)
+        return interpreter
+
+    def _release(self, interpreter: _Interpreter) -> None:
+        self._in_use.discard(interpreter)
+        if interpreter.alive and interpreter.executions < self._max_executions and not self._closed:
+            self._idle.put_nowait(interpreter)
+            return
+        # Recycle the interpreter in the background, so the next execution finds a warm one.
+        task = asyncio.create_task(self._recycle(interpreter))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _recycle(self, interpreter: _Interpreter) -> None:
+        await interpreter.kill()
+        if self._closed:
+            self._idle.put_nowait(None)
+        else:
+            await self._replace()
+
+    async def execute(
+        self, path: Path, stdout: OutputCapture, stderr: OutputCapture, timeout: Optional[float] = None
+    ) -> int:
+        """Run a Python script in one of the interpreters.
+
+        The output of the script is written to `stdout` and `stderr` when it finishes. If the
+        execution times out or is cancelled, the interpreter is killed and replaced.
+
+        Args:
+            path (Path): The script to run.
+            stdout (OutputCapture): Receives the standard output of the script.
+            stderr (OutputCapture): Receives the standard error of the script.
+            timeout (Optional[float], optional): The number of seconds the script may run. The time spent
+                waiting for a free interpreter does not count. Defaults to None, meaning no timeout.
+
+        Raises:
+            asyncio.TimeoutError: If the script runs longer than `timeout`.
+
+        Returns:
+            int: The exit code of the script.
+        """
+        if self._closed:
+            raise RuntimeError("Interpreter pool is stopped.")
+        if self._output_dir is None:
+            self._output_dir = tempfile.TemporaryDirectory()
+        output_prefix = Path(self._output_dir.name) / uuid.uuid4().hex
+        stdout_path = output_prefix.with_suffix(".stdout")
+        stderr_path = output_prefix.with_suffix(".stderr")
+        try:
+            interpreter = await self._acquire()
+            try:
+                exit_code = await asyncio.wait_for(interpreter.run(path, stdout_path, stderr_path), timeout)
+            except BaseException:
+                await interpreter.kill()
+                raise
+            finally:
+                self._release(interpreter)
+            _read_output(stdout_path, stdout)
+            _read_output(stderr_path, stderr)
+            return exit_code
+        finally:
+            stdout_path.unlink(missing_ok=True)
+            stderr_path.unlink(missing_ok=True)
+
+    async def stop(self) -> None:
+        """Kill all interpreters. Running executions end as if their interpreter crashed."""
+        self._closed = True
+        for task in list(self._background_tasks):
+            await task
+        interpreters = list(self._in_use)
+        while not self._idle.empty():
+            interpreter = self._idle.get_nowait()
+            if interpreter is not None:
+                interpreters.append(interpreter)
+        await asyncio.gather(*(interpreter.kill() for interpreter in interpreters))
+        if self._output_dir is not None:
+            self._output_dir.cleanup()
+            self._output_dir = None
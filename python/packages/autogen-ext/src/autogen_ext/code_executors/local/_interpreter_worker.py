@@ -0,0 +1,109 @@
+"""Main loop of the interpreters of :class:`~autogen_ext.code_executors.local._interpreter_pool.InterpreterPool`.
+
+The source of this module is passed to ``python -c``, so it only uses the standard library: it
+also runs in virtual environments that do not have autogen-ext installed. The arguments are the
+modules to preload. The interpreter reports readiness on stdout and then reads one JSON request
+per line from stdin, runs the requested script with stdout and stderr redirected to the given
+files, and answers with the exit code of the script."""
+
+import builtins
+import importlib
+import json
+import os
+import sys
+import traceback
+from typing import Any, Dict, TextIO
+
+
+def _exit_code(code: Any) -> int:
+    # Mirrors how the interpreter turns the argument of SystemExit into a process exit code.
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)  # noqa: T201
+    return 1
+
+
+def _is_in_dir(path: str, directory: str) -> bool:
+    try:
+        return os.path.commonpath([os.path.realpath(path), directory]) == directory
+    except ValueError:
+        return False
+
+
+def _run(path: str, stdout_path: str, stderr_path: str) -> int:
+    script_dir = os.path.realpath(os.path.dirname(path))
+    cwd = os.getcwd()
+    saved_argv, saved_path = sys.argv, sys.path[0]
+    saved_streams = sys.stdin, sys.stdout, sys.stderr
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+    exit_code = 0
+    with open(stdout_path, "wb") as stdout, open(stderr_path, "wb") as stderr:
+        os.dup2(stdout.fileno(), 1)
+        os.dup2(stderr.fileno(), 2)
+        sys.argv = [path]
+        sys.path[0] = script_dir
+        try:
+            with open(path, "rb") as f:
+                source = f.read()
+            code = compile(source, path, "exec")
+            exec(code, {"__name__": "__main__", "__file__": path, "__builtins__": builtins})
+        except SystemExit as e:
+            exit_code = _exit_code(e.code)
+        except BaseException as e:
+            # Skip the frame of this function, so the traceback looks like the one of a script.
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next if e.__traceback__ else None)
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_stdout, 1)
+            os.dup2(saved_stderr, 2)
+            os.close(saved_stdout)
+            os.close(saved_stderr)
+            sys.argv = saved_argv
+            sys.path[0] = saved_path
+            os.chdir(cwd)
+    # Modules of the working directory may change between scripts, so they are imported again.
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and _is_in_dir(module_file, script_dir):
+            del sys.modules[name]
+    return exit_code
+
+
+def main() -> None:
+    control_in: TextIO = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    control_out: TextIO = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    # Scripts must not read the requests or write into the responses.
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+
+    def send(message: Dict[str, Any]) -> None:
+        control_out.write(json.dumps(message) + "\n")
+        control_out.flush()
+
+    for module in sys.argv[1:]:
+        try:
+            importlib.import_module(module)
+        except BaseException:
+            send({"error": f"Failed to preload module {module}:\n{traceback.format_exc()}"})
+            return
+    send({"ready": True})
+
+    for line in control_in:
+        request = json.loads(line)
+        exit_code = _run(request["path"], request["stdout"], request["stderr"])
+        send({"exit_code": exit_code})
+
+
+if __name__ == "__main__":
+    main()
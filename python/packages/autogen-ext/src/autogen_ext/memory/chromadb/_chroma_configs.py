@@ -116,6 +116,9 @@ class ChromaDBVectorMemoryConfig(BaseModel):
 
     .. versionchanged:: v0.4.1
        Added support for custom embedding functions via embedding_function_config.
+
+    .. versionchanged:: v0.6.2
+       Added embedding_cache_size and batch_size.
     """
 
     client_type: Literal["persistent", "http"]
@@ -129,6 +132,12 @@ class ChromaDBVectorMemoryConfig(BaseModel):
     embedding_function_config: EmbeddingFunctionConfig = Field(
         default_factory=DefaultEmbeddingFunctionConfig, description="Configuration for the embedding function"
     )
+    embedding_cache_size: int = Field(
+        default=1024, ge=0, description="Number of embeddings cached by text hash, 0 disables the cache"
+    )
+    batch_size: int = Field(
+        default=100, ge=1, description="Number of contents embedded and inserted at once by add_many"
+    )
 
 
 class PersistentChromaDBVectorMemoryConfig(ChromaDBVectorMemoryConfig):
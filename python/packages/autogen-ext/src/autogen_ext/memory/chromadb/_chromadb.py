@@ -1,6 +1,10 @@
+import asyncio
+import hashlib
 import logging
+import threading
 import uuid
-from typing import Any, List
+from collections import OrderedDict
+from typing import Any, List, Sequence, Tuple
 
 from autogen_core import CancellationToken, Component, Image
 from autogen_core.memory import Memory, MemoryContent, MemoryMimeType, MemoryQueryResult, UpdateContextResult
@@ -8,7 +12,7 @@
 from autogen_core.models import SystemMessage
 from chromadb import HttpClient, PersistentClient
 from chromadb.api.models.Collection import Collection
-from chromadb.api.types import Document, Metadata
+from chromadb.api.types import Document, Embedding, Metadata
 from typing_extensions import Self
 
 from ._chroma_configs import (
@@ -128,6 +132,11 @@ class ChromaDBVectorMemory(Memory, Component[ChromaDBVectorMemoryConfig]):
 
             # Remember to close the memory when finished
             await memory.close()
+
+    Embedding and the calls to ChromaDB run in a worker thread, so they do not block the event
+    loop. Embeddings are cached by a hash of the text, up to `embedding_cache_size` entries, so
+    repeated memories and queries are not embedded again. Use :meth:`add_many` to embed and
+    insert many contents in batches of `batch_size`.
     """
 
     component_config_schema = ChromaDBVectorMemoryConfig
@@ -138,6 +147,10 @@ def __init__(self, config: ChromaDBVectorMemoryConfig | None = None) -> None:
         self._config = config or PersistentChromaDBVectorMemoryConfig()
         self._client: ClientAPI | None = None
         self._collection: Collection | None = None
+        self._embedding_function: Any = None
+        self._embedding_cache: OrderedDict[Tuple[bool, str], Embedding] = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+        self._init_lock = asyncio.Lock()
 
     @property
     def collection_name(self) -> str:
@@ -235,10 +248,61 @@ def _ensure_initialized(self) -> None:
                     metadata={"distance_metric": self._config.distance_metric},
                     embedding_function=embedding_function,
                 )
+                self._embedding_function = embedding_function
             except Exception as e:
                 logger.error(f"Failed to get/create collection: {e}")
                 raise
 
+    async def _initialize(self) -> Collection:
+        """Initialize the client and collection in a worker thread, and return the collection."""
+        async with self._init_lock:
+            if self._client is None or self._collection is None:
+                await asyncio.to_thread(self._ensure_initialized)
+        if self._collection is None:
+            raise RuntimeError("Failed to initialize ChromaDB")
+        return self._collection
+
+    def _embed(self, texts: Sequence[str], is_query: bool = False) -> List[Embedding]:
+        """Embed the texts, reusing the cached embeddings of texts that were embedded before.
+
+        Blocking; called from a worker thread."""
+        keys = [(is_query, hashlib.sha256(text.encode("utf-8")).hexdigest()) for text in texts]
+        embeddings: dict[Tuple[bool, str], Embedding] = {}
+        missing: dict[Tuple[bool, str], str] = {}
+        with self._embedding_cache_lock:
+            for key, text in zip(keys, texts, strict=True):
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    self._embedding_cache.move_to_end(key)
+                    embeddings[key] = cached
+                else:
+                    missing[key] = text
+
+        if missing:
+            embedding_function = self._embedding_function
+            embed = getattr(embedding_function, "embed_query", None) if is_query else None
+            computed = (embed or embedding_function)(list(missing.values()))
+            embeddings.update(zip(missing.keys(), computed, strict=True))
+            cache_size = self._config.embedding_cache_size
+            if cache_size > 0:
+                with self._embedding_cache_lock:
+                    for key in missing:
+                        self._embedding_cache[key] = embeddings[key]
+                        self._embedding_cache.move_to_end(key)
+                    while len(self._embedding_cache) > cache_size:
+                        self._embedding_cache.popitem(last=False)
+
+        return [embeddings[key] for key in keys]
+
+    def _add_batch(self, collection: Collection, texts: List[str], metadatas: List[Metadata]) -> None:
+        """Embed and insert a batch of documents. Blocking; called from a worker thread."""
+        collection.add(
+            documents=texts,
+            embeddings=self._embed(texts),
+            metadatas=metadatas,
+            ids=[str(uuid.uuid4()) for _ in texts],
+        )
+
     def _extract_text(self, content_item: str | MemoryContent) -> str:
         """Extract searchable text from content."""
         if isinstance(content_item, str):
@@ -353,20 +417,49 @@ async def update_context(
 
     async def add(self, content: MemoryContent, cancellation_token: CancellationToken | None = None) -> None:
         """Add a memory content to ChromaDB."""
-        self._ensure_initialized()
-        if self._collection is None:
-            raise RuntimeError("Failed to initialize ChromaDB")
+        await self.add_many([content], cancellation_token)
+
+    async def add_many(
+        self, contents: Sequence[MemoryContent], cancellation_token: CancellationToken | None = None
+    ) -> None:
+        """Add many memory contents to ChromaDB.
+
+        The contents are embedded and inserted in batches of `batch_size`, each with a single
+        call to the embedding function and to ChromaDB.
+
+        Args:
+            contents (Sequence[MemoryContent]): The contents to add.
+            cancellation_token (CancellationToken | None): Token to cancel the operation. Batches
+                already inserted are kept.
+        """
+        collection = await self._initialize()
 
         try:
-            # Extract text from content
-            text = self._extract_text(content)
+            texts: List[str] = []
+            metadatas: List[Metadata] = []
+            for content in contents:
+                # Extract text from content
+                texts.append(self._extract_text(content))
 
-            # Use metadata directly from content
-            metadata_dict = content.metadata or {}
-            metadata_dict["mime_type"] = str(content.mime_type)
+                # Use metadata directly from content
+                metadata_dict = content.metadata or {}
+                metadata_dict["mime_type"] = str(content.mime_type)
+                metadatas.append(metadata_dict)
 
             # Add to ChromaDB
-            self._collection.add(documents=[text], metadatas=[metadata_dict], ids=[str(uuid.uuid4())])
+            batch_size = self._config.batch_size
+            for start in range(0, len(texts), batch_size):
+                future = asyncio.ensure_future(
+                    asyncio.to_thread(
+                        self._add_batch,
+                        collection,
+                        texts[start : start + batch_size],
+                        metadatas[start : start + batch_size],
+                    )
+                )
+                if cancellation_token is not None:
+                    cancellation_token.link_future(future)
+                await future
 
         except Exception as e:
             logger.error(f"Failed to add content to ChromaDB: {e}")
@@ -379,21 +472,25 @@ async def query(
         **kwargs: Any,
     ) -> MemoryQueryResult:
         """Query memory content based on vector similarity."""
-        self._ensure_initialized()
-        if self._collection is None:
-            raise RuntimeError("Failed to initialize ChromaDB")
+        collection = await self._initialize()
 
         try:
             # Extract text for query
             query_text = self._extract_text(query)
 
             # Query ChromaDB
-            results = self._collection.query(
-                query_texts=[query_text],
-                n_results=self._config.k,
-                include=["documents", "metadatas", "distances"],
-                **kwargs,
-            )
+            def run_query() -> Any:
+                return collection.query(
+                    query_embeddings=self._embed([query_text], is_query=True),
+                    n_results=self._config.k,
+                    include=["documents", "metadatas", "distances"],
+                    **kwargs,
+                )
+
+            future = asyncio.ensure_future(asyncio.to_thread(run_query))
+            if cancellation_token is not None:
+                cancellation_token.link_future(future)
+            results = await future
 
             # Convert results to MemoryContent list
             memory_results: List[MemoryContent] = []
@@ -439,14 +536,15 @@ async def query(
 
     async def clear(self) -> None:
         """Clear all entries from memory."""
-        self._ensure_initialized()
-        if self._collection is None:
-            raise RuntimeError("Failed to initialize ChromaDB")
+        collection = await self._initialize()
 
-        try:
-            results = self._collection.get()
+        def clear_collection() -> None:
+            results = collection.get()
             if results and results["ids"]:
-                self._collection.delete(ids=results["ids"])
+                collection.delete(ids=results["ids"])
+
+        try:
+            await asyncio.to_thread(clear_collection)
         except Exception as e:
             logger.error(f"Failed to clear ChromaDB collection: {e}")
             raise
@@ -455,16 +553,17 @@ async def close(self) -> None:
         """Clean up ChromaDB client and resources."""
         self._collection = None
         self._client = None
+        self._embedding_function = None
 
     async def reset(self) -> None:
         """Reset the memory by deleting all data."""
-        self._ensure_initialized()
+        await self._initialize()
         if not self._config.allow_reset:
             raise RuntimeError("Reset not allowed. Set allow_reset=True in config to enable.")
 
         if self._client is not None:
             try:
-                self._client.reset()
+                await asyncio.to_thread(self._client.reset)
             except Exception as e:
                 logger.error(f"Error during ChromaDB reset: {e}")
             finally:
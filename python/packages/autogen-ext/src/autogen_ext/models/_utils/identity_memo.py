@@ -0,0 +1,46 @@
+import weakref
+from typing import Any, Callable, Dict, Generic, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class IdentityMemo(Generic[V]):
+    """Memoizes a value per object identity for as long as the object is alive.
+
+    Entries are dropped when their object is garbage collected. Objects that cannot be
+    weakly referenced, such as plain dicts, are computed on every call. The memoized
+    objects are assumed not to be mutated, unless a change is reflected in the ``version``
+    passed to :meth:`get`."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Tuple["weakref.ref[Any]", Any, V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Weak references cannot be pickled or copied; a copy starts out empty.
+        return {"_entries": {}}
+
+    def get(self, obj: Any, compute: Callable[[Any], V], version: Any = None) -> V:
+        """Return the value memoized for the object, computing it if there is none.
+
+        The value is also recomputed if ``version`` is not the same object as the one it was
+        computed with."""
+        key = id(obj)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is obj and entry[1] is version:
+            return entry[2]
+        value = compute(obj)
+
+        def discard(dead_ref: "weakref.ref[Any]") -> None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is dead_ref:
+                del self._entries[key]
+
+        try:
+            ref = weakref.ref(obj, discard)
+        except TypeError:
+            return value
+        self._entries[key] = (ref, version, value)
+        return value
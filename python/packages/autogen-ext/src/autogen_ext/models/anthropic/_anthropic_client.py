@@ -65,6 +65,7 @@
 from pydantic import BaseModel, SecretStr
 from typing_extensions import Self, Unpack
 
+from .._utils.identity_memo import IdentityMemo
 from . import _model_info
 from .config import (
     AnthropicBedrockClientConfiguration,
@@ -290,47 +291,52 @@ def to_anthropic_type(message: LLMMessage) -> Union[str, List[MessageParam], Mes
         return tool_message_to_anthropic(message)
 
 
-def convert_tools(tools: Sequence[Tool | ToolSchema]) -> List[ToolParam]:
-    result: List[ToolParam] = []
+def _convert_tool(tool: Tool | ToolSchema) -> ToolParam:
+    if isinstance(tool, Tool):
+        tool_schema = tool.schema
+    else:
+        assert isinstance(tool, dict)
+        tool_schema = tool
 
-    for tool in tools:
-        if isinstance(tool, Tool):
-            tool_schema = tool.schema
-        else:
-            assert isinstance(tool, dict)
-            tool_schema = tool
+    # Convert parameters to match Anthropic's schema format
+    tool_params: Dict[str, Any] = {}
+    if "parameters" in tool_schema:
+        params = tool_schema["parameters"]
 
-        # Convert parameters to match Anthropic's schema format
-        tool_params: Dict[str, Any] = {}
-        if "parameters" in tool_schema:
-            params = tool_schema["parameters"]
+        # Transfer properties
+        if "properties" in params:
+            tool_params["properties"] = params["properties"]
 
-            # Transfer properties
-            if "properties" in params:
-                tool_params["properties"] = params["properties"]
+        # Transfer required fields
+        if "required" in params:
+            tool_params["required"] = params["required"]
 
-            # Transfer required fields
-            if "required" in params:
-                tool_params["required"] = params["required"]
+        # Handle schema type
+        if "type" in params:
+            tool_params["type"] = params["type"]
+        else:
+            tool_params["type"] = "object"
 
-            # Handle schema type
-            if "type" in params:
-                tool_params["type"] = params["type"]
-            else:
-                tool_params["type"] = "object"
+    # Check if the tool has a valid name
+    assert_valid_name(tool_schema["name"])
 
-        result.append(
-            ToolParam(
-                name=tool_schema["name"],
-                input_schema=tool_params,
-                description=tool_schema.get("description", ""),
-            )
-        )
+    return ToolParam(
+        name=tool_schema["name"],
+        input_schema=tool_params,
+        description=tool_schema.get("description", ""),
+    )
+
+
+# Tools are converted once per tool instance, as agents send the same tools on every call. A tool is
+# converted again when it returns another schema, as BaseTool does after its name or description change.
+_converted_tools = IdentityMemo[ToolParam]()
 
-        # Check if the tool has a valid name
-        assert_valid_name(tool_schema["name"])
 
-    return result
+def convert_tools(tools: Sequence[Tool | ToolSchema]) -> List[ToolParam]:
+    return [
+        _converted_tools.get(tool, _convert_tool, version=None if isinstance(tool, dict) else tool.schema)
+        for tool in tools
+    ]
 
 
 def normalize_name(name: str) -> str:
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import weakref
+from typing import Any, Mapping, Optional, Sequence
+
+from autogen_core.models import LLMMessage
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import BaseModel
+
+from .._utils.identity_memo import IdentityMemo
+
+
+def _sha256(data: str) -> bytes:
+    return hashlib.sha256(data.encode()).digest()
+
+
+def _message_digest(message: LLMMessage) -> bytes:
+    return _sha256(json.dumps(message.model_dump(), sort_keys=True))
+
+
+def _tool_digest(tool: Tool | ToolSchema) -> bytes:
+    schema = tool.schema if isinstance(tool, Tool) else tool
+    return _sha256(json.dumps(schema, sort_keys=True))
+
+
+class CacheKeyBuilder:
+    """Computes the cache keys of :class:`~autogen_ext.models.cache.ChatCompletionCache`.
+
+    The key is a SHA-256 over the digests of the individual messages, tools, output type and
+    extra create arguments. Digests of messages and tools are memoized per object, and digests
+    of structured output types per type, so a call that extends a previously seen conversation
+    only serializes the new messages. Messages and tools are therefore assumed not to be
+    mutated after they have been passed to the cache.
+    """
+
+    def __init__(self) -> None:
+        self._message_digests = IdentityMemo[bytes]()
+        self._tool_digests = IdentityMemo[bytes]()
+        self._schema_digests: "weakref.WeakKeyDictionary[type, bytes]" = weakref.WeakKeyDictionary()
+
+    def _json_output_digest(self, json_output: Optional[bool | type[BaseModel]]) -> bytes:
+        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
+            digest = self._schema_digests.get(json_output)
+            if digest is None:
+                digest = _sha256(json.dumps(json_output.model_json_schema(), sort_keys=True))
+                self._schema_digests[json_output] = digest
+            return b"schema:" + digest
+        if isinstance(json_output, bool):
+            return b"json:" + str(json_output).encode()
+        return b"none"
+
+    def build(
+        self,
+        messages: Sequence[LLMMessage],
+        tools: Sequence[Tool | ToolSchema],
+        json_output: Optional[bool | type[BaseModel]],
+        extra_create_args: Mapping[str, Any],
+    ) -> str:
+        hasher = hashlib.sha256()
+        # Digests have a fixed length, so the counts are enough to delimit the sections.
+        hasher.update(len(messages).to_bytes(8, "big"))
+        for message in messages:
+            hasher.update(self._message_digests.get(message, _message_digest))
+        hasher.update(len(tools).to_bytes(8, "big"))
+        for tool in tools:
+            hasher.update(self._tool_digests.get(tool, _tool_digest))
+        hasher.update(self._json_output_digest(json_output))
+        hasher.update(b"\x00")
+        hasher.update(json.dumps(extra_create_args, sort_keys=True).encode())
+        return hasher.hexdigest()
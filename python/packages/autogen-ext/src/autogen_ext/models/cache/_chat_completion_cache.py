@@ -1,9 +1,16 @@
-import hashlib
-import json
+import asyncio
 import warnings
-from typing import Any, AsyncGenerator, List, Mapping, Optional, Sequence, Union, cast
-
-from autogen_core import CacheStore, CancellationToken, Component, ComponentModel, InMemoryStore
+from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Sequence, Union, cast
+
+from autogen_core import (
+    AsyncCacheStore,
+    CacheStore,
+    CancellationToken,
+    Component,
+    ComponentLoader,
+    ComponentModel,
+    InMemoryStore,
+)
 from autogen_core.models import (
     ChatCompletionClient,
     CreateResult,
@@ -16,9 +23,70 @@
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from ._cache_key import CacheKeyBuilder
+
 CHAT_CACHE_VALUE_TYPE = Union[CreateResult, List[Union[str, CreateResult]]]
 
 
+class _StreamBroadcast:
+    """Buffers the chunks of a single upstream stream so that any number of
+    consumers can replay what has been produced so far and then follow it live.
+
+    The upstream stream has its own cancellation token, which is cancelled once the
+    last consumer has left because its own token was cancelled. Consumers that stop
+    reading without cancelling leave the upstream stream running, so that it is cached."""
+
+    def __init__(self) -> None:
+        self.chunks: List[Union[str, CreateResult]] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.task: Optional[asyncio.Task[None]] = None
+        self.cancellation_token = CancellationToken()
+        self._subscribers = 0
+        self._updated = asyncio.Event()
+
+    def append(self, chunk: Union[str, CreateResult]) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+
+    def _notify(self) -> None:
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    async def subscribe(
+        self, cancellation_token: Optional[CancellationToken] = None
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        self._subscribers += 1
+        if cancellation_token is not None:
+            cancellation_token.add_callback(self._notify)
+        index = 0
+        try:
+            while True:
+                if cancellation_token is not None and cancellation_token.is_cancelled():
+                    raise asyncio.CancelledError()
+                updated = self._updated
+                while index < len(self.chunks):
+                    yield self.chunks[index]
+                    index += 1
+                if self.done:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                await updated.wait()
+        finally:
+            self._subscribers -= 1
+            cancelled = cancellation_token is not None and cancellation_token.is_cancelled()
+            if cancelled and self._subscribers == 0 and not self.done:
+                self.cancellation_token.cancel()
+                if self.task is not None:
+                    self.task.cancel()
+
+
 class ChatCompletionCacheConfig(BaseModel):
     """ """
 
@@ -79,11 +147,26 @@ async def main():
 
     You can now use the `cached_client` as you would the original client, but with caching enabled.
 
+    Concurrent identical requests are coalesced: while a request is in flight, further calls
+    with the same cache key wait for its result instead of invoking the underlying client again,
+    and are returned with ``cached`` set to ``True``. For :meth:`create_stream`, callers that join
+    late first replay the chunks streamed so far and then follow the live stream. The upstream
+    stream runs to completion even if the caller that started it stops iterating early.
+
+    Cache keys are built from per-message digests that are memoized for each message object,
+    so extending a conversation only serializes the new messages. Messages and tools must
+    therefore not be mutated after they have been passed to the cache.
+
+    Stores that perform I/O can implement :class:`~autogen_core.AsyncCacheStore` so lookups
+    do not block the event loop, e.g. :class:`~autogen_ext.cache_store.redis.AsyncRedisStore`
+    or :class:`~autogen_ext.cache_store.diskcache.AsyncDiskCacheStore`.
+
     Args:
         client (ChatCompletionClient): The original ChatCompletionClient to wrap.
-        store (CacheStore): A store object that implements get and set methods.
+        store (CacheStore | AsyncCacheStore): A store object that implements get and set methods.
             The user is responsible for managing the store's lifecycle & clearing it (if needed).
-            Defaults to using in-memory cache.
+            Defaults to an unbounded :class:`~autogen_core.InMemoryStore`; for long-running processes,
+            pass an :class:`~autogen_core.InMemoryStore` with `max_entries`, `max_bytes` or `ttl` set.
     """
 
     component_type = "chat_completion_cache"
@@ -93,44 +176,33 @@ async def main():
     def __init__(
         self,
         client: ChatCompletionClient,
-        store: Optional[CacheStore[CHAT_CACHE_VALUE_TYPE]] = None,
+        store: Optional[Union[CacheStore[CHAT_CACHE_VALUE_TYPE], AsyncCacheStore[CHAT_CACHE_VALUE_TYPE]]] = None,
     ):
         self.client = client
         self.store = store or InMemoryStore[CHAT_CACHE_VALUE_TYPE]()
+        self._in_flight_creates: Dict[str, asyncio.Future[CreateResult]] = {}
+        self._in_flight_streams: Dict[str, _StreamBroadcast] = {}
+        self._cache_key_builder = CacheKeyBuilder()
 
-    def _check_cache(
+    def _compute_cache_key(
         self,
         messages: Sequence[LLMMessage],
         tools: Sequence[Tool | ToolSchema],
         json_output: Optional[bool | type[BaseModel]],
         extra_create_args: Mapping[str, Any],
-    ) -> tuple[Optional[Union[CreateResult, List[Union[str, CreateResult]]]], str]:
-        """
-        Helper function to check the cache for a result.
-        Returns a tuple of (cached_result, cache_key).
-        """
-
-        json_output_data: str | bool | None = None
+    ) -> str:
+        return self._cache_key_builder.build(messages, tools, json_output, extra_create_args)
 
-        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
-            json_output_data = json.dumps(json_output.model_json_schema())
-        elif isinstance(json_output, bool):
-            json_output_data = json_output
+    async def _store_get(self, cache_key: str) -> Optional[CHAT_CACHE_VALUE_TYPE]:
+        if isinstance(self.store, AsyncCacheStore):
+            return await self.store.get(cache_key)
+        return self.store.get(cache_key)
 
-        data = {
-            "messages": [message.model_dump() for message in messages],
-            "tools": [(tool.schema if isinstance(tool, Tool) else tool) for tool in tools],
-            "json_output": json_output_data,
-            "extra_create_args": extra_create_args,
-        }
-        serialized_data = json.dumps(data, sort_keys=True)
-        cache_key = hashlib.sha256(serialized_data.encode()).hexdigest()
-
-        cached_result = cast(Optional[CreateResult], self.store.get(cache_key))
-        if cached_result is not None:
-            return cached_result, cache_key
-
-        return None, cache_key
+    async def _store_set(self, cache_key: str, value: CHAT_CACHE_VALUE_TYPE) -> None:
+        if isinstance(self.store, AsyncCacheStore):
+            await self.store.set(cache_key, value)
+        else:
+            self.store.set(cache_key, value)
 
     async def create(
         self,
@@ -144,24 +216,56 @@ async def create(
         """
         Cached version of ChatCompletionClient.create.
         If the result of a call to create has been cached, it will be returned immediately
-        without invoking the underlying client.
+        without invoking the underlying client. If an identical call is already in flight,
+        its result is awaited and shared.
 
-        NOTE: cancellation_token is ignored for cached results.
+        NOTE: cancellation_token is ignored for cached and shared results.
         """
-        cached_result, cache_key = self._check_cache(messages, tools, json_output, extra_create_args)
-        if cached_result:
-            assert isinstance(cached_result, CreateResult)
-            cached_result.cached = True
-            return cached_result
-
-        result = await self.client.create(
-            messages,
-            tools=tools,
-            json_output=json_output,
-            extra_create_args=extra_create_args,
-            cancellation_token=cancellation_token,
-        )
-        self.store.set(cache_key, result)
+        cache_key = self._compute_cache_key(messages, tools, json_output, extra_create_args)
+        while True:
+            in_flight = self._in_flight_creates.get(cache_key)
+            if in_flight is None:
+                cached_result = await self._store_get(cache_key)
+                if cached_result:
+                    assert isinstance(cached_result, CreateResult)
+                    cached_result.cached = True
+                    return cached_result
+                # Another caller may have started the same request while the store was queried.
+                in_flight = self._in_flight_creates.get(cache_key)
+                if in_flight is None:
+                    break
+            try:
+                shared_result = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if in_flight.cancelled():
+                    # The caller that owned the request was cancelled; retry on our own.
+                    continue
+                raise
+            return shared_result.model_copy(update={"cached": True})
+
+        future: asyncio.Future[CreateResult] = asyncio.get_running_loop().create_future()
+        self._in_flight_creates[cache_key] = future
+        try:
+            result = await self.client.create(
+                messages,
+                tools=tools,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=cancellation_token,
+            )
+            await self._store_set(cache_key, result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no other caller was waiting on it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._in_flight_creates[cache_key]
         return result
 
     def create_stream(
@@ -176,43 +280,91 @@ def create_stream(
         """
         Cached version of ChatCompletionClient.create_stream.
         If the result of a call to create_stream has been cached, it will be returned
-        without streaming from the underlying client.
+        without streaming from the underlying client. If an identical stream is already
+        in flight, its chunks are replayed from the start and then followed live.
 
-        NOTE: cancellation_token is ignored for cached results.
+        Cancelling cancellation_token stops this caller's stream. The upstream stream
+        is shared by its callers and is only cancelled once every caller has gone after
+        cancelling. It is ignored for cached results.
         """
 
         async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
-            cached_result, cache_key = self._check_cache(
-                messages,
-                tools,
-                json_output,
-                extra_create_args,
-            )
-            if cached_result:
-                assert isinstance(cached_result, list)
-                for result in cached_result:
+            cache_key = self._compute_cache_key(messages, tools, json_output, extra_create_args)
+            broadcast = self._in_flight_streams.get(cache_key)
+            if broadcast is not None and broadcast.cancellation_token.is_cancelled():
+                # The stream is being cancelled by its last caller; start a new one.
+                broadcast = None
+            if broadcast is None:
+                cached_result = await self._store_get(cache_key)
+                if cached_result:
+                    assert isinstance(cached_result, list)
+                    for result in cached_result:
+                        if isinstance(result, CreateResult):
+                            result.cached = True
+                        yield result
+                    return
+                # Another caller may have started the same stream while the store was queried.
+                broadcast = self._in_flight_streams.get(cache_key)
+                if broadcast is not None and broadcast.cancellation_token.is_cancelled():
+                    broadcast = None
+
+            if broadcast is not None:
+                async for result in broadcast.subscribe(cancellation_token):
                     if isinstance(result, CreateResult):
-                        result.cached = True
+                        result = result.model_copy(update={"cached": True})
                     yield result
                 return
 
-            result_stream = self.client.create_stream(
-                messages,
-                tools=tools,
-                json_output=json_output,
-                extra_create_args=extra_create_args,
-                cancellation_token=cancellation_token,
+            broadcast = _StreamBroadcast()
+            self._in_flight_streams[cache_key] = broadcast
+            broadcast.task = asyncio.create_task(
+                self._pump_stream(
+                    cache_key,
+                    broadcast,
+                    messages,
+                    tools=tools,
+                    json_output=json_output,
+                    extra_create_args=extra_create_args,
+                )
             )
-
-            output_results: List[Union[str, CreateResult]] = []
-            self.store.set(cache_key, output_results)
-
-            async for result in result_stream:
-                output_results.append(result)
+            async for result in broadcast.subscribe(cancellation_token):
                 yield result
 
         return _generator()
 
+    async def _pump_stream(
+        self,
+        cache_key: str,
+        broadcast: _StreamBroadcast,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema],
+        json_output: Optional[bool | type[BaseModel]],
+        extra_create_args: Mapping[str, Any],
+    ) -> None:
+        """Drive the upstream stream into the broadcast and cache the complete output."""
+        try:
+            async for result in self.client.create_stream(
+                messages,
+                tools=tools,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=broadcast.cancellation_token,
+            ):
+                broadcast.append(result)
+            await self._store_set(cache_key, list(broadcast.chunks))
+        except asyncio.CancelledError as e:
+            broadcast.finish(e)
+            raise
+        except BaseException as e:
+            broadcast.finish(e)
+        else:
+            broadcast.finish()
+        finally:
+            # A new stream may have replaced this one after it was cancelled.
+            if self._in_flight_streams.get(cache_key) is broadcast:
+                del self._in_flight_streams[cache_key]
+
     async def close(self) -> None:
         await self.client.close()
 
@@ -240,13 +392,16 @@ def total_usage(self) -> RequestUsage:
     def _to_config(self) -> ChatCompletionCacheConfig:
         return ChatCompletionCacheConfig(
             client=self.client.dump_component(),
-            store=self.store.dump_component() if not isinstance(self.store, InMemoryStore) else None,
+            store=self.store.dump_component(),
         )
 
     @classmethod
     def _from_config(cls, config: ChatCompletionCacheConfig) -> Self:
         client = ChatCompletionClient.load_component(config.client)
-        store: Optional[CacheStore[CHAT_CACHE_VALUE_TYPE]] = (
-            CacheStore.load_component(config.store) if config.store else InMemoryStore()
-        )
+        store: Optional[Union[CacheStore[CHAT_CACHE_VALUE_TYPE], AsyncCacheStore[CHAT_CACHE_VALUE_TYPE]]] = None
+        if config.store:
+            loaded_store = ComponentLoader.load_component(config.store)
+            if not isinstance(loaded_store, (CacheStore, AsyncCacheStore)):
+                raise TypeError(f"Expected a CacheStore or AsyncCacheStore, got {type(loaded_store).__name__}")
+            store = cast(Union[CacheStore[CHAT_CACHE_VALUE_TYPE], AsyncCacheStore[CHAT_CACHE_VALUE_TYPE]], loaded_store)
         return cls(client=client, store=store)
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import inspect
 import json
 import logging
@@ -72,6 +73,7 @@
 from pydantic import BaseModel, SecretStr
 from typing_extensions import Self, Unpack
 
+from .._utils.identity_memo import IdentityMemo
 from .._utils.normalize_stop_reason import normalize_stop_reason
 from .._utils.parse_r1_content import parse_r1_content
 from . import _model_info
@@ -235,34 +237,39 @@ def _add_usage(usage1: RequestUsage, usage2: RequestUsage) -> RequestUsage:
     )
 
 
+def _convert_tool(tool: Tool | ToolSchema) -> ChatCompletionToolParam:
+    if isinstance(tool, Tool):
+        tool_schema = tool.schema
+    else:
+        assert isinstance(tool, dict)
+        tool_schema = tool
+
+    tool_param = ChatCompletionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            name=tool_schema["name"],
+            description=(tool_schema["description"] if "description" in tool_schema else ""),
+            parameters=(cast(FunctionParameters, tool_schema["parameters"]) if "parameters" in tool_schema else {}),
+            strict=(tool_schema["strict"] if "strict" in tool_schema else False),
+        ),
+    )
+    # Check if the tool has a valid name.
+    assert_valid_name(tool_param["function"]["name"])
+    return tool_param
+
+
+# Tools are converted once per tool instance, as agents send the same tools on every call. A tool is
+# converted again when it returns another schema, as BaseTool does after its name or description change.
+_converted_tools = IdentityMemo[ChatCompletionToolParam]()
+
+
 def convert_tools(
     tools: Sequence[Tool | ToolSchema],
 ) -> List[ChatCompletionToolParam]:
-    result: List[ChatCompletionToolParam] = []
-    for tool in tools:
-        if isinstance(tool, Tool):
-            tool_schema = tool.schema
-        else:
-            assert isinstance(tool, dict)
-            tool_schema = tool
-
-        result.append(
-            ChatCompletionToolParam(
-                type="function",
-                function=FunctionDefinition(
-                    name=tool_schema["name"],
-                    description=(tool_schema["description"] if "description" in tool_schema else ""),
-                    parameters=(
-                        cast(FunctionParameters, tool_schema["parameters"]) if "parameters" in tool_schema else {}
-                    ),
-                    strict=(tool_schema["strict"] if "strict" in tool_schema else False),
-                ),
-            )
-        )
-    # Check if all tools have valid names.
-    for tool_param in result:
-        assert_valid_name(tool_param["function"]["name"])
-    return result
+    return [
+        _converted_tools.get(tool, _convert_tool, version=None if isinstance(tool, dict) else tool.schema)
+        for tool in tools
+    ]
 
 
 def normalize_name(name: str) -> str:
@@ -274,6 +281,99 @@ def normalize_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_-]", "_", name)[:64]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _count_message_tokens(
+    message: LLMMessage,
+    encoding: tiktoken.Encoding,
+    model: str,
+    *,
+    add_name_prefixes: bool,
+    model_family: str,
+) -> int:
+    tokens_per_message = 3
+    tokens_per_name = 1
+    num_tokens = tokens_per_message
+    oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
+    for oai_message_part in oai_message:
+        for key, value in oai_message_part.items():
+            if value is None:
+                continue
+
+            if isinstance(message, UserMessage) and isinstance(value, list):
+                typed_message_value = cast(List[ChatCompletionContentPartParam], value)
+
+                assert len(typed_message_value) == len(
+                    message.content
+                ), "Mismatch in message content and typed message value"
+
+                # We need image properties that are only in the original message
+                for part, content_part in zip(typed_message_value, message.content, strict=False):
+                    if isinstance(content_part, Image):
+                        # TODO: add detail parameter
+                        num_tokens += calculate_vision_tokens(content_part)
+                    elif isinstance(part, str):
+                        num_tokens += len(encoding.encode(part))
+                    else:
+                        try:
+                            serialized_part = json.dumps(part)
+                            num_tokens += len(encoding.encode(serialized_part))
+                        except TypeError:
+                            trace_logger.warning(f"Could not convert {part} to string, skipping.")
+            else:
+                if not isinstance(value, str):
+                    try:
+                        value = json.dumps(value)
+                    except TypeError:
+                        trace_logger.warning(f"Could not convert {value} to string, skipping.")
+                        continue
+                num_tokens += len(encoding.encode(value))
+                if key == "name":
+                    num_tokens += tokens_per_name
+    return num_tokens
+
+
+def _count_tool_tokens(tool: Tool | ToolSchema, encoding: tiktoken.Encoding) -> int:
+    function = convert_tools([tool])[0]["function"]
+    tool_tokens = len(encoding.encode(function["name"]))
+    if "description" in function:
+        tool_tokens += len(encoding.encode(function["description"]))
+    tool_tokens -= 2
+    if "parameters" in function:
+        parameters = function["parameters"]
+        if "properties" in parameters:
+            assert isinstance(parameters["properties"], dict)
+            for propertiesKey in parameters["properties"]:  # pyright: ignore
+                assert isinstance(propertiesKey, str)
+                tool_tokens += len(encoding.encode(propertiesKey))
+                v = parameters["properties"][propertiesKey]  # pyright: ignore
+                for field in v:  # pyright: ignore
+                    if field == "type":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
+                    elif field == "description":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
+                    elif field == "enum":
+                        tool_tokens -= 3
+                        for o in v["enum"]:  # pyright: ignore
+                            tool_tokens += 3
+                            tool_tokens += len(encoding.encode(o))  # pyright: ignore
+                    else:
+                        trace_logger.warning(f"Not supported field {field}")
+            tool_tokens += 11
+            if len(parameters["properties"]) == 0:  # pyright: ignore
+                tool_tokens -= 2
+    return tool_tokens
+
+
 def count_tokens_openai(
     messages: Sequence[LLMMessage],
     model: str,
@@ -282,90 +382,19 @@ def count_tokens_openai(
     tools: Sequence[Tool | ToolSchema] = [],
     model_family: str = ModelFamily.UNKNOWN,
 ) -> int:
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
-    tokens_per_message = 3
-    tokens_per_name = 1
+    encoding = _get_encoding(model)
     num_tokens = 0
 
     # Message tokens.
     for message in messages:
-        num_tokens += tokens_per_message
-        oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
-        for oai_message_part in oai_message:
-            for key, value in oai_message_part.items():
-                if value is None:
-                    continue
-
-                if isinstance(message, UserMessage) and isinstance(value, list):
-                    typed_message_value = cast(List[ChatCompletionContentPartParam], value)
-
-                    assert len(typed_message_value) == len(
-                        message.content
-                    ), "Mismatch in message content and typed message value"
-
-                    # We need image properties that are only in the original message
-                    for part, content_part in zip(typed_message_value, message.content, strict=False):
-                        if isinstance(content_part, Image):
-                            # TODO: add detail parameter
-                            num_tokens += calculate_vision_tokens(content_part)
-                        elif isinstance(part, str):
-                            num_tokens += len(encoding.encode(part))
-                        else:
-                            try:
-                                serialized_part = json.dumps(part)
-                                num_tokens += len(encoding.encode(serialized_part))
-                            except TypeError:
-                                trace_logger.warning(f"Could not convert {part} to string, skipping.")
-                else:
-                    if not isinstance(value, str):
-                        try:
-                            value = json.dumps(value)
-                        except TypeError:
-                            trace_logger.warning(f"Could not convert {value} to string, skipping.")
-                            continue
-                    num_tokens += len(encoding.encode(value))
-                    if key == "name":
-                        num_tokens += tokens_per_name
+        num_tokens += _count_message_tokens(
+            message, encoding, model, add_name_prefixes=add_name_prefixes, model_family=model_family
+        )
     num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
 
     # Tool tokens.
-    oai_tools = convert_tools(tools)
-    for tool in oai_tools:
-        function = tool["function"]
-        tool_tokens = len(encoding.encode(function["name"]))
-        if "description" in function:
-            tool_tokens += len(encoding.encode(function["description"]))
-        tool_tokens -= 2
-        if "parameters" in function:
-            parameters = function["parameters"]
-            if "properties" in parameters:
-                assert isinstance(parameters["properties"], dict)
-                for propertiesKey in parameters["properties"]:  # pyright: ignore
-                    assert isinstance(propertiesKey, str)
-                    tool_tokens += len(encoding.encode(propertiesKey))
-                    v = parameters["properties"][propertiesKey]  # pyright: ignore
-                    for field in v:  # pyright: ignore
-                        if field == "type":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
-                        elif field == "description":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
-                        elif field == "enum":
-                            tool_tokens -= 3
-                            for o in v["enum"]:  # pyright: ignore
-                                tool_tokens += 3
-                                tool_tokens += len(encoding.encode(o))  # pyright: ignore
-                        else:
-                            trace_logger.warning(f"Not supported field {field}")
-                tool_tokens += 11
-                if len(parameters["properties"]) == 0:  # pyright: ignore
-                    tool_tokens -= 2
-        num_tokens += tool_tokens
+    for tool in tools:
+        num_tokens += _count_tool_tokens(tool, encoding)
     num_tokens += 12
     return num_tokens
 
@@ -390,6 +419,8 @@ def __init__(
     ):
         self._client = client
         self._add_name_prefixes = add_name_prefixes
+        self._message_token_counts = IdentityMemo[int]()
+        self._tool_token_counts = IdentityMemo[int]()
         if model_capabilities is None and model_info is None:
             try:
                 self._model_info = _model_info.get_info(create_args["model"])
@@ -1065,13 +1096,30 @@ def total_usage(self) -> RequestUsage:
         return self._total_usage
 
     def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
-        return count_tokens_openai(
-            messages,
-            self._create_args["model"],
-            add_name_prefixes=self._add_name_prefixes,
-            tools=tools,
-            model_family=self._model_info["family"],
-        )
+        """Count the tokens of `messages` and `tools` as :func:`count_tokens_openai` does.
+
+        Token counts are memoized per message and tool object, so counting a growing
+        conversation only encodes the messages that were not counted before. Messages and
+        tools must therefore not be mutated after they have been counted."""
+        model = self._create_args["model"]
+        encoding = _get_encoding(model)
+
+        def count_message(message: LLMMessage) -> int:
+            return _count_message_tokens(
+                message,
+                encoding,
+                model,
+                add_name_prefixes=self._add_name_prefixes,
+                model_family=self._model_info["family"],
+            )
+
+        num_tokens = 3  # every reply is primed with <|start|>assistant<|message|>
+        for message in messages:
+            num_tokens += self._message_token_counts.get(message, count_message)
+        for tool in tools:
+            num_tokens += self._tool_token_counts.get(tool, lambda tool: _count_tool_tokens(tool, encoding))
+        num_tokens += 12
+        return num_tokens
 
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         token_limit = _model_info.get_token_limit(self._create_args["model"])
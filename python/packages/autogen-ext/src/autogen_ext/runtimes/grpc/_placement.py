@@ -0,0 +1,75 @@
+import bisect
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """Maps keys to nodes by consistent hashing.
+
+    Each node is placed on the ring at `virtual_nodes` points, and a key belongs to the node of
+    the first point at or after the hash of the key. Adding or removing a node therefore only
+    moves the keys of the ring segments that node gains or loses, and the mapping is the same
+    in every process that holds the same nodes."""
+
+    def __init__(self, virtual_nodes: int = 64) -> None:
+        if virtual_nodes < 1:
+            raise ValueError("virtual_nodes must be at least 1")
+        self._virtual_nodes = virtual_nodes
+        self._points: List[int] = []
+        self._point_to_node: Dict[int, str] = {}
+        self._nodes: Set[str] = set()
+
+    @property
+    def nodes(self) -> Set[str]:
+        return set(self._nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add(self, node: str) -> None:
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for i in range(self._virtual_nodes):
+            point = _hash(f"{node}#{i}")
+            # Ignore the astronomically unlikely collision with another node's point.
+            if point not in self._point_to_node:
+                self._point_to_node[point] = node
+                bisect.insort(self._points, point)
+
+    def remove(self, node: str) -> None:
+        if node not in self._nodes:
+            return
+        self._nodes.remove(node)
+        self._points = [point for point in self._points if self._point_to_node[point] != node]
+        self._point_to_node = {point: self._point_to_node[point] for point in self._points}
+
+    def get(self, key: str) -> str | None:
+        if not self._points:
+            return None
+        index = bisect.bisect_left(self._points, _hash(key))
+        if index == len(self._points):
+            index = 0
+        return self._point_to_node[self._points[index]]
+
+
+@dataclass
+class WorkerLoad:
+    """Load of a worker connected to a :class:`~autogen_ext.runtimes.grpc.GrpcWorkerAgentRuntimeHost`."""
+
+    agent_types: Set[str] = field(default_factory=set)
+    """The agent types registered by the worker."""
+    pending_requests: int = 0
+    """Number of RPC requests delivered to the worker that have not been answered yet."""
+    delivered_requests: int = 0
+    """Total number of RPC requests delivered to the worker."""
+    delivered_events: int = 0
+    """Total number of events delivered to the worker."""
@@ -9,6 +9,7 @@
 import warnings
 from asyncio import Future, Task
 from collections import defaultdict
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -38,6 +39,7 @@
     AgentId,
     AgentInstantiationContext,
     AgentMetadata,
+    AgentPassivationPolicy,
     AgentRuntime,
     AgentType,
     CancellationToken,
@@ -47,7 +49,7 @@
     Subscription,
     TopicId,
 )
-from autogen_core._runtime_impl_helpers import SubscriptionManager, get_impl
+from autogen_core._runtime_impl_helpers import AgentPassivationManager, SubscriptionManager, get_impl
 from autogen_core._serialization import (
     SerializationRegistry,
 )
@@ -219,6 +221,15 @@ class GrpcWorkerAgentRuntime(AgentRuntime):
 
     Cross-language agents will additionally require all agents use shared protobuf schemas for any message types that are sent between agents.
 
+    Args:
+        host_address (str): The address of the host runtime.
+        tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
+        extra_grpc_config (ChannelArgumentType, optional): Extra gRPC channel options. Defaults to None.
+        payload_serialization_format (str, optional): The serialization format used for message payloads. Defaults to JSON.
+        passivation_policy (AgentPassivationPolicy, optional): Policy for saving the state of idle agents and dropping them from memory.
+            Passivated agents are recreated through their factory and have their state restored on the next message they receive.
+            Defaults to None, meaning agents stay in memory.
+
     .. _agent_worker.proto: https://github.com/microsoft/autogen/blob/main/protos/agent_worker.proto
 
     .. _cloudevent.proto: https://github.com/microsoft/autogen/blob/main/protos/cloudevent.proto
@@ -232,6 +243,7 @@ def __init__(
         tracer_provider: TracerProvider | None = None,
         extra_grpc_config: ChannelArgumentType | None = None,
         payload_serialization_format: str = JSON_DATA_CONTENT_TYPE,
+        passivation_policy: AgentPassivationPolicy | None = None,
     ) -> None:
         self._host_address = host_address
         self._trace_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("Worker Runtime"))
@@ -252,12 +264,29 @@ def __init__(
         self._serialization_registry = SerializationRegistry()
         self._extra_grpc_config = extra_grpc_config or []
         self._agent_instance_types: Dict[str, Type[Agent]] = {}
+        self._passivation: AgentPassivationManager | None = None
+        if passivation_policy is not None:
+            self._passivation = AgentPassivationManager(
+                passivation_policy,
+                self._instantiated_agents,
+                is_evictable=lambda agent_id: agent_id.type not in self._agent_instance_types,
+            )
 
         if payload_serialization_format not in {JSON_DATA_CONTENT_TYPE, PROTOBUF_DATA_CONTENT_TYPE}:
             raise ValueError(f"Unsupported payload serialization format: {payload_serialization_format}")
 
         self._payload_serialization_format = payload_serialization_format
 
+    @property
+    def resident_agents_count(self) -> int:
+        """The number of agent instances in memory."""
+        return len(self._instantiated_agents)
+
+    @property
+    def passivated_agents_count(self) -> int:
+        """The number of agents whose state was saved to the passivation state store and that are not in memory."""
+        return self._passivation.passivated_count if self._passivation is not None else 0
+
     async def start(self) -> None:
         """Start the runtime in a background task."""
         if self._running:
@@ -270,6 +299,8 @@ async def start(self) -> None:
         if self._read_task is None:
             self._read_task = asyncio.create_task(self._run_read_loop())
         self._running = True
+        if self._passivation is not None:
+            self._passivation.start_idle_sweep()
 
     def _raise_on_exception(self, task: Task[Any]) -> None:
         exception = task.exception()
@@ -310,6 +341,8 @@ async def stop(self) -> None:
         if not self._running:
             raise RuntimeError("Runtime is not running.")
         self._running = False
+        if self._passivation is not None:
+            await self._passivation.stop_idle_sweep()
         # Wait for all background tasks to finish.
         final_tasks_results = await asyncio.gather(*self._background_tasks, return_exceptions=True)
         for task_result in final_tasks_results:
@@ -526,38 +559,39 @@ async def _process_request(self, request: agent_worker_pb2.RpcRequest) -> None:
             data_content_type=request.payload.data_content_type,
         )
 
-        # Get the receiving agent and prepare the message context.
-        rec_agent = await self._get_agent(recipient)
-        message_context = MessageContext(
-            sender=sender,
-            topic_id=None,
-            is_rpc=True,
-            cancellation_token=CancellationToken(),
-            message_id=request.request_id,
-        )
-
-        # Call the receiving agent.
-        try:
-            with MessageHandlerContext.populate_context(rec_agent.id):
-                with self._trace_helper.trace_block(
-                    "process",
-                    rec_agent.id,
-                    parent=request.metadata,
-                    attributes={"request_id": request.request_id},
-                    extraAttributes={"message_type": request.payload.data_type},
-                ):
-                    result = await rec_agent.on_message(message, ctx=message_context)
-        except BaseException as e:
-            response_message = agent_worker_pb2.Message(
-                response=agent_worker_pb2.RpcResponse(
-                    request_id=request.request_id,
-                    error=str(e),
-                    metadata=get_telemetry_grpc_metadata(),
-                ),
+        # Pin the receiving agent up front, so that construction errors are raised here and the agent
+        # is not passivated before it handles the message, and prepare the message context.
+        async with self._agent_in_use(recipient) as rec_agent:
+            message_context = MessageContext(
+                sender=sender,
+                topic_id=None,
+                is_rpc=True,
+                cancellation_token=CancellationToken(),
+                message_id=request.request_id,
             )
-            # Send the error response.
-            await self._host_connection.send(response_message)
-            return
+
+            # Call the receiving agent.
+            try:
+                with MessageHandlerContext.populate_context(rec_agent.id):
+                    with self._trace_helper.trace_block(
+                        "process",
+                        rec_agent.id,
+                        parent=request.metadata,
+                        attributes={"request_id": request.request_id},
+                        extraAttributes={"message_type": request.payload.data_type},
+                    ):
+                        result = await rec_agent.on_message(message, ctx=message_context)
+            except BaseException as e:
+                response_message = agent_worker_pb2.Message(
+                    response=agent_worker_pb2.RpcResponse(
+                        request_id=request.request_id,
+                        error=str(e),
+                        metadata=get_telemetry_grpc_metadata(),
+                    ),
+                )
+                # Send the error response.
+                await self._host_connection.send(response_message)
+                return
 
         # Serialize the result.
         result_type = self._serialization_registry.type_name(result)
@@ -616,6 +650,11 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         topic_id = TopicId(event.type, event.source)
         # Get the recipients for the topic.
         recipients = await self._subscription_manager.get_subscribed_recipients(topic_id)
+        if _constants.AGENT_RECIPIENTS_ATTR in event_attributes:
+            # The host places keys of shared agent types on different workers and names the recipients
+            # this worker is responsible for.
+            assigned = set(json.loads(event_attributes[_constants.AGENT_RECIPIENTS_ATTR].ce_string))
+            recipients = [recipient for recipient in recipients if str(recipient) in assigned]
 
         message_content_type = event_attributes[_constants.DATA_CONTENT_TYPE_ATTR].ce_string
         message_type = event_attributes[_constants.DATA_SCHEMA_ATTR].ce_string
@@ -645,62 +684,64 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
 
         # Send the message to each recipient.
         responses: List[Awaitable[Any]] = []
-        for agent_id in recipients:
-            if agent_id == sender:
-                continue
-            message_context = MessageContext(
-                sender=sender,
-                topic_id=topic_id,
-                is_rpc=is_rpc,
-                cancellation_token=CancellationToken(),
-                message_id=event.id,
-            )
-            agent = await self._get_agent(agent_id)
-            with MessageHandlerContext.populate_context(agent.id):
-
-                def stringify_attributes(
-                    attributes: Mapping[str, cloudevent_pb2.CloudEvent.CloudEventAttributeValue],
-                ) -> Mapping[str, str]:
-                    result: Dict[str, str] = {}
-                    for key, value in attributes.items():
-                        item = None
-                        match value.WhichOneof("attr"):
-                            case "ce_boolean":
-                                item = str(value.ce_boolean)
-                            case "ce_integer":
-                                item = str(value.ce_integer)
-                            case "ce_string":
-                                item = value.ce_string
-                            case "ce_bytes":
-                                item = str(value.ce_bytes)
-                            case "ce_uri":
-                                item = value.ce_uri
-                            case "ce_uri_ref":
-                                item = value.ce_uri_ref
-                            case "ce_timestamp":
-                                item = str(value.ce_timestamp)
-                            case _:
-                                raise ValueError("Unknown attribute kind")
-                        result[key] = item
-
-                    return result
-
-                async def send_message(agent: Agent, message_context: MessageContext) -> Any:
-                    with self._trace_helper.trace_block(
-                        "process",
-                        agent.id,
-                        parent=stringify_attributes(event.attributes),
-                        extraAttributes={"message_type": message_type},
-                    ):
-                        await agent.on_message(message, ctx=message_context)
-
-                future = send_message(agent, message_context)
-            responses.append(future)
-        # Wait for all responses.
-        try:
-            await asyncio.gather(*responses)
-        except BaseException as e:
-            logger.error("Error handling event", exc_info=e)
+        async with AsyncExitStack() as pinned_agents:
+            for agent_id in recipients:
+                if agent_id == sender:
+                    continue
+                message_context = MessageContext(
+                    sender=sender,
+                    topic_id=topic_id,
+                    is_rpc=is_rpc,
+                    cancellation_token=CancellationToken(),
+                    message_id=event.id,
+                )
+                # Pin the agent up front so that it is not passivated before it handles the message.
+                agent = await pinned_agents.enter_async_context(self._agent_in_use(agent_id))
+                with MessageHandlerContext.populate_context(agent.id):
+
+                    def stringify_attributes(
+                        attributes: Mapping[str, cloudevent_pb2.CloudEvent.CloudEventAttributeValue],
+                    ) -> Mapping[str, str]:
+                        result: Dict[str, str] = {}
+                        for key, value in attributes.items():
+                            item = None
+                            match value.WhichOneof("attr"):
+                                case "ce_boolean":
+                                    item = str(value.ce_boolean)
+                                case "ce_integer":
+                                    item = str(value.ce_integer)
+                                case "ce_string":
+                                    item = value.ce_string
+                                case "ce_bytes":
+                                    item = str(value.ce_bytes)
+                                case "ce_uri":
+                                    item = value.ce_uri
+                                case "ce_uri_ref":
+                                    item = value.ce_uri_ref
+                                case "ce_timestamp":
+                                    item = str(value.ce_timestamp)
+                                case _:
+                                    raise ValueError("Unknown attribute kind")
+                            result[key] = item
+
+                        return result
+
+                    async def send_message(agent: Agent, message_context: MessageContext) -> Any:
+                        with self._trace_helper.trace_block(
+                            "process",
+                            agent.id,
+                            parent=stringify_attributes(event.attributes),
+                            extraAttributes={"message_type": message_type},
+                        ):
+                            await agent.on_message(message, ctx=message_context)
+
+                    future = send_message(agent, message_context)
+                responses.append(future)
+            # Wait for all responses.
+            try:
+                await asyncio.gather(*responses)
+            except BaseException as e:
+                logger.error("Error handling event", exc_info=e)
 
     async def _register_agent_type(self, agent_type: str) -> None:
         if self._host_connection is None:
@@ -795,16 +836,31 @@ async def _invoke_agent_factory(
         return agent
 
     async def _get_agent(self, agent_id: AgentId) -> Agent:
+        if self._passivation is not None:
+            return await self._passivation.get_agent(agent_id, self._create_agent)
+
         if agent_id in self._instantiated_agents:
             return self._instantiated_agents[agent_id]
 
+        agent = await self._create_agent(agent_id)
+        self._instantiated_agents[agent_id] = agent
+        return agent
+
+    async def _create_agent(self, agent_id: AgentId) -> Agent:
         if agent_id.type not in self._agent_factories:
             raise ValueError(f"Agent with name {agent_id.type} not found.")
 
         agent_factory = self._agent_factories[agent_id.type]
-        agent = await self._invoke_agent_factory(agent_factory, agent_id)
-        self._instantiated_agents[agent_id] = agent
-        return agent
+        return await self._invoke_agent_factory(agent_factory, agent_id)
+
+    @asynccontextmanager
+    async def _agent_in_use(self, agent_id: AgentId) -> AsyncIterator[Agent]:
+        """Get an agent for handling a message, keeping it from being passivated while the message is handled."""
+        if self._passivation is None:
+            yield await self._get_agent(agent_id)
+            return
+        async with self._passivation.pinned(agent_id, self._create_agent) as agent:
+            yield agent
 
     # TODO: uncomment out the following type ignore when this is fixed in mypy: https://github.com/python/mypy/issues/3737
     async def try_get_underlying_agent_instance(self, id: AgentId, type: Type[T] = Agent) -> T:  # type: ignore[assignment]
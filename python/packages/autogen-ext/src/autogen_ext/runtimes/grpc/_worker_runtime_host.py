@@ -1,9 +1,10 @@
 import asyncio
 import logging
 import signal
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence
 
 from ._constants import GRPC_IMPORT_ERROR_STR
+from ._placement import WorkerLoad
 from ._type_helpers import ChannelArgumentType
 from ._worker_runtime_host_servicer import GrpcWorkerAgentRuntimeHostServicer
 
@@ -17,14 +18,64 @@
 
 
 class GrpcWorkerAgentRuntimeHost:
-    def __init__(self, address: str, extra_grpc_config: Optional[ChannelArgumentType] = None) -> None:
+    """A host that routes messages between :class:`~autogen_ext.runtimes.grpc.GrpcWorkerAgentRuntime` workers.
+
+    Args:
+        address (str): The address to listen on, e.g. ``"localhost:50051"``.
+        extra_grpc_config (ChannelArgumentType, optional): Extra options for the gRPC server.
+        shared_agent_types (bool, optional): Whether several workers may register the same agent type, to scale
+            it horizontally. Messages for an agent of a shared type go to one of its workers by consistent hashing
+            on the agent key. See :class:`~autogen_ext.runtimes.grpc.GrpcWorkerAgentRuntimeHostServicer`.
+            Defaults to False.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+
+
+            async def main() -> None:
+                host = GrpcWorkerAgentRuntimeHost(address="localhost:50051", shared_agent_types=True)
+                host.start()
+
+                # Both workers host the "assistant" agent type; each key is handled by one of them.
+                workers = [GrpcWorkerAgentRuntime(host_address="localhost:50051") for _ in range(2)]
+                for worker in workers:
+                    await worker.start()
+                    # await MyAgent.register(worker, "assistant", lambda: MyAgent())
+
+                print(host.worker_load)
+
+                for worker in workers:
+                    await worker.stop()
+                await host.stop()
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        address: str,
+        extra_grpc_config: Optional[ChannelArgumentType] = None,
+        *,
+        shared_agent_types: bool = False,
+    ) -> None:
         self._server = grpc.aio.server(options=extra_grpc_config)
-        self._servicer = GrpcWorkerAgentRuntimeHostServicer()
+        self._servicer = GrpcWorkerAgentRuntimeHostServicer(shared_agent_types=shared_agent_types)
         agent_worker_pb2_grpc.add_AgentRpcServicer_to_server(self._servicer, self._server)
         self._server.add_insecure_port(address)
         self._address = address
         self._serve_task: asyncio.Task[None] | None = None
 
+    @property
+    def worker_load(self) -> Dict[str, WorkerLoad]:
+        """The load of each worker that registered an agent type, keyed by client id."""
+        return self._servicer.worker_load
+
     async def _serve(self) -> None:
         await self._server.start()
         logger.info(f"Server started at {self._address}.")
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from abc import ABC, abstractmethod
 from asyncio import Future, Task
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Sequence, Set, Tuple, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, List, Sequence, Set, Tuple, TypeVar
 
 from autogen_core import TopicId
 from autogen_core._agent_id import AgentId
 from autogen_core._runtime_impl_helpers import SubscriptionManager
 
+from . import _constants
 from ._constants import GRPC_IMPORT_ERROR_STR
+from ._placement import ConsistentHashRing, WorkerLoad
 from ._utils import subscription_from_proto, subscription_to_proto
 
 try:
@@ -95,21 +98,39 @@ async def _handle_message(self, message: ReceiveT) -> None:
 
 
 class GrpcWorkerAgentRuntimeHostServicer(agent_worker_pb2_grpc.AgentRpcServicer):
-    """A gRPC servicer that hosts message delivery service for agents."""
-
-    def __init__(self) -> None:
+    """A gRPC servicer that hosts message delivery service for agents.
+
+    Args:
+        shared_agent_types (bool, optional): Whether several workers may register the same agent type.
+            RPC requests and events for an agent of a shared type are routed to one of the workers that
+            registered the type by consistent hashing on the agent key, so a key is always handled by the
+            same worker while the set of workers is unchanged. When a worker joins or leaves, only the keys
+            of the ring segments it gains or loses move to another worker; agent state is not migrated.
+            Defaults to False, in which case registering an agent type that is already registered fails.
+        virtual_nodes (int, optional): Number of points each worker gets on the consistent hash ring of
+            an agent type. More points spread keys more evenly. Defaults to 64.
+    """
+
+    def __init__(self, *, shared_agent_types: bool = False, virtual_nodes: int = 64) -> None:
         self._data_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message]
         ] = {}
         self._control_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.ControlMessage, agent_worker_pb2.ControlMessage]
         ] = {}
+        self._shared_agent_types = shared_agent_types
+        self._virtual_nodes = virtual_nodes
         self._agent_type_to_client_id_lock = asyncio.Lock()
-        self._agent_type_to_client_id: Dict[str, ClientConnectionId] = {}
+        self._agent_type_to_client_ids: Dict[str, ConsistentHashRing] = {}
+        self._worker_load: Dict[ClientConnectionId, WorkerLoad] = {}
         self._pending_responses: Dict[ClientConnectionId, Dict[str, Future[Any]]] = {}
         self._background_tasks: Set[Task[Any]] = set()
         self._subscription_manager = SubscriptionManager()
         self._client_id_to_subscription_id_mapping: Dict[ClientConnectionId, set[str]] = {}
+        # The id each client used for a subscription, mapped to the id of the copy kept by the subscription manager.
+        self._client_id_to_subscription_aliases: Dict[ClientConnectionId, Dict[str, str]] = {}
+        # Number of clients that hold each subscription in the subscription manager.
+        self._subscription_refcounts: Dict[str, int] = {}
 
     async def OpenChannel(  # type: ignore
         self,
@@ -162,14 +183,46 @@ async def handle_callback(message: agent_worker_pb2.ControlMessage) -> None:
             # Clean up the client connection.
             del self._control_connections[client_id]
 
+    @property
+    def worker_load(self) -> Dict[ClientConnectionId, WorkerLoad]:
+        """The load of each connected worker, keyed by client id."""
+        return {
+            client_id: WorkerLoad(
+                agent_types=set(load.agent_types),
+                pending_requests=len(self._pending_responses.get(client_id, {})),
+                delivered_requests=load.delivered_requests,
+                delivered_events=load.delivered_events,
+            )
+            for client_id, load in self._worker_load.items()
+        }
+
+    def _get_client_id(self, agent_id: AgentId) -> ClientConnectionId | None:
+        """Get the id of the client that hosts the agent, if any."""
+        client_ids = self._agent_type_to_client_ids.get(agent_id.type)
+        if client_ids is None:
+            return None
+        return client_ids.get(agent_id.key)
+
     async def _on_client_disconnect(self, client_id: ClientConnectionId) -> None:
         async with self._agent_type_to_client_id_lock:
-            agent_types = [agent_type for agent_type, id_ in self._agent_type_to_client_id.items() if id_ == client_id]
+            self._worker_load.pop(client_id, None)
+            agent_types = [
+                agent_type
+                for agent_type, client_ids in self._agent_type_to_client_ids.items()
+                if client_id in client_ids
+            ]
             for agent_type in agent_types:
-                logger.info(f"Removing agent type {agent_type} from agent type to client id mapping")
-                del self._agent_type_to_client_id[agent_type]
-            for sub_id in self._client_id_to_subscription_id_mapping.get(client_id, set()):
-                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {id}")
+                logger.info(f"Removing client {client_id} from the clients of agent type {agent_type}")
+                client_ids = self._agent_type_to_client_ids[agent_type]
+                client_ids.remove(client_id)
+                if not client_ids:
+                    del self._agent_type_to_client_ids[agent_type]
+            self._client_id_to_subscription_aliases.pop(client_id, None)
+            for sub_id in self._client_id_to_subscription_id_mapping.pop(client_id, set()):
+                if not self._release_subscription(sub_id):
+                    # Another worker hosting the same agent type still relies on the subscription.
+                    continue
+                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {sub_id}")
                 try:
                     await self._subscription_manager.remove_subscription(sub_id)
                 # Catch and ignore if the subscription does not exist.
@@ -213,7 +266,7 @@ async def _receive_control_message(
         destination = message.destination
         if destination.startswith("agentid="):
             agent_id = AgentId.from_str(destination[len("agentid=") :])
-            target_client_id = self._agent_type_to_client_id.get(agent_id.type)
+            target_client_id = self._get_client_id(agent_id)
             if target_client_id is None:
                 logger.error(f"Agent client id not found for agent type {agent_id.type}.")
                 return
@@ -232,7 +285,7 @@ async def _receive_control_message(
     async def _process_request(self, request: agent_worker_pb2.RpcRequest, client_id: ClientConnectionId) -> None:
         # Deliver the message to a client given the target agent type.
         async with self._agent_type_to_client_id_lock:
-            target_client_id = self._agent_type_to_client_id.get(request.target.type)
+            target_client_id = self._get_client_id(AgentId(request.target.type, request.target.key))
         if target_client_id is None:
             logger.error(f"Agent {request.target.type} not found, failed to deliver message.")
             return
@@ -241,6 +294,8 @@ async def _process_request(self, request: agent_worker_pb2.RpcRequest, client_id
             logger.error(f"Client {target_client_id} not found, failed to deliver message.")
             return
         await target_send_queue.send(agent_worker_pb2.Message(request=request))
+        if (load := self._worker_load.get(target_client_id)) is not None:
+            load.delivered_requests += 1
 
         # Create a future to wait for the response from the target.
         future = asyncio.get_event_loop().create_future()
@@ -273,16 +328,27 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         recipients = await self._subscription_manager.get_subscribed_recipients(topic_id)
         # Get the client ids of the recipients.
         async with self._agent_type_to_client_id_lock:
-            client_ids: Set[ClientConnectionId] = set()
+            client_recipients: Dict[ClientConnectionId, List[AgentId]] = {}
             for recipient in recipients:
-                client_id = self._agent_type_to_client_id.get(recipient.type)
+                client_id = self._get_client_id(recipient)
                 if client_id is not None:
-                    client_ids.add(client_id)
+                    client_recipients.setdefault(client_id, []).append(recipient)
                 else:
                     logger.error(f"Agent {recipient.type} and its client not found for topic {topic_id}.")
         # Deliver the event to clients.
-        for client_id in client_ids:
-            await self._data_connections[client_id].send(agent_worker_pb2.Message(cloudEvent=event))
+        for client_id, client_recipient_ids in client_recipients.items():
+            client_event = event
+            if self._shared_agent_types:
+                # A worker may host agent types whose keys are placed on other workers, so tell it
+                # which of the recipients it is responsible for.
+                client_event = cloudevent_pb2.CloudEvent()
+                client_event.CopyFrom(event)
+                client_event.attributes[_constants.AGENT_RECIPIENTS_ATTR].ce_string = json.dumps(
+                    [str(recipient) for recipient in client_recipient_ids]
+                )
+            await self._data_connections[client_id].send(agent_worker_pb2.Message(cloudEvent=client_event))
+            if (load := self._worker_load.get(client_id)) is not None:
+                load.delivered_events += 1
 
     async def RegisterAgent(  # type: ignore
         self,
@@ -294,14 +360,18 @@ async def RegisterAgent(  # type: ignore
         client_id = await get_client_id_or_abort(context)
 
         async with self._agent_type_to_client_id_lock:
-            if request.type in self._agent_type_to_client_id:
-                existing_client_id = self._agent_type_to_client_id[request.type]
+            client_ids = self._agent_type_to_client_ids.get(request.type)
+            if client_ids is not None and (client_id in client_ids or not self._shared_agent_types):
+                existing_client_ids = ", ".join(sorted(client_ids.nodes))
                 await context.abort(
                     grpc.StatusCode.INVALID_ARGUMENT,
-                    f"Agent type {request.type} already registered with client {existing_client_id}.",
+                    f"Agent type {request.type} already registered with client {existing_client_ids}.",
                 )
             else:
-                self._agent_type_to_client_id[request.type] = client_id
+                if client_ids is None:
+                    client_ids = self._agent_type_to_client_ids[request.type] = ConsistentHashRing(self._virtual_nodes)
+                client_ids.add(client_id)
+                self._worker_load.setdefault(client_id, WorkerLoad()).agent_types.add(request.type)
 
         return agent_worker_pb2.RegisterAgentTypeResponse()
 
@@ -315,12 +385,22 @@ async def AddSubscription(  # type: ignore
         client_id = await get_client_id_or_abort(context)
 
         subscription = subscription_from_proto(request.subscription)
+        subscription_ids = self._client_id_to_subscription_id_mapping.setdefault(client_id, set())
+        aliases = self._client_id_to_subscription_aliases.setdefault(client_id, {})
         try:
             await self._subscription_manager.add_subscription(subscription)
-            subscription_ids = self._client_id_to_subscription_id_mapping.setdefault(client_id, set())
-            subscription_ids.add(subscription.id)
+            sub_id = subscription.id
         except ValueError as e:
-            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            existing = next((sub for sub in self._subscription_manager.subscriptions if sub == subscription), None)
+            if not self._shared_agent_types or existing is None or existing.id in subscription_ids:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+                raise AssertionError("Unreachable: abort raises.") from e
+            # Workers sharing an agent type add the same subscriptions; keep a single copy that
+            # is removed once the last of these workers removes it or disconnects.
+            sub_id = existing.id
+        subscription_ids.add(sub_id)
+        aliases[subscription.id] = sub_id
+        self._subscription_refcounts[sub_id] = self._subscription_refcounts.get(sub_id, 0) + 1
         return agent_worker_pb2.AddSubscriptionResponse()
 
     async def RemoveSubscription(  # type: ignore
@@ -330,10 +410,34 @@ async def RemoveSubscription(  # type: ignore
             agent_worker_pb2.RemoveSubscriptionRequest, agent_worker_pb2.RemoveSubscriptionResponse
         ],
     ) -> agent_worker_pb2.RemoveSubscriptionResponse:
-        _client_id = await get_client_id_or_abort(context)
-        await self._subscription_manager.remove_subscription(request.id)
+        client_id = await get_client_id_or_abort(context)
+        subscription_ids = self._client_id_to_subscription_id_mapping.get(client_id, set())
+        sub_id = self._client_id_to_subscription_aliases.get(client_id, {}).pop(request.id, request.id)
+        if sub_id in subscription_ids:
+            subscription_ids.discard(sub_id)
+            if not self._release_subscription(sub_id):
+                # Other workers sharing the agent type still hold the subscription.
+                return agent_worker_pb2.RemoveSubscriptionResponse()
+        else:
+            # The subscription was added by another client; remove it for every client.
+            self._subscription_refcounts.pop(sub_id, None)
+            for client_subscription_ids in self._client_id_to_subscription_id_mapping.values():
+                client_subscription_ids.discard(sub_id)
+        try:
+            await self._subscription_manager.remove_subscription(sub_id)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
         return agent_worker_pb2.RemoveSubscriptionResponse()
 
+    def _release_subscription(self, sub_id: str) -> bool:
+        """Drop one client's reference to a subscription. Returns True if no client holds it any more."""
+        count = self._subscription_refcounts.get(sub_id, 0) - 1
+        if count > 0:
+            self._subscription_refcounts[sub_id] = count
+            return False
+        self._subscription_refcounts.pop(sub_id, None)
+        return True
+
     async def GetSubscriptions(  # type: ignore
         self,
         request: agent_worker_pb2.GetSubscriptionsRequest,
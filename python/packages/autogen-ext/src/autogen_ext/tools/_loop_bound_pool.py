@@ -0,0 +1,96 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, Generic, Hashable, Optional, Tuple, Type, TypeVar, cast
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+EntryT = TypeVar("EntryT")
+PoolT = TypeVar("PoolT", bound="LoopBoundPool[Any, Any]")
+
+
+class LoopBoundPool(ABC, Generic[KeyT, EntryT]):
+    """A pool of entries bound to the event loop that opened them; each event loop gets its own entries.
+
+    The entries of an event loop are closed by :meth:`close`, or when the event loop shuts down: the
+    pool keeps a task on every event loop it has entries on, and closes the entries when that task is
+    cancelled, as :func:`asyncio.run` does with the tasks still pending when its coroutine returns.
+    """
+
+    _defaults: ClassVar[Dict[type, "LoopBoundPool[Any, Any]"]] = {}
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[int, KeyT], Tuple[asyncio.AbstractEventLoop, EntryT]] = {}
+        self._watchers: Dict[int, asyncio.Task[None]] = {}
+
+    @classmethod
+    def get_default(cls: Type[PoolT]) -> PoolT:
+        """The pool shared by the whole process."""
+        default = LoopBoundPool._defaults.get(cls)
+        if default is None:
+            default = LoopBoundPool._defaults[cls] = cls()
+        return cast(PoolT, default)
+
+    @abstractmethod
+    def _is_open(self, entry: EntryT) -> bool: ...
+
+    def _is_stale(self, entry: EntryT) -> bool:
+        return not self._is_open(entry)
+
+    @abstractmethod
+    async def _close_entry(self, entry: EntryT) -> None: ...
+
+    @property
+    def size(self) -> int:
+        """The number of open entries."""
+        return sum(1 for _, entry in self._entries.values() if self._is_open(entry))
+
+    def _remove_stale(self) -> None:
+        for key, (loop, entry) in list(self._entries.items()):
+            if loop.is_closed() or self._is_stale(entry):
+                del self._entries[key]
+        for loop_id, watcher in list(self._watchers.items()):
+            if watcher.done() or watcher.get_loop().is_closed():
+                del self._watchers[loop_id]
+
+    def _get(self, key: KeyT) -> Optional[EntryT]:
+        loop = asyncio.get_running_loop()
+        pair = self._entries.get((id(loop), key))
+        if pair is None or pair[0] is not loop:
+            return None
+        return pair[1]
+
+    def _add(self, key: KeyT, entry: EntryT) -> None:
+        loop = asyncio.get_running_loop()
+        self._entries[(id(loop), key)] = (loop, entry)
+        watcher = self._watchers.get(id(loop))
+        if watcher is None or watcher.get_loop() is not loop or watcher.done():
+            self._watchers[id(loop)] = loop.create_task(self._close_on_shutdown())
+
+    def _discard(self, key: KeyT, entry: EntryT) -> None:
+        loop_key = (id(asyncio.get_running_loop()), key)
+        pair = self._entries.get(loop_key)
+        if pair is not None and pair[1] is entry:
+            del self._entries[loop_key]
+
+    async def _close_on_shutdown(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.create_future()
+        except asyncio.CancelledError:
+            # A watcher that close() has replaced or cancelled leaves the entries to it.
+            if self._watchers.get(id(loop)) is asyncio.current_task():
+                del self._watchers[id(loop)]
+                await self._close_loop_entries(loop)
+            raise
+
+    async def _close_loop_entries(self, loop: asyncio.AbstractEventLoop) -> None:
+        closing = [entry for entry_loop, entry in self._entries.values() if entry_loop is loop]
+        self._entries = {key: pair for key, pair in self._entries.items() if pair[0] is not loop}
+        await asyncio.gather(*(self._close_entry(entry) for entry in closing))
+
+    async def close(self) -> None:
+        """Close the entries of the pool that belong to the running event loop."""
+        loop = asyncio.get_running_loop()
+        watcher = self._watchers.pop(id(loop), None)
+        if watcher is not None:
+            watcher.cancel()
+        await self._close_loop_entries(loop)
@@ -0,0 +1,84 @@
+from typing import Optional, Tuple
+
+import httpx
+
+from .._loop_bound_pool import LoopBoundPool
+
+_ClientKey = Tuple[str, Optional[int], Optional[int], Optional[float], bool]
+
+
+class HttpClientPool(LoopBoundPool[_ClientKey, httpx.AsyncClient]):
+    """A pool of shared :class:`httpx.AsyncClient` instances, one per base URL and connection settings.
+
+    Tools that call the same server share one client, and so its pool of connections, instead of
+    opening a new connection for every call. Connections are kept alive between calls, which
+    saves the DNS lookup and the TCP and TLS handshakes, and with HTTP/2 concurrent calls are
+    multiplexed over a single connection.
+
+    Clients are bound to the event loop that created them; each event loop gets its own clients,
+    which are closed by :meth:`close` or when the event loop shuts down.
+    :class:`~autogen_ext.tools.http.HttpTool` uses the pool returned by :meth:`get_default`.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_ext.tools.http import HttpClientPool
+
+
+            async def main() -> None:
+                pool = HttpClientPool.get_default()
+                client = pool.get_client("https://httpbin.org", max_connections=10)
+                print((await client.get("https://httpbin.org/get")).status_code)
+                # The connection is reused.
+                print((await client.get("https://httpbin.org/uuid")).status_code)
+                await pool.close()
+
+
+            asyncio.run(main())
+    """
+
+    def _is_open(self, entry: httpx.AsyncClient) -> bool:
+        return not entry.is_closed
+
+    async def _close_entry(self, entry: httpx.AsyncClient) -> None:
+        await entry.aclose()
+
+    def get_client(
+        self,
+        base_url: str,
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+    ) -> httpx.AsyncClient:
+        """Get the shared client for the base URL and connection settings, creating one if needed.
+
+        Args:
+            base_url (str): The scheme, host and port of the server, e.g. "https://example.com:443".
+            max_connections (Optional[int]): The maximum number of concurrent connections, or None
+                for no limit. Defaults to 100.
+            max_keepalive_connections (Optional[int]): The maximum number of idle connections kept
+                alive, or None for no limit. Defaults to 20.
+            keepalive_expiry (Optional[float]): Seconds after which an idle connection is closed, or
+                None to keep idle connections open. Defaults to 5.
+            http2 (bool): Whether to use HTTP/2 when the server supports it. Requires the
+                :code:`h2` package, installed with :code:`pip install "httpx[http2]"`.
+                Defaults to False.
+        """
+        self._remove_stale()
+        key = (base_url, max_connections, max_keepalive_connections, keepalive_expiry, http2)
+        client = self._get(key)
+        if client is not None:
+            return client
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        client = httpx.AsyncClient(limits=limits, http2=http2)
+        self._add(key, client)
+        return client
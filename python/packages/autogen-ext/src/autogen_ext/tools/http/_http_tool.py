@@ -1,5 +1,8 @@
 import re
-from typing import Any, Literal, Optional, Type
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal, Optional, Tuple, Type
 
 import httpx
 from autogen_core import CancellationToken, Component
@@ -8,6 +11,8 @@
 from pydantic import BaseModel, Field
 from typing_extensions import Self
 
+from ._client_pool import HttpClientPool
+
 
 class HttpToolConfig(BaseModel):
     name: str
@@ -53,6 +58,55 @@ class HttpToolConfig(BaseModel):
     """
     The type of response to return from the tool.
     """
+    max_connections: Optional[int] = 100
+    """
+    The maximum number of concurrent connections to the server, or None for no limit.
+    """
+    max_keepalive_connections: Optional[int] = 20
+    """
+    The maximum number of idle connections kept alive, or None for no limit.
+    """
+    keepalive_expiry: Optional[float] = 5.0
+    """
+    Seconds after which an idle connection is closed, or None to keep idle connections open.
+    """
+    http2: bool = False
+    """
+    Whether to use HTTP/2 when the server supports it. Requires the h2 package.
+    """
+    cache_responses: bool = False
+    """
+    Whether to cache the responses of GET requests for as long as their Cache-Control or Expires headers allow.
+    """
+    response_cache_size: int = Field(default=128, ge=1)
+    """
+    The maximum number of responses cached when cache_responses is enabled.
+    """
+
+
+def _cache_lifetime(response: httpx.Response) -> Optional[float]:
+    """The number of seconds the response may be reused, or None if it must not be cached."""
+    if response.status_code != 200 or response.headers.get("vary", "").strip() == "*":
+        return None
+    directives: dict[str, Optional[str]] = {}
+    for directive in response.headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    if "no-store" in directives or "no-cache" in directives:
+        return None
+    try:
+        age = float(response.headers.get("age", 0))
+        if "max-age" in directives:
+            return float(directives["max-age"] or 0) - age
+        if "expires" in response.headers:
+            expires = parsedate_to_datetime(response.headers["expires"])
+            date = parsedate_to_datetime(response.headers["date"]) if "date" in response.headers else None
+            return (expires - date).total_seconds() - age if date else expires.timestamp() - time.time()
+    except (TypeError, ValueError):
+        # Malformed headers are treated as "do not cache".
+        return None
+    return None
 
 
 class HttpTool(BaseTool[BaseModel, Any], Component[HttpToolConfig]):
@@ -73,6 +127,23 @@ class HttpTool(BaseTool[BaseModel, Any], Component[HttpToolConfig]):
             Path parameters must also be included in the schema and must be strings.
         return_type (Literal["text", "json"], optional): The type of response to return from the tool.
             Defaults to "text".
+        max_connections (int, optional): The maximum number of concurrent connections to the server,
+            or None for no limit. Defaults to 100.
+        max_keepalive_connections (int, optional): The maximum number of idle connections kept alive,
+            or None for no limit. Defaults to 20.
+        keepalive_expiry (float, optional): Seconds after which an idle connection is closed,
+            or None to keep idle connections open. Defaults to 5.
+        http2 (bool, optional): Whether to use HTTP/2 when the server supports it. Requires the
+            :code:`h2` package, installed with :code:`pip install "httpx[http2]"`. Defaults to False.
+        cache_responses (bool, optional): Whether to cache the responses of GET requests, keyed by URL,
+            for as long as their :code:`Cache-Control: max-age` or :code:`Expires` headers allow.
+            Responses with :code:`no-store` or :code:`no-cache`, or without an expiration, are not cached.
+            Defaults to False.
+        response_cache_size (int, optional): The maximum number of cached responses. Defaults to 128.
+
+    Requests are sent with a client shared by all the tools that call the same server with the same
+    connection settings, from :meth:`HttpClientPool.get_default() <autogen_ext.tools.http.HttpClientPool.get_default>`,
+    so connections are kept alive and reused between calls.
 
     .. note::
         This tool requires the :code:`http-tool` extra for the :code:`autogen-ext` package.
@@ -148,6 +219,12 @@ def __init__(
         scheme: Literal["http", "https"] = "http",
         method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"] = "POST",
         return_type: Literal["text", "json"] = "text",
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        cache_responses: bool = False,
+        response_cache_size: int = 128,
     ) -> None:
         self.server_params = HttpToolConfig(
             name=name,
@@ -160,7 +237,14 @@ def __init__(
             headers=headers,
             json_schema=json_schema,
             return_type=return_type,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            cache_responses=cache_responses,
+            response_cache_size=response_cache_size,
         )
+        self._response_cache: OrderedDict[str, Tuple[float, httpx.Response]] = OrderedDict()
 
         # Use regex to find all path parameters, we will need those later to template the path
         path_params = {match.group(1) for match in re.finditer(r"{([^}]*)}", path)}
@@ -183,6 +267,24 @@ def _from_config(cls, config: HttpToolConfig) -> Self:
         copied_config = config.model_copy().model_dump()
         return cls(**copied_config)
 
+    async def _cached_get(self, client: httpx.AsyncClient, url: httpx.URL) -> httpx.Response:
+        key = str(url)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            expires_at, response = cached
+            if time.monotonic() < expires_at:
+                self._response_cache.move_to_end(key)
+                return response
+            del self._response_cache[key]
+
+        response = await client.get(url, headers=self.server_params.headers)
+        lifetime = _cache_lifetime(response)
+        if lifetime is not None and lifetime > 0:
+            self._response_cache[key] = (time.monotonic() + lifetime, response)
+            while len(self._response_cache) > self.server_params.response_cache_size:
+                self._response_cache.popitem(last=False)
+        return response
+
     async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> Any:
         """Execute the HTTP tool with the given arguments.
 
@@ -211,18 +313,27 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
             port=self.server_params.port,
             path=path,
         )
-        async with httpx.AsyncClient() as client:
-            match self.server_params.method:
-                case "GET":
+        client = HttpClientPool.get_default().get_client(
+            str(url.copy_with(path="/")),
+            max_connections=self.server_params.max_connections,
+            max_keepalive_connections=self.server_params.max_keepalive_connections,
+            keepalive_expiry=self.server_params.keepalive_expiry,
+            http2=self.server_params.http2,
+        )
+        match self.server_params.method:
+            case "GET":
+                if self.server_params.cache_responses:
+                    response = await self._cached_get(client, url.copy_merge_params(model_dump))
+                else:
                     response = await client.get(url, headers=self.server_params.headers, params=model_dump)
-                case "PUT":
-                    response = await client.put(url, headers=self.server_params.headers, json=model_dump)
-                case "DELETE":
-                    response = await client.delete(url, headers=self.server_params.headers, params=model_dump)
-                case "PATCH":
-                    response = await client.patch(url, headers=self.server_params.headers, json=model_dump)
-                case _:  # Default case POST
-                    response = await client.post(url, headers=self.server_params.headers, json=model_dump)
+            case "PUT":
+                response = await client.put(url, headers=self.server_params.headers, json=model_dump)
+            case "DELETE":
+                response = await client.delete(url, headers=self.server_params.headers, params=model_dump)
+            case "PATCH":
+                response = await client.patch(url, headers=self.server_params.headers, json=model_dump)
+            case _:  # Default case POST
+                response = await client.post(url, headers=self.server_params.headers, json=model_dump)
 
         match self.server_params.return_type:
             case "text":
@@ -2,6 +2,7 @@
 from ._config import McpServerParams, SseServerParams, StdioServerParams, StreamableHttpServerParams
 from ._factory import mcp_server_tools
 from ._session import create_mcp_server_session
+from ._session_pool import McpSessionPool
 from ._sse import SseMcpToolAdapter
 from ._stdio import StdioMcpToolAdapter
 from ._streamable_http import StreamableHttpMcpToolAdapter
@@ -10,6 +11,7 @@
 __all__ = [
     "create_mcp_server_session",
     "McpSessionActor",
+    "McpSessionPool",
     "StdioMcpToolAdapter",
     "StdioServerParams",
     "SseMcpToolAdapter",
@@ -1,8 +1,10 @@
 import asyncio
 import atexit
-from typing import Any, Coroutine, Dict, Mapping, TypedDict
+from typing import Any, Awaitable, Coroutine, Dict, Mapping, Set, TypedDict
 
 from autogen_core import Component, ComponentBase
+from mcp import ClientSession
+from mcp.client.session import MessageHandlerFnT
 from mcp.types import CallToolResult, ListToolsResult
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -10,7 +12,7 @@
 from ._config import McpServerParams
 from ._session import create_mcp_server_session
 
-McpResult = Coroutine[Any, Any, ListToolsResult] | Coroutine[Any, Any, CallToolResult]
+McpResult = Coroutine[Any, Any, ListToolsResult] | Awaitable[CallToolResult]
 McpFuture = asyncio.Future[McpResult]
 
 
@@ -21,9 +23,22 @@ class McpActorArgs(TypedDict):
 
 class McpSessionActorConfig(BaseModel):
     server_params: McpServerParams
+    max_concurrent_calls: int = 8
 
 
 class McpSessionActor(ComponentBase[BaseModel], Component[McpSessionActorConfig]):
+    """Owns an MCP client session and serves the requests made through it.
+
+    Tool calls run concurrently on the session, up to `max_concurrent_calls` at a time; further
+    calls wait for one of them to finish.
+
+    Args:
+        server_params (McpServerParams): Parameters for the MCP server connection.
+        max_concurrent_calls (int, optional): The maximum number of tool calls in flight. Defaults to 8.
+        message_handler (MessageHandlerFnT | None, optional): A handler for the notifications and requests
+            sent by the server. Defaults to None.
+    """
+
     component_type = "mcp_session_actor"
     component_config_schema = McpSessionActorConfig
     component_provider_override = "autogen_ext.tools.mcp.McpSessionActor"
@@ -32,8 +47,19 @@ class McpSessionActor(ComponentBase[BaseModel], Component[McpSessionActorConfig]
 
     # model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def __init__(self, server_params: McpServerParams) -> None:
+    def __init__(
+        self,
+        server_params: McpServerParams,
+        max_concurrent_calls: int = 8,
+        message_handler: MessageHandlerFnT | None = None,
+    ) -> None:
+        if max_concurrent_calls < 1:
+            raise ValueError("max_concurrent_calls must be at least 1.")
         self.server_params: McpServerParams = server_params
+        self._max_concurrent_calls = max_concurrent_calls
+        self._message_handler = message_handler
+        self._call_semaphore = asyncio.Semaphore(max_concurrent_calls)
+        self._call_tasks: Set[asyncio.Task[CallToolResult]] = set()
         self.name = "mcp_session_actor"
         self.description = "MCP session actor"
         self._command_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
@@ -72,16 +98,17 @@ async def call(self, type: str, args: McpActorArgs | None = None) -> McpFuture:
     async def close(self) -> None:
         if not self._active or self._actor_task is None:
             return
+        actor_task = self._actor_task
         self._shutdown_future = asyncio.Future()
         await self._command_queue.put({"type": "shutdown", "future": self._shutdown_future})
         await self._shutdown_future
-        await self._actor_task
+        await actor_task
         self._active = False
 
     async def _run_actor(self) -> None:
         result: McpResult
         try:
-            async with create_mcp_server_session(self.server_params) as session:
+            async with create_mcp_server_session(self.server_params, message_handler=self._message_handler) as session:
                 await session.initialize()
                 while True:
                     cmd = await self._command_queue.get()
@@ -89,17 +116,21 @@ async def _run_actor(self) -> None:
                         cmd["future"].set_result("ok")
                         break
                     elif cmd["type"] == "call_tool":
-                        try:
-                            result = session.call_tool(name=cmd["name"], arguments=cmd["args"])
-                            cmd["future"].set_result(result)
-                        except Exception as e:
-                            cmd["future"].set_exception(e)
+                        # The call runs in a task of its own, so that the actor keeps serving commands.
+                        task = asyncio.create_task(self._call_tool(session, cmd["name"], cmd["args"]))
+                        self._call_tasks.add(task)
+                        task.add_done_callback(self._call_tasks.discard)
+                        cmd["future"].set_result(task)
                     elif cmd["type"] == "list_tools":
                         try:
                             result = session.list_tools()
                             cmd["future"].set_result(result)
                         except Exception as e:
                             cmd["future"].set_exception(e)
+                # Calls still in flight cannot complete once the session is closed.
+                for task in self._call_tasks:
+                    task.cancel()
+                await asyncio.gather(*self._call_tasks, return_exceptions=True)
         except Exception as e:
             if self._shutdown_future and not self._shutdown_future.done():
                 self._shutdown_future.set_exception(e)
@@ -107,6 +138,10 @@ async def _run_actor(self) -> None:
             self._active = False
             self._actor_task = None
 
+    async def _call_tool(self, session: ClientSession, name: str, args: Mapping[str, Any]) -> CallToolResult:
+        async with self._call_semaphore:
+            return await session.call_tool(name=name, arguments=dict(args))
+
     def _sync_shutdown(self) -> None:
         if not self._active or self._actor_task is None:
             return
@@ -131,7 +166,7 @@ def _to_config(self) -> McpSessionActorConfig:
         Returns:
             McpSessionConfig: The configuration of the adapter.
         """
-        return McpSessionActorConfig(server_params=self.server_params)
+        return McpSessionActorConfig(server_params=self.server_params, max_concurrent_calls=self._max_concurrent_calls)
 
     @classmethod
     def _from_config(cls, config: McpSessionActorConfig) -> Self:
@@ -144,4 +179,4 @@ def _from_config(cls, config: McpSessionActorConfig) -> Self:
         Returns:
             McpSessionActor: An instance of SseMcpToolAdapter.
         """
-        return cls(server_params=config.server_params)
+        return cls(server_params=config.server_params, max_concurrent_calls=config.max_concurrent_calls)
@@ -14,6 +14,7 @@
 
 from ._config import McpServerParams
 from ._session import create_mcp_server_session
+from ._session_pool import McpSessionPool
 
 TServerParams = TypeVar("TServerParams", bound=McpServerParams)
 
@@ -25,6 +26,9 @@ class McpToolAdapter(BaseTool[BaseModel, Any], ABC, Generic[TServerParams]):
     Args:
         server_params (TServerParams): Parameters for the MCP server connection.
         tool (Tool): The MCP tool to wrap.
+        session (ClientSession | None): The session to call the tool with. If None, the session for the
+            server parameters in the process-wide :class:`McpSessionPool` is used, so the server is started
+            and the session initialized once and reused by later calls.
     """
 
     component_type = "tool"
@@ -70,8 +74,9 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
             session = self._session
             return await self._run(args=kwargs, cancellation_token=cancellation_token, session=session)
 
-        async with create_mcp_server_session(self._server_params) as session:
-            await session.initialize()
+        async with McpSessionPool.get_default().session(
+            self._server_params, factory=create_mcp_server_session
+        ) as session:
             return await self._run(args=kwargs, cancellation_token=cancellation_token, session=session)
 
     def _normalize_payload_to_content_list(
@@ -3,6 +3,7 @@
 from typing import AsyncGenerator
 
 from mcp import ClientSession
+from mcp.client.session import MessageHandlerFnT
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
@@ -13,13 +14,17 @@
 @asynccontextmanager
 async def create_mcp_server_session(
     server_params: McpServerParams,
+    message_handler: MessageHandlerFnT | None = None,
 ) -> AsyncGenerator[ClientSession, None]:
-    """Create an MCP client session for the given server parameters."""
+    """Create an MCP client session for the given server parameters.
+
+    The `message_handler`, if given, receives the notifications and requests sent by the server."""
     if isinstance(server_params, StdioServerParams):
         async with stdio_client(server_params) as (read, write):
             async with ClientSession(
                 read_stream=read,
                 write_stream=write,
+                message_handler=message_handler,
                 read_timeout_seconds=timedelta(seconds=server_params.read_timeout_seconds),
             ) as session:
                 yield session
@@ -28,6 +33,7 @@ async def create_mcp_server_session(
             async with ClientSession(
                 read_stream=read,
                 write_stream=write,
+                message_handler=message_handler,
                 read_timeout_seconds=timedelta(seconds=server_params.sse_read_timeout),
             ) as session:
                 yield session
@@ -41,6 +47,7 @@ async def create_mcp_server_session(
             async with ClientSession(
                 read_stream=read,
                 write_stream=write,
+                message_handler=message_handler,
                 read_timeout_seconds=server_params.sse_read_timeout,
             ) as session:
                 yield session
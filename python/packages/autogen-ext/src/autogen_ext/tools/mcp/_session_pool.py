@@ -0,0 +1,205 @@
+import asyncio
+import logging
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import AsyncGenerator, Callable, Optional, Set, Tuple
+
+from mcp import ClientSession
+from pydantic import TypeAdapter
+
+from .._loop_bound_pool import LoopBoundPool
+from ._config import McpServerParams
+from ._session import create_mcp_server_session
+
+SessionFactory = Callable[[McpServerParams], AbstractAsyncContextManager[ClientSession]]
+_SessionKey = Tuple[SessionFactory, str]
+
+_server_params_adapter: TypeAdapter[McpServerParams] = TypeAdapter(McpServerParams)
+
+
+class _PooledSession:
+    """A session kept open by a task of its own, since the transports of the MCP client must be
+    entered and exited in the same task."""
+
+    def __init__(self, server_params: McpServerParams, factory: SessionFactory) -> None:
+        self._server_params = server_params
+        self._factory = factory
+        self.loop = asyncio.get_running_loop()
+        self.users = 0
+        self.last_used = self.loop.time()
+        self.idle_handle: Optional[asyncio.TimerHandle] = None
+        self._ready: asyncio.Future[ClientSession] = self.loop.create_future()
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._hold())
+
+    @property
+    def alive(self) -> bool:
+        return not self._task.done() and not self._closing.is_set()
+
+    async def _hold(self) -> None:
+        try:
+            async with self._factory(self._server_params) as session:
+                await session.initialize()
+                self._ready.set_result(session)
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            self._ready.cancel()
+            raise
+        except Exception as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+            else:
+                logging.warning(f"MCP session closed with an error: {e}")
+
+    async def wait_ready(self) -> ClientSession:
+        return await asyncio.shield(self._ready)
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self.idle_handle is not None:
+            self.idle_handle.cancel()
+            self.idle_handle = None
+        try:
+            await self._task
+        except BaseException:
+            pass
+        if self._ready.done() and not self._ready.cancelled():
+            # Retrieve the exception, if any, so that it is not reported as never retrieved.
+            self._ready.exception()
+
+
+class McpSessionPool(LoopBoundPool[_SessionKey, _PooledSession]):
+    """A pool of initialized MCP client sessions, keyed by server parameters.
+
+    Tools that connect to the same server share one session instead of starting a server process,
+    or opening a connection, and initializing a session for every call. MCP sessions handle
+    concurrent requests, so a session is shared by all the calls in flight. A session that has
+    not been used for `health_check_interval` seconds is pinged before it is handed out, and
+    replaced if the ping fails. A session that has not been used for `idle_timeout` seconds is
+    closed.
+
+    Sessions are bound to the event loop that opened them; each event loop gets its own sessions,
+    which are closed by :meth:`close` or when the event loop shuts down.
+    :class:`~autogen_ext.tools.mcp.McpToolAdapter` uses the pool returned by :meth:`get_default`
+    when it is not given a session.
+
+    Args:
+        idle_timeout (float): Seconds after which an unused session is closed. Defaults to 60.
+        health_check_interval (float): Seconds of inactivity after which a session is pinged
+            before it is reused. Defaults to 30.
+        health_check_timeout (float): Seconds to wait for the response to a ping. Defaults to 5.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_ext.tools.mcp import McpSessionPool, StdioServerParams
+
+
+            async def main() -> None:
+                pool = McpSessionPool.get_default()
+                params = StdioServerParams(command="uvx", args=["mcp-server-fetch"])
+                async with pool.session(params) as session:
+                    print(await session.list_tools())
+                # The server process is still running, and the next session is served immediately.
+                async with pool.session(params) as session:
+                    print(await session.call_tool("fetch", {"url": "https://github.com/"}))
+                await pool.close()
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self, *, idle_timeout: float = 60, health_check_interval: float = 30, health_check_timeout: float = 5
+    ) -> None:
+        super().__init__()
+        if idle_timeout <= 0:
+            raise ValueError("idle_timeout must be greater than 0.")
+        self._idle_timeout = idle_timeout
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._closing_tasks: Set[asyncio.Task[None]] = set()
+
+    def _is_open(self, entry: _PooledSession) -> bool:
+        return entry.alive
+
+    def _is_stale(self, entry: _PooledSession) -> bool:
+        return entry.users == 0 and not entry.alive
+
+    async def _close_entry(self, entry: _PooledSession) -> None:
+        await entry.close()
+
+    def _key(self, server_params: McpServerParams, factory: SessionFactory) -> _SessionKey:
+        return factory, _server_params_adapter.dump_json(server_params).decode()
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        if not pooled.alive:
+            return False
+        if pooled.users > 0 or pooled.loop.time() - pooled.last_used < self._health_check_interval:
+            return True
+        try:
+            session = await pooled.wait_ready()
+            await asyncio.wait_for(session.send_ping(), timeout=self._health_check_timeout)
+        except Exception as e:
+            logging.warning(f"Replacing MCP session that failed a health check: {e}")
+            return False
+        return True
+
+    def _release(self, key: _SessionKey, pooled: _PooledSession) -> None:
+        pooled.users -= 1
+        pooled.last_used = pooled.loop.time()
+        if pooled.users > 0:
+            return
+        if not pooled.alive:
+            self._discard(key, pooled)
+            return
+
+        def close_if_idle() -> None:
+            pooled.idle_handle = None
+            if pooled.users == 0:
+                self._discard(key, pooled)
+                task = asyncio.create_task(pooled.close())
+                self._closing_tasks.add(task)
+                task.add_done_callback(self._closing_tasks.discard)
+
+        pooled.idle_handle = pooled.loop.call_later(self._idle_timeout, close_if_idle)
+
+    @asynccontextmanager
+    async def session(
+        self, server_params: McpServerParams, *, factory: SessionFactory = create_mcp_server_session
+    ) -> AsyncGenerator[ClientSession, None]:
+        """Lease the initialized session for the server parameters, opening one if needed.
+
+        Args:
+            server_params (McpServerParams): The parameters of the server.
+            factory (SessionFactory, optional): The function that opens a session. Defaults to
+                :func:`~autogen_ext.tools.mcp.create_mcp_server_session`.
+        """
+        self._remove_stale()
+        key = self._key(server_params, factory)
+        pooled = self._get(key)
+        if pooled is not None and not await self._is_healthy(pooled):
+            self._discard(key, pooled)
+            if pooled.users == 0:
+                await pooled.close()
+            pooled = None
+        if pooled is None:
+            pooled = self._get(key)
+        if pooled is None:
+            pooled = _PooledSession(server_params, factory)
+            self._add(key, pooled)
+        pooled.users += 1
+        if pooled.idle_handle is not None:
+            pooled.idle_handle.cancel()
+            pooled.idle_handle = None
+        try:
+            session = await pooled.wait_ready()
+        except BaseException:
+            self._release(key, pooled)
+            raise
+        try:
+            yield session
+        finally:
+            self._release(key, pooled)
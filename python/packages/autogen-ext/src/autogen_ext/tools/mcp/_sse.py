@@ -38,8 +38,8 @@ class SseMcpToolAdapter(
             including URL, headers, and timeouts.
         tool (Tool): The MCP tool to wrap.
         session (ClientSession, optional): The MCP client session to use. If not provided,
-            it will create a new session. This is useful for testing or when you want to
-            manage the session lifecycle yourself.
+            the session for the server parameters in the process-wide :class:`McpSessionPool`
+            is used. This is useful for testing or when you want to manage the session lifecycle yourself.
 
     Examples:
         Use a remote translation service that implements MCP over SSE to create tools
@@ -38,8 +38,8 @@ class StdioMcpToolAdapter(
             including command to run and its arguments
         tool (Tool): The MCP tool to wrap
         session (ClientSession, optional): The MCP client session to use. If not provided,
-            a new session will be created. This is useful for testing or when you want to
-            manage the session lifecycle yourself.
+            the session for the server parameters in the process-wide :class:`McpSessionPool`
+            is used. This is useful for testing or when you want to manage the session lifecycle yourself.
 
     See :func:`~autogen_ext.tools.mcp.mcp_server_tools` for examples.
     """
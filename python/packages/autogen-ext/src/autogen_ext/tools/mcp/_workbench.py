@@ -1,7 +1,9 @@
 import asyncio
 import builtins
+import time
 import warnings
-from typing import Any, List, Literal, Mapping
+import weakref
+from typing import Any, List, Literal, Mapping, Optional
 
 from autogen_core import CancellationToken, Component, Image, trace_tool_span
 from autogen_core.tools import (
@@ -12,7 +14,19 @@
     ToolSchema,
     Workbench,
 )
-from mcp.types import CallToolResult, EmbeddedResource, ImageContent, ListToolsResult, TextContent
+from mcp.client.session import MessageHandlerFnT
+from mcp.shared.session import RequestResponder
+from mcp.types import (
+    CallToolResult,
+    ClientResult,
+    EmbeddedResource,
+    ImageContent,
+    ListToolsResult,
+    ServerNotification,
+    ServerRequest,
+    TextContent,
+    ToolListChangedNotification,
+)
 from pydantic import BaseModel
 from typing_extensions import Self
 
@@ -22,6 +36,7 @@
 
 class McpWorkbenchConfig(BaseModel):
     server_params: McpServerParams
+    tool_cache_ttl: Optional[float] = 60
 
 
 class McpWorkbenchState(BaseModel):
@@ -36,6 +51,10 @@ class McpWorkbench(Workbench, Component[McpWorkbenchConfig]):
     Args:
         server_params (McpServerParams): The parameters to connect to the MCP server.
             This can be either a :class:`StdioServerParams` or :class:`SseServerParams`.
+        tool_cache_ttl (Optional[float]): Seconds for which the result of :meth:`list_tools` is cached.
+            The cache is also cleared when the server sends a ``notifications/tools/list_changed``
+            notification, and can be refreshed with :meth:`refresh_tools`. If None, the listing is cached
+            until one of these happens. If 0, the server is asked on every call. Defaults to 60.
 
     Examples:
 
@@ -149,8 +168,15 @@ async def main() -> None:
     component_provider_override = "autogen_ext.tools.mcp.McpWorkbench"
     component_config_schema = McpWorkbenchConfig
 
-    def __init__(self, server_params: McpServerParams) -> None:
+    def __init__(self, server_params: McpServerParams, tool_cache_ttl: Optional[float] = 60) -> None:
+        if tool_cache_ttl is not None and tool_cache_ttl < 0:
+            raise ValueError("tool_cache_ttl must be greater than or equal to 0.")
         self._server_params = server_params
+        self._tool_cache_ttl = tool_cache_ttl
+        self._tool_cache: List[ToolSchema] | None = None
+        self._tool_cache_time = 0.0
+        # Incremented when the cache is cleared, so that a listing fetched before is not cached.
+        self._tool_cache_generation = 0
         # self._session: ClientSession | None = None
         self._actor: McpSessionActor | None = None
         self._actor_loop: asyncio.AbstractEventLoop | None = None
@@ -161,13 +187,31 @@ def __init__(self, server_params: McpServerParams) -> None:
     def server_params(self) -> McpServerParams:
         return self._server_params
 
+    def _tool_cache_valid(self) -> bool:
+        if self._tool_cache is None or self._tool_cache_ttl == 0:
+            return False
+        return self._tool_cache_ttl is None or time.monotonic() - self._tool_cache_time < self._tool_cache_ttl
+
+    def invalidate_tool_cache(self) -> None:
+        """Clear the cached tool listing, so that the next :meth:`list_tools` asks the server."""
+        self._tool_cache = None
+        self._tool_cache_generation += 1
+
+    async def refresh_tools(self) -> List[ToolSchema]:
+        """List the tools from the server, replacing the cached listing."""
+        self.invalidate_tool_cache()
+        return await self.list_tools()
+
     async def list_tools(self) -> List[ToolSchema]:
+        if self._tool_cache is not None and self._tool_cache_valid():
+            return list(self._tool_cache)
         if not self._actor:
             await self.start()  # fallback to start the actor if not initialized instead of raising an error
             # Why? Because when deserializing the workbench, the actor might not be initialized yet.
             # raise RuntimeError("Actor is not initialized. Call start() first.")
         if self._actor is None:
             raise RuntimeError("Actor is not initialized. Please check the server connection.")
+        generation = self._tool_cache_generation
         result_future = await self._actor.call("list_tools", None)
         list_tool_result = await result_future
         assert isinstance(
@@ -189,7 +233,10 @@ async def list_tools(self) -> List[ToolSchema]:
                 parameters=parameters,
             )
             schema.append(tool_schema)
-        return schema
+        if generation == self._tool_cache_generation:
+            self._tool_cache = schema
+            self._tool_cache_time = time.monotonic()
+        return list(schema)
 
     async def call_tool(
         self,
@@ -261,17 +308,35 @@ async def start(self) -> None:
             return  # Already initialized, no need to start again
 
         if isinstance(self._server_params, (StdioServerParams, SseServerParams, StreamableHttpServerParams)):
-            self._actor = McpSessionActor(self._server_params)
+            self._actor = McpSessionActor(self._server_params, message_handler=self._create_message_handler())
             await self._actor.initialize()
             self._actor_loop = asyncio.get_event_loop()
         else:
             raise ValueError(f"Unsupported server params type: {type(self._server_params)}")
 
+    def _create_message_handler(self) -> MessageHandlerFnT:
+        # The actor outlives the workbench when the workbench is deleted, so it must not keep the workbench alive.
+        workbench_ref = weakref.ref(self)
+
+        async def handle_message(
+            message: RequestResponder[ServerRequest, ClientResult] | ServerNotification | Exception,
+        ) -> None:
+            workbench = workbench_ref()
+            if (
+                workbench is not None
+                and isinstance(message, ServerNotification)
+                and isinstance(message.root, ToolListChangedNotification)
+            ):
+                workbench.invalidate_tool_cache()
+
+        return handle_message
+
     async def stop(self) -> None:
         if self._actor:
             # Close the actor
             await self._actor.close()
             self._actor = None
+            self.invalidate_tool_cache()
         else:
             raise RuntimeError("McpWorkbench is not started. Call start() first.")
 
@@ -285,11 +350,11 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
         pass
 
     def _to_config(self) -> McpWorkbenchConfig:
-        return McpWorkbenchConfig(server_params=self._server_params)
+        return McpWorkbenchConfig(server_params=self._server_params, tool_cache_ttl=self._tool_cache_ttl)
 
     @classmethod
     def _from_config(cls, config: McpWorkbenchConfig) -> Self:
-        return cls(server_params=config.server_params)
+        return cls(server_params=config.server_params, tool_cache_ttl=config.tool_cache_ttl)
 
     def __del__(self) -> None:
         # Ensure the actor is stopped when the workbench is deleted
@@ -24,6 +24,10 @@ def test_diskcache_store_basic() -> None:
         default_value = 99
         assert store.get(key, default_value) == default_value
 
+        store.delete(test_key)
+        assert store.get(test_key) is None
+        store.delete(test_key)
+
 
 def test_diskcache_with_different_instances() -> None:
     from autogen_ext.cache_store.diskcache import DiskCacheStore
@@ -53,3 +57,33 @@ def test_diskcache_with_different_instances() -> None:
         loaded_store_1: DiskCacheStore[int] = DiskCacheStore.load_component(store_1_config)
         assert loaded_store_1.get(test_key) == test_value_1
         loaded_store_1.cache.close()
+
+
+@pytest.mark.asyncio
+async def test_async_diskcache_store_basic() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from autogen_ext.cache_store.diskcache import AsyncDiskCacheStore
+    from diskcache import Cache
+
+    with (
+        tempfile.TemporaryDirectory() as temp_dir,
+        Cache(temp_dir) as cache,
+        ThreadPoolExecutor(max_workers=1) as executor,
+    ):
+        store = AsyncDiskCacheStore[int](cache, executor=executor)
+        test_key = "test_key"
+        test_value = 42
+        await store.set(test_key, test_value)
+        assert await store.get(test_key) == test_value
+
+        key = "non_existent_key"
+        default_value = 99
+        assert await store.get(key, default_value) == default_value
+
+        # Test serialization
+        store_config = store.dump_component()
+        assert store_config.component_type == "cache_store"
+        loaded_store: AsyncDiskCacheStore[int] = AsyncDiskCacheStore.load_component(store_config)
+        assert await loaded_store.get(test_key) == test_value
+        loaded_store.cache.close()
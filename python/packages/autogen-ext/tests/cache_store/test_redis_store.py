@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -28,6 +28,9 @@ def test_redis_store_basic() -> None:
     redis_instance.get.return_value = None
     assert store.get(key, default_value) == default_value
 
+    store.delete(test_key)
+    redis_instance.delete.assert_called_with(test_key)
+
 
 def test_redis_with_different_instances() -> None:
     from autogen_ext.cache_store.redis import RedisStore
@@ -56,3 +59,30 @@ def test_redis_with_different_instances() -> None:
     store_1_config = store_1.dump_component()
     assert store_1_config.component_type == "cache_store"
     assert store_1_config.component_version == 1
+
+
+@pytest.mark.asyncio
+async def test_async_redis_store_basic() -> None:
+    from autogen_ext.cache_store.redis import AsyncRedisStore
+
+    redis_instance = AsyncMock()
+    store = AsyncRedisStore[int](redis_instance)
+    test_key = "test_key"
+    test_value = 42
+    await store.set(test_key, test_value)
+    redis_instance.set.assert_awaited_with(test_key, test_value)
+    redis_instance.get.return_value = test_value
+    assert await store.get(test_key) == test_value
+
+    key = "non_existent_key"
+    default_value = 99
+    redis_instance.get.return_value = None
+    assert await store.get(key, default_value) == default_value
+
+    # test serialization
+    redis_instance.connection_pool.connection_kwargs = {"host": "redis.example.com", "port": 6380, "db": 1}
+    store_config = store.dump_component()
+    assert store_config.component_type == "cache_store"
+    assert store_config.config["host"] == "redis.example.com"
+    loaded_store: AsyncRedisStore[int] = AsyncRedisStore.load_component(store_config)
+    assert loaded_store.cache.connection_pool.connection_kwargs["port"] == 6380
@@ -19,6 +19,7 @@
 from aiofiles import open
 from autogen_core import CancellationToken
 from autogen_core.code_executor import CodeBlock
+from autogen_ext.code_executors._common import CommandLineCodeResult
 from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
 
 HAS_POWERSHELL: bool = platform.system() == "Windows" and (
@@ -445,3 +446,194 @@ async def test_cleanup_temp_files_oserror(caplog: pytest.LogCaptureFixture) -> N
                 # The code file should have been attempted to be deleted and failed
                 assert any("Failed to delete temporary file" in record.message for record in caplog.records)
                 assert any("Mocked OSError" in record.message for record in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_interpreter_pool() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, interpreter_pool_size=1, preload_modules=["json"])
+        await executor.start()
+        cancellation_token = CancellationToken()
+
+        async def run(code: str) -> CommandLineCodeResult:
+            return await executor.execute_code_blocks([CodeBlock(code=code, language="python")], cancellation_token)
+
+        result = await run("import os, sys; x = 1; print(os.getpid(), 'json' in sys.modules)")
+        assert result.exit_code == 0
+        pid, preloaded = result.output.split()
+        assert preloaded == "True"
+
+        # Code blocks run in the same interpreter, but with a fresh namespace.
+        result = await run("import os; print(os.getpid()); print(x)")
+        assert result.exit_code == 1
+        assert result.output.endswith(f"{pid}\n")
+        assert "NameError" in result.output
+
+        # Modules of the working directory are imported again by each code block.
+        for value in [1, 2]:
+            (Path(temp_dir) / "helper.py").write_text(f"value = {value}")
+            result = await run("import helper; print(helper.value)")
+            assert result.exit_code == 0 and result.output == f"{value}\n"
+
+        result = await run("import sys; print('exiting'); sys.exit(3)")
+        assert result.exit_code == 3 and result.output == "exiting\n"
+
+        # A crashed interpreter is replaced.
+        result = await run("import os; os._exit(7)")
+        assert result.exit_code == 7
+        result = await run("import os; print(os.getpid())")
+        assert result.exit_code == 0 and result.output.strip() != pid
+
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_interpreter_pool_recycles_interpreters() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=temp_dir, interpreter_pool_size=1, max_executions_per_interpreter=2
+        )
+        cancellation_token = CancellationToken()
+        code_blocks = [CodeBlock(code="import os; print(os.getpid())", language="python")]
+        pids = [(await executor.execute_code_blocks(code_blocks, cancellation_token)).output for _ in range(4)]
+        assert pids[0] == pids[1] and pids[2] == pids[3] and pids[1] != pids[2]
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_interpreter_pool_timeout_and_cancellation() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(timeout=1, work_dir=temp_dir, interpreter_pool_size=1)
+        await executor.start()
+        code_blocks = [CodeBlock(code="import time; time.sleep(10); print('hello world!')", language="python")]
+        code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+        assert code_result.exit_code == 124 and "Timeout" in code_result.output
+
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, interpreter_pool_size=1)
+        await executor.start()
+        cancellation_token = CancellationToken()
+        code = """import time
+time.sleep(10)
+with open("hello.txt", "w") as f:
+    f.write("hello world!")
+"""
+        task = asyncio.create_task(
+            executor.execute_code_blocks([CodeBlock(code=code, language="python")], cancellation_token)
+        )
+        await asyncio.sleep(1)
+        cancellation_token.cancel()
+        code_result = await task
+        assert code_result.exit_code == 125 and "Cancelled" in code_result.output
+        assert not (Path(temp_dir) / "hello.txt").exists()
+
+        # The pool keeps working with a new interpreter.
+        code_result = await executor.execute_code_blocks(
+            [CodeBlock(code="print('hello world!')", language="python")], CancellationToken()
+        )
+        assert code_result.exit_code == 0 and code_result.output == "hello world!\n"
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_interpreter_pool_timeout_excludes_wait() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(timeout=2, work_dir=temp_dir, interpreter_pool_size=1)
+        await executor.start()
+        # The second code block waits for the only interpreter longer than the timeout is left after its own run.
+        results = await asyncio.gather(
+            *(
+                executor.execute_code_blocks(
+                    [CodeBlock(code=f"import time; time.sleep(1.5); print({i})", language="python")],
+                    CancellationToken(),
+                )
+                for i in range(2)
+            )
+        )
+        assert [result.exit_code for result in results] == [0, 0]
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_interpreter_pool_preload_error() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=temp_dir, interpreter_pool_size=1, preload_modules=["module_that_does_not_exist"]
+        )
+        with pytest.raises(RuntimeError, match="module_that_does_not_exist"):
+            await executor.start()
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_interpreter_pool_serialize_deserialize() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=temp_dir, interpreter_pool_size=2, preload_modules=["json"], max_executions_per_interpreter=10
+        )
+        loaded_executor = LocalCommandLineCodeExecutor.load_component(executor.dump_component())
+        assert loaded_executor.dump_component() == executor.dump_component()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("interpreter_pool_size", [0, 1])
+async def test_max_output_bytes(interpreter_pool_size: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=temp_dir, max_output_bytes=100, interpreter_pool_size=interpreter_pool_size
+        )
+        code = "for i in range(1000):\n    print(f'line {i:04}')"
+        code_blocks = [CodeBlock(code=code, language="python")]
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+        assert result.exit_code == 0
+        assert result.output.startswith("line 0000\n")
+        assert result.output.endswith("line 0999\n")
+        assert "bytes truncated" in result.output
+        assert len(result.output) < 300
+
+        # The full output is spilled to a log file next to the code file.
+        assert result.code_file is not None
+        log_file = Path(result.code_file).with_suffix(".stdout.log")
+        assert log_file.read_text() == "".join(f"line {i:04}\n" for i in range(1000))
+
+        # Short output is not truncated.
+        result = await executor.execute_code_blocks(
+            [CodeBlock(code="print('hello world!')", language="python")], CancellationToken()
+        )
+        assert result.output == "hello world!\n"
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_execute_code_blocks_stream() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir)
+        code = "import time\nprint('first', flush=True)\ntime.sleep(1)\nprint('second', flush=True)"
+        code_blocks = [CodeBlock(code=code, language="python"), CodeBlock(code="echo third", language="sh")]
+
+        chunks: list[str] = []
+        result: CommandLineCodeResult | None = None
+        async for item in executor.execute_code_blocks_stream(code_blocks, CancellationToken()):
+            if isinstance(item, CommandLineCodeResult):
+                result = item
+            else:
+                chunks.append(item)
+        assert result is not None
+        assert result.exit_code == 0
+        assert "".join(chunks) == result.output == "first\nsecond\nthird\n"
+
+
+@pytest.mark.asyncio
+async def test_execute_code_blocks_stream_timeout() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(timeout=1, work_dir=temp_dir)
+        code = "import time\nprint('started', flush=True)\ntime.sleep(10)"
+        items = [
+            item
+            async for item in executor.execute_code_blocks_stream(
+                [CodeBlock(code=code, language="python")], CancellationToken()
+            )
+        ]
+        result = items[-1]
+        assert isinstance(result, CommandLineCodeResult)
+        assert "".join(str(item) for item in items[:-1]) == "started\n"
+        assert result.exit_code == 124 and result.output == "started\n\nTimeout"
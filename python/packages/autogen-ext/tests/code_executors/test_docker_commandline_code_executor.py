@@ -12,7 +12,8 @@
 from aiofiles import open
 from autogen_core import CancellationToken
 from autogen_core.code_executor import CodeBlock
-from autogen_ext.code_executors.docker import DockerCommandLineCodeExecutor
+from autogen_ext.code_executors._common import CommandLineCodeResult
+from autogen_ext.code_executors.docker import DockerCommandLineCodeExecutor, DockerContainerPool
 
 
 def docker_tests_enabled() -> bool:
@@ -398,3 +399,109 @@ def run_scenario_in_new_loop(executor_instance: DockerCommandLineCodeExecutor) -
 
     executor, _ = executor_and_temp_dir
     await asyncio.get_running_loop().run_in_executor(None, run_scenario_in_new_loop, executor)
+
+
+@pytest.mark.asyncio
+async def test_docker_commandline_code_executor_output_stream() -> None:
+    if not docker_tests_enabled():
+        pytest.skip("Docker tests are disabled")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        async with DockerCommandLineCodeExecutor(work_dir=temp_dir, max_output_bytes=100) as executor:
+            code = "import time\nprint('first', flush=True)\ntime.sleep(1)\nprint('second', flush=True)"
+            chunks: list[str] = []
+            result: CommandLineCodeResult | None = None
+            async for item in executor.execute_code_blocks_stream(
+                [CodeBlock(code=code, language="python")], CancellationToken()
+            ):
+                if isinstance(item, CommandLineCodeResult):
+                    result = item
+                else:
+                    chunks.append(item)
+            assert result is not None and result.exit_code == 0
+            assert "".join(chunks) == result.output == "first\nsecond\n"
+
+            # Long output is truncated, and spilled to a log file next to the code file.
+            code = "for i in range(1000):\n    print(f'line {i:04}')"
+            result = await executor.execute_code_blocks([CodeBlock(code=code, language="python")], CancellationToken())
+            assert result.exit_code == 0
+            assert result.output.startswith("line 0000\n") and result.output.endswith("line 0999\n")
+            assert "bytes truncated" in result.output
+            assert result.code_file is not None
+            log_file = Path(result.code_file).with_suffix(".log")
+            assert log_file.read_text() == "".join(f"line {i:04}\n" for i in range(1000))
+
+
+@pytest.mark.asyncio
+async def test_docker_container_pool() -> None:
+    if not docker_tests_enabled():
+        pytest.skip("Docker tests are disabled")
+
+    async with DockerContainerPool(size=2, max_size=3) as pool:
+        assert pool.stats.containers == 2 and pool.stats.cold_starts == 2
+
+        # Leases run concurrently, in separate workspaces.
+        async def run(i: int) -> tuple[str, str]:
+            async with DockerCommandLineCodeExecutor(container_pool=pool) as executor:
+                code = (
+                    f"import os, time\nprint(sorted(os.listdir('.')))\nopen('mine_{i}.txt', 'w').close()\ntime.sleep(1)"
+                )
+                result = await executor.execute_code_blocks(
+                    [CodeBlock(code=code, language="python")], CancellationToken()
+                )
+                assert result.exit_code == 0
+                return executor.container_name, result.output
+
+        results = await asyncio.gather(*(run(i) for i in range(3)))
+        assert len({name for name, _ in results}) == 3
+        assert all(output.startswith("['tmp_code_") for _, output in results)
+        assert pool.stats.containers == 3 and pool.stats.cold_starts == 3 and pool.stats.leased == 0
+
+        # Returned containers are reused with an empty workspace.
+        name, output = await run(3)
+        assert name in {name for name, _ in results}
+        assert "mine_" not in output
+        assert pool.stats.warm_leases >= 3 and pool.stats.cold_starts == 3
+
+        # Files the container created as root, including hidden ones, are removed too.
+        lease = await pool.acquire()
+        command = ["sh", "-c", "mkdir -p .hidden/locked && touch .hidden/locked/file && chmod 000 .hidden/locked"]
+        assert (await asyncio.to_thread(lease.container.exec_run, command)).exit_code == 0
+        await pool.release(lease)
+        assert list(lease.work_dir.iterdir()) == []
+
+        # A container that stopped is replaced when it is leased.
+        lease = await pool.acquire()
+        await pool.release(lease)
+        await asyncio.to_thread(lease.container.kill)
+        for _ in range(pool.stats.containers):
+            await pool.release(await pool.acquire())
+        assert pool.stats.replaced == 1
+
+
+@pytest.mark.asyncio
+async def test_docker_container_pool_stop_wakes_acquire() -> None:
+    if not docker_tests_enabled():
+        pytest.skip("Docker tests are disabled")
+
+    pool = DockerContainerPool(size=1)
+    await pool.start()
+    lease = await pool.acquire()
+    waiters = [asyncio.create_task(pool.acquire()) for _ in range(2)]
+    await asyncio.sleep(0.1)
+    await pool.stop()
+    for waiter in waiters:
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(waiter, timeout=5)
+    await pool.release(lease)
+    assert pool.stats.containers == 0
+
+
+@pytest.mark.asyncio
+async def test_docker_container_pool_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        DockerContainerPool(size=2, max_size=1)
+    with pytest.raises(ValueError):
+        DockerCommandLineCodeExecutor(work_dir=".", container_pool=DockerContainerPool())
+    with pytest.raises(RuntimeError):
+        await DockerContainerPool().acquire()
@@ -10,6 +10,7 @@
 from autogen_core.code_executor import CodeBlock
 from autogen_ext.code_executors.docker_jupyter import (
     DockerJupyterCodeExecutor,
+    DockerJupyterKernelPool,
     DockerJupyterServer,
 )
 
@@ -172,3 +173,23 @@ async def test_execute_code_with_image_output() -> None:
                 assert code_result.exit_code == 0
                 assert "<PIL.Image.Image image mode=RGB size=100x100>" in code_result.output
                 assert str(Path(code_result.output_files[0]).parent) == temp_dir
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool() -> None:
+    if not docker_tests_enabled():
+        pytest.skip("Docker tests are disabled")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        async with DockerJupyterServer(bind_dir=temp_dir) as jupyter_server:
+            async with DockerJupyterKernelPool(jupyter_server, size=2, warmup_code="import json") as pool:
+                async with DockerJupyterCodeExecutor(jupyter_server=jupyter_server, kernel_pool=pool) as executor:
+                    code_blocks = [CodeBlock(code="x = 1\nprint(json.dumps(x))", language="python")]
+                    code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+                    assert code_result.exit_code == 0 and code_result.output.strip() == "1"
+
+                    # A restart leases another warm kernel, with a fresh state.
+                    await executor.restart()
+                    code_blocks = [CodeBlock(code="print('x' in globals(), 'json' in globals())", language="python")]
+                    code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+                    assert code_result.output.strip() == "False True"
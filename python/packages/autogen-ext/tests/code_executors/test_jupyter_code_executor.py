@@ -5,7 +5,7 @@
 import pytest
 from autogen_core import CancellationToken
 from autogen_core.code_executor import CodeBlock
-from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterCodeResult
+from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterCodeResult, JupyterKernelPool
 
 
 @pytest.mark.asyncio
@@ -225,3 +225,53 @@ async def test_runtime_error_not_started() -> None:
     code_blocks = [CodeBlock(code="print('hello world!')", language="python")]
     with pytest.raises(RuntimeError, match="Executor must be started before executing cells"):
         await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool(tmp_path: Path) -> None:
+    async with JupyterKernelPool(size=1, warmup_code="import json") as pool:
+        assert pool.idle == 1
+        async with JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool) as executor:
+            # The warm-up code ran in the leased kernel.
+            code_blocks = [CodeBlock(code="x = 1\nprint(json.dumps(x))", language="python")]
+            code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+            assert code_result == JupyterCodeResult(exit_code=0, output="1\n", output_files=[])
+
+            # A restart leases the kernel started in the background, with a fresh state.
+            await executor.restart()
+            code_blocks = [CodeBlock(code="print('x' in globals(), 'json' in globals())", language="python")]
+            code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+            assert code_result.output == "False True\n"
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool_max_uses(tmp_path: Path) -> None:
+    async with JupyterKernelPool(size=1, max_uses=2) as pool:
+        async with JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool) as executor:
+            await executor.execute_code_blocks([CodeBlock(code="x = 1", language="python")], CancellationToken())
+        # The kernel is given back with its state, and not reused after its second lease.
+        code_blocks = [CodeBlock(code="print('x' in globals())", language="python")]
+        for expected in ["True\n", "False\n"]:
+            async with JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool) as executor:
+                code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+                assert code_result.output == expected
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool_warmup_error() -> None:
+    pool = JupyterKernelPool(warmup_code="import not_a_module")
+    with pytest.raises(RuntimeError, match="Warm-up code failed: ModuleNotFoundError"):
+        await pool.start()
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool_serialization(tmp_path: Path) -> None:
+    executor = JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=JupyterKernelPool(size=2, warmup_code="import os"))
+    config = executor.dump_component()
+    assert config.config["kernel_pool"]["config"]["size"] == 2
+    loaded_executor = JupyterCodeExecutor.load_component(config)
+    async with loaded_executor:
+        code_blocks = [CodeBlock(code="print(os.sep)", language="python")]
+        code_result = await loaded_executor.execute_code_blocks(code_blocks, CancellationToken())
+        assert code_result.exit_code == 0
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
 from autogen_core.memory import MemoryContent, MemoryMimeType
 from autogen_core.model_context import BufferedChatCompletionContext
@@ -440,3 +441,58 @@ def dummy_function() -> None:
     assert custom_config.function_type == "custom"
     assert custom_config.function == dummy_function
     assert custom_config.params == {"test": "value"}
+
+
+class CountingEmbeddingFunction(chromadb.EmbeddingFunction[chromadb.Documents]):
+    """Embeds texts by their character counts and records the texts it is called with."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def __call__(self, input: chromadb.Documents) -> chromadb.Embeddings:
+        self.calls.append(list(input))
+        return [np.array([text.count(c) for c in "aeiou"] + [1], dtype=np.float32) for text in input]
+
+    @staticmethod
+    def name() -> str:
+        return "counting"
+
+    def get_config(self) -> dict[str, object]:
+        return {}
+
+    @staticmethod
+    def build_from_config(config: dict[str, object]) -> "CountingEmbeddingFunction":
+        return CountingEmbeddingFunction()
+
+
+@pytest.mark.asyncio
+async def test_add_many_batches_and_caches_embeddings(tmp_path: Path) -> None:
+    """Test that add_many embeds in batches and that embeddings are cached by text."""
+    embedding_function = CountingEmbeddingFunction()
+    config = PersistentChromaDBVectorMemoryConfig(
+        collection_name="test_add_many",
+        allow_reset=True,
+        persistence_path=str(tmp_path / "chroma_db_add_many"),
+        batch_size=2,
+        k=5,
+        embedding_function_config=CustomEmbeddingFunctionConfig(function=lambda: embedding_function, params={}),
+    )
+    memory = ChromaDBVectorMemory(config=config)
+    await memory.clear()
+
+    texts = ["apple pie", "banana bread", "cherry tart", "apple pie", "date cake"]
+    await memory.add_many([MemoryContent(content=text, mime_type=MemoryMimeType.TEXT) for text in texts])
+    # Three batches, and the repeated text of the second batch is served from the cache.
+    assert embedding_function.calls == [["apple pie", "banana bread"], ["cherry tart"], ["date cake"]]
+
+    results = await memory.query("apple pie")
+    assert len(results.results) == 5
+    assert results.results[0].content == "apple pie"
+    await memory.query("apple pie")
+    # The query is embedded once, as a query.
+    assert embedding_function.calls[3:] == [["apple pie"]]
+
+    await memory.add(MemoryContent(content="banana bread", mime_type=MemoryMimeType.TEXT))
+    assert len(embedding_function.calls) == 4
+
+    await memory.close()
@@ -21,6 +21,7 @@
     AnthropicChatCompletionClient,
     BedrockInfo,
 )
+from autogen_ext.models.anthropic._anthropic_client import convert_tools
 
 
 def _pass_function(input: str) -> str:
@@ -680,3 +681,17 @@ def test_rstrip_railing_whitespace_at_last_assistant_content() -> None:
 
     assert isinstance(result[-1].content, str)
     assert result[-1].content == "foobar"
+
+
+def test_convert_tools_follows_tool_changes() -> None:
+    tool = FunctionTool(_add_numbers, description="Add two numbers together", name="add_numbers")
+    converted = convert_tools([tool])[0]
+    assert convert_tools([tool])[0] is converted
+    assert converted["name"] == "add_numbers"
+
+    # A tool with a new name or description is converted again.
+    tool._name = "sum_numbers"  # pyright: ignore[reportPrivateUsage]
+    tool._description = "Sum two numbers"  # pyright: ignore[reportPrivateUsage]
+    renamed = convert_tools([tool])[0]
+    assert renamed["name"] == "sum_numbers"
+    assert renamed.get("description") == "Sum two numbers"
@@ -1,7 +1,9 @@
+import asyncio
 import copy
-from typing import List, Tuple, Union
+from typing import Any, AsyncGenerator, List, Optional, Tuple, Union
 
 import pytest
+from autogen_core import AsyncCacheStore, CancellationToken, InMemoryStore
 from autogen_core.models import (
     ChatCompletionClient,
     CreateResult,
@@ -184,3 +186,306 @@ async def test_cache_create_stream() -> None:
     # cached_client_config = cached_client.dump_component()
     # loaded_client = ChatCompletionCache.load_component(cached_client_config)
     # assert loaded_client.client == cached_client.client
+
+
+class GatedReplayChatCompletionClient(ReplayChatCompletionClient):
+    """A replay client that holds every upstream call until the gate is opened."""
+
+    def __init__(self, responses: List[str]) -> None:
+        super().__init__(responses)
+        self.gate = asyncio.Event()
+        self.upstream_calls = 0
+
+    async def create(self, *args: Any, **kwargs: Any) -> CreateResult:
+        self.upstream_calls += 1
+        await self.gate.wait()
+        return await super().create(*args, **kwargs)
+
+    async def create_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[Union[str, CreateResult], None]:
+        self.upstream_calls += 1
+        first = True
+        async for chunk in super().create_stream(*args, **kwargs):
+            yield chunk
+            if first:
+                # Pause after the first chunk so that late joiners have something to replay.
+                await self.gate.wait()
+                first = False
+
+
+class AsyncInMemoryStore(AsyncCacheStore[Any]):
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+
+    async def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
+        await asyncio.sleep(0)
+        return self.store.get(key, default)
+
+    async def set(self, key: str, value: Any) -> None:
+        await asyncio.sleep(0)
+        self.store[key] = value
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesces_concurrent_create() -> None:
+    responses = ["This is dummy message number 0", "This is dummy message number 1"]
+    client = GatedReplayChatCompletionClient(responses)
+    client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(client)
+    messages: List[LLMMessage] = [UserMessage(content="Same prompt", source="user")]
+
+    tasks = [asyncio.create_task(cached_client.create(messages)) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    client.gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert client.upstream_calls == 1
+    assert all(result.content == responses[0] for result in results)
+    assert sum(not result.cached for result in results) == 1
+
+    # Subsequent calls are served from the store.
+    result = await cached_client.create(messages)
+    assert result.cached
+    assert client.upstream_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesced_create_propagates_errors() -> None:
+    # No responses, so the single upstream call fails.
+    client = GatedReplayChatCompletionClient([])
+    cached_client = ChatCompletionCache(client)
+    messages: List[LLMMessage] = [UserMessage(content="Same prompt", source="user")]
+
+    tasks = [asyncio.create_task(cached_client.create(messages)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    client.gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert client.upstream_calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesced_create_retries_after_owner_cancelled() -> None:
+    client = GatedReplayChatCompletionClient(["This is dummy message number 0"])
+    client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(client)
+    messages: List[LLMMessage] = [UserMessage(content="Same prompt", source="user")]
+
+    owner = asyncio.create_task(cached_client.create(messages))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(cached_client.create(messages))
+    await asyncio.sleep(0.01)
+    owner.cancel()
+    await asyncio.sleep(0.01)
+    client.gate.set()
+
+    result = await follower
+    assert owner.cancelled()
+    assert client.upstream_calls == 2
+    assert result.content == "This is dummy message number 0"
+    assert not result.cached
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesces_concurrent_create_stream() -> None:
+    responses = ["This is dummy message number 0"]
+    client = GatedReplayChatCompletionClient(responses)
+    client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(client)
+    messages: List[LLMMessage] = [UserMessage(content="Same prompt", source="user")]
+
+    leader_stream = cached_client.create_stream(messages)
+    leader_results: List[Union[str, CreateResult]] = [await leader_stream.__anext__()]
+
+    async def consume() -> List[Union[str, CreateResult]]:
+        return [chunk async for chunk in cached_client.create_stream(messages)]
+
+    # The follower joins after the first chunk has been streamed.
+    follower = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    client.gate.set()
+    leader_results.extend([chunk async for chunk in leader_stream])
+    follower_results = await follower
+
+    assert client.upstream_calls == 1
+    assert len(follower_results) == len(leader_results)
+    for leader_chunk, follower_chunk in zip(leader_results, follower_results, strict=True):
+        if isinstance(leader_chunk, str):
+            assert leader_chunk == follower_chunk
+        else:
+            assert isinstance(follower_chunk, CreateResult)
+            assert leader_chunk.content == follower_chunk.content
+            assert not leader_chunk.cached
+            assert follower_chunk.cached
+
+    # The completed stream is cached.
+    cached_results = [chunk async for chunk in cached_client.create_stream(messages)]
+    assert client.upstream_calls == 1
+    assert [chunk for chunk in cached_results if isinstance(chunk, str)] == [
+        chunk for chunk in leader_results if isinstance(chunk, str)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_continues_after_leader_cancelled() -> None:
+    responses = ["This is dummy message number 0"]
+    client = GatedReplayChatCompletionClient(responses)
+    client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(client)
+    messages: List[LLMMessage] = [UserMessage(content="Same prompt", source="user")]
+
+    leader_token = CancellationToken()
+    leader_stream = cached_client.create_stream(messages, cancellation_token=leader_token)
+    await leader_stream.__anext__()
+
+    async def consume() -> List[Union[str, CreateResult]]:
+        return [chunk async for chunk in cached_client.create_stream(messages)]
+
+    follower = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    leader_token.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader_stream.__anext__()
+    client.gate.set()
+
+    # The follower still gets the whole result of the shared upstream stream, which is cached.
+    follower_results = await follower
+    final = follower_results[-1]
+    assert isinstance(final, CreateResult)
+    assert final.content == responses[0]
+    assert client.upstream_calls == 1
+    cached_results = [chunk async for chunk in cached_client.create_stream(messages)]
+    assert client.upstream_calls == 1
+    assert len(cached_results) == len(follower_results)
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_cancelled_by_every_caller() -> None:
+    client = GatedReplayChatCompletionClient(["This is dummy message number 0", "This is dummy message number 1"])
+    cached_client = ChatCompletionCache(client)
+    messages: List[LLMMessage] = [UserMessage(content="Same prompt", source="user")]
+
+    tokens = [CancellationToken(), CancellationToken()]
+    streams = [cached_client.create_stream(messages, cancellation_token=token) for token in tokens]
+    for stream in streams:
+        await stream.__anext__()
+    for token, stream in zip(tokens, streams, strict=True):
+        token.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stream.__anext__()
+
+    # The upstream stream is cancelled and nothing is cached, so the next call streams again.
+    client.gate.set()
+    results = [chunk async for chunk in cached_client.create_stream(messages)]
+    assert client.upstream_calls == 2
+    assert isinstance(results[-1], CreateResult)
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_not_cached_until_complete() -> None:
+    responses = ["This is dummy message number 0", "This is dummy message number 1"]
+    client = GatedReplayChatCompletionClient(responses)
+    client.set_cached_bool_value(False)
+    client.gate.set()
+    cached_client = ChatCompletionCache(client)
+    messages: List[LLMMessage] = [UserMessage(content="Same prompt", source="user")]
+
+    # Stop consuming early; the upstream stream still runs to completion in the background.
+    stream = cached_client.create_stream(messages)
+    await stream.__anext__()
+    await stream.aclose()
+    await asyncio.sleep(0.01)
+
+    results = [chunk async for chunk in cached_client.create_stream(messages)]
+    assert client.upstream_calls == 1
+    final = results[-1]
+    assert isinstance(final, CreateResult)
+    assert final.content == responses[0]
+    assert final.cached
+
+
+@pytest.mark.asyncio
+async def test_cache_with_async_store() -> None:
+    responses, prompts, system_prompt, replay_client, _ = get_test_data()
+    cached_client = ChatCompletionCache(replay_client, AsyncInMemoryStore())
+
+    response0 = await cached_client.create([system_prompt, UserMessage(content=prompts[0], source="user")])
+    assert not response0.cached
+    assert response0.content == responses[0]
+
+    response0_cached = await cached_client.create([system_prompt, UserMessage(content=prompts[0], source="user")])
+    assert response0_cached.cached
+    assert response0_cached.content == responses[0]
+
+    streamed = [
+        chunk
+        async for chunk in cached_client.create_stream([system_prompt, UserMessage(content=prompts[1], source="user")])
+    ]
+    streamed_cached = [
+        chunk
+        async for chunk in cached_client.create_stream([system_prompt, UserMessage(content=prompts[1], source="user")])
+    ]
+    assert len(streamed) == len(streamed_cached)
+    assert isinstance(streamed_cached[-1], CreateResult)
+    assert streamed_cached[-1].cached
+
+
+def test_cache_key_depends_on_content() -> None:
+    from autogen_ext.models.cache._cache_key import CacheKeyBuilder
+
+    class Answer(BaseModel):
+        answer: str
+
+    builder = CacheKeyBuilder()
+    messages: List[LLMMessage] = [SystemMessage(content="system"), UserMessage(content="hello", source="user")]
+    key = builder.build(messages, [], None, {})
+
+    # Equal messages produce the same key, regardless of object identity.
+    same_messages: List[LLMMessage] = [SystemMessage(content="system"), UserMessage(content="hello", source="user")]
+    assert builder.build(same_messages, [], None, {}) == key
+
+    other_keys = [
+        builder.build(messages[:1], [], None, {}),
+        builder.build([*messages, UserMessage(content="again", source="user")], [], None, {}),
+        builder.build(messages, [], True, {}),
+        builder.build(messages, [], False, {}),
+        builder.build(messages, [], Answer, {}),
+        builder.build(messages, [], None, {"temperature": 0.5}),
+        builder.build(messages, [{"name": "tool", "description": "A tool."}], None, {}),
+    ]
+    assert len({key, *other_keys}) == len(other_keys) + 1
+
+
+def test_cache_key_memoizes_message_digests(monkeypatch: pytest.MonkeyPatch) -> None:
+    from autogen_ext.models.cache import _cache_key
+
+    digested: List[LLMMessage] = []
+    original_digest = _cache_key._message_digest  # pyright: ignore[reportPrivateUsage]
+
+    def counting_digest(message: LLMMessage) -> bytes:
+        digested.append(message)
+        return original_digest(message)
+
+    monkeypatch.setattr(_cache_key, "_message_digest", counting_digest)
+    builder = _cache_key.CacheKeyBuilder()
+
+    history: List[LLMMessage] = [UserMessage(content=f"message {i}", source="user") for i in range(50)]
+    builder.build(history, [], None, {})
+    assert len(digested) == 50
+
+    digested.clear()
+    history.append(UserMessage(content="new message", source="user"))
+    builder.build(history, [], None, {})
+    assert digested == [history[-1]]
+
+    # Digests are dropped together with the messages they belong to.
+    del history[:]
+    del digested[:]
+    assert len(builder._message_digests) == 0  # pyright: ignore[reportPrivateUsage]
+
+
+def test_cache_serialization_keeps_store_config() -> None:
+    replay_client = ReplayChatCompletionClient(["response"])
+    cached_client = ChatCompletionCache(replay_client, InMemoryStore(max_entries=100, ttl=60))
+    loaded_client = ChatCompletionCache.load_component(cached_client.dump_component())
+    assert isinstance(loaded_client.store, InMemoryStore)
+    assert loaded_client.store.dump_component() == cached_client.store.dump_component()
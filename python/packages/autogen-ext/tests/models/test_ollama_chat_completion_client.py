@@ -243,6 +243,12 @@ def add(x: int, y: Optional[int]) -> str:
     assert converted_tools[1].function.name == "manual_tool"
     assert converted_tools[1].function.parameters.properties["param_with_type"].type == "integer"
     assert converted_tools[1].function.parameters.properties["param_without_type"].type == "string"
+
+    # A renamed tool is converted again.
+    add_tool._name = "add_numbers"  # pyright: ignore[reportPrivateUsage]
+    renamed = convert_tools([add_tool])[0]
+    assert isinstance(renamed.function, Tool.Function)
+    assert renamed.function.name == "add_numbers"
     assert converted_tools[1].function.parameters.required == ["param_with_type"]
 
 
@@ -29,6 +29,7 @@
     BaseOpenAIChatCompletionClient,
     calculate_vision_tokens,
     convert_tools,
+    count_tokens_openai,
     to_oai_type,
 )
 from autogen_ext.models.openai._transformation import TransformerMap, get_transformer
@@ -442,6 +443,61 @@ def tool2(test1: int, test2: List[int]) -> str:
     assert remaining_tokens
 
 
+def test_convert_tools_memoized() -> None:
+    def tool1(test: str, test2: str) -> str:
+        return test + test2
+
+    tool = FunctionTool(tool1, description="example tool 1")
+    converted = convert_tools([tool])[0]
+    assert convert_tools([tool])[0] is converted
+    assert converted["function"]["parameters"] == tool.schema.get("parameters")
+
+    # Tool schemas given as dicts are converted on every call.
+    schema = tool.schema
+    assert convert_tools([schema])[0] == converted
+    assert convert_tools([schema])[0] is not convert_tools([schema])[0]
+
+    # A renamed tool is converted again.
+    tool._name = "renamed_tool1"  # pyright: ignore[reportPrivateUsage]
+    renamed = convert_tools([tool])[0]
+    assert renamed is not converted
+    assert renamed["function"]["name"] == "renamed_tool1"
+    assert convert_tools([tool])[0] is renamed
+
+
+def test_openai_chat_completion_client_count_tokens_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    from autogen_ext.models.openai import _openai_client
+
+    client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key")
+
+    def tool1(test: str, test2: str) -> str:
+        return test + test2
+
+    tools = [FunctionTool(tool1, description="example tool 1")]
+    history: List[LLMMessage] = [SystemMessage(content="You are a helpful assistant.")]
+    history.extend(UserMessage(content=f"Message number {i}", source="user") for i in range(20))
+    expected = count_tokens_openai(history, "gpt-4o", tools=tools, model_family=client.model_info["family"])
+
+    counted: List[LLMMessage] = []
+    original_count_message_tokens = _openai_client._count_message_tokens  # pyright: ignore[reportPrivateUsage]
+
+    def counting_count_message_tokens(message: LLMMessage, *args: Any, **kwargs: Any) -> int:
+        counted.append(message)
+        return original_count_message_tokens(message, *args, **kwargs)
+
+    monkeypatch.setattr(_openai_client, "_count_message_tokens", counting_count_message_tokens)
+
+    assert client.count_tokens(history, tools=tools) == expected
+    assert len(counted) == len(history)
+
+    # Counting the grown history only counts the new message.
+    counted.clear()
+    history.append(AssistantMessage(content="A reply", source="assistant"))
+    num_tokens = client.count_tokens(history, tools=tools)
+    assert counted == [history[-1]]
+    assert num_tokens == count_tokens_openai(history, "gpt-4o", tools=tools, model_family=client.model_info["family"])
+
+
 @pytest.mark.parametrize(
     "mock_size, expected_num_tokens",
     [
@@ -1,12 +1,13 @@
 import asyncio
 import logging
 import os
-from typing import Any, List
+from typing import Any, List, Mapping
 
 import pytest
 from autogen_core import (
     PROTOBUF_DATA_CONTENT_TYPE,
     AgentId,
+    AgentPassivationPolicy,
     AgentType,
     DefaultSubscription,
     DefaultTopicId,
@@ -21,6 +22,7 @@
     type_subscription,
 )
 from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+from autogen_ext.runtimes.grpc._placement import ConsistentHashRing
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -406,7 +408,7 @@ async def test_disconnected_agent() -> None:
     # to some private properties. This needs to be updated once they are available publicly
 
     def get_current_subscriptions() -> List[Subscription]:
-        return host._servicer._subscription_manager._subscriptions  # type: ignore[reportPrivateUsage]
+        return list(host._servicer._subscription_manager.subscriptions)  # type: ignore[reportPrivateUsage]
 
     async def get_subscribed_recipients() -> List[AgentId]:
         return await host._servicer._subscription_manager.get_subscribed_recipients(DefaultTopicId())  # type: ignore[reportPrivateUsage]
@@ -716,3 +718,160 @@ async def test_instance_factory_messaging() -> None:
 
     asyncio.run(test_disconnected_agent())
     asyncio.run(test_grpc_max_message_size())
+
+
+class StatefulLoopbackAgent(LoopbackAgent):
+    async def save_state(self) -> Mapping[str, Any]:
+        return {"num_calls": self.num_calls}
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        self.num_calls = state["num_calls"]
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_agent_passivation() -> None:
+    host_address = "localhost:50062"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    worker = GrpcWorkerAgentRuntime(
+        host_address=host_address, passivation_policy=AgentPassivationPolicy(max_resident_agents=1)
+    )
+    worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker.start()
+    await StatefulLoopbackAgent.register(worker, "loopback", StatefulLoopbackAgent)
+
+    for key in ["a", "b", "a"]:
+        await worker.send_message(ContentMessage(content="Hello!"), recipient=AgentId("loopback", key))
+    assert worker.resident_agents_count == 1
+    assert worker.passivated_agents_count == 1
+
+    # "a" was rehydrated with its state before handling its second message.
+    agent = await worker.try_get_underlying_agent_instance(AgentId("loopback", "a"), StatefulLoopbackAgent)
+    assert agent.num_calls == 2
+
+    await worker.stop()
+    await host.stop()
+
+
+def test_consistent_hash_ring() -> None:
+    ring = ConsistentHashRing()
+    assert ring.get("key") is None
+
+    ring.add("worker1")
+    ring.add("worker2")
+    keys = [f"key-{i}" for i in range(1000)]
+    placement = {key: ring.get(key) for key in keys}
+    counts = {node: list(placement.values()).count(node) for node in ring.nodes}
+    assert all(count > 300 for count in counts.values())
+    # The placement does not depend on the ring instance.
+    other_ring = ConsistentHashRing()
+    other_ring.add("worker2")
+    other_ring.add("worker1")
+    assert all(other_ring.get(key) == node for key, node in placement.items())
+
+    # A new node only takes keys over; no key moves between the existing nodes.
+    ring.add("worker3")
+    for key, node in placement.items():
+        assert ring.get(key) in (node, "worker3")
+    assert sum(ring.get(key) == "worker3" for key in keys) > 200
+
+    # Removing the node restores the original placement.
+    ring.remove("worker3")
+    assert all(ring.get(key) == node for key, node in placement.items())
+    ring.remove("worker1")
+    assert all(ring.get(key) == "worker2" for key in keys)
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_shared_agent_type_placement() -> None:
+    host_address = "localhost:50063"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, shared_agent_types=True)
+    host.start()
+
+    workers: List[GrpcWorkerAgentRuntime] = []
+    agents: List[List[LoopbackAgentWithDefaultSubscription]] = [[], []]
+    for worker_agents in agents:
+        worker = GrpcWorkerAgentRuntime(host_address=host_address)
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+        await worker.start()
+
+        def factory(worker_agents: List[LoopbackAgentWithDefaultSubscription] = worker_agents) -> Any:
+            agent = LoopbackAgentWithDefaultSubscription()
+            worker_agents.append(agent)
+            return agent
+
+        await LoopbackAgentWithDefaultSubscription.register(worker, "name", factory)
+        workers.append(worker)
+
+    sender = GrpcWorkerAgentRuntime(host_address=host_address)
+    sender.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await sender.start()
+
+    keys = [f"key-{i}" for i in range(20)]
+    for key in keys:
+        await sender.send_message(MessageType(), recipient=AgentId("name", key))
+        await sender.publish_message(MessageType(), topic_id=DefaultTopicId(source=key))
+    await asyncio.sleep(1)
+
+    # Each key lives on exactly one worker, which received both the request and the event for it.
+    placed_keys = [sorted(agent.id.key for agent in worker_agents) for worker_agents in agents]
+    assert sorted(placed_keys[0] + placed_keys[1]) == sorted(keys)
+    assert placed_keys[0] and placed_keys[1]
+    assert all(agent.num_calls == 2 for worker_agents in agents for agent in worker_agents)
+
+    load = host.worker_load
+    assert len(load) == 2
+    assert sum(worker_load.delivered_requests for worker_load in load.values()) == len(keys)
+    assert sum(worker_load.delivered_events for worker_load in load.values()) == len(keys)
+    assert all(worker_load.agent_types == {"name"} for worker_load in load.values())
+    assert all(worker_load.pending_requests == 0 for worker_load in load.values())
+
+    # When a worker leaves, its keys move to the remaining worker.
+    await workers[1].stop()
+    await asyncio.sleep(0.5)
+    for key in placed_keys[1]:
+        await sender.send_message(MessageType(), recipient=AgentId("name", key))
+    assert sorted(agent.id.key for agent in agents[0]) == sorted(keys)
+    assert len(host.worker_load) == 1
+
+    await workers[0].stop()
+    await sender.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_shared_agent_type_subscription_refcount() -> None:
+    host_address = "localhost:50064"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, shared_agent_types=True)
+    host.start()
+
+    def get_current_subscriptions() -> List[Subscription]:
+        return list(host._servicer._subscription_manager.subscriptions)  # type: ignore[reportPrivateUsage]
+
+    workers = [GrpcWorkerAgentRuntime(host_address=host_address) for _ in range(2)]
+    subscriptions = [TypeSubscription("events", "name") for _ in workers]
+    for worker, subscription in zip(workers, subscriptions, strict=True):
+        await worker.start()
+        await worker.add_subscription(subscription)
+    # The workers share a single copy of the subscription.
+    assert [sub.id for sub in get_current_subscriptions()] == [subscriptions[0].id]
+
+    # The first worker to unsubscribe leaves the copy in place for the other worker.
+    await workers[0].remove_subscription(subscriptions[0].id)
+    assert [sub.id for sub in get_current_subscriptions()] == [subscriptions[0].id]
+
+    # The copy is removed once the last worker unsubscribes.
+    await workers[1].remove_subscription(subscriptions[1].id)
+    assert get_current_subscriptions() == []
+
+    # Subscribing again after everyone unsubscribed starts a new copy.
+    await workers[1].add_subscription(TypeSubscription("events", "name"))
+    assert len(get_current_subscriptions()) == 1
+
+    for worker in workers:
+        await worker.stop()
+    await host.stop()
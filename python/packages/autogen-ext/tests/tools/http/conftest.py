@@ -5,7 +5,7 @@
 import pytest_asyncio
 import uvicorn
 from autogen_core import ComponentModel
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from pydantic import BaseModel, Field
 
 
@@ -57,6 +57,17 @@ async def test_patch_endpoint(body: TestArgs) -> TestResponse:
     return TestResponse(result=f"Received: {body.query} with value {body.value}")
 
 
+cached_get_calls: Dict[str, int] = {}
+
+
+@app.get("/cached")
+async def test_cached_get_endpoint(query: str, value: int, response: Response) -> TestResponse:
+    cached_get_calls[query] = cached_get_calls.get(query, 0) + 1
+    if query != "uncached":
+        response.headers["Cache-Control"] = "max-age=60"
+    return TestResponse(result=f"Received: {query} with value {value}, call {cached_get_calls[query]}")
+
+
 @pytest.fixture
 def test_config() -> ComponentModel:
     return ComponentModel(
@@ -1,10 +1,11 @@
+import asyncio
 import json
 import logging
 
 import httpx
 import pytest
 from autogen_core import CancellationToken, Component, ComponentModel
-from autogen_ext.tools.http import HttpTool
+from autogen_ext.tools.http import HttpClientPool, HttpTool
 from pydantic import ValidationError
 
 
@@ -205,3 +206,53 @@ def test_config_deserialization(test_config: ComponentModel) -> None:
     assert tool.server_params.scheme == test_config.config["scheme"]
     assert tool.server_params.method == test_config.config["method"]
     assert tool.server_params.headers == test_config.config["headers"]
+
+
+@pytest.mark.asyncio
+async def test_requests_share_pooled_client(test_config: ComponentModel, test_server: None) -> None:
+    tool = HttpTool.load_component(test_config)
+    other_tool = HttpTool.load_component(test_config)
+    pool = HttpClientPool.get_default()
+    await pool.close()
+
+    await tool.run_json({"query": "test query", "value": 42}, CancellationToken())
+    await other_tool.run_json({"query": "test query", "value": 43}, CancellationToken())
+    assert pool.size == 1
+
+    await pool.close()
+    assert pool.size == 0
+
+
+def test_pooled_clients_closed_on_loop_shutdown() -> None:
+    pool = HttpClientPool()
+
+    async def main() -> httpx.AsyncClient:
+        return pool.get_client("http://localhost:8000")
+
+    client = asyncio.run(main())
+    assert client.is_closed
+    assert pool.size == 0
+
+
+@pytest.mark.asyncio
+async def test_get_response_caching(test_config: ComponentModel, test_server: None) -> None:
+    config = test_config.model_copy()
+    config.config["method"] = "GET"
+    config.config["path"] = "/cached"
+    config.config["cache_responses"] = True
+    tool = HttpTool.load_component(config)
+
+    first = await tool.run_json({"query": "cached", "value": 1}, CancellationToken())
+    assert await tool.run_json({"query": "cached", "value": 1}, CancellationToken()) == first
+    assert json.loads(first)["result"] == "Received: cached with value 1, call 1"
+
+    # Different arguments are a different URL.
+    other = await tool.run_json({"query": "cached", "value": 2}, CancellationToken())
+    assert json.loads(other)["result"] == "Received: cached with value 2, call 2"
+
+    # Responses without an expiration are not cached.
+    await tool.run_json({"query": "uncached", "value": 1}, CancellationToken())
+    result = await tool.run_json({"query": "uncached", "value": 1}, CancellationToken())
+    assert json.loads(result)["result"] == "Received: uncached with value 1, call 2"
+
+    await HttpClientPool.get_default().close()
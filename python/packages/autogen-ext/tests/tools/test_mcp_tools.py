@@ -12,6 +12,7 @@
 from autogen_core.utils import schema_to_pydantic_model
 from autogen_ext.tools.mcp import (
     McpSessionActor,
+    McpSessionPool,
     McpWorkbench,
     SseMcpToolAdapter,
     SseServerParams,
@@ -27,8 +28,11 @@
     Annotations,
     EmbeddedResource,
     ImageContent,
+    ListToolsResult,
+    ServerNotification,
     TextContent,
     TextResourceContents,
+    ToolListChangedNotification,
 )
 from pydantic.networks import AnyUrl
 
@@ -909,3 +913,190 @@ async def test_mcp_tool_adapter_run_cancelled_during_call(
         await adapter._run(args=args, cancellation_token=cancellation_token, session=mock_session)  # type: ignore[reportPrivateUsage]
 
     mock_session.call_tool.assert_called_once_with(name=sample_tool.name, arguments=args)
+
+
+@pytest.mark.asyncio
+async def test_mcp_session_pool(sample_server_params: StdioServerParams, mock_session: AsyncMock) -> None:
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = mock_session
+    factory = MagicMock(return_value=mock_context)
+    pool = McpSessionPool(idle_timeout=0.1, health_check_interval=60)
+
+    # Sequential and concurrent leases share one initialized session.
+    async with pool.session(sample_server_params, factory=factory) as session:
+        assert session is mock_session
+    async with pool.session(sample_server_params, factory=factory) as first:
+        async with pool.session(sample_server_params, factory=factory) as second:
+            assert first is second
+    assert factory.call_count == 1
+    mock_session.initialize.assert_called_once()
+    assert pool.size == 1
+
+    # Other server parameters get their own session.
+    async with pool.session(StdioServerParams(command="echo", args=["other"]), factory=factory):
+        assert pool.size == 2
+
+    # Unused sessions are closed.
+    await asyncio.sleep(0.3)
+    assert pool.size == 0
+    assert mock_context.__aexit__.await_count == 2
+
+    async with pool.session(sample_server_params, factory=factory):
+        pass
+    assert factory.call_count == 3
+    await pool.close()
+    assert pool.size == 0
+
+
+def test_mcp_session_pool_closed_on_loop_shutdown(
+    sample_server_params: StdioServerParams, mock_session: AsyncMock
+) -> None:
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = mock_session
+    pool = McpSessionPool()
+
+    async def main() -> None:
+        async with pool.session(sample_server_params, factory=MagicMock(return_value=mock_context)):
+            pass
+        assert pool.size == 1
+
+    asyncio.run(main())
+    mock_context.__aexit__.assert_awaited_once()
+    assert pool.size == 0
+
+
+@pytest.mark.asyncio
+async def test_mcp_session_pool_health_check(sample_server_params: StdioServerParams) -> None:
+    sessions = [AsyncMock(), AsyncMock()]
+    contexts = [AsyncMock(), AsyncMock()]
+    for context, session in zip(contexts, sessions, strict=True):
+        context.__aenter__.return_value = session
+    factory = MagicMock(side_effect=contexts)
+    pool = McpSessionPool(health_check_interval=0)
+
+    async with pool.session(sample_server_params, factory=factory) as leased:
+        assert leased is sessions[0]
+    # A session that answers the ping is reused, and one that does not is replaced.
+    async with pool.session(sample_server_params, factory=factory) as leased:
+        assert leased is sessions[0]
+    sessions[0].send_ping.side_effect = ConnectionError("server is gone")
+    async with pool.session(sample_server_params, factory=factory) as leased:
+        assert leased is sessions[1]
+    contexts[0].__aexit__.assert_awaited_once()
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_mcp_tool_adapter_reuses_pooled_session(
+    sample_tool: Tool,
+    sample_server_params: StdioServerParams,
+    mock_session: AsyncMock,
+    mock_tool_response: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = mock_session
+    monkeypatch.setattr(
+        "autogen_ext.tools.mcp._base.create_mcp_server_session",
+        lambda *args, **kwargs: mock_context,  # type: ignore
+    )
+    mock_session.call_tool.return_value = mock_tool_response
+
+    adapter = StdioMcpToolAdapter(server_params=sample_server_params, tool=sample_tool)
+    for _ in range(3):
+        await adapter.run_json({"test_param": "test"}, CancellationToken())
+    mock_session.initialize.assert_called_once()
+    assert mock_session.call_tool.call_count == 3
+    await McpSessionPool.get_default().close()
+
+
+@pytest.mark.asyncio
+async def test_mcp_session_actor_concurrent_calls(
+    sample_server_params: StdioServerParams,
+    mock_session: AsyncMock,
+    mock_tool_response: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = mock_session
+    monkeypatch.setattr(
+        "autogen_ext.tools.mcp._actor.create_mcp_server_session",
+        lambda *args, **kwargs: mock_context,  # type: ignore
+    )
+    in_flight = 0
+    max_in_flight = 0
+
+    async def call_tool(name: str, arguments: dict[str, str]) -> MagicMock:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return mock_tool_response
+
+    mock_session.call_tool.side_effect = call_tool
+
+    actor = McpSessionActor(sample_server_params, max_concurrent_calls=2)
+    await actor.initialize()
+
+    async def call(i: int) -> object:
+        result_future = await actor.call("call_tool", {"name": "test_tool", "kargs": {"i": i}})
+        return await result_future
+
+    results = await asyncio.gather(*(call(i) for i in range(5)))
+    assert results == [mock_tool_response] * 5
+    assert max_in_flight == 2
+    await actor.close()
+
+    assert McpSessionActor.load_component(actor.dump_component())._max_concurrent_calls == 2  # type: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_mcp_workbench_tool_cache(
+    sample_tool: Tool,
+    sample_server_params: StdioServerParams,
+    mock_session: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = mock_session
+    session_kwargs: dict[str, object] = {}
+
+    def create_session(*args: object, **kwargs: object) -> AsyncMock:
+        session_kwargs.update(kwargs)
+        return mock_context
+
+    monkeypatch.setattr("autogen_ext.tools.mcp._actor.create_mcp_server_session", create_session)
+    mock_session.list_tools.return_value = ListToolsResult(tools=[sample_tool])
+
+    async with McpWorkbench(server_params=sample_server_params, tool_cache_ttl=None) as workbench:
+        tools = await workbench.list_tools()
+        assert [tool["name"] for tool in tools] == ["test_tool"]
+        assert await workbench.list_tools() == tools
+        assert mock_session.list_tools.await_count == 1
+
+        # The server reports that its tools changed.
+        handler = session_kwargs["message_handler"]
+        notification = ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed"))
+        await handler(notification)  # type: ignore[operator]
+        await workbench.list_tools()
+        assert mock_session.list_tools.await_count == 2
+
+        await workbench.refresh_tools()
+        await workbench.list_tools()
+        assert mock_session.list_tools.await_count == 3
+
+    mock_session.list_tools.reset_mock()
+    async with McpWorkbench(server_params=sample_server_params, tool_cache_ttl=0.05) as workbench:
+        await workbench.list_tools()
+        await workbench.list_tools()
+        assert mock_session.list_tools.await_count == 1
+        await asyncio.sleep(0.1)
+        await workbench.list_tools()
+        assert mock_session.list_tools.await_count == 2
+
+    mock_session.list_tools.reset_mock()
+    async with McpWorkbench(server_params=sample_server_params, tool_cache_ttl=0) as workbench:
+        await workbench.list_tools()
+        await workbench.list_tools()
+        assert mock_session.list_tools.await_count == 2
@@ -1,5 +1,10 @@
+from .blob_store import BlobStore
 from .db_manager import DatabaseManager
+from .write_queue import WriteQueue, WriteQueueStats
 
 __all__ = [
+    "BlobStore",
     "DatabaseManager",
+    "WriteQueue",
+    "WriteQueueStats",
 ]
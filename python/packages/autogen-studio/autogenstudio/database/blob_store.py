@@ -0,0 +1,132 @@
+import base64
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from loguru import logger
+
+_DATA_URL = re.compile(r"data:(?P<mime>[\w.+-]+/[\w.+-]+);base64,", re.ASCII)
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+_MEDIA_TYPES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+
+
+class BlobStore:
+    """
+    Content-addressed storage, in files outside of the database, of the large base64 payloads of JSON columns,
+    such as the images of multimodal messages.
+
+    When it is given a blob store, the DatabaseManager scans the JSON values it saves for base64 strings of at least
+    min_size characters: data URLs ("data:image/png;base64,...") and plain base64 data, as in serialized images
+    ({"data": "..."}). Each of them is decoded, written once to a file named after the SHA-256 of its bytes, and
+    replaced by a reference, {"$blob": "<sha256>"}, with a "mime" key for data URLs. The references are replaced by
+    the original strings when the values are read back, unless the reader asks for the references.
+
+    Blob files are shared by all the rows with the same content, and are not deleted with them.
+
+    Args:
+        root: The directory of the blob files
+        min_size: The minimum length of the strings that are offloaded
+    """
+
+    REF_KEY = "$blob"
+
+    def __init__(self, root: Union[str, Path], min_size: int = 32 * 1024) -> None:
+        self.root = Path(root)
+        self.min_size = min_size
+
+    def path(self, digest: str) -> Path:
+        """Get the path of the blob file with the digest"""
+        if not _DIGEST.fullmatch(digest):
+            raise ValueError(f"Invalid blob digest: {digest}")
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """Store bytes, unless they are already stored, and return their digest"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so a blob file is either complete or missing
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Get the stored bytes with the digest"""
+        return self.path(digest).read_bytes()
+
+    def media_type(self, digest: str) -> str:
+        """Guess the media type of a blob, from the header of the images it may be"""
+        with open(self.path(digest), "rb") as fh:
+            data = fh.read(16)
+        for magic, media_type in _MEDIA_TYPES:
+            if data.startswith(magic):
+                return media_type
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            return "image/webp"
+        return "application/octet-stream"
+
+    def _decode(self, value: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        mime = None
+        encoded = value
+        match = _DATA_URL.match(value)
+        if match:
+            mime = match.group("mime")
+            encoded = value[match.end() :]
+        try:
+            data = base64.b64decode(encoded, validate=True)
+        except (binascii.Error, ValueError):
+            return None
+        # Only offload what is restored exactly
+        if base64.b64encode(data).decode("ascii") != encoded:
+            return None
+        return data, mime
+
+    def offload(self, value: Any) -> Any:
+        """Replace the large base64 strings in a JSON value with references to blob files"""
+        if isinstance(value, dict):
+            return {k: self.offload(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [self.offload(item) for item in value]
+        elif isinstance(value, str) and len(value) >= self.min_size:
+            decoded = self._decode(value)
+            if decoded is None:
+                return value
+            data, mime = decoded
+            ref = {self.REF_KEY: self.put(data)}
+            if mime is not None:
+                ref["mime"] = mime
+            return ref
+        return value
+
+    def inline(self, value: Any) -> Any:
+        """Replace the references to blob files in a JSON value with the original strings"""
+        if isinstance(value, dict):
+            if self.REF_KEY in value and set(value) <= {self.REF_KEY, "mime"}:
+                try:
+                    encoded = base64.b64encode(self.get(value[self.REF_KEY])).decode("ascii")
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not read blob {value[self.REF_KEY]}: {e}")
+                    return value
+                mime = value.get("mime")
+                return f"data:{mime};base64,{encoded}" if mime else encoded
+            return {k: self.inline(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [self.inline(item) for item in value]
+        return value
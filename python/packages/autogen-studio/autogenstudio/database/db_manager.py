@@ -2,14 +2,15 @@
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Sequence, Union
 
 from loguru import logger
-from sqlalchemy import exc, inspect, text
+from sqlalchemy import JSON, exc, inspect, text
 from sqlmodel import Session, SQLModel, and_, create_engine, select
 
 from ..datamodel import BaseDBModel, Response, Team
 from ..teammanager import TeamManager
+from .blob_store import BlobStore
 from .schema_manager import SchemaManager
 
 
@@ -31,7 +32,12 @@ def default(self, o):
 class DatabaseManager:
     _init_lock = threading.Lock()
 
-    def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None) -> None:
+    def __init__(
+        self,
+        engine_uri: str,
+        base_dir: Optional[Union[str, Path]] = None,
+        blob_store: Optional[BlobStore] = None,
+    ) -> None:
         """
         Initialize DatabaseManager with database connection settings.
         Does not perform any database operations.
@@ -39,8 +45,13 @@ def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None)
         Args:
             engine_uri: Database connection URI (e.g. sqlite:///db.sqlite3)
             base_dir: Base directory for migration files. If None, uses current directory
+            blob_store: Store to offload the large base64 payloads of JSON columns to. If None, they are kept
+                in the database
         """
-        connection_args = {"check_same_thread": True} if "sqlite" in engine_uri else {}
+        self.blob_store = blob_store
+        # Connections are handed out by the pool one thread at a time, but not always to the thread that opened them,
+        # as writes are made on the thread of the WriteQueue
+        connection_args = {"check_same_thread": False} if "sqlite" in engine_uri else {}
 
         if base_dir is not None and isinstance(base_dir, str):
             base_dir = Path(base_dir)
@@ -87,6 +98,7 @@ def initialize_database(self, auto_upgrade: bool = False, force_init_alembic: bo
                 return Response(message="Failed to initialize migrations", status=False)
 
             # Handle existing database
+            self._create_missing_indexes()
             if auto_upgrade or self._should_auto_upgrade():
                 logger.info("Checking database schema...")
                 if self.schema_manager.ensure_schema_up_to_date():
@@ -102,6 +114,24 @@ def initialize_database(self, auto_upgrade: bool = False, force_init_alembic: bo
         finally:
             self._init_lock.release()
 
+    def _create_missing_indexes(self) -> None:
+        """
+        Create the indexes of the models that are missing from existing tables.
+
+        create_all skips existing tables together with their indexes, and migrations only run with
+        auto upgrade. Adding an index changes no data, so databases created before an index was added
+        to a model get it on startup.
+        """
+        table_names = set(inspect(self.engine).get_table_names())
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in table_names:
+                continue
+            existing = {index["name"] for index in inspect(self.engine).get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    logger.info(f"Creating missing index {index.name} on {table.name}")
+                    index.create(self.engine)
+
     def reset_db(self, recreate_tables: bool = True) -> Response:
         """
         Reset the database by dropping all tables and optionally recreating them.
@@ -173,6 +203,7 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
         status = True
         model_class = type(model)
         existing_model = None
+        self._offload_blobs(model)
 
         with Session(self.engine) as session:
             try:
@@ -192,6 +223,7 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
                 logger.error("Error while updating/creating " + str(model_class.__name__) + ": " + str(e))
                 status = False
 
+        self._inline_blobs(model)
         return Response(
             message=(
                 f"{model_class.__name__} Updated Successfully"
@@ -202,17 +234,71 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
             data=model.model_dump() if return_json else model,
         )
 
+    def insert_many(self, models: Sequence[BaseDBModel]) -> Response:
+        """Create entities in a single transaction
+
+        Unlike :meth:`upsert`, existing rows are not looked up, so the models must be new.
+
+        Args:
+            models (Sequence[SQLModel]): The model instances to create
+
+        Returns:
+            Response: Contains status and message
+        """
+        if not models:
+            return Response(message="No entities to create", status=True)
+
+        for model in models:
+            self._offload_blobs(model)
+
+        with Session(self.engine, expire_on_commit=False) as session:
+            try:
+                session.add_all(models)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                error_msg = f"Error while creating {len(models)} entities: {e}"
+                logger.error(error_msg)
+                return Response(message=error_msg, status=False)
+
+        return Response(message=f"{len(models)} entities created successfully", status=True)
+
     def _model_to_dict(self, model_obj):
         return {col.name: getattr(model_obj, col.name) for col in model_obj.__table__.columns}
 
+    def _json_columns(self, model_class: type[BaseDBModel]) -> list[str]:
+        return [col.name for col in model_class.__table__.columns if isinstance(col.type, JSON)]  # type: ignore
+
+    def _offload_blobs(self, model: BaseDBModel) -> None:
+        if self.blob_store is None:
+            return
+        for name in self._json_columns(type(model)):
+            setattr(model, name, self.blob_store.offload(getattr(model, name)))
+
+    def _inline_blobs(self, item: Any, model_class: Optional[type[BaseDBModel]] = None) -> None:
+        """Restore the offloaded payloads of an entity, a model instance or a dict of its columns"""
+        if self.blob_store is None:
+            return
+        for name in self._json_columns(model_class or type(item)):
+            if isinstance(item, dict):
+                if name in item:
+                    item[name] = self.blob_store.inline(item[name])
+            else:
+                setattr(item, name, self.blob_store.inline(getattr(item, name)))
+
     def get(
         self,
         model_class: type[BaseDBModel],
         filters: dict | None = None,
         return_json: bool = False,
         order: str = "desc",
+        inline_blobs: bool = True,
     ):
-        """List entities"""
+        """List entities
+
+        Large payloads offloaded to the blob store are restored, unless inline_blobs is False, in which case
+        they are returned as references to the blob files.
+        """
         with Session(self.engine) as session:
             result = []
             status = True
@@ -230,6 +316,9 @@ def get(
 
                 items = session.exec(statement).all()
                 result = [self._model_to_dict(item) if return_json else item for item in items]
+                if inline_blobs:
+                    for item in result:
+                        self._inline_blobs(item, model_class)
                 status_message = f"{model_class.__name__} Retrieved Successfully"
             except Exception as e:
                 session.rollback()
@@ -239,6 +328,82 @@ def get(
 
             return Response(message=status_message, status=status, data=result)
 
+    def get_page(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict | None = None,
+        columns: Sequence[str] | None = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[int] = None,
+        order: str = "asc",
+        inline_blobs: bool = True,
+    ) -> Response:
+        """List a page of entities, ordered by id
+
+        Pages start after the id of the last entity of the previous page, rather than at an offset, so fetching a page
+        costs the same wherever it is, and no entity is skipped or repeated when entities are added between pages.
+
+        Args:
+            model_class: The model to list
+            filters: The values of the columns to match. A list of values matches any of them.
+            columns: The columns to return, in addition to the id. If None, all of them. Leaving out the large JSON
+                columns, such as the team result of runs, saves loading them.
+            limit: The maximum number of entities on the page. If None, all of them
+            cursor: The next_cursor of the previous page, or None for the first page
+            order: "asc" for the oldest entities first, "desc" for the newest first
+            inline_blobs: If False, payloads offloaded to the blob store are returned as references to the blob files
+
+        Returns:
+            Response: Contains status, message and data, a dict with the entities as "items" (dicts of the columns if
+                columns are given, model instances otherwise), and the cursor of the next page as "next_cursor", or
+                None on the last page
+        """
+        if order not in ("asc", "desc"):
+            return Response(message=f"Invalid order: {order}", status=False)
+        if limit is not None and limit < 1:
+            return Response(message="limit must be at least 1", status=False)
+
+        with Session(self.engine) as session:
+            try:
+                id_column = model_class.id
+                names = ["id"] + [col for col in columns if col != "id"] if columns is not None else []
+                statement = select(*[getattr(model_class, col) for col in names]) if names else select(model_class)
+                if filters:
+                    conditions = [
+                        getattr(model_class, col).in_(value)
+                        if isinstance(value, (list, tuple, set))
+                        else getattr(model_class, col) == value
+                        for col, value in filters.items()
+                    ]
+                    statement = statement.where(and_(*conditions))
+                if cursor is not None:
+                    statement = statement.where(id_column > cursor if order == "asc" else id_column < cursor)
+                statement = statement.order_by(getattr(id_column, order)())
+                if limit is not None:
+                    # Fetch one more entity, to know whether there is a next page
+                    statement = statement.limit(limit + 1)
+
+                rows = session.exec(statement).all()
+            except Exception as e:
+                session.rollback()
+                logger.error("Error while getting a page of items: " + str(model_class.__name__) + " " + str(e))
+                return Response(message=f"Error while fetching {model_class.__name__}", status=False)
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1][0] if names else rows[-1].id
+        items = [dict(zip(names, row)) for row in rows] if names else list(rows)
+        if inline_blobs:
+            for item in items:
+                self._inline_blobs(item, model_class)
+
+        return Response(
+            message=f"{model_class.__name__} Retrieved Successfully",
+            status=True,
+            data={"items": items, "next_cursor": next_cursor},
+        )
+
     def delete(self, model_class: type[BaseDBModel], filters: dict | None = None) -> Response:
         """Delete an entity"""
         status_message = ""
@@ -0,0 +1,162 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+from loguru import logger
+from pydantic import BaseModel
+
+from ..datamodel import BaseDBModel, Response
+from .db_manager import DatabaseManager
+
+T = TypeVar("T")
+
+_WriteResult = Tuple[Response, float]
+
+
+class WriteQueueStats(BaseModel):
+    pending: int  # Models queued, and not yet handed to the writer thread
+    in_flight: int  # Models handed to the writer thread, and not yet committed
+    written: int
+    failed: int
+    lag: float  # Seconds the oldest model not yet committed has been waiting
+    last_batch_seconds: float  # Seconds taken to commit the last batch
+
+
+class WriteQueue:
+    """
+    Write-behind persistence for models created at a high rate, such as the messages streamed by a run.
+
+    Models are queued per key (e.g. a run id) and created in batches, in one transaction per batch, on a single
+    writer thread, so the event loop never waits for the database. A batch is written when it reaches batch_size
+    models, or flush_interval seconds after its first model was queued, whichever comes first. Writes of the same
+    key are committed in the order they were queued.
+
+    Args:
+        db_manager: The database manager that creates the models
+        batch_size: The maximum number of models created in one transaction
+        flush_interval: Seconds after which queued models are written, even if the batch is not full
+        lag_warning: Seconds after which a warning is logged when queued models have not been committed
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        lag_warning: float = 5.0,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._db_manager = db_manager
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._lag_warning = lag_warning
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autogenstudio-db-writer")
+
+        self._pending: Dict[int, List[BaseDBModel]] = {}
+        self._pending_since: Dict[int, float] = {}
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._writes: Dict[int, Set["asyncio.Future[_WriteResult]"]] = {}
+        self._in_flight: Dict["asyncio.Future[_WriteResult]", Tuple[int, float]] = {}
+
+        self._written = 0
+        self._failed = 0
+        self._last_batch_seconds = 0.0
+
+    def put(self, key: int, model: BaseDBModel) -> None:
+        """Queue a new model to be created. Must be called from the event loop."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.setdefault(key, [])
+        if not pending:
+            self._pending_since[key] = time.monotonic()
+        pending.append(model)
+
+        if len(pending) >= self._batch_size:
+            self._submit(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self._flush_interval, self._submit, key)
+
+    def _write(self, models: List[BaseDBModel]) -> _WriteResult:
+        start = time.perf_counter()
+        response = self._db_manager.insert_many(models)
+        return response, time.perf_counter() - start
+
+    def _submit(self, key: int) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        models = self._pending.pop(key, [])
+        since = self._pending_since.pop(key, time.monotonic())
+        if not models:
+            return
+
+        future = asyncio.get_running_loop().run_in_executor(self._executor, self._write, models)
+        self._in_flight[future] = (len(models), since)
+        self._writes.setdefault(key, set()).add(future)
+        future.add_done_callback(functools.partial(self._on_written, key))
+
+    def _on_written(self, key: int, future: "asyncio.Future[_WriteResult]") -> None:
+        count, since = self._in_flight.pop(future)
+        writes = self._writes.get(key)
+        if writes is not None:
+            writes.discard(future)
+            if not writes:
+                del self._writes[key]
+
+        if future.cancelled():
+            self._failed += count
+            return
+        error = future.exception()
+        if error is not None:
+            self._failed += count
+            logger.error(f"Error while writing {count} queued entities for {key}: {error}")
+            return
+        response, seconds = future.result()
+        if response.status:
+            self._written += count
+        else:
+            # The error has been logged by the database manager
+            self._failed += count
+        self._last_batch_seconds = seconds
+
+        lag = time.monotonic() - since
+        if lag > self._lag_warning:
+            logger.warning(
+                f"Database writes are lagging: {count} entities for {key} were written {lag:.1f}s after they were queued"
+            )
+
+    async def flush(self, key: Optional[int] = None) -> None:
+        """Write the queued models of a key, or of all keys, and wait until they are committed."""
+        keys = [key] if key is not None else list(self._pending)
+        for k in keys:
+            self._submit(k)
+        futures = set(self._writes.get(key, set())) if key is not None else set(self._in_flight)
+        if futures:
+            await asyncio.wait(futures)
+
+    async def submit(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a database operation on the writer thread, after the writes already handed to it.
+        Call :meth:`flush` first to also order it after the models that are still queued.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, *args))
+
+    @property
+    def stats(self) -> WriteQueueStats:
+        """The state of the queue, and how far behind the writes are."""
+        oldest = list(self._pending_since.values()) + [since for _, since in self._in_flight.values()]
+        return WriteQueueStats(
+            pending=sum(len(models) for models in self._pending.values()),
+            in_flight=sum(count for count, _ in self._in_flight.values()),
+            written=self._written,
+            failed=self._failed,
+            lag=time.monotonic() - min(oldest) if oldest else 0.0,
+            last_batch_seconds=self._last_batch_seconds,
+        )
+
+    async def close(self) -> None:
+        """Write all queued models, and stop the writer thread."""
+        await self.flush()
+        self._executor.shutdown(wait=False)
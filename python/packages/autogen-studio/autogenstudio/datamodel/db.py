@@ -34,6 +34,7 @@ class BaseDBModel(SQLModel, table=False):
 
     created_at: datetime = Field(
         default_factory=datetime.now,
+        index=True,
         sa_type=DateTime(timezone=True),  # type: ignore[assignment]
         sa_column_kwargs={"server_default": func.now(), "nullable": True},
     )
@@ -60,9 +61,11 @@ class Message(BaseDBModel, table=True):
         default_factory=lambda: MessageConfig(source="", content=""), sa_column=Column(JSON)
     )
     session_id: Optional[int] = Field(
-        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="NO ACTION"))
+        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="NO ACTION"), index=True)
+    )
+    run_id: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, ForeignKey("run.id", ondelete="CASCADE"), index=True)
     )
-    run_id: Optional[int] = Field(default=None, sa_column=Column(Integer, ForeignKey("run.id", ondelete="CASCADE")))
 
     message_meta: Optional[Union[MessageMeta, dict]] = Field(default={}, sa_column=Column(JSON))
 
@@ -94,7 +97,8 @@ class Run(BaseDBModel, table=True):
     __table_args__ = {"sqlite_autoincrement": True}
 
     session_id: Optional[int] = Field(
-        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False)
+        default=None,
+        sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False, index=True),
     )
     status: RunStatus = Field(default=RunStatus.CREATED)
 
@@ -15,7 +15,7 @@
 from .config import settings
 from .deps import cleanup_managers, init_auth_manager, init_managers, register_auth_dependencies
 from .initialization import AppInitializer
-from .routes import gallery, runs, sessions, settingsroute, teams, validation, ws
+from .routes import blobs, gallery, runs, sessions, settingsroute, teams, validation, ws
 
 # Initialize application
 app_file_path = os.path.dirname(os.path.abspath(__file__))
@@ -98,6 +98,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     responses={404: {"description": "Not found"}},
 )
 
+api.include_router(
+    blobs.router,
+    prefix="/blobs",
+    tags=["blobs"],
+    responses={404: {"description": "Not found"}},
+)
+
 api.include_router(
     teams.router,
     prefix="/teams",
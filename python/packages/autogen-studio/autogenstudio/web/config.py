@@ -11,6 +11,9 @@ class Settings(BaseSettings):
     CONFIG_DIR: str = "configs"  # Default config directory relative to app_root
     DEFAULT_USER_ID: str = "guestuser@gmail.com"
     UPGRADE_DATABASE: bool = False
+    MESSAGE_BATCH_SIZE: int = 100  # Maximum number of streamed messages saved in one transaction
+    MESSAGE_FLUSH_INTERVAL: float = 0.5  # Seconds after which streamed messages are saved, if the batch is not full
+    BLOB_MIN_SIZE: int = 32 * 1024  # Length from which base64 payloads are stored in blob files, not in the database
 
     model_config = {"env_prefix": "AUTOGENSTUDIO_"}
 
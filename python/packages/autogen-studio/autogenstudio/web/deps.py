@@ -7,7 +7,7 @@
 
 from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket, status
 
-from ..database import DatabaseManager
+from ..database import BlobStore, DatabaseManager, WriteQueue
 from ..teammanager import TeamManager
 from .auth import AuthConfig, AuthManager, AuthMiddleware
 from .auth.dependencies import get_auth_manager
@@ -124,14 +124,18 @@ async def init_managers(database_uri: str, config_dir: str | Path, app_root: str
 
     try:
         # Initialize database manager
-        _db_manager = DatabaseManager(engine_uri=database_uri, base_dir=app_root)
+        blob_store = BlobStore(Path(app_root) / "blobs", min_size=settings.BLOB_MIN_SIZE)
+        _db_manager = DatabaseManager(engine_uri=database_uri, base_dir=app_root, blob_store=blob_store)
         _db_manager.initialize_database(auto_upgrade=settings.UPGRADE_DATABASE)
 
         # init default team config
         await _db_manager.import_teams_from_directory(config_dir, settings.DEFAULT_USER_ID, check_exists=True)
 
         # Initialize connection manager
-        _websocket_manager = WebSocketManager(db_manager=_db_manager)
+        write_queue = WriteQueue(
+            _db_manager, batch_size=settings.MESSAGE_BATCH_SIZE, flush_interval=settings.MESSAGE_FLUSH_INTERVAL
+        )
+        _websocket_manager = WebSocketManager(db_manager=_db_manager, write_queue=write_queue)
         logger.info("Connection manager initialized")
 
         # Initialize team manager
@@ -22,7 +22,7 @@
 from autogen_core import Image as AGImage
 from fastapi import WebSocket, WebSocketDisconnect
 
-from ...database import DatabaseManager
+from ...database import DatabaseManager, WriteQueue, WriteQueueStats
 from ...datamodel import (
     LLMCallEventMessage,
     Message,
@@ -42,8 +42,11 @@
 class WebSocketManager:
     """Manages WebSocket connections and message streaming for team task execution"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, write_queue: Optional[WriteQueue] = None):
         self.db_manager = db_manager
+        # Messages are saved in batches, and run updates made, on the writer thread of the queue
+        self._write_queue = write_queue or WriteQueue(db_manager)
+        self._run_sessions: Dict[int, Optional[int]] = {}
         self._connections: Dict[int, WebSocket] = {}
         self._cancellation_tokens: Dict[int, CancellationToken] = {}
         # Track explicitly closed connections
@@ -99,13 +102,16 @@ async def start_stream(
                 # Update run with task and status
                 run = await self._get_run(run_id)
 
+                if run is not None:
+                    self._run_sessions[run_id] = run.session_id
+
                 if run is not None and run.user_id:
                     # get user Settings
                     user_settings = await self._get_settings(run.user_id)
                     env_vars = SettingsConfig(**user_settings.config).environment if user_settings else None  # type: ignore
                     run.task = self._convert_images_in_dict(MessageConfig(content=task, source="user").model_dump())
                     run.status = RunStatus.ACTIVE
-                    self.db_manager.upsert(run)
+                    await self._write_queue.submit(self.db_manager.upsert, run)
 
                 input_func = self.create_input_func(run_id)
 
@@ -166,26 +172,33 @@ async def start_stream(
                 await self._handle_stream_error(run_id, e)
             finally:
                 self._cancellation_tokens.pop(run_id, None)
+                self._run_sessions.pop(run_id, None)
+                await self._write_queue.flush(run_id)
 
     async def _save_message(
         self, run_id: int, message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage]
     ) -> None:
-        """Save a message to the database"""
-
-        run = await self._get_run(run_id)
-        if run:
-            db_message = Message(
-                session_id=run.session_id,
-                run_id=run_id,
-                config=self._convert_images_in_dict(message.model_dump()),
-                user_id=None,  # You might want to pass this from somewhere
-            )
-            self.db_manager.upsert(db_message)
+        """Queue a message to be saved to the database"""
+
+        if run_id not in self._run_sessions:
+            run = await self._get_run(run_id)
+            if not run:
+                return
+            self._run_sessions[run_id] = run.session_id
+
+        db_message = Message(
+            session_id=self._run_sessions[run_id],
+            run_id=run_id,
+            config=self._convert_images_in_dict(message.model_dump()),
+            user_id=None,  # You might want to pass this from somewhere
+        )
+        self._write_queue.put(run_id, db_message)
 
     async def _update_run(
         self, run_id: int, status: RunStatus, team_result: Optional[dict] = None, error: Optional[str] = None
     ) -> None:
-        """Update run status and result"""
+        """Update run status and result, after saving the queued messages of the run"""
+        await self._write_queue.flush(run_id)
         run = await self._get_run(run_id)
         if run:
             run.status = status
@@ -193,7 +206,7 @@ async def _update_run(
                 run.team_result = self._convert_images_in_dict(team_result)
             if error:
                 run.error_message = error
-            self.db_manager.upsert(run)
+            await self._write_queue.submit(self.db_manager.upsert, run)
 
     def create_input_func(self, run_id: int) -> Callable:
         """Creates an input function for a specific run"""
@@ -426,11 +439,12 @@ async def _update_run_status(self, run_id: int, status: RunStatus, error: Option
             status: New status to set
             error: Optional error message
         """
+        await self._write_queue.flush(run_id)
         run = await self._get_run(run_id)
         if run:
             run.status = status
             run.error_message = error
-            self.db_manager.upsert(run)
+            await self._write_queue.submit(self.db_manager.upsert, run)
 
     async def cleanup(self) -> None:
         """Clean up all active connections and resources when server is shutting down"""
@@ -454,7 +468,7 @@ async def cleanup(self) -> None:
 
                     run.status = RunStatus.STOPPED
                     run.team_result = interrupted_result
-                    self.db_manager.upsert(run)
+                    await self._write_queue.submit(self.db_manager.upsert, run)
 
             # Then disconnect all websockets with timeout
             # 10 second timeout for entire cleanup
@@ -479,6 +493,9 @@ async def cleanup(self) -> None:
             self._cancellation_tokens.clear()
             self._closed_connections.clear()
             self._input_responses.clear()
+            self._run_sessions.clear()
+            # Save the messages still queued
+            await self._write_queue.close()
 
     @property
     def active_connections(self) -> set[int]:
@@ -489,3 +506,8 @@ def active_connections(self) -> set[int]:
     def active_runs(self) -> set[int]:
         """Get set of runs with active cancellation tokens"""
         return set(self._cancellation_tokens.keys())
+
+    @property
+    def persistence_stats(self) -> WriteQueueStats:
+        """Get the state of the queue of messages to save, and how far behind saving them is"""
+        return self._write_queue.stats
@@ -0,0 +1,26 @@
+# api/routes/blobs.py
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from ..deps import get_db
+
+router = APIRouter()
+
+
+@router.get("/{digest}")
+async def get_blob(digest: str, db=Depends(get_db)) -> FileResponse:
+    """Get a payload offloaded to the blob store, such as a large image of a message"""
+    if db.blob_store is None:
+        raise HTTPException(status_code=404, detail="Blob not found")
+    try:
+        path = db.blob_store.path(digest)
+        media_type = await asyncio.to_thread(db.blob_store.media_type, digest)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail="Blob not found") from e
+
+    # Blobs are addressed by their content, so they never change
+    return FileResponse(path, media_type=media_type, headers={"Cache-Control": "public, max-age=31536000, immutable"})
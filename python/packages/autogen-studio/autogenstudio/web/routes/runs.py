@@ -1,7 +1,7 @@
 # /api/runs routes
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from ...datamodel import Message, Run, RunStatus, Session
@@ -58,8 +58,17 @@ async def get_run(run_id: int, db=Depends(get_db)) -> Dict:
 
 
 @router.get("/{run_id}/messages")
-async def get_run_messages(run_id: int, db=Depends(get_db)) -> Dict:
-    """Get all messages for a run"""
-    messages = db.get(Message, filters={"run_id": run_id}, order="created_at asc", return_json=False)
+async def get_run_messages(
+    run_id: int,
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[int] = None,
+    inline_blobs: bool = True,
+    db=Depends(get_db),
+) -> Dict:
+    """Get the messages of a run, oldest first. With a limit, get a page of them, and the cursor of the next page.
+    With inline_blobs=false, large images are returned as references to /blobs/{digest}."""
+    messages = db.get_page(Message, filters={"run_id": run_id}, limit=limit, cursor=cursor, inline_blobs=inline_blobs)
+    if not messages.status:
+        raise HTTPException(status_code=500, detail=messages.message)
 
-    return {"status": True, "data": messages.data}
+    return {"status": True, "data": messages.data["items"], "next_cursor": messages.data["next_cursor"]}
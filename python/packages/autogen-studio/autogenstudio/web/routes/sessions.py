@@ -1,8 +1,8 @@
 # api/routes/sessions.py
 import re
-from typing import Dict
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from loguru import logger
 
 from ...datamodel import Message, Response, Run, Session
@@ -11,11 +11,22 @@
 router = APIRouter()
 
 
+# Columns of runs returned when their results are not included
+RUN_SUMMARY_COLUMNS = ["created_at", "status", "task", "error_message"]
+
+
 @router.get("/")
-async def list_sessions(user_id: str, db=Depends(get_db)) -> Dict:
-    """List all sessions for a user"""
-    response = db.get(Session, filters={"user_id": user_id})
-    return {"status": True, "data": response.data}
+async def list_sessions(
+    user_id: str,
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[int] = None,
+    db=Depends(get_db),
+) -> Dict:
+    """List the sessions of a user, newest first. With a limit, list a page of them, and the cursor of the next page."""
+    response = db.get_page(Session, filters={"user_id": user_id}, limit=limit, cursor=cursor, order="desc")
+    if not response.status:
+        raise HTTPException(status_code=500, detail=response.message)
+    return {"status": True, "data": response.data["items"], "next_cursor": response.data["next_cursor"]}
 
 
 @router.get("/{session_id}")
@@ -64,8 +75,19 @@ async def delete_session(session_id: int, user_id: str, db=Depends(get_db)) -> D
 
 
 @router.get("/{session_id}/runs")
-async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -> Dict:
-    """Get complete session history organized by runs"""
+async def list_session_runs(
+    session_id: int,
+    user_id: str,
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[int] = None,
+    include_messages: bool = True,
+    include_results: bool = True,
+    inline_blobs: bool = True,
+    db=Depends(get_db),
+) -> Dict:
+    """Get session history organized by runs, oldest first. With a limit, get a page of runs, and the cursor of the
+    next page. Without messages and results, only the summaries of the runs are loaded, and the messages of a run can
+    be fetched a page at a time from /runs/{run_id}/messages."""
 
     try:
         # 1. Verify session exists and belongs to user
@@ -75,49 +97,52 @@ async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -
         if not session.data:
             raise HTTPException(status_code=404, detail="Session not found or access denied")
 
-        # 2. Get ordered runs for session
-        runs = db.get(Run, filters={"session_id": session_id}, order="asc", return_json=False)
+        # 2. Get ordered runs for session, without the columns that are not needed
+        columns = RUN_SUMMARY_COLUMNS + (["team_result"] if include_results else [])
+        runs = db.get_page(
+            Run,
+            filters={"session_id": session_id},
+            columns=columns,
+            limit=limit,
+            cursor=cursor,
+            inline_blobs=inline_blobs,
+        )
         if not runs.status:
             raise HTTPException(status_code=500, detail="Database error while fetching runs")
-
-        # 3. Build response with messages per run
+        run_items = runs.data["items"]
+
+        # 3. Get the messages of all the runs in one query
+        messages_by_run: Dict[int, List[Message]] = {}
+        if include_messages and run_items:
+            messages = db.get_page(
+                Message,
+                filters={"run_id": [run["id"] for run in run_items]},
+                limit=None,
+                inline_blobs=inline_blobs,
+            )
+            if messages.status:
+                for message in messages.data["items"]:
+                    messages_by_run.setdefault(message.run_id, []).append(message)
+            else:
+                # Return the runs even if their messages could not be fetched
+                logger.error(f"Failed to fetch messages for runs of session {session_id}")
+
+        # 4. Build response with messages per run
         run_data = []
-        if runs.data:  # It's ok to have no runs
-            for run in runs.data:
-                try:
-                    # Get messages for this specific run
-                    messages = db.get(Message, filters={"run_id": run.id}, order="asc", return_json=False)
-                    if not messages.status:
-                        logger.error(f"Failed to fetch messages for run {run.id}")
-                        # Continue processing other runs even if one fails
-                        messages.data = []
-
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": run.status,
-                            "task": run.task,
-                            "team_result": run.team_result,
-                            "messages": messages.data or [],
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing run {run.id}: {str(e)}")
-                    # Include run with error state instead of failing entirely
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": "ERROR",
-                            "task": run.task,
-                            "team_result": None,
-                            "messages": [],
-                            "error": f"Failed to process run: {str(e)}",
-                        }
-                    )
-
-        return {"status": True, "data": {"runs": run_data}}
+        for run in run_items:
+            run_entry = {
+                "id": str(run["id"]),
+                "created_at": run["created_at"],
+                "status": run["status"],
+                "task": run["task"],
+            }
+            if include_results:
+                run_entry["team_result"] = run["team_result"]
+            if include_messages:
+                run_entry["messages"] = messages_by_run.get(run["id"], [])
+            run_data.append(run_entry)
+
+        return {"status": True, "data": {"runs": run_data, "next_cursor": runs.data["next_cursor"]}}
 
     except HTTPException:
         raise  # Re-raise HTTP exceptions
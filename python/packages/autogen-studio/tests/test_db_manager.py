@@ -1,9 +1,11 @@
 import asyncio 
+import base64
 import pytest
 from sqlmodel import Session, text, select
 from typing import Generator
+from sqlalchemy import inspect
 
-from autogenstudio.database import DatabaseManager
+from autogenstudio.database import BlobStore, DatabaseManager, WriteQueue
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.teams import RoundRobinGroupChat
 from autogen_ext.models.openai import OpenAIChatCompletionClient
@@ -167,6 +169,111 @@ def test_cascade_delete(self, test_db: DatabaseManager, test_user: str):
         # Clean up
         test_db.delete(Team, {"id": team1.id})
 
+    def test_insert_many(self, test_db: DatabaseManager, test_user: str):
+        """Test creating several entities in one transaction"""
+        messages = [
+            Message(user_id=test_user, config=MessageConfig(content=f"Message{i}", source="assistant").model_dump())
+            for i in range(5)
+        ]
+        response = test_db.insert_many(messages)
+        assert response.status is True
+
+        result = test_db.get(Message, {"user_id": test_user}, order="asc")
+        assert [m.config["content"] for m in result.data] == [f"Message{i}" for i in range(5)]
+
+        # A failed batch is rolled back as a whole
+        duplicates = [Message(id=messages[0].id, user_id=test_user), Message(user_id=test_user)]
+        response = test_db.insert_many(duplicates)
+        assert response.status is False
+        assert len(test_db.get(Message, {"user_id": test_user}).data) == 5
+
+    def test_get_page(self, test_db: DatabaseManager, test_user: str):
+        """Test cursor pagination, projection and list filters"""
+        test_db.insert_many(
+            [Message(user_id=test_user, run_id=None, config={"content": f"Message{i}", "source": "a"}) for i in range(7)]
+        )
+
+        contents = []
+        cursor = None
+        pages = 0
+        while True:
+            response = test_db.get_page(Message, filters={"user_id": test_user}, limit=3, cursor=cursor)
+            assert response.status is True
+            contents += [m.config["content"] for m in response.data["items"]]
+            pages += 1
+            cursor = response.data["next_cursor"]
+            if cursor is None:
+                break
+        assert pages == 3
+        assert contents == [f"Message{i}" for i in range(7)]
+
+        # Newest first, only some columns
+        response = test_db.get_page(Message, filters={"user_id": test_user}, columns=["config"], limit=2, order="desc")
+        items = response.data["items"]
+        assert [set(item) for item in items] == [{"id", "config"}] * 2
+        assert [item["config"]["content"] for item in items] == ["Message6", "Message5"]
+
+        # A list of values matches any of them
+        ids = [item["id"] for item in items]
+        response = test_db.get_page(Message, filters={"id": ids}, limit=None)
+        assert sorted(m.id for m in response.data["items"]) == sorted(ids)
+        assert response.data["next_cursor"] is None
+
+        assert test_db.get_page(Message, limit=0).status is False
+        assert test_db.get_page(Message, columns=["missing"]).status is False
+
+    def test_blob_offload(self, tmp_path, test_user: str):
+        """Test that large base64 payloads are stored in blob files, and restored when read"""
+        blob_store = BlobStore(tmp_path / "blobs", min_size=1024)
+        db = DatabaseManager(f"sqlite:///{tmp_path / 'blobs.db'}", base_dir=tmp_path, blob_store=blob_store)
+        db.initialize_database(auto_upgrade=False)
+        try:
+            image = base64.b64encode(b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 16).decode("ascii")
+            data_url = f"data:image/png;base64,{image}"
+            config = {"source": "a", "content": ["text", {"data": image}, {"url": data_url}], "small": "c2hvcnQ="}
+
+            # The same image is stored once
+            db.insert_many([Message(user_id=test_user, config=config), Message(user_id=test_user, config=config)])
+            assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # The directory and the file
+
+            with Session(db.engine) as session:
+                raw = session.exec(text("SELECT config FROM message")).first()[0]  # type: ignore
+            assert image not in raw and "$blob" in raw
+
+            messages = db.get(Message, {"user_id": test_user}).data
+            assert [m.config for m in messages] == [config, config]
+
+            refs = db.get_page(Message, {"user_id": test_user}, inline_blobs=False).data["items"][0].config["content"]
+            digest = refs[1]["data"]["$blob"]
+            assert refs[2] == {"url": {"$blob": digest, "mime": "image/png"}}
+            assert blob_store.media_type(digest) == "image/png"
+            assert base64.b64encode(blob_store.get(digest)).decode("ascii") == image
+
+            # Upserted models keep their payloads inline for the caller
+            message = Message(user_id=test_user, config=config)
+            assert db.upsert(message, return_json=False).data.config == config
+        finally:
+            asyncio.run(db.close())
+
+    def test_initialize_database_creates_missing_indexes(self, tmp_path, monkeypatch):
+        """Databases created before an index was added to a model get it without a migration"""
+        db_path = tmp_path / "test_indexes.db"
+        db = DatabaseManager(f"sqlite:///{db_path}", base_dir=tmp_path)
+        try:
+            assert db.initialize_database().status is True
+            with db.engine.begin() as conn:
+                conn.execute(text("DROP INDEX ix_message_run_id"))
+
+            # No migration runs
+            monkeypatch.setattr(db.schema_manager, "check_schema_status", lambda: (False, None))
+
+            assert db.initialize_database().status is True
+            indexes = {index["name"] for index in inspect(db.engine).get_indexes("message")}
+            assert "ix_message_run_id" in indexes
+        finally:
+            asyncio.run(db.close())
+            db.reset_db()
+
     def test_initialize_database_scenarios(self, tmp_path, monkeypatch):
         """Test different initialize_database parameters"""
         db_path = tmp_path / "test_init.db"
@@ -188,3 +295,59 @@ def test_initialize_database_scenarios(self, tmp_path, monkeypatch):
         finally:
             asyncio.run(db.close())
             db.reset_db() 
+
+
+class TestWriteQueue:
+    @pytest.mark.asyncio
+    async def test_batches_and_flush(self, test_db: DatabaseManager, test_user: str):
+        """Test that queued models are written in batches, and all of them on flush"""
+        queue = WriteQueue(test_db, batch_size=3, flush_interval=60)
+        try:
+            for i in range(4):
+                queue.put(1, Message(user_id=test_user, config={"content": f"Message{i}", "source": "assistant"}))
+
+            # The first batch is full and is written, the last message waits for the flush interval
+            assert queue.stats.pending == 1
+            for _ in range(100):
+                if queue.stats.written == 3 and queue.stats.in_flight == 0:
+                    break
+                await asyncio.sleep(0.05)
+            assert queue.stats.written == 3
+            assert queue.stats.pending == 1
+            assert len(test_db.get(Message, {"user_id": test_user}).data) == 3
+
+            await queue.flush(1)
+            stats = queue.stats
+            assert (stats.pending, stats.in_flight, stats.written, stats.failed) == (0, 0, 4, 0)
+            assert stats.lag == 0
+            assert len(test_db.get(Message, {"user_id": test_user}).data) == 4
+        finally:
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_interval(self, test_db: DatabaseManager, test_user: str):
+        """Test that a batch that is not full is written after the flush interval"""
+        queue = WriteQueue(test_db, batch_size=100, flush_interval=0.05)
+        try:
+            queue.put(1, Message(user_id=test_user, config={"content": "Message", "source": "assistant"}))
+            assert queue.stats.pending == 1
+            for _ in range(100):
+                if queue.stats.written == 1:
+                    break
+                await asyncio.sleep(0.05)
+            assert queue.stats.written == 1
+        finally:
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_submit_after_flush(self, test_db: DatabaseManager, test_user: str):
+        """Test that operations submitted after a flush see the queued models"""
+        queue = WriteQueue(test_db, flush_interval=60)
+        try:
+            for i in range(10):
+                queue.put(1, Message(user_id=test_user, config={"content": f"Message{i}", "source": "assistant"}))
+            await queue.flush(1)
+            response = await queue.submit(test_db.get, Message, {"user_id": test_user})
+            assert len(response.data) == 10
+        finally:
+            await queue.close()